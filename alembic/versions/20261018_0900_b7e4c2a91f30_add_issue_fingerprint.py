@@ -0,0 +1,33 @@
+"""add fingerprint to issues
+
+Revision ID: b7e4c2a91f30
+Revises: ac742ebbc2ba
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4c2a91f30"
+down_revision: str | None = "ac742ebbc2ba"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.add_column("issues", sa.Column("fingerprint", sa.String(length=40), nullable=True))
+    op.create_index(
+        "idx_issues_repo_fingerprint", "issues", ["repository_id", "fingerprint"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_issues_repo_fingerprint", table_name="issues")
+    op.drop_column("issues", "fingerprint")
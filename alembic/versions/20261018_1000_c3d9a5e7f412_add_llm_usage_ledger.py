@@ -0,0 +1,93 @@
+"""add llm usage ledger and hourly rollups
+
+Revision ID: c3d9a5e7f412
+Revises: b7e4c2a91f30
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d9a5e7f412"
+down_revision: str | None = "b7e4c2a91f30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "llm_usage",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("operation_id", sa.String(length=100), nullable=True),
+        sa.Column("operation_type", sa.String(length=50), nullable=False),
+        sa.Column("parent_session_id", sa.String(length=100), nullable=True),
+        sa.Column("repository_id", sa.String(length=36), nullable=True),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("input_tokens", sa.Integer(), nullable=False),
+        sa.Column("output_tokens", sa.Integer(), nullable=False),
+        sa.Column("cache_read_tokens", sa.Integer(), nullable=False),
+        sa.Column("cache_creation_tokens", sa.Integer(), nullable=False),
+        sa.Column("cost_usd", sa.Float(), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=True),
+        sa.Column("success", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_llm_usage_operation_id", "llm_usage", ["operation_id"], unique=False)
+    op.create_index(
+        "ix_llm_usage_parent_session_id", "llm_usage", ["parent_session_id"], unique=False
+    )
+    op.create_index(
+        "idx_llm_usage_repo_created", "llm_usage", ["repository_id", "created_at"], unique=False
+    )
+    op.create_index("idx_llm_usage_created", "llm_usage", ["created_at"], unique=False)
+
+    op.create_table(
+        "llm_usage_hourly",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("repository_id", sa.String(length=36), nullable=False),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("operation_type", sa.String(length=50), nullable=False),
+        sa.Column("calls", sa.Integer(), nullable=False),
+        sa.Column("failed_calls", sa.Integer(), nullable=False),
+        sa.Column("input_tokens", sa.Integer(), nullable=False),
+        sa.Column("output_tokens", sa.Integer(), nullable=False),
+        sa.Column("cache_read_tokens", sa.Integer(), nullable=False),
+        sa.Column("cache_creation_tokens", sa.Integer(), nullable=False),
+        sa.Column("cost_usd", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "bucket_start",
+            "repository_id",
+            "provider",
+            "model",
+            "operation_type",
+            name="uq_llm_usage_hourly_bucket",
+        ),
+    )
+    op.create_index(
+        "idx_llm_usage_hourly_repo_bucket",
+        "llm_usage_hourly",
+        ["repository_id", "bucket_start"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_llm_usage_hourly_repo_bucket", table_name="llm_usage_hourly")
+    op.drop_table("llm_usage_hourly")
+    op.drop_index("idx_llm_usage_created", table_name="llm_usage")
+    op.drop_index("idx_llm_usage_repo_created", table_name="llm_usage")
+    op.drop_index("ix_llm_usage_parent_session_id", table_name="llm_usage")
+    op.drop_index("ix_llm_usage_operation_id", table_name="llm_usage")
+    op.drop_table("llm_usage")
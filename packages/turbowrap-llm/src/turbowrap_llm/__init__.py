@@ -38,6 +38,11 @@ With operation tracking:
             await my_db.upsert(operation_id, status, kwargs)
 
     cli = ClaudeCLI(tracker=MyTracker())
+
+With a call limiter (rate limits, concurrency caps):
+    from turbowrap_llm.hooks import set_default_limiter
+
+    set_default_limiter(my_limiter)  # All CLIs, or ClaudeCLI(limiter=my_limiter)
 """
 
 __version__ = "0.1.0"
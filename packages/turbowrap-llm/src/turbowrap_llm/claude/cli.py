@@ -22,10 +22,14 @@ from typing import Any
 
 from ..hooks import (
     ArtifactSaver,
+    CallLimiter,
     NoOpArtifactSaver,
     NoOpOperationTracker,
     OperationTracker,
+    estimate_tokens,
+    get_default_limiter,
 )
+from ..process import kill_process
 from .models import (
     DEFAULT_TIMEOUT,
     MODEL_MAP,
@@ -94,6 +98,7 @@ class ClaudeCLI:
         thinking_budget: int = 10000,
         artifact_saver: ArtifactSaver | None = None,
         tracker: OperationTracker | None = None,
+        limiter: CallLimiter | None = None,
     ):
         """Initialize Claude CLI runner.
 
@@ -111,6 +116,7 @@ class ClaudeCLI:
             thinking_budget: Token budget for extended thinking.
             artifact_saver: Optional artifact saver for S3/storage.
             tracker: Optional operation tracker for progress updates.
+            limiter: Optional call limiter (defaults to the process-wide one).
         """
         self.model = MODEL_MAP.get(model, model)
 
@@ -133,6 +139,7 @@ class ClaudeCLI:
 
         self._artifact_saver = artifact_saver or NoOpArtifactSaver()
         self._tracker = tracker or NoOpOperationTracker()
+        self._limiter = limiter
         self._agent_prompt: str | None = None
 
     def load_agent_prompt(self) -> str | None:
@@ -233,22 +240,28 @@ class ClaudeCLI:
             publish_delay_ms=publish_delay_ms,
         )
 
+        limiter = self._limiter or get_default_limiter()
         try:
-            return await self._run_internal(
-                full_prompt=full_prompt,
-                operation_id=op_id,
-                session_id=sess_id,
-                resume_id=resume_id,
-                thinking_budget=thinking_budget,
-                save_artifacts=save_artifacts,
-                on_chunk=on_chunk,
-                on_thinking=on_thinking,
-                on_stderr=on_stderr,
-                start_time=start_time,
-                publish_delay_ms=publish_delay_ms,
-                context_id=context_id,
-                s3_prompt_url=s3_prompt_url,
-            )
+            async with limiter.limit(
+                "claude", self.model, estimate_tokens(full_prompt)
+            ) as slot:
+                result = await self._run_internal(
+                    full_prompt=full_prompt,
+                    operation_id=op_id,
+                    session_id=sess_id,
+                    resume_id=resume_id,
+                    thinking_budget=thinking_budget,
+                    save_artifacts=save_artifacts,
+                    on_chunk=on_chunk,
+                    on_thinking=on_thinking,
+                    on_stderr=on_stderr,
+                    start_time=start_time,
+                    publish_delay_ms=publish_delay_ms,
+                    context_id=context_id,
+                    s3_prompt_url=s3_prompt_url,
+                )
+                slot.observe(result.error)
+                return result
         except Exception as e:
             await self._tracker.progress(
                 operation_id=op_id,
@@ -372,6 +385,17 @@ class ClaudeCLI:
             "total_cache_creation_tokens": total_cache_creation_tokens,
             "cost_usd": total_cost,
             "models_used": models_used,
+            "model_usage": [
+                {
+                    "model": u.model,
+                    "input_tokens": u.input_tokens,
+                    "output_tokens": u.output_tokens,
+                    "cache_read_tokens": u.cache_read_tokens,
+                    "cache_creation_tokens": u.cache_creation_tokens,
+                    "cost_usd": u.cost_usd,
+                }
+                for u in model_usage
+            ],
             # Legacy fields for backwards compatibility
             "total_tokens": total_input_tokens + total_output_tokens,
             "total_cost_usd": total_cost,
@@ -546,6 +570,8 @@ class ClaudeCLI:
             Tuple of (output, model_usage, thinking, raw_output, error, tools_used, agents_launched,
                       duration_api_ms, num_turns)
         """
+        process: asyncio.subprocess.Process | None = None
+        stderr_task: asyncio.Task[None] | None = None
         try:
             env = os.environ.copy()
 
@@ -793,6 +819,12 @@ class ClaudeCLI:
                 num_turns,
             )
 
+        except asyncio.CancelledError:
+            # Cancelled by the caller: don't leave the CLI running
+            if stderr_task is not None:
+                stderr_task.cancel()
+            await kill_process(process)
+            raise
         except FileNotFoundError:
             return None, [], None, None, "Claude CLI not found", set(), 0, 0, 0
         except Exception as e:
@@ -20,10 +20,14 @@ from typing import Any
 
 from ..hooks import (
     ArtifactSaver,
+    CallLimiter,
     NoOpArtifactSaver,
     NoOpOperationTracker,
     OperationTracker,
+    estimate_tokens,
+    get_default_limiter,
 )
+from ..process import kill_process
 from .models import (
     DEFAULT_GEMINI_TIMEOUT,
     GEMINI_MODEL_MAP,
@@ -101,6 +105,7 @@ class GeminiCLI:
         api_key: str | None = None,
         artifact_saver: ArtifactSaver | None = None,
         tracker: OperationTracker | None = None,
+        limiter: CallLimiter | None = None,
     ):
         """Initialize Gemini CLI runner.
 
@@ -112,6 +117,7 @@ class GeminiCLI:
             api_key: Google API key (defaults to GOOGLE_API_KEY env var).
             artifact_saver: Optional artifact saver for S3/storage.
             tracker: Optional operation tracker for progress updates.
+            limiter: Optional call limiter (defaults to the process-wide one).
         """
         self.model = GEMINI_MODEL_MAP.get(model, model)
 
@@ -126,6 +132,7 @@ class GeminiCLI:
 
         self._artifact_saver = artifact_saver or NoOpArtifactSaver()
         self._tracker = tracker or NoOpOperationTracker()
+        self._limiter = limiter
 
     def session(
         self,
@@ -184,6 +191,30 @@ class GeminiCLI:
         Returns:
             GeminiCLIResult with output, IDs, and stats.
         """
+        limiter = self._limiter or get_default_limiter()
+        async with limiter.limit("gemini", self.model, estimate_tokens(prompt)) as slot:
+            result = await self._run_internal(
+                prompt,
+                operation_id=operation_id,
+                session_id=session_id,
+                save_artifacts=save_artifacts,
+                on_chunk=on_chunk,
+                publish_delay_ms=publish_delay_ms,
+            )
+            slot.observe(result.error)
+            return result
+
+    async def _run_internal(
+        self,
+        prompt: str,
+        *,
+        operation_id: str | None,
+        session_id: str | None,
+        save_artifacts: bool,
+        on_chunk: Callable[[str], Awaitable[None]] | None,
+        publish_delay_ms: int,
+    ) -> GeminiCLIResult:
+        """Run the CLI process (called with a limiter slot held)."""
         start_time = time.time()
 
         # Generate IDs if not provided
@@ -214,6 +245,7 @@ class GeminiCLI:
                 metadata={"model": self.model, "operation_id": op_id},
             )
 
+        process: asyncio.subprocess.Process | None = None
         try:
             # Build environment
             env = os.environ.copy()
@@ -380,6 +412,24 @@ class GeminiCLI:
             if session_stats:
                 result_details["total_tokens"] = session_stats.total_tokens
                 result_details["total_cost_usd"] = session_stats.total_cost_usd
+                result_details["total_input_tokens"] = session_stats.total_input_tokens
+                result_details["total_output_tokens"] = (
+                    session_stats.total_output_tokens
+                )
+                result_details["cost_usd"] = session_stats.total_cost_usd
+                result_details["models_used"] = [
+                    m.model for m in session_stats.model_usage
+                ]
+                result_details["model_usage"] = [
+                    {
+                        "model": m.model,
+                        "input_tokens": m.input_tokens,
+                        "output_tokens": m.output_tokens,
+                        "cache_read_tokens": m.cache_reads,
+                        "cost_usd": m.cost_usd,
+                    }
+                    for m in session_stats.model_usage
+                ]
                 result_details["tool_calls"] = session_stats.tool_calls_total
 
             # Check result status
@@ -436,6 +486,11 @@ class GeminiCLI:
                 tools_used=tools_used,
             )
 
+        except asyncio.CancelledError:
+            # Cancelled by the caller: don't leave the CLI running
+            await kill_process(process)
+            raise
+
         except FileNotFoundError:
             duration_ms = int((time.time() - start_time) * 1000)
             error_msg = "Gemini CLI not found"
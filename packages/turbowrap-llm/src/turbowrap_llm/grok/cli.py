@@ -21,10 +21,14 @@ from typing import Any
 
 from ..hooks import (
     ArtifactSaver,
+    CallLimiter,
     NoOpArtifactSaver,
     NoOpOperationTracker,
     OperationTracker,
+    estimate_tokens,
+    get_default_limiter,
 )
+from ..process import kill_process
 from .models import (
     DEFAULT_GROK_MODEL,
     DEFAULT_GROK_TIMEOUT,
@@ -61,6 +65,7 @@ class GrokCLI:
         api_key: str | None = None,
         artifact_saver: ArtifactSaver | None = None,
         tracker: OperationTracker | None = None,
+        limiter: CallLimiter | None = None,
     ):
         """Initialize Grok CLI runner.
 
@@ -72,6 +77,7 @@ class GrokCLI:
             api_key: Grok API key (defaults to GROK_API_KEY env var).
             artifact_saver: Optional artifact saver for S3/storage.
             tracker: Optional operation tracker for progress updates.
+            limiter: Optional call limiter (defaults to the process-wide one).
         """
         self.model = model
         self.working_dir = working_dir
@@ -81,6 +87,7 @@ class GrokCLI:
 
         self._artifact_saver = artifact_saver or NoOpArtifactSaver()
         self._tracker = tracker or NoOpOperationTracker()
+        self._limiter = limiter
 
     def session(
         self,
@@ -141,6 +148,32 @@ class GrokCLI:
         Returns:
             GrokCLIResult with output, messages, and stats.
         """
+        limiter = self._limiter or get_default_limiter()
+        async with limiter.limit("grok", self.model, estimate_tokens(prompt)) as slot:
+            result = await self._run_internal(
+                prompt,
+                operation_id=operation_id,
+                session_id=session_id,
+                save_artifacts=save_artifacts,
+                on_chunk=on_chunk,
+                headless=headless,
+                publish_delay_ms=publish_delay_ms,
+            )
+            slot.observe(result.error)
+            return result
+
+    async def _run_internal(
+        self,
+        prompt: str,
+        *,
+        operation_id: str | None,
+        session_id: str | None,
+        save_artifacts: bool,
+        on_chunk: Callable[[str], Awaitable[None]] | None,
+        headless: bool,
+        publish_delay_ms: int,
+    ) -> GrokCLIResult:
+        """Run the CLI process (called with a limiter slot held)."""
         start_time = time.time()
 
         # Generate IDs if not provided
@@ -171,6 +204,7 @@ class GrokCLI:
                 metadata={"model": self.model, "operation_id": op_id},
             )
 
+        process: asyncio.subprocess.Process | None = None
         try:
             # Build environment
             env = os.environ.copy()
@@ -327,6 +361,8 @@ class GrokCLI:
                 "model": self.model,
                 "tools_used": sorted(tools_used),
                 "tool_calls": session_stats.tool_calls,
+                "total_input_tokens": session_stats.input_tokens,
+                "total_output_tokens": session_stats.output_tokens,
                 "s3_prompt_url": s3_prompt_url,
                 "s3_output_url": s3_output_url,
             }
@@ -386,6 +422,11 @@ class GrokCLI:
                 tools_used=tools_used,
             )
 
+        except asyncio.CancelledError:
+            # Cancelled by the caller: don't leave the CLI running
+            await kill_process(process)
+            raise
+
         except FileNotFoundError:
             duration_ms = int((time.time() - start_time) * 1000)
             error_msg = "Grok CLI not found. Install: npm install -g @vibe-kit/grok-cli"
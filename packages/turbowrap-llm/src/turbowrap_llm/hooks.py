@@ -1,9 +1,12 @@
 """Protocol interfaces for extensibility.
 
 This module defines Protocol classes that allow injecting custom implementations
-for artifact saving and operation tracking without coupling to specific backends.
+for artifact saving, operation tracking and call limiting without coupling to
+specific backends.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -90,6 +93,44 @@ class OperationTracker(Protocol):
         ...
 
 
+class CallSlot(Protocol):
+    """Permission to run one CLI call, held for the whole run."""
+
+    def observe(self, error: str | None) -> None:
+        """Report the outcome of the call (None on success).
+
+        Limiters use this to back off when the provider rate-limits.
+        """
+        ...
+
+
+@runtime_checkable
+class CallLimiter(Protocol):
+    """Protocol for gating CLI runs (rate limits, concurrency caps).
+
+    Implementations can queue, prioritise or throttle calls across all the
+    CLI wrappers of a process.
+    """
+
+    def limit(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int = 0,
+    ) -> AbstractAsyncContextManager[CallSlot]:
+        """Wait for permission to run a call.
+
+        Args:
+            provider: CLI provider ("claude", "gemini", "grok").
+            model: Model the call will use.
+            input_tokens: Estimated prompt tokens.
+
+        Returns:
+            Async context manager held while the CLI process runs.
+        """
+        ...
+
+
 class NoOpArtifactSaver:
     """No-op implementation of ArtifactSaver."""
 
@@ -127,6 +168,47 @@ class NoOpOperationTracker:
         pass
 
 
+class _NoOpCallSlot:
+    def observe(self, error: str | None) -> None:
+        pass
+
+
+class NoOpCallLimiter:
+    """No-op implementation of CallLimiter (never waits)."""
+
+    @asynccontextmanager
+    async def limit(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int = 0,
+    ) -> AsyncIterator[CallSlot]:
+        yield _NoOpCallSlot()
+
+
+_default_limiter: CallLimiter = NoOpCallLimiter()
+
+
+def set_default_limiter(limiter: CallLimiter | None) -> None:
+    """Set the limiter used by CLIs created without an explicit one.
+
+    Args:
+        limiter: Process-wide limiter (None restores the no-op limiter).
+    """
+    global _default_limiter
+    _default_limiter = limiter or NoOpCallLimiter()
+
+
+def get_default_limiter() -> CallLimiter:
+    """Return the process-wide default limiter."""
+    return _default_limiter
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate for limiter accounting (~4 chars per token)."""
+    return len(text) // 4
+
+
 # Optional S3 implementation (only available if boto3 is installed)
 try:
     import boto3
@@ -0,0 +1,24 @@
+"""Subprocess helpers shared by the CLI wrappers."""
+
+import asyncio
+import contextlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def kill_process(process: asyncio.subprocess.Process | None) -> None:
+    """Kill a CLI subprocess (if still running) and reap it.
+
+    Used when a run is cancelled (e.g. a hedged duplicate lost the race), so
+    the CLI stops spending tokens instead of running on in the background.
+    Safe to call from a cancelled task: the wait is shielded from the
+    pending cancellation.
+    """
+    if process is None or process.returncode is not None:
+        return
+    logger.info(f"Killing cancelled CLI process PID={process.pid}")
+    with contextlib.suppress(ProcessLookupError):
+        process.kill()
+    with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+        await asyncio.wait_for(asyncio.shield(process.wait()), timeout=5.0)
@@ -1,10 +1,14 @@
-"""Tests for hooks module (ArtifactSaver, OperationTracker)."""
+"""Tests for hooks module (ArtifactSaver, OperationTracker, CallLimiter)."""
 
 import pytest
 
 from turbowrap_llm.hooks import (
+    CallLimiter,
     NoOpArtifactSaver,
+    NoOpCallLimiter,
     NoOpOperationTracker,
+    get_default_limiter,
+    set_default_limiter,
 )
 
 
@@ -70,6 +74,33 @@ class TestNoOpOperationTracker:
         )
 
 
+class TestCallLimiter:
+    """Tests for NoOpCallLimiter and the default limiter."""
+
+    @pytest.mark.asyncio
+    async def test_noop_limiter_yields_slot(self) -> None:
+        """Test the no-op limiter admits immediately."""
+        limiter = NoOpCallLimiter()
+
+        async with limiter.limit("claude", "opus", input_tokens=100) as slot:
+            slot.observe(None)
+
+        assert isinstance(limiter, CallLimiter)
+
+    def test_set_default_limiter(self) -> None:
+        """Test set_default_limiter installs and resets the default."""
+        custom = NoOpCallLimiter()
+
+        set_default_limiter(custom)
+        try:
+            assert get_default_limiter() is custom
+        finally:
+            set_default_limiter(None)
+
+        assert isinstance(get_default_limiter(), NoOpCallLimiter)
+        assert get_default_limiter() is not custom
+
+
 class TestCustomImplementations:
     """Tests for custom implementations of protocols."""
 
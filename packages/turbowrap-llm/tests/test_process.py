@@ -0,0 +1,52 @@
+"""Tests for stopping CLI subprocesses when a run is cancelled."""
+
+import asyncio
+import sys
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from turbowrap_llm import ClaudeCLI, GeminiCLI, GrokCLI
+
+SLEEPER = [sys.executable, "-c", "import time; time.sleep(60)"]
+
+
+class TestCancelledRunKillsProcess:
+    """A cancelled run (e.g. a hedged duplicate that lost) must not leave the CLI running."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "make_cli",
+        [
+            lambda: ClaudeCLI(model="sonnet", api_key="test-key"),
+            lambda: GeminiCLI(model="flash"),
+            lambda: GrokCLI(),
+        ],
+        ids=["claude", "gemini", "grok"],
+    )
+    async def test_cancel_kills_and_reaps_process(self, make_cli: Any) -> None:
+        spawn = asyncio.create_subprocess_exec
+        started: list[asyncio.subprocess.Process] = []
+
+        async def fake_cli(*args: str, **kwargs: Any) -> asyncio.subprocess.Process:
+            kwargs.pop("cwd", None)
+            process = await spawn(*SLEEPER, **kwargs)
+            started.append(process)
+            return process
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_cli):
+            run = asyncio.create_task(
+                make_cli().run("Review this", save_artifacts=False)
+            )
+            for _ in range(100):
+                if started:
+                    break
+                await asyncio.sleep(0.02)
+            assert started, "CLI process was never started"
+
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+        assert started[0].returncode is not None
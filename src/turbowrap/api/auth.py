@@ -10,6 +10,7 @@ from botocore.exceptions import ClientError
 from jose import JWTError, jwt
 
 from ..config import get_settings
+from .principal_cache import get_principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +118,12 @@ def verify_token(token: str) -> dict[str, Any] | None:
     """
     settings = get_settings()
 
+    # Already verified and not yet expired
+    cache = get_principal_cache()
+    cached_claims = cache.get_claims(token)
+    if cached_claims is not None:
+        return cached_claims
+
     try:
         # Get JWKS
         jwks = get_jwks()
@@ -144,6 +151,7 @@ def verify_token(token: str) -> dict[str, Any] | None:
             audience=settings.auth.cognito_app_client_id,
             issuer=f"https://cognito-idp.{settings.auth.cognito_region}.amazonaws.com/{settings.auth.cognito_user_pool_id}",
         )
+        cache.put_claims(token, decoded)
         return decoded
 
     except JWTError as e:
@@ -22,6 +22,7 @@ from ..db.models import (
 )
 from ..db.session import get_db as _get_db
 from .auth import verify_token
+from .principal_cache import get_principal_cache
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -29,6 +30,20 @@ def get_db() -> Generator[Session, None, None]:
     yield from _get_db()
 
 
+def _get_access_token(request: Request) -> str | None:
+    """Get the access token for this request (refreshed by middleware, or cookie)."""
+    settings = get_settings()
+
+    # Check for refreshed token from middleware first
+    access_token: str | None = getattr(request.state, "refreshed_access_token", None)
+
+    # Fall back to cookie
+    if not access_token:
+        access_token = request.cookies.get(settings.auth.session_cookie_name)
+
+    return access_token
+
+
 def get_current_user(request: Request) -> dict[str, Any] | None:
     """
     Get current authenticated user from session cookie.
@@ -42,13 +57,7 @@ def get_current_user(request: Request) -> dict[str, Any] | None:
     if not settings.auth.enabled:
         return {"email": "anonymous@local", "username": "anonymous"}
 
-    # Check for refreshed token from middleware first
-    access_token = getattr(request.state, "refreshed_access_token", None)
-
-    # Fall back to cookie
-    if not access_token:
-        access_token = request.cookies.get(settings.auth.session_cookie_name)
-
+    access_token = _get_access_token(request)
     if not access_token:
         return None
 
@@ -93,6 +102,19 @@ def require_auth(
         # Anonymous user (auth disabled) - treat as admin
         return {**current_user, "role": UserRole.ADMIN.value, "user_id": None}
 
+    # Role resolved on an earlier request with the same token
+    access_token = _get_access_token(request)
+    cache = get_principal_cache()
+    cached_user = cache.get_user(access_token) if access_token else None
+    if cached_user is not None:
+        user_id, role = cached_user
+        return {
+            **current_user,
+            "user_id": user_id,
+            "role": role,
+            "is_admin": role == UserRole.ADMIN.value,
+        }
+
     # Look up user in local DB for role
     user = db.query(User).filter(User.cognito_sub == cognito_sub).first()
 
@@ -114,6 +136,9 @@ def require_auth(
         db.commit()
         db.refresh(user)
 
+    if access_token:
+        cache.set_user(access_token, str(user.id), str(user.role))
+
     # Return enriched user info
     return {
         **current_user,
@@ -225,16 +250,7 @@ def require_repo_access(
             detail="Accesso negato a questo repository",
         )
 
-    access = (
-        db.query(UserRepository)
-        .filter(
-            UserRepository.user_id == user_id,
-            UserRepository.repository_id == repository_id,
-        )
-        .first()
-    )
-
-    if not access:
+    if repository_id not in _get_user_repo_ids(db, user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Non hai accesso a questo repository",
@@ -243,6 +259,19 @@ def require_repo_access(
     return repo
 
 
+def _get_user_repo_ids(db: Session, user_id: str) -> frozenset[str]:
+    """Get IDs of repositories assigned to a user (cached)."""
+    cache = get_principal_cache()
+    repo_ids = cache.get_repo_ids(user_id)
+    if repo_ids is None:
+        access = (
+            db.query(UserRepository.repository_id).filter(UserRepository.user_id == user_id).all()
+        )
+        repo_ids = frozenset(str(a.repository_id) for a in access)
+        cache.set_repo_ids(user_id, repo_ids)
+    return repo_ids
+
+
 def get_accessible_repo_ids(
     current_user: dict[str, Any] = Depends(require_auth),
     db: Session = Depends(get_db),
@@ -265,8 +294,7 @@ def get_accessible_repo_ids(
     if not user_id:
         return []
 
-    access = db.query(UserRepository.repository_id).filter(UserRepository.user_id == user_id).all()
-    return [str(a.repository_id) for a in access]
+    return sorted(_get_user_repo_ids(db, user_id))
 
 
 def check_repo_access(
@@ -296,15 +324,7 @@ def check_repo_access(
     if not user_id:
         return False
 
-    access = (
-        db.query(UserRepository)
-        .filter(
-            UserRepository.user_id == user_id,
-            UserRepository.repository_id == repository_id,
-        )
-        .first()
-    )
-    return access is not None
+    return repository_id in _get_user_repo_ids(db, user_id)
 
 
 # =============================================================================
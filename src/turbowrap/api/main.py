@@ -185,6 +185,9 @@ async def _cleanup_stale_processes_task() -> None:
             terminated = await manager.cleanup_stale_processes()
             if terminated > 0:
                 logger.info(f"[CLEANUP] Cleaned up {terminated} stale processes")
+            idle_seconds = get_settings().chat_cli.idle_eviction_seconds
+            if idle_seconds > 0:
+                manager.evict_idle_processes(idle_seconds)
         except asyncio.CancelledError:
             logger.info("[CLEANUP] Background cleanup task cancelled")
             break
@@ -198,17 +201,36 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     import asyncio
 
     from ..chat_cli.process_manager import get_process_manager
+    from ..llm.governor import install_llm_governor, uninstall_llm_governor
+    from .services.browser_pool import close_browser_pool, warm_browser_pool
+    from .services.file_watcher import FileWatcherService
+    from .services.live_status_sampler import get_live_status_sampler
+    from .services.usage_ledger import get_usage_ledger
 
     logger = logging.getLogger(__name__)
 
     # Startup
     init_db()
 
+    # Route every turbowrap_llm CLI call through the global LLM governor
+    install_llm_governor()
+
     # Start background repo check task (non-blocking, repos may take time to clone)
     repo_check_task = asyncio.create_task(_ensure_all_repos_exist_task())
 
     # Start background cleanup task
     cleanup_task = asyncio.create_task(_cleanup_stale_processes_task())
+
+    # Start live status sampler (process scans for /status/live)
+    live_status_sampler = get_live_status_sampler()
+    live_status_sampler.start()
+
+    # Launch warm screenshot browsers (non-blocking, Chromium startup is slow)
+    browser_warm_task = asyncio.create_task(warm_browser_pool())
+
+    # Batched writer for the LLM usage ledger
+    usage_ledger = get_usage_ledger()
+    usage_ledger.start()
     logger.info("[STARTUP] Background tasks started")
 
     yield
@@ -224,6 +246,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await cleanup_task
     except asyncio.CancelledError:
         pass
+    await live_status_sampler.stop()
 
     # Terminate all remaining CLI processes
     manager = get_process_manager()
@@ -231,6 +254,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if terminated > 0:
         logger.info(f"[SHUTDOWN] Terminated {terminated} CLI processes")
 
+    # Close warm screenshot browsers
+    browser_warm_task.cancel()
+    try:
+        await browser_warm_task
+    except asyncio.CancelledError:
+        pass
+    await close_browser_pool()
+
+    # Stop watching repositories (publishes pending change batches)
+    FileWatcherService.get_instance().stop()
+
+    # Write usage still buffered (including calls failed by terminate_all)
+    await usage_ledger.stop()
+
+    uninstall_llm_governor()
+
 
 def create_app() -> FastAPI:
     """Create FastAPI application."""
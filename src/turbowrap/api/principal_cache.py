@@ -0,0 +1,210 @@
+"""Cache of authenticated principals.
+
+Every authenticated request verifies the Cognito JWT (JWKS lookup + RSA),
+loads the local User for its role and, on repo-scoped routes, queries
+UserRepository. HTMX pages fire dozens of partial requests per view, so the
+results are cached here:
+
+- Verified claims, user ID and role, keyed by token fingerprint (SHA-256)
+  and never kept past the token's ``exp``.
+- Accessible repository IDs, keyed by local user ID.
+
+Entries are invalidated when a user's role or repository assignments change
+(see ``routes/users.py``). The TTL bounds staleness across workers.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ..config import get_settings
+
+
+@dataclass
+class CachedPrincipal:
+    """Verified token claims plus the local user resolved for them."""
+
+    claims: dict[str, Any]
+    expires_at: float
+    user_id: str | None = None
+    role: str | None = None
+
+
+@dataclass
+class _CachedRepoIds:
+    repo_ids: frozenset[str]
+    expires_at: float
+
+
+class PrincipalCache:
+    """Thread-safe LRU cache of principals, bounded by TTL and token expiry."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._principals: OrderedDict[str, CachedPrincipal] = OrderedDict()
+        self._repo_ids: dict[str, _CachedRepoIds] = {}
+        # user_id -> token fingerprints, for invalidation
+        self._user_tokens: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def fingerprint(token: str) -> str:
+        """Hash a token so raw JWTs are never kept as dict keys."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _get_entry(self, token: str) -> CachedPrincipal | None:
+        """Look up a live entry. Caller holds the lock."""
+        key = self.fingerprint(token)
+        entry = self._principals.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(key)
+            self.misses += 1
+            return None
+        self._principals.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _drop(self, key: str) -> None:
+        """Remove a principal and its user index. Caller holds the lock."""
+        entry = self._principals.pop(key, None)
+        if entry is not None and entry.user_id is not None:
+            tokens = self._user_tokens.get(entry.user_id)
+            if tokens is not None:
+                tokens.discard(key)
+                if not tokens:
+                    del self._user_tokens[entry.user_id]
+
+    def get_claims(self, token: str) -> dict[str, Any] | None:
+        """Get cached verified claims for ``token``."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._get_entry(token)
+            return dict(entry.claims) if entry else None
+
+    def put_claims(self, token: str, claims: dict[str, Any]) -> None:
+        """Cache verified claims until the token expires (at most ``ttl_seconds``)."""
+        if not self.enabled:
+            return
+        now = self._clock()
+        expires_at = now + self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+
+        key = self.fingerprint(token)
+        with self._lock:
+            self._drop(key)
+            self._principals[key] = CachedPrincipal(claims=dict(claims), expires_at=expires_at)
+            while len(self._principals) > self.max_entries:
+                self._drop(next(iter(self._principals)))
+
+    def get_user(self, token: str) -> tuple[str, str] | None:
+        """Get cached ``(user_id, role)`` resolved for ``token``."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._get_entry(token)
+            if entry is None or entry.user_id is None or entry.role is None:
+                return None
+            return entry.user_id, entry.role
+
+    def set_user(self, token: str, user_id: str, role: str) -> None:
+        """Attach the local user to an already cached principal."""
+        if not self.enabled:
+            return
+        key = self.fingerprint(token)
+        with self._lock:
+            entry = self._principals.get(key)
+            if entry is None:
+                return
+            entry.user_id = user_id
+            entry.role = role
+            self._user_tokens.setdefault(user_id, set()).add(key)
+
+    def get_repo_ids(self, user_id: str) -> frozenset[str] | None:
+        """Get cached accessible repository IDs for a user."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            cached = self._repo_ids.get(user_id)
+            if cached is None or cached.expires_at <= self._clock():
+                self._repo_ids.pop(user_id, None)
+                return None
+            return cached.repo_ids
+
+    def set_repo_ids(self, user_id: str, repo_ids: frozenset[str]) -> None:
+        """Cache accessible repository IDs for a user."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._repo_ids[user_id] = _CachedRepoIds(
+                repo_ids=repo_ids, expires_at=self._clock() + self.ttl_seconds
+            )
+            while len(self._repo_ids) > self.max_entries:
+                del self._repo_ids[next(iter(self._repo_ids))]
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget everything cached for a user (role or repo assignments changed)."""
+        with self._lock:
+            for key in list(self._user_tokens.get(user_id, ())):
+                self._drop(key)
+            self._repo_ids.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Forget all cached principals."""
+        with self._lock:
+            self._principals.clear()
+            self._repo_ids.clear()
+            self._user_tokens.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "principals": len(self._principals),
+                "users_with_repo_ids": len(self._repo_ids),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Singleton instance
+_cache: PrincipalCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get singleton PrincipalCache configured from settings."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                auth = get_settings().auth
+                _cache = PrincipalCache(
+                    ttl_seconds=auth.principal_cache_ttl,
+                    max_entries=auth.principal_cache_max_entries,
+                )
+    return _cache
@@ -3,7 +3,6 @@
 import asyncio
 import json
 import logging
-import os
 import re
 import uuid
 from collections.abc import AsyncIterator
@@ -13,6 +12,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
 
@@ -20,9 +20,10 @@ from turbowrap_llm import GeminiCLI
 
 from ...db.models import Issue, IssueStatus, Repository, Task
 from ...review.reviewers.utils.json_extraction import parse_llm_json
-from ...utils.aws_secrets import get_anthropic_api_key
+from ...review.utils.fingerprint import issue_fingerprint
 from ...utils.git_utils import get_current_branch
-from ...utils.lint_utils import parse_lint_json_from_llm
+from ...utils.lint_engine import LintEngine, lint_issue_code, lint_severity
+from ...utils.lint_utils import LintIssue as LinterFinding
 from ..deps import get_db, get_or_404
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,6 @@ router = APIRouter(prefix="/analysis", tags=["analysis"])
 
 # Agent file paths
 AGENTS_DIR = Path(__file__).parent.parent.parent.parent.parent / "agents"
-LINTER_ANALYZER_AGENT = AGENTS_DIR / "linter_analyzer.md"
 LINT_FIXER_AGENT = AGENTS_DIR / "lint_fixer.md"
 
 # Linting types by category
@@ -63,6 +63,10 @@ class LintRequest(BaseModel):
 
     repository_id: str = Field(..., description="Repository ID")
     task_id: str | None = Field(default=None, description="Task ID to associate issues with")
+    full: bool = Field(default=False, description="Ignore cached results and lint every file")
+    triage: bool = Field(
+        default=False, description="Let Gemini Flash adjust severity and suggest fixes"
+    )
 
 
 class LintIssue(BaseModel):
@@ -91,19 +95,139 @@ class LintResult(BaseModel):
     message: str
 
 
+# Most new lint issues sent to the optional LLM triage
+MAX_TRIAGE_ISSUES = 50
+
+LINT_TRIAGE_PROMPT = """You are triaging linter findings for this repository.
+For each issue below, look at the code and decide its real severity
+(CRITICAL, HIGH, MEDIUM, LOW) and a short suggested fix.
+
+Issues (JSON):
+{issues}
+
+Respond ONLY with a JSON array, one object per issue:
+[{{"id": "<id>", "severity": "HIGH", "suggested_fix": "..."}}]
+"""
+
+
+def _store_lint_issues(
+    db: Session, repository_id: str, task_id: str, findings: list[LinterFinding]
+) -> list[str]:
+    """Bulk-insert linter findings as issues, skipping ones already open.
+
+    Returns:
+        IDs of the created issues
+    """
+    open_rows: list[Any] = (
+        db.query(Issue.file, Issue.line, Issue.issue_code)
+        .filter(
+            Issue.repository_id == repository_id,
+            Issue.category == "linting",
+            Issue.status.in_([IssueStatus.OPEN.value, IssueStatus.IN_PROGRESS.value]),
+        )
+        .all()
+    )
+    existing = {(row.file, row.line, row.issue_code) for row in open_rows}
+
+    now = datetime.utcnow()
+    rows: list[dict[str, Any]] = []
+    for finding in findings:
+        issue_code = lint_issue_code(finding)
+        key = (finding.file, finding.line or None, issue_code)
+        if key in existing:
+            continue
+        existing.add(key)
+        title = finding.message.splitlines()[0][:500] if finding.message else "Linting issue"
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "task_id": task_id,
+                "repository_id": repository_id,
+                "issue_code": issue_code,
+                "severity": lint_severity(finding),
+                "category": "linting",
+                "rule": finding.code[:100] or None,
+                "fingerprint": issue_fingerprint(
+                    finding.file, "linting", f"{finding.code} {title}", None, finding.line
+                ),
+                "file": finding.file[:500],
+                "line": finding.line or None,
+                "title": title,
+                "description": f"{finding.linter} {finding.code}: {finding.message}".strip(),
+                "flagged_by": [finding.linter],
+                "status": IssueStatus.OPEN.value,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+    if rows:
+        db.execute(insert(Issue), rows)
+    db.commit()
+    logger.info(
+        f"[LINT] {len(rows)} new issues for {repository_id} "
+        f"({len(findings) - len(rows)} already open)"
+    )
+    return [row["id"] for row in rows]
+
+
+async def _triage_lint_issues(db: Session, repo_path: Path, issue_ids: list[str]) -> int:
+    """Let Gemini Flash re-rate severity and suggest fixes for new lint issues.
+
+    Returns:
+        Number of issues updated
+    """
+    severity_rank = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+    issues = db.query(Issue).filter(Issue.id.in_(issue_ids[:1000])).all()
+    issues.sort(key=lambda i: severity_rank.get(str(i.severity), 4))
+    issues = issues[:MAX_TRIAGE_ISSUES]
+    payload = [
+        {"id": i.id, "file": i.file, "line": i.line, "rule": i.rule, "message": i.title}
+        for i in issues
+    ]
+
+    gemini_cli = GeminiCLI(working_dir=repo_path, model="flash", timeout=300)
+    result = await gemini_cli.run(prompt=LINT_TRIAGE_PROMPT.format(issues=json.dumps(payload)))
+    if not result.success:
+        logger.warning(f"[LINT] Triage failed: {result.error}")
+        return 0
+
+    verdicts = parse_llm_json(result.output, default=[])
+    if not isinstance(verdicts, list):
+        return 0
+    by_id = {i.id: i for i in issues}
+    updated = 0
+    for verdict in verdicts:
+        if not isinstance(verdict, dict):
+            continue
+        issue = by_id.get(verdict.get("id"))
+        if issue is None:
+            continue
+        severity = str(verdict.get("severity", "")).upper()
+        if severity in severity_rank:
+            issue.severity = severity  # type: ignore[assignment]
+        if verdict.get("suggested_fix"):
+            issue.suggested_fix = str(verdict["suggested_fix"])  # type: ignore[assignment]
+        issue.flagged_by = [*(issue.flagged_by or []), "gemini_triage"]  # type: ignore[assignment]
+        updated += 1
+    db.commit()
+    return updated
+
+
 @router.post("/lint")
 async def run_lint_analysis(
     request: LintRequest,
     db: Session = Depends(get_db),
 ) -> EventSourceResponse:
     """
-    Run linting analysis on a repository using Claude CLI.
+    Run linting analysis on a repository.
 
-    Uses the linter_analyzer agent to:
-    1. Detect project type (Python, TypeScript, etc.)
-    2. Run appropriate linting tools
-    3. Parse output into structured issues
-    4. Create issues in the database
+    Uses the native lint engine (utils/lint_engine.py) to:
+    1. Detect configured linters (ruff, eslint, mypy)
+    2. Run them in parallel on files changed since the last lint
+    3. Map their JSON output (plus cached results) to issues
+    4. Create new issues in the database in bulk
+    5. Optionally triage the new issues with Gemini Flash
 
     Returns SSE stream with progress updates.
     """
@@ -150,72 +274,31 @@ async def run_lint_analysis(
                 ),
             }
 
-            # Load agent prompt
-            lint_prompt = _load_agent(LINTER_ANALYZER_AGENT)
-            if not lint_prompt:
-                yield {
-                    "event": "lint_error",
-                    "data": json.dumps(
-                        {
-                            "error": "Linter analyzer agent not found",
-                        }
-                    ),
-                }
-                return
-
-            # Build environment with API key
-            env = os.environ.copy()
-            api_key = get_anthropic_api_key()
-            if api_key:
-                env["ANTHROPIC_API_KEY"] = api_key
-            # Workaround: Bun file watcher bug on macOS /var/folders
-            env["TMPDIR"] = "/tmp"
-
-            # Find Claude CLI
-            cli_path = "/Users/niccolocalandri/.claude/local/claude"
-            if not Path(cli_path).exists():
-                cli_path = "claude"  # Fallback to PATH
-
+            engine = LintEngine(repo_path, use_cache=not request.full)
             yield {
                 "event": "lint_progress",
                 "data": json.dumps(
                     {
-                        "message": "Running linting tools with Claude CLI...",
+                        "message": "Running linters...",
                         "phase": "analysis",
                     }
                 ),
             }
 
-            # Run Claude CLI with lint prompt
-            process = await asyncio.create_subprocess_exec(
-                cli_path,
-                "--print",
-                "--verbose",
-                "--dangerously-skip-permissions",
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(repo_path),
-                env=env,
-            )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=lint_prompt.encode()),
-                timeout=300,  # 5 minutes timeout for linting
-            )
-
-            output = stdout.decode() if stdout else ""
-            error = stderr.decode() if stderr else ""
+            run = await engine.run()
+            summary = run.summary()
 
-            if process.returncode != 0:
-                logger.error(f"Lint analysis failed: {error}")
+            if not run.linters and run.skipped:
+                reasons = ", ".join(f"{name} {why}" for name, why in run.skipped.items())
                 yield {
                     "event": "lint_error",
-                    "data": json.dumps(
-                        {
-                            "error": f"Linting failed: {error[:500]}",
-                        }
-                    ),
+                    "data": json.dumps({"error": f"No linter could run ({reasons})"}),
+                }
+                return
+            if run.errors and not run.issues:
+                yield {
+                    "event": "lint_error",
+                    "data": json.dumps({"error": f"Linting failed: {'; '.join(run.errors)[:500]}"}),
                 }
                 return
 
@@ -223,95 +306,38 @@ async def run_lint_analysis(
                 "event": "lint_progress",
                 "data": json.dumps(
                     {
-                        "message": "Parsing linting results...",
-                        "phase": "parsing",
+                        "message": (
+                            f"Found {len(run.issues)} issues "
+                            f"({run.files_linted} files linted, {run.files_cached} cached), "
+                            "creating in database..."
+                        ),
+                        "phase": "creating",
+                        "issues_found": len(run.issues),
                     }
                 ),
             }
 
-            # Parse JSON output from Claude
-            issues = parse_lint_json_from_llm(output)
+            created_ids = _store_lint_issues(db, request.repository_id, task_id, run.issues)
+            issues_created = len(created_ids)
 
-            if not issues:
+            if request.triage and created_ids:
                 yield {
-                    "event": "lint_complete",
+                    "event": "lint_progress",
                     "data": json.dumps(
                         {
-                            "message": "No issues found!",
-                            "issues_found": 0,
-                            "issues_created": 0,
-                            "task_id": task_id,
+                            "message": "Triaging new issues with Gemini Flash...",
+                            "phase": "triage",
                         }
                     ),
                 }
-                # Update task status
-                task_obj = db.query(Task).filter(Task.id == task_id).first()
-                if task_obj:
-                    task_obj.status = "completed"  # type: ignore[assignment]
-                    task_obj.result = {"issues_found": 0}  # type: ignore[assignment]
-                    db.commit()
-                return
-
-            yield {
-                "event": "lint_progress",
-                "data": json.dumps(
-                    {
-                        "message": f"Found {len(issues)} issues, creating in database...",
-                        "phase": "creating",
-                        "issues_found": len(issues),
-                    }
-                ),
-            }
-
-            # Create issues in database
-            for issue_data in issues:
-                # Check for duplicates (same file, line, issue_code)
-                existing = (
-                    db.query(Issue)
-                    .filter(
-                        Issue.repository_id == request.repository_id,
-                        Issue.file == issue_data.get("file", ""),
-                        Issue.line == issue_data.get("line"),
-                        Issue.issue_code == issue_data.get("issue_code", ""),
-                        Issue.status.in_(["open", "in_progress"]),
-                    )
-                    .first()
-                )
-
-                if existing:
-                    logger.debug(f"Skipping duplicate issue: {issue_data.get('issue_code')}")
-                    continue
-
-                issue = Issue(
-                    id=str(uuid.uuid4()),
-                    task_id=task_id,
-                    repository_id=request.repository_id,
-                    issue_code=issue_data.get("issue_code", f"LINT-{issues_created + 1:03d}"),
-                    severity=issue_data.get("severity", "MEDIUM").upper(),
-                    category=issue_data.get("category", "linting"),
-                    rule=issue_data.get("rule"),
-                    file=issue_data.get("file", "unknown"),
-                    line=issue_data.get("line"),
-                    title=issue_data.get("title", "Linting issue"),
-                    description=issue_data.get("description", ""),
-                    current_code=issue_data.get("current_code"),
-                    suggested_fix=issue_data.get("suggested_fix"),
-                    flagged_by=issue_data.get("flagged_by", ["linter"]),
-                    status=IssueStatus.OPEN.value,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                db.add(issue)
-                issues_created += 1
-
-            db.commit()
+                summary["issues_triaged"] = await _triage_lint_issues(db, repo_path, created_ids)
 
             # Update task status
             task_obj = db.query(Task).filter(Task.id == task_id).first()
             if task_obj:
                 task_obj.status = "completed"  # type: ignore[assignment]
                 task_obj.result = {  # type: ignore[assignment]
-                    "issues_found": len(issues),
+                    **summary,
                     "issues_created": issues_created,
                 }
                 db.commit()
@@ -320,23 +346,19 @@ async def run_lint_analysis(
                 "event": "lint_complete",
                 "data": json.dumps(
                     {
-                        "message": f"Analysis complete! Created {issues_created} issues.",
-                        "issues_found": len(issues),
+                        "message": (
+                            f"Analysis complete! Created {issues_created} issues."
+                            if run.issues
+                            else "No issues found!"
+                        ),
+                        "issues_found": len(run.issues),
                         "issues_created": issues_created,
                         "task_id": task_id,
+                        **summary,
                     }
                 ),
             }
 
-        except asyncio.TimeoutError:
-            yield {
-                "event": "lint_error",
-                "data": json.dumps(
-                    {
-                        "error": "Lint analysis timed out after 5 minutes",
-                    }
-                ),
-            }
         except Exception as e:
             logger.exception("Lint analysis failed")
             yield {
@@ -228,7 +228,7 @@ def trigger_endpoint_detection(
     try:
         result = detect_endpoints(str(repo.local_path), use_ai=use_ai)
 
-        # Save to new Endpoint table (upsert - no duplicates)
+        # Sync the Endpoint table (only new/changed rows are written)
         saved_count = save_endpoints_to_db(db, str(repo.id), result)
 
         # Also save summary to metadata for backwards compatibility
@@ -244,7 +244,7 @@ def trigger_endpoint_detection(
 
         return DetectionResponse(
             status="success",
-            message=f"Detected {len(result.routes)} endpoints ({saved_count} saved) using {result.framework} framework",
+            message=f"Detected {len(result.routes)} endpoints ({saved_count} new or changed) using {result.framework} framework",
             endpoint_count=len(result.routes),
         )
 
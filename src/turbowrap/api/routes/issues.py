@@ -13,6 +13,7 @@ from sqlalchemy import case
 from sqlalchemy.orm import Session
 
 from ...db.models import Issue, IssueStatus, Operation, Repository, is_valid_issue_transition
+from ...utils.artifact_cache import get_artifact_cache
 from ...utils.aws_clients import get_s3_client
 from ...utils.git_utils import is_commit_in_branch
 from ..deps import (
@@ -667,9 +668,8 @@ def get_issue_fix_log(
                 status_code=404, detail=f"Fix log not found in S3 for session {session_id}"
             )
 
-        # Fetch the log
-        response = s3_client.get_object(Bucket=S3_BUCKET, Key=s3_key)
-        log_data: dict[str, Any] = json.loads(response["Body"].read().decode("utf-8"))
+        # Fetch the log (cached locally, revalidated by ETag)
+        log_data: dict[str, Any] = json.loads(get_artifact_cache().get_text(S3_BUCKET, s3_key))
 
         return FixLogResponse(
             session_id=log_data.get("session_id", session_id),
@@ -18,7 +18,7 @@ from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
@@ -207,7 +207,8 @@ async def get_operation_stats(
     """
     Get operation statistics for the specified time period.
 
-    Returns counts by status, type, and daily breakdown.
+    Returns counts by status and type, average durations, and LLM token/cost
+    totals per operation type (read from the hourly usage rollups).
     """
     from datetime import timedelta
 
@@ -215,6 +216,7 @@ async def get_operation_stats(
 
     from ...db.models import Operation as DBOperation
     from ...db.session import get_session_local
+    from ..services.usage_ledger import get_usage_ledger
 
     SessionLocal = get_session_local()
     db = SessionLocal()
@@ -263,12 +265,61 @@ async def get_operation_stats(
             "avg_duration_seconds": {
                 k: round(v, 2) if v else None for k, v in avg_durations.items()
             },
+            "usage_by_type": {
+                row.pop("operation_type"): row
+                for row in get_usage_ledger().query(db, since, group_by=["operation_type"])
+            },
         }
 
     finally:
         db.close()
 
 
+@router.get("/usage")
+async def get_usage(
+    days: int = Query(7, ge=1, le=366, description="Number of days to include"),
+    group_by: list[str] = Query(
+        ["repository_id"],
+        description="Any of: repository_id, provider, model, operation_type, day, hour",
+    ),
+    repository_id: str | None = Query(None, description="Only this repository"),
+    provider: str | None = Query(None, description="Only this provider (claude, gemini, grok)"),
+) -> dict[str, Any]:
+    """
+    Get LLM token usage and cost, aggregated from the hourly usage rollups.
+
+    E.g. weekly spend per repository: ``/operations/usage?days=7``.
+    Reads O(hours x groups) rollup rows, never the operations JSON.
+    """
+    from datetime import timedelta
+
+    from ...db.session import get_session_local
+    from ..services.usage_ledger import get_usage_ledger
+
+    ledger = get_usage_ledger()
+    since = datetime.utcnow() - timedelta(days=days)
+
+    SessionLocal = get_session_local()
+    db = SessionLocal()
+    try:
+        rows = ledger.query(
+            db, since, group_by=group_by, repository_id=repository_id, provider=provider
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        db.close()
+
+    return {
+        "period_days": days,
+        "group_by": group_by,
+        "total_cost_usd": round(sum(row["cost_usd"] for row in rows), 6),
+        "total_calls": sum(row["calls"] for row in rows),
+        "groups": rows,
+        "ledger": ledger.stats(),
+    }
+
+
 @router.post("/{operation_id}/complete")
 async def complete_operation(operation_id: str) -> dict[str, str]:
     """
@@ -446,6 +497,33 @@ async def reset_stuck_issues(
         db.close()
 
 
+async def _fetch_s3_artifact(s3_url: str) -> str | None:
+    """Fetch an operation artifact by S3 URL.
+
+    Both pre-signed HTTPS and legacy s3:// URLs are resolved to bucket/key and
+    read through the local artifact cache; other HTTPS URLs are fetched directly.
+
+    Returns:
+        Artifact text, or None if the URL scheme is not supported
+    """
+    from ...utils.artifact_cache import get_artifact_cache, parse_s3_url
+
+    location = parse_s3_url(s3_url)
+    if location:
+        bucket, key = location
+        return await get_artifact_cache().aget_text(bucket, key)
+
+    if s3_url.startswith("https://"):
+        import httpx
+
+        async with httpx.AsyncClient() as client:
+            response = await client.get(s3_url, timeout=30)
+            response.raise_for_status()
+            return response.text
+
+    return None
+
+
 @router.get("/{operation_id}/prompt")
 async def get_operation_prompt(operation_id: str) -> dict[str, Any]:
     """
@@ -493,42 +571,13 @@ async def get_operation_prompt(operation_id: str) -> dict[str, Any]:
         # Handle S3 URLs (both legacy s3:// and pre-signed HTTPS)
         if s3_url:
             try:
-                import httpx
-
-                # Pre-signed HTTPS URL - fetch directly
-                if s3_url.startswith("https://"):
-                    logger.info("[PROMPT] Fetching from pre-signed URL")
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(s3_url, timeout=30)
-                        response.raise_for_status()
-                        content = response.text
-                    logger.info(
-                        f"[PROMPT] Pre-signed URL fetch successful, content_len={len(content)}"
-                    )
-                    return {
-                        "status": "ok",
-                        "source": "s3_presigned",
-                        "s3_url": s3_url,
-                        "content": content,
-                    }
-
-                # Legacy s3:// URL - fetch via boto3
-                if s3_url.startswith("s3://"):
-                    from ...utils.aws_clients import get_s3_client
-
-                    parts = s3_url.replace("s3://", "").split("/", 1)
-                    bucket = parts[0]
-                    key = parts[1] if len(parts) > 1 else ""
-
-                    logger.info(f"[PROMPT] Fetching from S3: bucket={bucket}, key={key}")
-                    s3 = get_s3_client()
-                    response = s3.get_object(Bucket=bucket, Key=key)
-                    content = response["Body"].read().decode("utf-8")
+                logger.info(f"[PROMPT] Fetching from S3: {s3_url[:120]}")
+                content = await _fetch_s3_artifact(s3_url)
+                if content is not None:
                     logger.info(f"[PROMPT] S3 fetch successful, content_len={len(content)}")
-
                     return {
                         "status": "ok",
-                        "source": "s3",
+                        "source": "s3_presigned" if s3_url.startswith("https://") else "s3",
                         "s3_url": s3_url,
                         "content": content,
                     }
@@ -610,36 +659,11 @@ async def get_operation_output(operation_id: str) -> dict[str, Any]:
 
     if s3_url:
         try:
-            import httpx
-
-            # Pre-signed HTTPS URL - fetch directly
-            if s3_url.startswith("https://"):
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(s3_url, timeout=30)
-                    response.raise_for_status()
-                    content = response.text
+            content = await _fetch_s3_artifact(s3_url)
+            if content is not None:
                 return {
                     "status": "ok",
-                    "source": "s3_presigned",
-                    "s3_url": s3_url,
-                    "content": content,
-                }
-
-            # Legacy s3:// URL - fetch via boto3
-            if s3_url.startswith("s3://"):
-                from ...utils.aws_clients import get_s3_client
-
-                parts = s3_url.replace("s3://", "").split("/", 1)
-                bucket = parts[0]
-                key = parts[1] if len(parts) > 1 else ""
-
-                s3 = get_s3_client()
-                response = s3.get_object(Bucket=bucket, Key=key)
-                content = response["Body"].read().decode("utf-8")
-
-                return {
-                    "status": "ok",
-                    "source": "s3",
+                    "source": "s3_presigned" if s3_url.startswith("https://") else "s3",
                     "s3_url": s3_url,
                     "content": content,
                 }
@@ -655,13 +679,24 @@ async def get_operation_output(operation_id: str) -> dict[str, Any]:
 
 
 @router.get("/{operation_id}/stream")
-async def stream_operation_output(operation_id: str) -> EventSourceResponse:
+async def stream_operation_output(
+    operation_id: str,
+    last_event_id: int | None = Query(
+        default=None, ge=0, description="Resume after this event (same as Last-Event-ID)"
+    ),
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> EventSourceResponse:
     """
     Stream live output for an operation via SSE.
 
     This endpoint allows the frontend to subscribe to real-time output
     from an operation (fix, review, etc.) as it runs.
 
+    Stream events carry increasing ids and are kept in a bounded log per
+    operation: clients connecting late get everything recorded so far, and
+    reconnecting clients (Last-Event-ID header, sent automatically by
+    EventSource, or ?last_event_id=) only get what they missed.
+
     Events:
     - connected: Connection established
     - chunk: Output chunk {content: "..."}
@@ -669,9 +704,25 @@ async def stream_operation_output(operation_id: str) -> EventSourceResponse:
     - complete: Operation finished {success: bool}
     - thinking: Extended thinking content (Claude)
     - tool_call: Tool invocation info
+    - truncated: Some requested events were dropped from the log {missed_events: n}
+      (fetch the full output from /output)
     - ping: Keepalive (every 30s)
     """
     tracker = get_tracker()
+    if last_event_id is None and last_event_id_header and last_event_id_header.isdigit():
+        last_event_id = int(last_event_id_header)
+
+    def complete_event(op: Any) -> dict[str, str]:
+        return {
+            "event": "complete",
+            "data": json.dumps(
+                {
+                    "status": op.status if op else "unknown",
+                    "result": op.result if op else None,
+                    "error": op.error if op else None,
+                }
+            ),
+        }
 
     async def generate() -> AsyncGenerator[dict[str, str], None]:
         # Find operation in tracker
@@ -688,63 +739,44 @@ async def stream_operation_output(operation_id: str) -> EventSourceResponse:
             }
             return
 
-        # Send connected event with operation info
-        yield {
-            "event": "connected",
-            "data": json.dumps(
-                {
-                    "operation_id": operation_id,
-                    "type": op.operation_type.value,
-                    "status": op.status,
-                    "repository_name": op.repository_name,
-                }
-            ),
-        }
+        # Subscribe before anything is sent: the queue starts with the
+        # recorded events, so nothing emitted in between is lost
+        queue = tracker.subscribe(operation_id, last_event_id)
 
-        # If operation already completed, send final status and return
-        if op.status in ("completed", "failed", "cancelled"):
+        try:
+            # Send connected event with operation info
             yield {
-                "event": "complete",
+                "event": "connected",
                 "data": json.dumps(
                     {
+                        "operation_id": operation_id,
+                        "type": op.operation_type.value,
                         "status": op.status,
-                        "result": op.result,
-                        "error": op.error,
+                        "repository_name": op.repository_name,
                     }
                 ),
             }
-            return
 
-        # Subscribe to operation events
-        queue = tracker.subscribe(operation_id)
-
-        try:
+            finished = op.status in ("completed", "failed", "cancelled")
             while True:
                 try:
-                    # Wait for event with timeout for keepalive
-                    event = await asyncio.wait_for(queue.get(), timeout=30)
+                    if finished:
+                        # Replay what was recorded, then report the final status
+                        event = queue.get_nowait() if not queue.empty() else None
+                    else:
+                        # Wait for event with timeout for keepalive
+                        event = await asyncio.wait_for(queue.get(), timeout=30)
 
                     if event is None:
                         # None signals operation completion
-                        # Get final status
-                        final_op = tracker.get(operation_id)
-                        yield {
-                            "event": "complete",
-                            "data": json.dumps(
-                                {
-                                    "status": final_op.status if final_op else "unknown",
-                                    "result": final_op.result if final_op else None,
-                                    "error": final_op.error if final_op else None,
-                                }
-                            ),
-                        }
+                        yield complete_event(tracker.get(operation_id))
                         break
 
                     # Forward event to client
-                    yield {
-                        "event": event["type"],
-                        "data": json.dumps(event["data"]),
-                    }
+                    message = {"event": event["type"], "data": json.dumps(event["data"])}
+                    if event.get("id") is not None:
+                        message["id"] = str(event["id"])
+                    yield message
 
                 except asyncio.TimeoutError:
                     # Send ping to keep connection alive
@@ -753,17 +785,7 @@ async def stream_operation_output(operation_id: str) -> EventSourceResponse:
                     # Check if operation is still active
                     current_op = tracker.get(operation_id)
                     if current_op and current_op.status != "in_progress":
-                        yield {
-                            "event": "complete",
-                            "data": json.dumps(
-                                {
-                                    "status": current_op.status,
-                                    "result": current_op.result,
-                                    "error": current_op.error,
-                                }
-                            ),
-                        }
-                        break
+                        finished = True
 
         except asyncio.CancelledError:
             logger.debug(f"[STREAM] Client disconnected from {operation_id[:8]}")
@@ -16,6 +16,7 @@ from ...db.models import Repository
 from ...llm.gemini import GeminiCLI
 from ...review.reviewers.utils.json_extraction import parse_llm_json
 from ...tools.dependency_parser import build_dependency_graph, generate_mermaid_diagrams
+from ...utils.structure_docs import STRUCTURE_XML_PATH, get_structure_cache
 from ..deps import get_db
 
 logger = logging.getLogger(__name__)
@@ -150,17 +151,14 @@ async def _generate_readme_stream(
 
 def _load_structure_file(repo_path: Path) -> str:
     """Load structure.xml or STRUCTURE.md from repo."""
-    # Try XML first (more detailed)
-    xml_path = repo_path / ".llms" / "structure.xml"
-    if xml_path.exists():
-        try:
-            content = xml_path.read_text(encoding="utf-8")
-            # Truncate if too long
-            if len(content) > 50000:
-                content = content[:50000] + "\n... (truncated)"
-            return content
-        except Exception:
-            pass
+    # Try XML first (more detailed); whole directories within ~50000 chars
+    document = get_structure_cache().get(repo_path / STRUCTURE_XML_PATH)
+    if document is not None:
+        content = document.render(max_tokens=12500)
+        # Unparseable XML comes back whole
+        if len(content) > 50000:
+            content = content[:50000] + "\n... (truncated)"
+        return content
 
     # Try STRUCTURE.md
     md_path = repo_path / "STRUCTURE.md"
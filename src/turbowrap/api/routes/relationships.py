@@ -14,11 +14,15 @@ from ...core.repo_manager import RepoManager
 from ...db.models import LinkType, Repository, RepositoryLink
 from ...llm import GeminiClient
 from ...review.reviewers.utils.json_extraction import parse_llm_json
+from ...utils.structure_docs import STRUCTURE_XML_PATH, get_structure_cache
 from ..deps import get_db, require_auth
 from ..utils.sse import sse_error, sse_event, sse_progress
 
 router = APIRouter(prefix="/relationships", tags=["relationships"])
 
+# Roughly the 8000 characters of structure each repository gets in the prompt
+STRUCTURE_MAX_TOKENS = 2000
+
 
 # --- Schemas ---
 
@@ -149,16 +153,20 @@ Se non trovi connessioni, rispondi con connections: [] e un summary esplicativo.
 
 
 def load_structure_content(repo: Repository) -> str | None:
-    """Load the main STRUCTURE.md content for a repository."""
+    """Load the structure documentation of a repository.
+
+    Prefers .llms/structure.xml, falling back to STRUCTURE.md files. Reads go
+    through the shared structure cache, so analyses that revisit the same
+    repositories don't re-read them. XML documents are cut to whole
+    directories within the prompt's budget rather than mid-tag.
+    """
     repo_path = Path(str(repo.local_path))
+    cache = get_structure_cache()
 
-    # Try root STRUCTURE.md first
-    structure_file = repo_path / "STRUCTURE.md"
-    if structure_file.exists():
-        try:
-            return structure_file.read_text(encoding="utf-8")
-        except Exception:
-            pass
+    for candidate in (repo_path / STRUCTURE_XML_PATH, repo_path / "STRUCTURE.md"):
+        document = cache.get(candidate)
+        if document is not None:
+            return document.render(max_tokens=STRUCTURE_MAX_TOKENS)
 
     # Try to find any STRUCTURE.md
     for f in repo_path.rglob("STRUCTURE.md"):
@@ -166,10 +174,9 @@ def load_structure_content(repo: Repository) -> str | None:
         # Skip hidden directories
         if any(part.startswith(".") for part in rel_path.parts):
             continue
-        try:
-            return f.read_text(encoding="utf-8")
-        except Exception:
-            continue
+        document = cache.get(f)
+        if document is not None:
+            return document.text
 
     return None
 
@@ -5,11 +5,20 @@ import json
 import logging
 import re
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from pathlib import Path
 from typing import Any, Literal, cast
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, Request
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.responses import StreamingResponse
 from github import GithubException
 from pydantic import BaseModel
@@ -43,6 +52,7 @@ from ..schemas.repos import (
     RepoResponse,
     RepoStatus,
 )
+from ..services.file_index import IndexEntry, RepoFileIndex, get_file_index_registry, split_path
 from ..services.file_watcher import FileWatcherService
 from ..services.operation_tracker import OperationType, get_tracker
 from ..utils.sse import sse_ping
@@ -72,6 +82,7 @@ class TreeNode(BaseModel):
     children: list["TreeNode"] = []
     is_modified: bool = False
     is_untracked: bool = False
+    loaded: bool = True  # False: directory beyond the requested depth, children not listed
 
 
 TreeNode.model_rebuild()
@@ -424,6 +435,8 @@ def sync_repo(
 
     try:
         result = manager.sync(repo_id)
+        # A pull can touch any number of files: rescan lazily
+        get_file_index_registry().invalidate(repo_id)
         tracker.complete(op_id)
         return RepoResponse.model_validate(result)
     except RepositoryError as e:
@@ -1202,20 +1215,53 @@ ALLOWED_EXTENSIONS = {
 MAX_FILE_SIZE = 1024 * 1024  # 1MB
 
 
+def _repo_file_index(repo: Any) -> RepoFileIndex:
+    """Directory index of a repository (see services/file_index.py)."""
+    return get_file_index_registry().get(cast(str, repo.id), cast(str, repo.local_path))
+
+
+def _file_info(entry: IndexEntry) -> FileInfo:
+    if entry.is_dir:
+        return FileInfo(name=entry.name, path=entry.path, type="directory")
+    return FileInfo(
+        name=entry.name,
+        path=entry.path,
+        type="file",
+        size=entry.size,
+        extension=entry.extension,
+    )
+
+
+def _paginate(
+    items: list[FileInfo], offset: int, limit: int | None, response: Response
+) -> list[FileInfo]:
+    """Slice a listing, exposing the full count in X-Total-Count."""
+    response.headers["X-Total-Count"] = str(len(items))
+    return items[offset : offset + limit if limit is not None else None]
+
+
 @router.get("/{repo_id}/files", response_model=list[FileInfo])
 def list_files(
     repo_id: str,
+    response: Response,
     path: str = Query(default="", description="Subdirectory path"),
     pattern: str = Query(default="*", description="Glob pattern to filter files"),
+    limit: int | None = Query(default=None, ge=1, le=5000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: dict[str, Any] = Depends(require_auth),
 ) -> list[FileInfo]:
     """List files in a repository directory.
 
+    Served from the in-memory directory index; the total number of
+    matches is returned in the X-Total-Count header.
+
     Args:
         repo_id: Repository UUID
         path: Subdirectory path (relative to repo root)
         pattern: Glob pattern to filter files (e.g., '*.md', 'STRUCTURE*')
+        limit: Maximum entries to return (all if omitted)
+        offset: Entries to skip
     """
     from ...db.models import Repository
 
@@ -1224,71 +1270,36 @@ def list_files(
         raise HTTPException(status_code=403, detail="Non hai accesso a questa repository")
 
     repo = get_or_404(db, Repository, repo_id)
+    index = _repo_file_index(repo)
 
-    repo_path = Path(cast(str, repo.local_path))
-    target_path = repo_path / path
-
-    # Security: ensure we stay within repo directory
     try:
-        target_path = target_path.resolve()
-        repo_path = repo_path.resolve()
-        if not str(target_path).startswith(str(repo_path)):
-            raise HTTPException(status_code=400, detail="Invalid path")
-    except Exception:
+        entries = index.list_dir(path, pattern)
+    except ValueError:
         raise HTTPException(status_code=400, detail="Invalid path")
-
-    if not target_path.exists():
+    except KeyError:
         raise HTTPException(status_code=404, detail="Path not found")
+    except NotADirectoryError:
+        entry = index.get(path)
+        entries = [entry] if entry is not None else []
 
-    files: list[FileInfo] = []
-    if target_path.is_file():
-        files.append(
-            FileInfo(
-                name=target_path.name,
-                path=str(target_path.relative_to(repo_path)),
-                type="file",
-                size=target_path.stat().st_size,
-                extension=target_path.suffix,
-            )
-        )
-    else:
-        for item in sorted(target_path.glob(pattern)):
-            if item.name.startswith("."):
-                continue
-
-            rel_path = str(item.relative_to(repo_path))
-            if item.is_dir():
-                files.append(
-                    FileInfo(
-                        name=item.name,
-                        path=rel_path,
-                        type="directory",
-                    )
-                )
-            else:
-                files.append(
-                    FileInfo(
-                        name=item.name,
-                        path=rel_path,
-                        type="file",
-                        size=item.stat().st_size,
-                        extension=item.suffix,
-                    )
-                )
-
-    return files
+    return _paginate([_file_info(e) for e in entries], offset, limit, response)
 
 
 @router.get("/{repo_id}/files/tree")
 def get_file_tree(
     repo_id: str,
+    response: Response,
     extensions: str = Query(default=".md", description="Comma-separated extensions to include"),
+    path: str = Query(default="", description="Only files under this directory"),
+    limit: int | None = Query(default=None, ge=1, le=5000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: dict[str, Any] = Depends(require_auth),
 ) -> list[FileInfo]:
     """Get a tree of files matching specified extensions.
 
-    Returns a flat list of all matching files in the repository.
+    Returns a flat list of all matching files in the repository, sorted by
+    path. The total number of matches is returned in X-Total-Count.
     """
     from ...db.models import Repository
 
@@ -1298,75 +1309,67 @@ def get_file_tree(
     if not check_repo_access(repo_id, current_user, db):
         raise HTTPException(status_code=403, detail="Non hai accesso a questa repository")
 
-    repo_path = Path(cast(str, repo.local_path))
-    ext_list = [ext.strip() for ext in extensions.split(",")]
-
-    files: list[FileInfo] = []
-    for ext in ext_list:
-        if not ext.startswith("."):
-            ext = "." + ext
-        for item in repo_path.rglob(f"*{ext}"):
-            rel_path = item.relative_to(repo_path)
-            # Skip hidden and .git directories (check relative path, not absolute)
-            if any(part.startswith(".") for part in rel_path.parts):
-                continue
-
-            rel_path_str = str(rel_path)
-            files.append(
-                FileInfo(
-                    name=item.name,
-                    path=rel_path_str,
-                    type="file",
-                    size=item.stat().st_size,
-                    extension=item.suffix,
-                )
-            )
+    try:
+        entries = _repo_file_index(repo).iter_files(path, extensions.split(","))
+        files = [_file_info(e) for e in entries]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid path")
 
-    return sorted(files, key=lambda f: f.path)
+    return _paginate(files, offset, limit, response)
 
 
-def _build_tree_from_files(
-    files: list[FileInfo],
+def _build_tree(
+    entries: Iterable[IndexEntry],
+    root_path: str,
+    depth: int | None,
     modified_files: set[str],
     untracked_files: set[str],
 ) -> TreeNode:
-    """Build hierarchical tree from flat file list."""
-    root = TreeNode(name="root", path="", type="directory", children=[])
-
-    # Dictionary to track created directories
-    dir_nodes: dict[str, TreeNode] = {"": root}
+    """Build hierarchical tree from index entries (in path order) under root_path.
 
-    for file in sorted(files, key=lambda f: f.path):
-        parts = file.path.split("/")
-
-        # Create directory nodes for all parent directories
-        current_path = ""
-        for _i, part in enumerate(parts[:-1]):
-            parent_path = current_path
-            current_path = f"{current_path}/{part}" if current_path else part
+    Directories ``depth`` levels below the root are returned without
+    children and with ``loaded=False``; the explorer fetches them when
+    they are expanded.
+    """
+    root = TreeNode(name=root_path.rsplit("/", 1)[-1] or "root", path=root_path, type="directory")
+    base = len(root_path.split("/")) if root_path else 0
 
-            if current_path not in dir_nodes:
+    # Dictionary to track created directories
+    dir_nodes: dict[str, TreeNode] = {root_path: root}
+
+    for entry in entries:
+        parts = entry.path.split("/")
+        last_dir_level = len(parts) - base if entry.is_dir else len(parts) - base - 1
+        if depth is not None:
+            last_dir_level = min(last_dir_level, depth)
+
+        # Create directory nodes for all parent directories (filtered listings
+        # only contain files)
+        for level in range(1, last_dir_level + 1):
+            dir_path = "/".join(parts[: base + level])
+            if dir_path not in dir_nodes:
                 dir_node = TreeNode(
-                    name=part,
-                    path=current_path,
+                    name=parts[base + level - 1],
+                    path=dir_path,
                     type="directory",
-                    children=[],
+                    loaded=depth is None or level < depth,
                 )
-                dir_nodes[current_path] = dir_node
-                dir_nodes[parent_path].children.append(dir_node)
-
-        file_node = TreeNode(
-            name=file.name,
-            path=file.path,
-            type="file",
-            extension=file.extension,
-            size=file.size,
-            is_modified=file.path in modified_files,
-            is_untracked=file.path in untracked_files,
-        )
+                dir_nodes[dir_path] = dir_node
+                dir_nodes["/".join(parts[: base + level - 1])].children.append(dir_node)
 
-        parent_path = "/".join(parts[:-1])
-        dir_nodes.get(parent_path, root).children.append(file_node)
+        if entry.is_dir or (depth is not None and len(parts) - base > depth):
+            continue
+        dir_nodes["/".join(parts[:-1])].children.append(
+            TreeNode(
+                name=entry.name,
+                path=entry.path,
+                type="file",
+                extension=entry.extension,
+                size=entry.size,
+                is_modified=entry.path in modified_files,
+                is_untracked=entry.path in untracked_files,
+            )
+        )
 
     def sort_children(node: TreeNode) -> None:
         node.children.sort(key=lambda n: (n.type == "file", n.name.lower()))
@@ -1383,13 +1386,20 @@ def get_file_tree_hierarchy(
     repo_id: str,
     extensions: str = Query(default=".md", description="Comma-separated extensions to include"),
     include_git_status: bool = Query(default=True, description="Include git modification status"),
+    path: str = Query(default="", description="Subtree root (relative to repo root)"),
+    depth: int | None = Query(
+        default=None, ge=1, le=64, description="Directory levels to expand (all if omitted)"
+    ),
     db: Session = Depends(get_db),
     current_user: dict[str, Any] = Depends(require_auth),
 ) -> TreeNode:
     """Get hierarchical file tree with git status.
 
     Returns a nested tree structure suitable for VS Code-like file explorer.
-    Directories come first, sorted alphabetically.
+    Directories come first, sorted alphabetically. With '*' every directory
+    is listed, otherwise only directories containing matching files. With
+    ``depth``, deeper directories come back with ``loaded=False`` and can be
+    fetched one at a time by passing them as ``path``.
     """
     from ...db.models import Repository
 
@@ -1399,52 +1409,20 @@ def get_file_tree_hierarchy(
     if not check_repo_access(repo_id, current_user, db):
         raise HTTPException(status_code=403, detail="Non hai accesso a questa repository")
 
-    repo_path = Path(cast(str, repo.local_path))
-    ext_list = [ext.strip() for ext in extensions.split(",")]
-
-    # Get flat file list
-    files: list[FileInfo] = []
-    seen_paths: set[str] = set()  # Avoid duplicates when using '*'
+    index = _repo_file_index(repo)
+    ext_list = extensions.split(",")
 
-    # Handle '*' for all files
-    if "*" in ext_list:
-        for item in repo_path.rglob("*"):
-            if not item.is_file():
-                continue
-            rel_path = item.relative_to(repo_path)
-            if any(part.startswith(".") for part in rel_path.parts):
-                continue
-            rel_path_str = str(rel_path)
-            if rel_path_str not in seen_paths:
-                seen_paths.add(rel_path_str)
-                files.append(
-                    FileInfo(
-                        name=item.name,
-                        path=rel_path_str,
-                        type="file",
-                        size=item.stat().st_size,
-                        extension=item.suffix,
-                    )
-                )
-    else:
-        for ext in ext_list:
-            if not ext.startswith("."):
-                ext = "." + ext
-            for item in repo_path.rglob(f"*{ext}"):
-                rel_path = item.relative_to(repo_path)
-                if any(part.startswith(".") for part in rel_path.parts):
-                    continue
-
-                rel_path_str = str(rel_path)
-                files.append(
-                    FileInfo(
-                        name=item.name,
-                        path=rel_path_str,
-                        type="file",
-                        size=item.stat().st_size,
-                        extension=item.suffix,
-                    )
-                )
+    try:
+        root_path = "/".join(split_path(path))
+        root_entry = index.get(root_path)
+        if root_entry is None or not root_entry.is_dir:
+            raise HTTPException(status_code=404, detail="Path not found")
+        if "*" in (e.strip() for e in ext_list):
+            entries: Iterable[IndexEntry] = index.walk(root_path, max_depth=depth)
+        else:
+            entries = index.iter_files(root_path, ext_list)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid path")
 
     # Get git status if requested
     modified_files: set[str] = set()
@@ -1452,13 +1430,13 @@ def get_file_tree_hierarchy(
 
     if include_git_status:
         try:
-            git_status = get_git_status(repo_path)
+            git_status = get_git_status(Path(cast(str, repo.local_path)))
             modified_files = set(git_status.modified)
             untracked_files = set(git_status.untracked)
         except Exception:
             pass
 
-    return _build_tree_from_files(files, modified_files, untracked_files)
+    return _build_tree(entries, root_path, depth, modified_files, untracked_files)
 
 
 @router.get("/{repo_id}/files/diff", response_model=FileDiff)
@@ -1979,6 +1957,11 @@ def write_file(
 
     is_new = not file_path.exists()
     file_path.write_text(data.content, encoding="utf-8")
+    # Visible in listings right away, without waiting for the watcher batch
+    get_file_index_registry().apply_changes(
+        repo_id,
+        {file_path.relative_to(repo_path_resolved).as_posix(): "created" if is_new else "modified"},
+    )
 
     committed = False
     if data.commit_message:
@@ -2029,6 +2012,7 @@ def switch_file_watcher(
     """Switch the file watcher to a different repository.
 
     Called when the user changes the repository context in the footer.
+    Previously selected repositories stay watched (up to the hub's limit).
     """
     from ...db.models import Repository
 
@@ -2060,20 +2044,23 @@ def switch_file_watcher(
 @router.get("/files/watch")
 async def watch_file_changes(
     request: Request,
+    repo_id: str | None = None,
     current_user: dict[str, Any] = Depends(require_auth),
 ) -> StreamingResponse:
     """SSE endpoint for real-time file change notifications.
 
-    Clients connect to receive notifications when files are modified
-    in the currently watched repository.
+    Clients connect to receive coalesced change batches of the watched
+    repositories (only ``repo_id``'s if given).
 
     Events format:
-        {"action": "modified|created|deleted|moved", "path": "...", "repo_id": "..."}
+        {"type": "batch", "repo_id": "...", "count": 412, "raw_events": 1650,
+         "changes": [{"action": "created|modified|deleted", "path": "src/a.py"}, ...],
+         "truncated": false}
     """
     watcher = FileWatcherService.get_instance()
 
     async def event_generator() -> AsyncGenerator[str, None]:
-        queue = watcher.subscribe()
+        queue = watcher.subscribe({repo_id} if repo_id else None)
         try:
             # Send initial connection message with current status
             yield f"data: {json.dumps({'type': 'connected', 'status': watcher.get_status()})}\n\n"
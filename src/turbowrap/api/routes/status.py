@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Any, Literal
 from weakref import WeakSet
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
@@ -206,6 +206,14 @@ def queue_status() -> dict[str, Any]:
     return queue.get_status()
 
 
+@router.get("/uploads")
+def upload_pipeline_status() -> dict[str, Any]:
+    """Get S3 artifact upload pipeline throughput and queue metrics."""
+    from ...utils.s3_upload_pipeline import get_upload_pipeline
+
+    return get_upload_pipeline().get_metrics()
+
+
 @router.get("/reviews")
 def active_reviews_status() -> dict[str, Any]:
     """Get status of active background reviews."""
@@ -231,38 +239,27 @@ def active_reviews_status() -> dict[str, Any]:
 
 
 @router.get("/live")
-def live_status() -> dict[str, Any]:
+def live_status(
+    history: int = Query(default=0, ge=0, le=1000, description="Sparkline points to include"),
+) -> dict[str, Any]:
     """
     Get real-time system status for frontend polling.
 
-    Returns CPU, memory, and active review information.
-    Designed for lightweight polling (every 2-5 seconds).
+    Returns CPU, memory, active reviews and CLI/build processes.
+    Designed for lightweight polling (every 2-5 seconds): process metrics
+    come from the background LiveStatusSampler, not a per-request scan.
     """
     from ..review_manager import get_review_manager
+    from ..services.live_status_sampler import MAX_REPORTED_PROCESSES, get_live_status_sampler
 
     result: dict[str, Any] = {
         "timestamp": format_iso(now_utc()),
         "uptime_seconds": (datetime.now() - SERVER_START_TIME).total_seconds(),
     }
 
-    try:
-        import psutil
-
-        cpu_percent = psutil.cpu_percent(interval=None)
-        if cpu_percent == 0.0:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-
-        memory = psutil.virtual_memory()
-
-        result["system"] = {
-            "cpu_percent": round(cpu_percent, 1),
-            "cpu_count": psutil.cpu_count(),
-            "memory_percent": round(memory.percent, 1),
-            "memory_used_gb": round((memory.total - memory.available) / (1024**3), 2),
-            "memory_total_gb": round(memory.total / (1024**3), 2),
-        }
-    except ImportError:
-        result["system"] = {"error": "psutil not installed"}
+    sampler = get_live_status_sampler()
+    snapshot = sampler.get_latest()
+    result["system"] = snapshot.system
 
     try:
         manager = get_review_manager()
@@ -292,208 +289,44 @@ def live_status() -> dict[str, Any]:
     except Exception as e:
         result["queue"] = {"error": str(e)[:100]}
 
-    try:
-        import psutil
+    result["cli_processes"] = {
+        "count": len(snapshot.cli_processes),
+        "processes": snapshot.cli_processes[:MAX_REPORTED_PROCESSES],
+    }
+    result["build_processes"] = {
+        "count": len(snapshot.build_processes),
+        "processes": snapshot.build_processes[:MAX_REPORTED_PROCESSES],
+    }
+    result["sampled_at"] = datetime.fromtimestamp(snapshot.timestamp).isoformat()
 
-        cli_processes = []
-        now = time.time()
+    if history:
+        result["history"] = sampler.get_history(history)
 
-        for proc in psutil.process_iter(["name", "memory_percent", "cpu_percent"]):
-            try:
-                name = proc.info["name"].lower()
-                if name in ("claude", "gemini", "node"):
-                    cmdline_list = proc.cmdline()
-                    cmdline = " ".join(cmdline_list).lower()
-                    if "claude" in cmdline or "gemini" in cmdline:
-                        # Get additional process info
-                        cwd = None
-                        try:
-                            cwd = proc.cwd()
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            pass
-
-                        elapsed_seconds = 0
-                        try:
-                            elapsed_seconds = int(now - proc.create_time())
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            pass
-
-                        cpu = 0
-                        try:
-                            cpu = proc.cpu_percent(interval=None)
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            pass
-
-                        status = "unknown"
-                        try:
-                            status = proc.status()
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            pass
-
-                        # Extract repo name from cwd
-                        repo_name = cwd.rstrip("/").split("/")[-1] if cwd else None
-
-                        if elapsed_seconds < 60:
-                            elapsed_str = f"{elapsed_seconds}s"
-                        elif elapsed_seconds < 3600:
-                            elapsed_str = f"{elapsed_seconds // 60}m {elapsed_seconds % 60}s"
-                        else:
-                            elapsed_str = (
-                                f"{elapsed_seconds // 3600}h {(elapsed_seconds % 3600) // 60}m"
-                            )
-
-                        # Extract meaningful cmdline info
-                        cmdline_short = " ".join(cmdline_list[1:4]) if len(cmdline_list) > 1 else ""
-                        if len(cmdline_short) > 60:
-                            cmdline_short = cmdline_short[:57] + "..."
-
-                        cli_processes.append(
-                            {
-                                "name": "claude" if "claude" in cmdline else "gemini",
-                                "pid": proc.pid,
-                                "memory_percent": round(proc.info["memory_percent"] or 0, 1),
-                                "cpu_percent": round(cpu, 1),
-                                "status": status,
-                                "cwd": cwd,
-                                "repo_name": repo_name,
-                                "elapsed": elapsed_str,
-                                "elapsed_seconds": elapsed_seconds,
-                                "cmdline": cmdline_short,
-                            }
-                        )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        result["cli_processes"] = {
-            "count": len(cli_processes),
-            "processes": cli_processes[:10],
-        }
-    except Exception as e:
-        result["cli_processes"] = {"count": 0, "error": str(e)[:50]}
+    return result
 
-    # Docker/Container build processes
-    try:
-        import psutil
 
-        build_processes = []
-        now = time.time()
+@router.get("/live/sampler")
+def live_status_sampler_stats() -> dict[str, Any]:
+    """Get live status sampler diagnostics (cadence, scan time, freshness)."""
+    from ..services.live_status_sampler import get_live_status_sampler
 
-        for proc in psutil.process_iter(["name", "memory_percent", "cpu_percent"]):
-            try:
-                name = proc.info["name"].lower()
-                # Detect docker, docker-compose, buildx, podman, buildah
-                if name in (
-                    "docker",
-                    "docker-compose",
-                    "podman",
-                    "buildah",
-                    "buildx",
-                    "containerd",
-                ):
-                    cmdline_list = proc.cmdline()
-                    cmdline = " ".join(cmdline_list).lower()
-
-                    # Check if it's a build operation
-                    is_build = any(
-                        kw in cmdline for kw in ["build", "push", "pull", "compose up", "run"]
-                    )
-                    if not is_build:
-                        continue
-
-                    # Get additional process info
-                    cwd = None
-                    try:
-                        cwd = proc.cwd()
-                    except (psutil.AccessDenied, psutil.NoSuchProcess):
-                        pass
-
-                    elapsed_seconds = 0
-                    try:
-                        elapsed_seconds = int(now - proc.create_time())
-                    except (psutil.AccessDenied, psutil.NoSuchProcess):
-                        pass
-
-                    cpu = 0
-                    try:
-                        cpu = proc.cpu_percent(interval=None)
-                    except (psutil.AccessDenied, psutil.NoSuchProcess):
-                        pass
-
-                    status = "unknown"
-                    try:
-                        status = proc.status()
-                    except (psutil.AccessDenied, psutil.NoSuchProcess):
-                        pass
-
-                    if "build" in cmdline:
-                        op_type = "build"
-                    elif "push" in cmdline:
-                        op_type = "push"
-                    elif "pull" in cmdline:
-                        op_type = "pull"
-                    elif "compose up" in cmdline or "up -d" in cmdline:
-                        op_type = "up"
-                    elif "run" in cmdline:
-                        op_type = "run"
-                    else:
-                        op_type = "other"
-
-                    # Extract image/service name from cmdline
-                    image_name = None
-                    # Try to find -t flag for build
-                    if "-t " in cmdline:
-                        parts = cmdline.split("-t ")
-                        if len(parts) > 1:
-                            image_name = parts[1].split()[0].split(":")[0]
-                    elif "-f " in cmdline:
-                        parts = cmdline.split("-f ")
-                        if len(parts) > 1:
-                            image_name = parts[1].split()[0]
-
-                    # Extract repo/project name from cwd
-                    project_name = cwd.rstrip("/").split("/")[-1] if cwd else None
-
-                    if elapsed_seconds < 60:
-                        elapsed_str = f"{elapsed_seconds}s"
-                    elif elapsed_seconds < 3600:
-                        elapsed_str = f"{elapsed_seconds // 60}m {elapsed_seconds % 60}s"
-                    else:
-                        elapsed_str = (
-                            f"{elapsed_seconds // 3600}h {(elapsed_seconds % 3600) // 60}m"
-                        )
-
-                    # Extract meaningful cmdline info
-                    cmdline_short = " ".join(cmdline_list[:5]) if cmdline_list else ""
-                    if len(cmdline_short) > 80:
-                        cmdline_short = cmdline_short[:77] + "..."
-
-                    build_processes.append(
-                        {
-                            "tool": name,  # docker, podman, etc
-                            "operation": op_type,
-                            "pid": proc.pid,
-                            "memory_percent": round(proc.info["memory_percent"] or 0, 1),
-                            "cpu_percent": round(cpu, 1),
-                            "status": status,
-                            "cwd": cwd,
-                            "project_name": project_name,
-                            "image_name": image_name,
-                            "elapsed": elapsed_str,
-                            "elapsed_seconds": elapsed_seconds,
-                            "cmdline": cmdline_short,
-                        }
-                    )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        result["build_processes"] = {
-            "count": len(build_processes),
-            "processes": build_processes[:10],
-        }
-    except Exception as e:
-        result["build_processes"] = {"count": 0, "error": str(e)[:50]}
+    return get_live_status_sampler().get_stats()
 
-    return result
+
+@router.get("/llm")
+def llm_governor_status() -> dict[str, Any]:
+    """Get LLM governor metrics (in-flight calls, queue depth, budgets, waits)."""
+    from ...llm.governor import get_llm_governor
+
+    return get_llm_governor().snapshot()
+
+
+@router.get("/llm/prompt-cache")
+def llm_prompt_cache_status() -> dict[str, Any]:
+    """Get expected vs actual prompt-cache reads and hit rate per provider."""
+    from ...llm.prompt_layout import get_prompt_cache_monitor
+
+    return get_prompt_cache_monitor().snapshot()
 
 
 @router.get("/stats")
@@ -19,6 +19,7 @@ from ...core.task_queue import QueuedTask, get_task_queue
 from ...db.models import Issue, Repository, ReviewCheckpoint, Task
 from ...review.models.progress import ProgressEvent, ProgressEventType
 from ...tasks import TaskContext, get_task_registry
+from ...utils.structure_docs import get_structure_cache
 from ..deps import get_db, get_or_404, require_coder, require_repo_access
 from ..schemas.tasks import TaskCreate, TaskQueueStatus, TaskResponse
 
@@ -567,16 +568,14 @@ async def restart_reviewer(
             else:
                 xml_path = context.repo_path / ".llms" / "structure.xml"
 
-            if xml_path.exists():
-                try:
-                    content = xml_path.read_text(encoding="utf-8")
-                    context.structure_docs["structure.xml"] = content
-                    logger.info(
-                        f"[RESTART] Loaded {xml_path.relative_to(context.repo_path)} "
-                        f"({xml_path.stat().st_size:,} bytes)"
-                    )
-                except Exception as e:
-                    logger.warning(f"[RESTART] Failed to read {xml_path}: {e}")
+            document = get_structure_cache().get(xml_path)
+            if document is not None:
+                context.structure_document = document
+                context.structure_docs["structure.xml"] = document.text
+                logger.info(
+                    f"[RESTART] Loaded {xml_path.relative_to(context.repo_path)} "
+                    f"({len(document.text):,} chars)"
+                )
             else:
                 # Auto-generate structure.xml if missing - GeminiClient is REQUIRED
                 logger.error(
@@ -637,8 +636,10 @@ async def restart_reviewer(
                         f"[RESTART] Generated {len(generated_files)} files: {generated_files}"
                     )
 
-                    if xml_path.exists():
-                        content = xml_path.read_text(encoding="utf-8")
+                    document = get_structure_cache().get(xml_path)
+                    if document is not None:
+                        content = document.text
+                        context.structure_document = document
                         context.structure_docs["structure.xml"] = content
                         logger.info(
                             f"[RESTART] SUCCESS: Loaded structure.xml ({len(content)} chars)"
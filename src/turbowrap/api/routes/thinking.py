@@ -1,13 +1,19 @@
 """Thinking logs routes - fetch extended thinking from S3."""
 
 import asyncio
+from datetime import datetime
 from typing import Any
 
 from botocore.exceptions import ClientError
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
 
 from turbowrap.config import get_settings
+from turbowrap.db.models import Task
 from turbowrap.utils.aws_clients import get_s3_client as get_cached_s3_client
+from turbowrap.utils.thinking_logs import ThinkingLogIndex
+
+from ..deps import get_db
 
 router = APIRouter(prefix="/thinking", tags=["thinking"])
 
@@ -18,14 +24,32 @@ def get_s3_client() -> Any:
     return get_cached_s3_client(region=settings.thinking.s3_region)
 
 
+def get_thinking_index() -> ThinkingLogIndex:
+    """Thinking log index on the configured bucket."""
+    settings = get_settings()
+    return ThinkingLogIndex(
+        get_s3_client(), settings.thinking.s3_bucket, settings.thinking.retention_days
+    )
+
+
+def _task_started_at(db: Session, task_id: str) -> datetime | None:
+    """Creation time of a task (bounds the scan for logs written before the index)."""
+    task = db.query(Task.created_at).filter(Task.id == task_id).first()
+    return task.created_at if task else None
+
+
 @router.get("/{task_id}/{reviewer_name}")
 async def get_thinking_log(
     task_id: str,
     reviewer_name: str,
+    db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """
     Fetch thinking log for a specific reviewer from S3.
 
+    The log key is read from the thinking index (one GET); logs written
+    before the index existed are looked up in the days the task ran.
+
     Args:
         task_id: The task ID (UUID)
         reviewer_name: The reviewer name (e.g., reviewer_be, reviewer_fe)
@@ -38,47 +62,11 @@ async def get_thinking_log(
     if not settings.thinking.enabled:
         raise HTTPException(status_code=404, detail="Extended thinking is not enabled")
 
-    # Search for the thinking file in S3
-    # Format: thinking/{YYYY}/{MM}/{DD}/{HHMMSS}/{review_id}_{reviewer_name}.md
-    # where review_id can be task_id or {reviewer_name}_{timestamp}
     try:
-        s3_client = get_s3_client()
-
-        # List objects with prefix to find the file
-        paginator = s3_client.get_paginator("list_objects_v2")
-
-        # Track exact match (with task_id) and fallback (any file for this reviewer)
-        exact_match_key = None
-        exact_match_time = None
-        fallback_key = None
-        fallback_time = None
-
-        for page in paginator.paginate(
-            Bucket=settings.thinking.s3_bucket,
-            Prefix="thinking/",
-        ):
-            for obj in page.get("Contents", []):
-                key = obj["Key"]
-                filename = key.split("/")[-1]
-
-                # Check if this file is for the requested reviewer
-                # Filename format: {something}_{reviewer_name}.md
-                if not filename.endswith(f"_{reviewer_name}.md"):
-                    continue
-
-                # Check if it's an exact match for this task_id
-                if task_id in key or task_id in filename:
-                    if exact_match_time is None or obj["LastModified"] > exact_match_time:
-                        exact_match_key = key
-                        exact_match_time = obj["LastModified"]
-                else:
-                    # Fallback: any file for this reviewer (get most recent)
-                    if fallback_time is None or obj["LastModified"] > fallback_time:
-                        fallback_key = key
-                        fallback_time = obj["LastModified"]
-
-        # Prefer exact match, fall back to most recent for this reviewer
-        found_key = exact_match_key or fallback_key
+        index = get_thinking_index()
+        found_key = await asyncio.to_thread(
+            index.resolve, task_id, reviewer_name, _task_started_at(db, task_id)
+        )
 
         if not found_key:
             raise HTTPException(
@@ -87,12 +75,12 @@ async def get_thinking_log(
 
         # Get the object content
         response = await asyncio.to_thread(
-            s3_client.get_object,
+            index.client.get_object,
             Bucket=settings.thinking.s3_bucket,
             Key=found_key,
         )
 
-        content = response["Body"].read().decode("utf-8")
+        content = await asyncio.to_thread(lambda: response["Body"].read().decode("utf-8"))
 
         return {
             "task_id": task_id,
@@ -112,6 +100,7 @@ async def get_thinking_log(
 @router.get("/list/{review_id}")
 async def list_thinking_logs(
     review_id: str,
+    db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """
     List all thinking logs for a review.
@@ -128,34 +117,9 @@ async def list_thinking_logs(
         return {"logs": [], "enabled": False}
 
     try:
-        s3_client = get_s3_client()
-
-        logs = []
-        paginator = s3_client.get_paginator("list_objects_v2")
-
-        for page in paginator.paginate(
-            Bucket=settings.thinking.s3_bucket,
-            Prefix="thinking/",
-        ):
-            for obj in page.get("Contents", []):
-                key = obj["Key"]
-                # Match any file containing the review_id
-                if review_id in key and key.endswith(".md"):
-                    # Extract reviewer name from filename
-                    filename = key.split("/")[-1]
-                    # Format: {review_id}_{reviewer_name}.md
-                    parts = filename.replace(".md", "").split("_")
-                    if len(parts) >= 2:
-                        reviewer_name = "_".join(parts[1:])  # Handle reviewer_be etc
-                        logs.append(
-                            {
-                                "reviewer_name": reviewer_name,
-                                "s3_key": key,
-                                "last_modified": obj["LastModified"].isoformat(),
-                                "size_bytes": obj["Size"],
-                            }
-                        )
-
+        index = get_thinking_index()
+        refs = await asyncio.to_thread(index.list_logs, review_id, _task_started_at(db, review_id))
+        logs = [ref.to_dict() for ref in refs]
         return {"review_id": review_id, "logs": logs, "enabled": True}
 
     except ClientError as e:
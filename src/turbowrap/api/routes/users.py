@@ -12,6 +12,7 @@ from ...config import get_settings
 from ...db.models import Repository, User, UserRepository, UserRole
 from ..auth import get_cognito_client
 from ..deps import get_db, require_admin
+from ..principal_cache import get_principal_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/users", tags=["users"])
@@ -189,6 +190,9 @@ async def delete_user(
 
         logger.info(f"User {username} deleted by admin {admin.get('email')}")
 
+        # Cached principals are keyed by token, not username: drop them all
+        get_principal_cache().clear()
+
         return UserDeleteResponse(
             status="ok",
             message=f"Utente {username} eliminato",
@@ -242,6 +246,7 @@ async def update_user_role(
     old_role = user.role
     user.role = data.role
     db.commit()
+    get_principal_cache().invalidate_user(user_id)
 
     logger.info(
         f"User {user.email} role changed from {old_role} to {data.role} "
@@ -293,6 +298,7 @@ async def assign_repositories(
         db.add(UserRepository(user_id=user_id, repository_id=repo_id))
 
     db.commit()
+    get_principal_cache().invalidate_user(user_id)
 
     logger.info(
         f"User {user.email} assigned to {len(data.repository_ids)} repositories "
@@ -78,9 +78,17 @@ class ChatMessageResponse(BaseModel):
 class WebSocketMessage(BaseModel):
     """WebSocket message format."""
 
-    type: Literal["message", "ping", "pong", "error", "generating", "message_received"] = Field(
-        ..., description="Message type"
-    )
+    type: Literal[
+        "message",
+        "ping",
+        "pong",
+        "error",
+        "generating",
+        "message_received",
+        "delta",
+        "cancel",
+        "cancelled",
+    ] = Field(..., description="Message type")
     content: str | None = Field(default=None, description="Message content")
     role: ChatRole | None = Field(default=None, description="Message role")
     message_id: str | None = Field(default=None, description="Message ID")
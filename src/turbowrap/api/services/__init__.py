@@ -1,11 +1,15 @@
 """API services layer."""
 
+from .browser_pool import BrowserPool, BrowserPoolFullError, get_browser_pool
 from .fix_session_service import DuplicateSessionError, FixSessionService, get_fix_session_service
 from .mockup_service import MockupService, get_mockup_service
 from .review_stream_service import ReviewStreamService, get_review_stream_service
 from .screenshot_service import ScreenshotService
 
 __all__ = [
+    "BrowserPool",
+    "BrowserPoolFullError",
+    "get_browser_pool",
     "DuplicateSessionError",
     "FixSessionService",
     "get_fix_session_service",
@@ -0,0 +1,331 @@
+"""Headless browser pool for screenshot capture.
+
+Keeps a few warm Chromium instances alive and gives every capture its own
+browser context, so bursts of Live View captures don't pay a cold
+Chromium launch each time.
+
+Usage:
+    pool = get_browser_pool()
+    png = await pool.capture("https://example.com", viewport_width=1280, viewport_height=800)
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ...config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Extra wait after network idle for lazy-loaded content
+SETTLE_DELAY_MS = 1000
+
+# Launches a connected browser (Playwright Browser or a test double)
+BrowserFactory = Callable[[], Awaitable[Any]]
+
+# (url, viewport_width, viewport_height, full_page)
+CaptureKey = tuple[str, int, int, bool]
+
+
+class BrowserPoolFullError(RuntimeError):
+    """Raised when too many captures are already waiting for a slot."""
+
+
+@dataclass
+class _PooledBrowser:
+    """A warm browser plus its usage counters."""
+
+    browser: Any
+    pages_served: int = 0
+    active: int = 0
+    retired: bool = False
+
+
+class BrowserPool:
+    """Pool of warm headless browsers with queued, deduplicated captures.
+
+    - At most ``max_concurrent`` captures run at once; the rest wait in FIFO
+      order, up to ``max_queued`` waiters.
+    - Concurrent requests for the same URL and viewport share one capture.
+    - A browser is recycled after ``max_pages_per_browser`` captures, or as
+      soon as it is found disconnected (crash).
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_concurrent: int = 4,
+        max_queued: int = 50,
+        max_pages_per_browser: int = 50,
+        navigation_timeout_ms: int = 30000,
+        browser_factory: BrowserFactory | None = None,
+    ) -> None:
+        self.size = size
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.max_pages_per_browser = max_pages_per_browser
+        self.navigation_timeout_ms = navigation_timeout_ms
+        self._browser_factory = browser_factory
+
+        self._browsers: list[_PooledBrowser] = []
+        self._inflight: dict[CaptureKey, asyncio.Task[bytes]] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self._playwright: Any = None
+        self._closed = False
+
+        # Counters for get_stats()
+        self._captures = 0
+        self._deduped = 0
+        self._launches = 0
+        self._recycled = 0
+        self._crashes = 0
+
+    async def capture(
+        self,
+        url: str,
+        viewport_width: int = 1920,
+        viewport_height: int = 1080,
+        full_page: bool = True,
+    ) -> bytes:
+        """Capture a PNG screenshot of ``url``.
+
+        Args:
+            url: URL to screenshot
+            viewport_width: Browser viewport width
+            viewport_height: Browser viewport height
+            full_page: Capture the full scrollable page
+
+        Returns:
+            PNG bytes
+
+        Raises:
+            BrowserPoolFullError: If the capture queue is full
+            RuntimeError: If Playwright is unavailable or the pool is closed
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        key: CaptureKey = (url, viewport_width, viewport_height, full_page)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._capture_queued(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_capture_done(key, t))
+        else:
+            self._deduped += 1
+            logger.debug(f"[BROWSER POOL] Joining in-flight capture of {url}")
+
+        # Shield so one cancelled caller doesn't abort a capture others are awaiting
+        return await asyncio.shield(task)
+
+    def _on_capture_done(self, key: CaptureKey, task: "asyncio.Task[bytes]") -> None:
+        """Drop a finished capture from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved when every caller has gone away
+        if not task.cancelled():
+            task.exception()
+
+    async def _capture_queued(self, key: CaptureKey) -> bytes:
+        """Wait for a concurrency slot, then capture on a pooled browser."""
+        if self._semaphore.locked() and self._waiting >= self.max_queued:
+            raise BrowserPoolFullError(f"Screenshot queue full ({self._waiting} captures waiting)")
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            slot = await self._acquire_browser()
+            try:
+                return await self._capture_on(slot, key)
+            except Exception:
+                if not self._is_connected(slot):
+                    self._crashes += 1
+                    slot.retired = True
+                    logger.warning("[BROWSER POOL] Browser crashed during capture, recycling")
+                raise
+            finally:
+                await self._release_browser(slot)
+        finally:
+            self._semaphore.release()
+
+    async def _capture_on(self, slot: _PooledBrowser, key: CaptureKey) -> bytes:
+        """Capture a screenshot in a fresh context on ``slot``."""
+        url, viewport_width, viewport_height, full_page = key
+        context = await slot.browser.new_context(
+            viewport={"width": viewport_width, "height": viewport_height},
+            user_agent=DEFAULT_USER_AGENT,
+        )
+        try:
+            page = await context.new_page()
+            await page.goto(url, wait_until="networkidle", timeout=self.navigation_timeout_ms)
+            await page.wait_for_timeout(SETTLE_DELAY_MS)
+            screenshot: bytes = await page.screenshot(full_page=full_page, type="png")
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"[BROWSER POOL] Error closing context: {e}")
+
+        self._captures += 1
+        return screenshot
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        """Pick the least busy live browser, launching one if below pool size."""
+        async with self._lock:
+            for slot in self._browsers:
+                if not slot.retired and not self._is_connected(slot):
+                    self._crashes += 1
+                    slot.retired = True
+                    logger.warning("[BROWSER POOL] Found disconnected browser, recycling")
+            await self._close_idle_retired()
+
+            live = [slot for slot in self._browsers if not slot.retired]
+            chosen = min(live, key=lambda s: s.active, default=None)
+            if chosen is None or (chosen.active > 0 and len(live) < self.size):
+                chosen = _PooledBrowser(browser=await self._launch())
+                self._browsers.append(chosen)
+
+            chosen.active += 1
+            chosen.pages_served += 1
+            if chosen.pages_served >= self.max_pages_per_browser:
+                # Finish current captures, then close and replace
+                chosen.retired = True
+            return chosen
+
+    async def _release_browser(self, slot: _PooledBrowser) -> None:
+        """Return ``slot`` to the pool, closing it if it was retired."""
+        async with self._lock:
+            slot.active -= 1
+            await self._close_idle_retired()
+
+    async def _close_idle_retired(self) -> None:
+        """Close retired browsers with no captures in progress. Caller holds the lock."""
+        for slot in [s for s in self._browsers if s.retired and s.active == 0]:
+            self._browsers.remove(slot)
+            self._recycled += 1
+            await self._close_browser(slot)
+
+    async def _launch(self) -> Any:
+        """Launch a new headless browser."""
+        self._launches += 1
+        if self._browser_factory is not None:
+            return await self._browser_factory()
+
+        if self._playwright is None:
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError as e:
+                raise RuntimeError(
+                    "Playwright is not installed. Run: pip install playwright && playwright install chromium"
+                ) from e
+            self._playwright = await async_playwright().start()
+
+        logger.info("[BROWSER POOL] Launching headless Chromium")
+        return await self._playwright.chromium.launch(headless=True)
+
+    @staticmethod
+    def _is_connected(slot: _PooledBrowser) -> bool:
+        try:
+            return bool(slot.browser.is_connected())
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _close_browser(slot: _PooledBrowser) -> None:
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.debug(f"[BROWSER POOL] Error closing browser: {e}")
+
+    async def warm_up(self) -> None:
+        """Launch browsers until the pool holds ``size`` live instances."""
+        async with self._lock:
+            while len([s for s in self._browsers if not s.retired]) < self.size:
+                self._browsers.append(_PooledBrowser(browser=await self._launch()))
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        self._closed = True
+        for task in list(self._inflight.values()):
+            task.cancel()
+
+        async with self._lock:
+            for slot in self._browsers:
+                await self._close_browser(slot)
+            self._browsers.clear()
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"[BROWSER POOL] Error stopping Playwright: {e}")
+            self._playwright = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Get pool statistics."""
+        return {
+            "browsers": len([s for s in self._browsers if not s.retired]),
+            "active_captures": sum(s.active for s in self._browsers),
+            "queued_captures": self._waiting,
+            "captures": self._captures,
+            "deduplicated": self._deduped,
+            "launches": self._launches,
+            "recycled": self._recycled,
+            "crashes": self._crashes,
+        }
+
+
+# Singleton instance
+_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get singleton BrowserPool configured from settings."""
+    global _pool
+    if _pool is None:
+        config = get_settings().screenshot
+        _pool = BrowserPool(
+            size=config.pool_size,
+            max_concurrent=config.max_concurrent_captures,
+            max_queued=config.max_queued_captures,
+            max_pages_per_browser=config.max_pages_per_browser,
+            navigation_timeout_ms=config.navigation_timeout_ms,
+        )
+    return _pool
+
+
+async def warm_browser_pool() -> None:
+    """Launch the singleton pool's browsers ahead of the first capture.
+
+    Failures (e.g. Playwright not installed) are logged; browsers are then
+    launched on first use.
+    """
+    if not get_settings().screenshot.warm_on_startup:
+        return
+    pool = get_browser_pool()
+    try:
+        await pool.warm_up()
+        logger.info(f"[BROWSER POOL] Warmed up {pool.get_stats()['browsers']} browsers")
+    except Exception as e:
+        logger.warning(f"[BROWSER POOL] Warm-up failed, launching on demand: {e}")
+
+
+async def close_browser_pool() -> None:
+    """Close the singleton pool if it was ever started."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
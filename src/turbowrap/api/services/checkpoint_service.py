@@ -33,6 +33,26 @@ class CheckpointService:
         )
         return {str(cp.reviewer_name): cp for cp in checkpoints}
 
+    def get_resumable_reviewers(self, task_id: str) -> dict[str, ReviewCheckpoint]:
+        """Get the checkpoints a resumed review can restore.
+
+        Includes "partial" checkpoints, saved as each specialist's results
+        streamed in, so a crashed review only reruns the specialists that
+        had produced nothing yet.
+
+        Returns:
+            Dict mapping reviewer_name -> checkpoint
+        """
+        checkpoints = (
+            self.db.query(ReviewCheckpoint)
+            .filter(
+                ReviewCheckpoint.task_id == task_id,
+                ReviewCheckpoint.status.in_(("completed", "partial")),
+            )
+            .all()
+        )
+        return {str(cp.reviewer_name): cp for cp in checkpoints}
+
     def get_all_checkpoints(self, task_id: str) -> list[ReviewCheckpoint]:
         """Get all checkpoints for a task (any status).
 
@@ -64,7 +84,7 @@ class CheckpointService:
             iterations: Number of challenger iterations
             model_usage: Token/cost info
             started_at: When the reviewer started
-            status: 'completed' or 'failed'
+            status: 'completed', 'partial' or 'failed'
 
         Returns:
             The saved checkpoint
@@ -1,6 +1,7 @@
-"""Endpoint detection service using Gemini CLI.
+"""Endpoint detection service.
 
-Simple approach: let Gemini explore the repo and find ALL endpoints.
+Endpoints are found statically (see endpoint_extractor.py); Gemini CLI only
+describes the ones that are new or changed.
 """
 
 import asyncio
@@ -13,6 +14,10 @@ from typing import Any
 
 from turbowrap_llm import GeminiCLI
 
+from turbowrap.api.services.endpoint_extractor import EndpointExtractor
+from turbowrap.config import get_settings
+from turbowrap.db.models import Endpoint
+from turbowrap.llm.governor import Priority, llm_call_context
 from turbowrap.review.reviewers.utils.json_extraction import parse_llm_json
 
 logger = logging.getLogger(__name__)
@@ -58,82 +63,108 @@ class DetectionResult:
     error: str | None = None
 
 
-PROMPT = """You are a senior full-stack architect. Analyze this repository and find ALL API endpoints.
+ENRICH_PROMPT = """You are a senior full-stack architect documenting the API endpoints of this repository.
 
-## Your Task
+The endpoints below were found by static analysis. For each one, open the file at
+the given line and describe what it does.
 
-1. First, read .llms/structure.xml to understand the project structure
-2. Find ALL endpoints in two categories:
+## Endpoints
 
-### SERVED ENDPOINTS (source: "served")
-API routes EXPOSED/SERVED by this repository's backend. Look for:
-- FastAPI/Flask/Express/Django route decorators
-- Lambda handlers, serverless functions
-- Any HTTP endpoint definitions
-
-### CONSUMED ENDPOINTS (source: "consumed")
-API calls CONSUMED/USED by frontend code. Look for:
-- fetch() calls
-- axios requests
-- useSWR, useQuery, React Query hooks
-- $fetch (Nuxt), ofetch
-- Any HTTP client calls
+{endpoints}
 
 ## Output Format
 
-Return ONLY a valid JSON object (no markdown, no explanations):
+Return ONLY a valid JSON object (no markdown, no explanations), one entry per id:
 
-{
-  "framework": "fastapi",
-  "frontend_framework": "react",
+{{
   "endpoints": [
-    {
-      "method": "GET",
-      "path": "/api/users",
-      "file": "src/routes/users.py",
-      "line": 45,
+    {{
+      "id": "<id from the list>",
       "description": "List all users",
-      "source": "served",
-      "parameters": [
-        {"name": "page", "param_type": "query", "data_type": "int", "required": false, "description": "Page number"}
-      ],
-      "response_type": "List[User]",
       "auth_required": true,
       "visibility": "private",
-      "auth_type": "Bearer",
-      "tags": ["users"]
-    },
-    {
-      "method": "POST",
-      "path": "/api/login",
-      "file": "src/components/Login.tsx",
-      "line": 23,
-      "description": "Login API call from frontend",
-      "source": "consumed",
-      "parameters": [],
-      "response_type": "",
-      "auth_required": false,
-      "visibility": "public",
-      "auth_type": "",
-      "tags": ["auth"]
-    }
+      "auth_type": "Bearer"
+    }}
   ]
-}
+}}
 
 ## Rules
-- Do NOT skip any endpoints
-- Do NOT invent endpoints that don't exist
-- Always verify in actual code
-- Include the source file and line number
-- For frontend calls, extract the URL even if it uses template literals
+- visibility is one of: public, private, internal
+- auth_type is empty when no authentication is required
+- Keep descriptions to one short sentence
 """
 
-
-def detect_endpoints(repo_path: str, **_kwargs: Any) -> DetectionResult:
-    """Detect ALL API endpoints in a repository using Gemini CLI.
-
-    Gemini explores the repo autonomously and finds both backend routes
-    and frontend API calls in a single pass.
+ENRICHED_FIELDS = ("description", "auth_required", "visibility", "auth_type")
+
+
+def _endpoint_info(data: dict[str, Any]) -> EndpointInfo:
+    return EndpointInfo(
+        method=data["method"],
+        path=data["path"],
+        file=data["file"],
+        line=data.get("line"),
+        description=data.get("description", ""),
+        parameters=[EndpointParameter(**p) for p in data.get("parameters", [])],
+        response_type=data.get("response_type", ""),
+        auth_required=data.get("auth_required", False),
+        visibility=data.get("visibility", "private"),
+        auth_type=data.get("auth_type", ""),
+        tags=data.get("tags", []),
+        source=data.get("source", "served"),
+    )
+
+
+async def _enrich_endpoints(
+    repo_path: str, endpoints: list[dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """Ask Gemini Flash to describe endpoints static analysis can't.
+
+    Returns:
+        Enriched fields by endpoint fingerprint
+    """
+    from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
+
+    settings = get_settings()
+    artifact_saver = S3ArtifactSaver(
+        bucket=settings.thinking.s3_bucket,
+        region=settings.thinking.s3_region,
+        prefix="endpoint-detection",
+    )
+    cli = GeminiCLI(
+        working_dir=Path(repo_path),
+        model="flash",
+        timeout=None,
+        artifact_saver=artifact_saver,
+    )
+    listing = "\n".join(
+        f"- id={ep['fingerprint']} {ep['method']} {ep['path']} ({ep['source']}) "
+        f"{ep['file']}:{ep['line']}"
+        for ep in endpoints
+    )
+
+    logger.info(f"Running Gemini CLI to describe {len(endpoints)} endpoints in {repo_path}")
+    with llm_call_context(priority=Priority.BATCH, repository=repo_path):
+        res = await cli.run(ENRICH_PROMPT.format(endpoints=listing), save_artifacts=True)
+    if not res.success:
+        logger.error(f"Gemini CLI failed: {res.error}")
+        return {}
+
+    data = parse_llm_json(res.output.strip(), default={})
+    wanted = {ep["fingerprint"] for ep in endpoints}
+    enriched: dict[str, dict[str, Any]] = {}
+    for item in data.get("endpoints", []) if isinstance(data, dict) else []:
+        if isinstance(item, dict) and item.get("id") in wanted:
+            enriched[item["id"]] = {k: item[k] for k in ENRICHED_FIELDS if k in item}
+    return enriched
+
+
+async def adetect_endpoints(repo_path: str, use_ai: bool = True) -> DetectionResult:
+    """Detect served and consumed API endpoints in a repository.
+
+    Endpoints come from static analysis (EndpointExtractor), which only
+    re-parses files changed since the last run. With ``use_ai``, Gemini
+    describes endpoints that are new or whose handler changed; earlier
+    descriptions are reused from the extraction cache.
     """
     result = DetectionResult(detected_at=datetime.utcnow().isoformat())
 
@@ -142,94 +173,39 @@ def detect_endpoints(repo_path: str, **_kwargs: Any) -> DetectionResult:
         return result
 
     try:
-        from turbowrap.config import get_settings
-        from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
-
-        settings = get_settings()
-        artifact_saver = S3ArtifactSaver(
-            bucket=settings.thinking.s3_bucket,
-            region=settings.thinking.s3_region,
-            prefix="endpoint-detection",
-        )
-
-        cli = GeminiCLI(
-            working_dir=Path(repo_path),
-            model="flash",
-            timeout=None,
-            artifact_saver=artifact_saver,
-        )
-
-        logger.info(f"Running Gemini CLI for endpoint detection in {repo_path}")
-
-        async def run_cli() -> tuple[bool, str, str | None]:
-            res = await cli.run(PROMPT, save_artifacts=True)
-            return res.success, res.output, res.error
-
-        # Run in event loop
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop is not None:
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, run_cli())
-                success, output, error = future.result()
-        else:
-            success, output, error = asyncio.run(run_cli())
-
-        if not success:
-            logger.error(f"Gemini CLI failed: {error}")
-            result.error = str(error)
-            return result
-
-        # Parse response
-        data = parse_llm_json(output.strip(), default={})
-        if not data:
-            logger.warning("Could not parse Gemini response as JSON")
-            result.error = "Failed to parse LLM response"
-            return result
-
-        result.framework = data.get("framework", "")
-        result.frontend_framework = data.get("frontend_framework")
-
-        # Parse endpoints
-        seen: set[tuple[str, str, str]] = set()  # (method, path, source)
-        for ep in data.get("endpoints", []):
-            key = (ep.get("method", "GET").upper(), ep.get("path", ""), ep.get("source", "served"))
-            if key in seen:
-                continue
-            seen.add(key)
-
-            params = [
-                EndpointParameter(
-                    name=p.get("name", ""),
-                    param_type=p.get("param_type", "query"),
-                    data_type=p.get("data_type", "str"),
-                    required=p.get("required", False),
-                    description=p.get("description", ""),
-                )
-                for p in ep.get("parameters", [])
-            ]
-
-            result.routes.append(
-                EndpointInfo(
-                    method=ep.get("method", "GET").upper(),
-                    path=ep.get("path", ""),
-                    file=ep.get("file", ""),
-                    line=ep.get("line"),
-                    description=ep.get("description", ""),
-                    parameters=params,
-                    response_type=ep.get("response_type", ""),
-                    auth_required=ep.get("auth_required", False),
-                    visibility=ep.get("visibility", "private"),
-                    auth_type=ep.get("auth_type", ""),
-                    tags=ep.get("tags", []),
-                    source=ep.get("source", "served"),
-                )
-            )
+        extractor = EndpointExtractor(Path(repo_path))
+        extraction = await asyncio.to_thread(extractor.extract)
+        result.framework = extraction.framework
+        result.frontend_framework = extraction.frontend_framework
+
+        # One row per (method, path): served definitions win over frontend calls
+        endpoints: dict[tuple[str, str], dict[str, Any]] = {}
+        for ep in extraction.endpoints:
+            key = (ep["method"], ep["path"])
+            if key not in endpoints or (
+                ep["source"] == "served" and endpoints[key]["source"] != "served"
+            ):
+                endpoints[key] = ep
+
+        if use_ai:
+            pending = [
+                ep
+                for ep in endpoints.values()
+                if ep["fingerprint"] not in extractor.enriched and not ep["description"]
+            ][: get_settings().endpoints.enrich_max_endpoints]
+            if pending:
+                try:
+                    extractor.enriched.update(await _enrich_endpoints(repo_path, pending))
+                    extractor.save()
+                except Exception as e:
+                    # Static results are still complete without descriptions
+                    logger.warning(f"Endpoint enrichment failed: {e}")
+
+        for ep in endpoints.values():
+            enriched = extractor.enriched.get(ep["fingerprint"], {})
+            if ep["description"]:
+                enriched = {k: v for k, v in enriched.items() if k != "description"}
+            result.routes.append(_endpoint_info({**ep, **enriched}))
 
         logger.info(
             f"Detected {len(result.routes)} endpoints "
@@ -244,82 +220,90 @@ def detect_endpoints(repo_path: str, **_kwargs: Any) -> DetectionResult:
         return result
 
 
+def detect_endpoints(repo_path: str, use_ai: bool = True) -> DetectionResult:
+    """Synchronous adetect_endpoints() for callers outside an event loop."""
+    return asyncio.run(adetect_endpoints(repo_path, use_ai=use_ai))
+
+
 def save_endpoints_to_db(
     db_session: Any,
     repository_id: str,
     result: DetectionResult,
 ) -> int:
-    """Save detected endpoints to database."""
-    from turbowrap.db.models import Endpoint
+    """Sync detected endpoints to the database.
 
-    if not result.routes:
+    Existing rows are loaded once and diffed against the result: only new or
+    changed endpoints are written, and endpoints no longer detected are
+    removed (unless detection failed).
+
+    Returns:
+        Number of endpoints inserted or updated
+    """
+    existing = {
+        (row.method, row.path): row
+        for row in db_session.query(Endpoint).filter(Endpoint.repository_id == repository_id)
+    }
+    if not result.routes and (result.error or not existing):
         return 0
 
-    count = 0
+    now = datetime.utcnow()
+    inserted = updated = unchanged = 0
     for ep in result.routes:
-        existing = (
-            db_session.query(Endpoint)
-            .filter(
-                Endpoint.repository_id == repository_id,
-                Endpoint.method == ep.method.upper(),
-                Endpoint.path == ep.path,
-            )
-            .first()
-        )
-
-        params_list = [
-            {
-                "name": p.name,
-                "param_type": p.param_type,
-                "data_type": p.data_type,
-                "required": p.required,
-                "description": p.description,
-            }
-            for p in ep.parameters
-        ]
-
-        framework = result.framework if ep.source == "served" else result.frontend_framework
-
-        if existing:
-            existing.file = ep.file
-            existing.line = ep.line
-            existing.description = ep.description
-            existing.parameters = params_list
-            existing.response_type = ep.response_type
-            existing.requires_auth = ep.auth_required
-            existing.visibility = ep.visibility
-            existing.auth_type = ep.auth_type
-            existing.tags = ep.tags
-            existing.detected_at = datetime.utcnow()
-            existing.framework = framework
-            existing.source = ep.source
-            existing.updated_at = datetime.utcnow()
-        else:
+        values = {
+            "file": ep.file,
+            "line": ep.line,
+            "description": ep.description,
+            "parameters": [
+                {
+                    "name": p.name,
+                    "param_type": p.param_type,
+                    "data_type": p.data_type,
+                    "required": p.required,
+                    "description": p.description,
+                }
+                for p in ep.parameters
+            ],
+            "response_type": ep.response_type,
+            "requires_auth": ep.auth_required,
+            "visibility": ep.visibility,
+            "auth_type": ep.auth_type,
+            "tags": ep.tags,
+            "framework": result.framework if ep.source == "served" else result.frontend_framework,
+            "source": ep.source,
+        }
+        row = existing.pop((ep.method.upper(), ep.path), None)
+        if row is None:
             db_session.add(
                 Endpoint(
                     repository_id=repository_id,
                     method=ep.method.upper(),
                     path=ep.path,
-                    file=ep.file,
-                    line=ep.line,
-                    description=ep.description,
-                    parameters=params_list,
-                    response_type=ep.response_type,
-                    requires_auth=ep.auth_required,
-                    visibility=ep.visibility,
-                    auth_type=ep.auth_type,
-                    tags=ep.tags,
-                    detected_at=datetime.utcnow(),
-                    framework=framework,
-                    source=ep.source,
+                    detected_at=now,
+                    **values,
                 )
             )
+            inserted += 1
+        elif any(getattr(row, name) != value for name, value in values.items()):
+            for name, value in values.items():
+                setattr(row, name, value)
+            row.detected_at = now
+            row.updated_at = now
+            updated += 1
+        else:
+            unchanged += 1
 
-        count += 1
+    removed = 0
+    if result.error is None:
+        for row in existing.values():
+            db_session.delete(row)
+            removed += 1
 
     db_session.commit()
-    logger.info(f"Saved {count} endpoints for repository {repository_id}")
-    return count
+    logger.info(
+        f"Saved endpoints for repository {repository_id}: {inserted} new, {updated} updated, "
+        f"{unchanged} unchanged, {removed} removed"
+    )
+    return inserted + updated
 
 
 def result_to_dict(result: DetectionResult) -> dict[str, Any]:
@@ -0,0 +1,336 @@
+"""Static extraction of served and consumed HTTP endpoints.
+
+Replaces the "let an LLM explore the repo" pass of endpoint detection with
+deterministic parsing (utils/endpoint_parsing.py). Facts are extracted per
+file and cached by content hash, so re-runs only parse changed files; many
+changed files are parsed in a process pool. Router prefixes are resolved
+across modules (``include_router``/``register_blueprint``) from the cached
+facts on every run.
+
+Usage:
+    extractor = EndpointExtractor(Path(repo_path))
+    extraction = extractor.extract()
+    for endpoint in extraction.endpoints:
+        print(endpoint["method"], endpoint["path"], endpoint["file"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from turbowrap.config import get_settings
+from turbowrap.utils.endpoint_parsing import (
+    JS_EXTENSIONS,
+    PYTHON_EXTENSIONS,
+    extract_batch,
+    join_paths,
+)
+from turbowrap.utils.lint_engine import list_lint_files
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction output changes so cached facts are re-extracted
+EXTRACTOR_VERSION = 1
+
+# Generated bundles and vendored code are not worth parsing
+MAX_FILE_BYTES = 1_000_000
+SKIPPED_DIRS = {"node_modules", "dist", "build", ".next", ".nuxt", "vendor", "__pycache__"}
+MINIFIED_RE = re.compile(r"[.-]min\.\w+$")
+TEST_FILE_RE = re.compile(r"(^|/)(tests?|__tests__|e2e)/|(^|/)test_[^/]*$|\.(test|spec)\.\w+$")
+
+
+# =============================================================================
+# Cross-file resolution
+# =============================================================================
+
+
+class _PrefixResolver:
+    """Resolves the full mount prefix of routers across include_router calls."""
+
+    MAX_DEPTH = 12
+
+    def __init__(self, facts: dict[str, dict[str, Any]]):
+        self.facts = facts
+        # Module base path ("src/app/routes") -> file
+        self.modules: dict[str, str] = {}
+        for path in facts:
+            if path.endswith(".py"):
+                base = path[:-3]
+                self.modules[base[: -len("/__init__")] if base.endswith("/__init__") else base] = (
+                    path
+                )
+        # (file, router var) -> [(including file, including owner, prefix)]
+        self.mounts: dict[tuple[str, str], list[tuple[str, str, str]]] = {}
+        for path, file_facts in facts.items():
+            for owner, included, prefix in file_facts.get("includes", []):
+                target = self.resolve_name(path, included)
+                if target is not None:
+                    self.mounts.setdefault(target, []).append((path, owner, prefix))
+        self._cache: dict[tuple[str, str], str] = {}
+
+    def _module_file(self, base: str) -> str | None:
+        if base in self.modules:
+            return self.modules[base]
+        # Absolute import of a package under a source root (src/pkg/...)
+        matches = [m for m in self.modules if m.endswith("/" + base)]
+        return self.modules[matches[0]] if len(matches) == 1 else None
+
+    def resolve_name(self, path: str, name: str, depth: int = 0) -> tuple[str, str] | None:
+        """The (file, router var) a name used in ``path`` refers to."""
+        if depth > self.MAX_DEPTH:
+            return None
+        file_facts = self.facts.get(path, {})
+        if name in file_facts.get("routers", {}):
+            return path, name
+        head, _, rest = name.partition(".")
+        imported = file_facts.get("imports", {}).get(head)
+        if imported is None:
+            return None
+        base, attr = imported
+        if rest:
+            # module.router: the import names a module
+            module = self._module_file(f"{base}/{attr}" if attr else base)
+            return self.resolve_name(module, rest, depth + 1) if module else None
+        module = self._module_file(base)
+        if module is not None:
+            found = self.resolve_name(module, attr, depth + 1)
+            if found is not None:
+                return found
+        submodule = self._module_file(f"{base}/{attr}")
+        if submodule is not None:
+            return self.resolve_name(submodule, "router", depth + 1)
+        return None
+
+    def prefix(self, path: str, router: str, depth: int = 0) -> str:
+        """Mount prefix of a router (including its own prefix)."""
+        key = (path, router)
+        if key in self._cache:
+            return self._cache[key]
+        own = self.facts.get(path, {}).get("routers", {}).get(router, {}).get("prefix", "")
+        mounts = self.mounts.get(key, [])
+        outer = ""
+        if mounts and depth < self.MAX_DEPTH:
+            including_path, owner, include_prefix = mounts[0]
+            owner_key = self.resolve_name(including_path, owner) or (including_path, owner)
+            outer = join_paths(self.prefix(*owner_key, depth + 1), include_prefix)
+        result = join_paths(outer, own) if (outer != "/" or own) else "/"
+        self._cache[key] = result
+        return result
+
+
+# =============================================================================
+# Extractor
+# =============================================================================
+
+
+@dataclass
+class Extraction:
+    """Endpoints found in a repository."""
+
+    endpoints: list[dict[str, Any]] = field(default_factory=list)
+    framework: str = ""
+    frontend_framework: str | None = None
+    files_parsed: int = 0
+    files_cached: int = 0
+    duration_seconds: float = 0.0
+
+
+def endpoint_fingerprint(endpoint: dict[str, Any]) -> str:
+    """Changes when the endpoint or its handler code changes."""
+    key = "|".join(
+        [
+            endpoint["method"],
+            endpoint["path"],
+            endpoint["source"],
+            endpoint["file"],
+            endpoint.get("body_hash", ""),
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:24]
+
+
+def detect_frontend_framework(repo_path: Path) -> str | None:
+    """Frontend framework from the root package.json dependencies."""
+    package_json = repo_path / "package.json"
+    try:
+        data = json.loads(package_json.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+    for package, name in (
+        ("next", "nextjs"),
+        ("nuxt", "nuxt"),
+        ("@angular/core", "angular"),
+        ("svelte", "svelte"),
+        ("vue", "vue"),
+        ("react", "react"),
+    ):
+        if package in deps:
+            return name
+    return None
+
+
+class EndpointExtractor:
+    """Per-repository static endpoint extraction with a content-hash cache."""
+
+    def __init__(
+        self,
+        repo_path: Path,
+        cache_dir: Path | None = None,
+        workers: int | None = None,
+        pool_min_files: int | None = None,
+    ):
+        """Initialize extractor.
+
+        Args:
+            repo_path: Repository root
+            cache_dir: Where extraction caches live (default from settings)
+            workers: Worker processes for large batches (default from settings)
+            pool_min_files: Parse inline below this many changed files
+        """
+        settings = get_settings().endpoints
+        self.repo_path = repo_path.resolve()
+        self.workers = workers or settings.workers
+        self.pool_min_files = pool_min_files or settings.pool_min_files
+        repo_key = hashlib.sha256(str(self.repo_path).encode()).hexdigest()[:16]
+        self.cache_path = (cache_dir or settings.cache_dir) / f"{repo_key}.json"
+        self._data: dict[str, Any] = {"version": EXTRACTOR_VERSION, "files": {}, "enriched": {}}
+        try:
+            data = json.loads(self.cache_path.read_text())
+            if data.get("version") == EXTRACTOR_VERSION:
+                self._data = data
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[ENDPOINTS] Ignoring unreadable cache {self.cache_path}: {e}")
+
+    @property
+    def enriched(self) -> dict[str, dict[str, Any]]:
+        """LLM-enriched fields by endpoint fingerprint."""
+        enriched: dict[str, dict[str, Any]] = self._data.setdefault("enriched", {})
+        return enriched
+
+    def candidate_files(self) -> list[str]:
+        """Source files that may define or call endpoints."""
+        files = []
+        for rel_path in list_lint_files(self.repo_path):
+            if not rel_path.endswith(PYTHON_EXTENSIONS + JS_EXTENSIONS):
+                continue
+            if SKIPPED_DIRS.intersection(rel_path.split("/")) or TEST_FILE_RE.search(rel_path):
+                continue
+            if MINIFIED_RE.search(rel_path):
+                continue
+            files.append(rel_path)
+        return files
+
+    def extract(self) -> Extraction:
+        """Extract endpoints, re-parsing only files that changed."""
+        started = time.monotonic()
+        cached: dict[str, Any] = self._data["files"]
+        facts: dict[str, dict[str, Any]] = {}
+        dirty: list[tuple[str, dict[str, Any]]] = []
+
+        for rel_path in self.candidate_files():
+            path = self.repo_path / rel_path
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if stat.st_size > MAX_FILE_BYTES:
+                continue
+            entry = cached.get(rel_path)
+            state = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                facts[rel_path] = entry["facts"]
+                continue
+            content_hash = hashlib.sha256(path.read_bytes()).hexdigest()[:32]
+            if entry and entry["hash"] == content_hash:
+                entry.update(state)
+                facts[rel_path] = entry["facts"]
+                continue
+            dirty.append((rel_path, {**state, "hash": content_hash}))
+
+        for (rel_path, state), file_facts in zip(
+            dirty, self._parse([p for p, _ in dirty]), strict=True
+        ):
+            if file_facts is None:
+                continue
+            cached[rel_path] = {**state, "facts": file_facts}
+            facts[rel_path] = file_facts
+        for stale in set(cached) - set(facts):
+            del cached[stale]
+
+        extraction = self._assemble(facts)
+        extraction.files_parsed = len(dirty)
+        extraction.files_cached = len(facts) - len(dirty)
+        extraction.duration_seconds = time.monotonic() - started
+        self.save()
+        logger.info(
+            f"[ENDPOINTS] {self.repo_path.name}: {len(extraction.endpoints)} endpoints "
+            f"({extraction.files_parsed} files parsed, {extraction.files_cached} cached) "
+            f"in {extraction.duration_seconds:.2f}s"
+        )
+        return extraction
+
+    def save(self) -> None:
+        """Persist the cache (atomic replace)."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                json.dump(self._data, fh)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            logger.warning(f"[ENDPOINTS] Could not write cache {self.cache_path}: {e}")
+
+    def _parse(self, rel_paths: list[str]) -> list[dict[str, Any] | None]:
+        if len(rel_paths) < self.pool_min_files or self.workers <= 1:
+            return extract_batch(str(self.repo_path), rel_paths)
+        chunk = max(1, len(rel_paths) // (self.workers * 4))
+        batches = [rel_paths[i : i + chunk] for i in range(0, len(rel_paths), chunk)]
+        # spawn: forking a threaded server process is unsafe
+        context = multiprocessing.get_context("spawn")
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                results = pool.map(extract_batch, [str(self.repo_path)] * len(batches), batches)
+                return [facts for batch in results for facts in batch]
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"[ENDPOINTS] Process pool unavailable, parsing inline: {e}")
+            return extract_batch(str(self.repo_path), rel_paths)
+
+    def _assemble(self, facts: dict[str, dict[str, Any]]) -> Extraction:
+        resolver = _PrefixResolver(facts)
+        endpoints: list[dict[str, Any]] = []
+        frameworks: Counter[str] = Counter()
+        for rel_path in sorted(facts):
+            file_facts = facts[rel_path]
+            for raw in file_facts["endpoints"]:
+                endpoint = dict(raw)
+                if endpoint["router"]:
+                    prefix = resolver.prefix(rel_path, endpoint["router"])
+                    endpoint["path"] = join_paths(prefix, endpoint["path"])
+                    router_tags = file_facts["routers"].get(endpoint["router"], {}).get("tags")
+                    endpoint["tags"] = endpoint["tags"] or list(router_tags or [])
+                endpoint["file"] = rel_path
+                endpoint["fingerprint"] = endpoint_fingerprint(endpoint)
+                if endpoint["source"] == "served" and endpoint["framework"]:
+                    frameworks[endpoint["framework"]] += 1
+                endpoints.append(endpoint)
+        return Extraction(
+            endpoints=endpoints,
+            framework=frameworks.most_common(1)[0][0] if frameworks else "",
+            frontend_framework=detect_frontend_framework(self.repo_path),
+        )
@@ -0,0 +1,352 @@
+"""
+In-memory directory index behind the repository file APIs.
+
+The file explorer endpoints used to glob, resolve and stat the repository
+on every request, walking the whole tree (vendored directories included)
+even to show its first level. RepoFileIndex keeps a per-repository path
+trie with type, size and mtime:
+
+- Directories are scanned with ``os.scandir`` the first time they are
+  needed, so expanding one folder never walks its siblings.
+- File watcher batches (see file_watcher.py) patch the trie in place;
+  git syncs and large batches drop it to be rescanned lazily.
+- Indexes of repositories nobody is watching expire after a short TTL,
+  since nothing would tell them about changes.
+
+Hidden entries (names starting with ".") are not indexed, matching what
+the file APIs have always returned.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+
+from ...config import get_settings
+
+if TYPE_CHECKING:
+    from .file_watcher import FileChangeBatch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """A file or directory in the index."""
+
+    name: str
+    path: str  # Relative to the repository root, "/"-separated
+    is_dir: bool
+    size: int | None = None
+    mtime: float | None = None
+
+    @property
+    def extension(self) -> str:
+        return PurePosixPath(self.name).suffix if not self.is_dir else ""
+
+
+class _Node:
+    __slots__ = ("name", "is_dir", "size", "mtime", "children")
+
+    def __init__(self, name: str, is_dir: bool, size: int | None, mtime: float | None) -> None:
+        self.name = name
+        self.is_dir = is_dir
+        self.size = size
+        self.mtime = mtime
+        # Directories: None until scanned
+        self.children: dict[str, _Node] | None = None
+
+
+def split_path(rel_path: str) -> list[str]:
+    """Validated parts of a repository-relative path.
+
+    Raises:
+        ValueError: If the path is absolute or escapes the repository
+    """
+    path = PurePosixPath(rel_path.replace("\\", "/").strip("/"))
+    if rel_path.startswith("/") or any(part == ".." for part in path.parts):
+        raise ValueError(f"Invalid path: {rel_path}")
+    return [part for part in path.parts if part not in ("", ".")]
+
+
+def _normalize_extensions(extensions: Iterable[str] | None) -> set[str] | None:
+    if extensions is None:
+        return None
+    normalized = {e.strip().lower() for e in extensions if e.strip()}
+    if not normalized or "*" in normalized:
+        return None
+    return {e if e.startswith(".") else f".{e}" for e in normalized}
+
+
+class RepoFileIndex:
+    """Lazily scanned path trie of one repository."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize index.
+
+        Args:
+            root: Repository root
+        """
+        self.root = root.resolve()
+        self._lock = threading.RLock()
+        self._stats = {"dirs_scanned": 0, "resets": 0, "changes_applied": 0}
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything (rescanned on next access)."""
+        with self._lock:
+            self._root = _Node("", True, None, None)
+            self.built_at = time.monotonic()
+            self._stats["resets"] += 1
+
+    # -- Queries --------------------------------------------------------------
+
+    def get(self, rel_path: str) -> IndexEntry | None:
+        """Entry at a path, or None if it doesn't exist."""
+        parts = split_path(rel_path)
+        with self._lock:
+            node = self._find(parts)
+            return None if node is None else self._entry(node, "/".join(parts))
+
+    def list_dir(self, rel_path: str = "", pattern: str = "*") -> list[IndexEntry]:
+        """Entries directly inside a directory, sorted by name.
+
+        Raises:
+            KeyError: If the path doesn't exist
+            NotADirectoryError: If the path is a file
+        """
+        parts = split_path(rel_path)
+        with self._lock:
+            node = self._find(parts)
+            if node is None:
+                raise KeyError(rel_path)
+            if not node.is_dir:
+                raise NotADirectoryError(rel_path)
+            prefix = "/".join(parts)
+            return [
+                self._entry(child, f"{prefix}/{name}" if prefix else name)
+                for name, child in sorted(self._scan(node, parts).items())
+                if fnmatch.fnmatchcase(name, pattern)
+            ]
+
+    def iter_files(
+        self, rel_path: str = "", extensions: Iterable[str] | None = None
+    ) -> Iterator[IndexEntry]:
+        """Files under a directory (recursively, in path order).
+
+        Args:
+            rel_path: Directory to search
+            extensions: Only these extensions (".md" or "md"; "*" for all)
+        """
+        wanted = _normalize_extensions(extensions)
+        for entry in self.walk(rel_path):
+            if not entry.is_dir and (wanted is None or entry.extension.lower() in wanted):
+                yield entry
+
+    def walk(self, rel_path: str = "", max_depth: int | None = None) -> Iterator[IndexEntry]:
+        """Every entry under a directory, depth-first in path order."""
+        parts = split_path(rel_path)
+        with self._lock:
+            start = self._find(parts)
+            if start is None or not start.is_dir:
+                return
+            # Materialize under the lock: watcher batches mutate the trie
+            entries: list[IndexEntry] = []
+            stack: list[tuple[_Node, list[str], int]] = [(start, parts, 0)]
+            while stack:
+                node, node_parts, depth = stack.pop()
+                for name, child in self._scan(node, node_parts).items():
+                    child_parts = [*node_parts, name]
+                    entries.append(self._entry(child, "/".join(child_parts)))
+                    if child.is_dir and (max_depth is None or depth + 1 < max_depth):
+                        stack.append((child, child_parts, depth + 1))
+        yield from sorted(entries, key=lambda e: e.path.split("/"))
+
+    def stats(self) -> dict[str, float | int]:
+        """Scan counters and index age."""
+        with self._lock:
+            return {**self._stats, "age_seconds": time.monotonic() - self.built_at}
+
+    # -- Updates --------------------------------------------------------------
+
+    def apply_changes(self, changes: dict[str, str]) -> None:
+        """Patch the index with file watcher changes (path -> action)."""
+        with self._lock:
+            for rel_path, action in changes.items():
+                try:
+                    parts = split_path(rel_path)
+                except ValueError:
+                    continue
+                if not parts:
+                    continue
+                if action == "deleted":
+                    self._remove(parts)
+                else:
+                    self._upsert(parts)
+                self._stats["changes_applied"] += 1
+
+    def _upsert(self, parts: list[str]) -> None:
+        parent = self._root
+        for depth, name in enumerate(parts[:-1]):
+            if parent.children is None:
+                return  # Not scanned yet: the scan will find the file
+            child = parent.children.get(name)
+            if child is None:
+                if not name.startswith(".") and self.root.joinpath(*parts[: depth + 1]).is_dir():
+                    # New directory: its files are found when it is first scanned
+                    parent.children[name] = _Node(name, True, None, None)
+                return
+            parent = child
+        if parent.children is None or parts[-1].startswith("."):
+            return
+        try:
+            stat = self.root.joinpath(*parts).stat()
+        except OSError:
+            self._remove(parts)
+            return
+        node = parent.children.get(parts[-1])
+        if node is None or node.is_dir:
+            node = parent.children[parts[-1]] = _Node(parts[-1], False, None, None)
+        node.size, node.mtime = stat.st_size, stat.st_mtime
+
+    def _remove(self, parts: list[str]) -> None:
+        parent = self._find(parts[:-1], scan=False)
+        if parent is None or parent.children is None:
+            return
+        parent.children.pop(parts[-1], None)
+        # Drop directories that vanished with their last file
+        while parts[:-1] and not self.root.joinpath(*parts[:-1]).is_dir():
+            parts = parts[:-1]
+            parent = self._find(parts[:-1], scan=False)
+            if parent is None or parent.children is None:
+                return
+            parent.children.pop(parts[-1], None)
+
+    # -- Internals ------------------------------------------------------------
+
+    def _find(self, parts: list[str], scan: bool = True) -> _Node | None:
+        node = self._root
+        for depth, name in enumerate(parts):
+            if not node.is_dir:
+                return None
+            children = self._scan(node, parts[:depth]) if scan else node.children
+            if children is None or name not in children:
+                return None
+            node = children[name]
+        return node
+
+    def _scan(self, node: _Node, parts: list[str]) -> dict[str, _Node]:
+        if node.children is not None:
+            return node.children
+        children: dict[str, _Node] = {}
+        try:
+            with os.scandir(self.root.joinpath(*parts)) as it:
+                for item in it:
+                    if item.name.startswith("."):
+                        continue
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            children[item.name] = _Node(item.name, True, None, None)
+                        else:
+                            stat = item.stat()
+                            children[item.name] = _Node(
+                                item.name, False, stat.st_size, stat.st_mtime
+                            )
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"[FILE INDEX] Cannot scan {'/'.join(parts) or '.'}: {e}")
+        node.children = children
+        self._stats["dirs_scanned"] += 1
+        return children
+
+    @staticmethod
+    def _entry(node: _Node, path: str) -> IndexEntry:
+        return IndexEntry(
+            name=node.name, path=path, is_dir=node.is_dir, size=node.size, mtime=node.mtime
+        )
+
+
+class FileIndexRegistry:
+    """Per-repository indexes, kept current by the file watcher hub."""
+
+    def __init__(
+        self,
+        max_repos: int | None = None,
+        unwatched_ttl_seconds: float | None = None,
+        max_incremental_changes: int | None = None,
+    ) -> None:
+        """Initialize registry and subscribe to file watcher batches."""
+        from .file_watcher import FileWatcherService
+
+        settings = get_settings().file_index
+        self.max_repos = max_repos or settings.max_repos
+        self.unwatched_ttl_seconds = (
+            unwatched_ttl_seconds
+            if unwatched_ttl_seconds is not None
+            else settings.unwatched_ttl_seconds
+        )
+        self.max_incremental_changes = max_incremental_changes or settings.max_incremental_changes
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[str, RepoFileIndex] = OrderedDict()
+        self._watcher = FileWatcherService.get_instance()
+        self._watcher.add_listener(self._on_batch)
+
+    def get(self, repo_id: str, repo_path: str | Path) -> RepoFileIndex:
+        """Index of a repository (created on first use)."""
+        root = Path(repo_path).resolve()
+        with self._lock:
+            index = self._indexes.get(repo_id)
+            if index is None or index.root != root:
+                index = self._indexes[repo_id] = RepoFileIndex(root)
+            self._indexes.move_to_end(repo_id)
+            while len(self._indexes) > self.max_repos:
+                self._indexes.popitem(last=False)
+        watched = repo_id in self._watcher.watched_repo_ids
+        if not watched and time.monotonic() - index.built_at > self.unwatched_ttl_seconds:
+            index.reset()
+        return index
+
+    def invalidate(self, repo_id: str) -> None:
+        """Rescan a repository on next access (after git operations)."""
+        with self._lock:
+            index = self._indexes.get(repo_id)
+        if index is not None:
+            index.reset()
+
+    def apply_changes(self, repo_id: str, changes: dict[str, str]) -> None:
+        """Patch a repository's index (no-op if it isn't indexed)."""
+        with self._lock:
+            index = self._indexes.get(repo_id)
+        if index is None:
+            return
+        if len(changes) > self.max_incremental_changes:
+            # Checkouts and installs: rescanning lazily is cheaper
+            index.reset()
+        else:
+            index.apply_changes(changes)
+
+    def _on_batch(self, batch: FileChangeBatch) -> None:
+        self.apply_changes(batch.repo_id, batch.changes)
+
+
+_registry: FileIndexRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_file_index_registry() -> FileIndexRegistry:
+    """Get the process-wide file index registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = FileIndexRegistry()
+    return _registry
@@ -1,8 +1,14 @@
 """
 File watcher service - real-time file change detection using watchdog.
 
-Provides a singleton service that watches a repository directory and
-broadcasts file change events to SSE subscribers.
+A singleton hub that watches any number of repositories on one watchdog
+observer. Raw events are coalesced per repository into change batches
+(one batch for a whole ``git checkout`` or ``npm install`` instead of
+thousands of events) which are published to SSE subscribers and to
+in-process listeners such as caches and indexes.
+
+A batch closes once its repository has been quiet for ``quiet_seconds``
+or has been collecting for ``max_batch_seconds``, whichever comes first.
 """
 
 from __future__ import annotations
@@ -10,108 +16,143 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from watchdog.events import (
-    DirCreatedEvent,
-    DirDeletedEvent,
-    DirModifiedEvent,
-    DirMovedEvent,
-    FileCreatedEvent,
-    FileDeletedEvent,
-    FileModifiedEvent,
-    FileMovedEvent,
-    FileSystemEventHandler,
-)
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from ...config import get_settings
+from ...utils.file_utils import IGNORE_DIRS
+
 logger = logging.getLogger(__name__)
 
+# Editor swap files and compiler output
+IGNORED_SUFFIXES = (".pyc", ".pyo", ".swp", ".swo", "~", ".tmp")
+ALLOWED_HIDDEN = {".env", ".envrc"}
 
-class FileChangeHandler(FileSystemEventHandler):
-    """Handler that receives watchdog events and broadcasts them."""
+BatchListener = Callable[["FileChangeBatch"], None]
 
-    def __init__(self, service: FileWatcherService, repo_id: str) -> None:
-        super().__init__()
-        self.service = service
-        self.repo_id = repo_id
-        # Debounce: track recent events to avoid duplicates
-        self._recent_events: dict[str, float] = {}
-        self._debounce_seconds = 0.5
-
-    def _should_ignore(self, path: str) -> bool:
-        """Check if this path should be ignored."""
-        # Ignore hidden files/folders (except .env, etc.)
-        parts = Path(path).parts
-        for part in parts:
-            if part.startswith(".") and part not in (".env", ".envrc"):
-                return True
-        # Ignore common temp files
-        if path.endswith((".pyc", ".pyo", ".swp", ".swo", "~", ".tmp")):
-            return True
-        return "__pycache__" in path
 
-    def _debounce(self, path: str) -> bool:
-        """Return True if event should be processed (not debounced)."""
-        import time
+def _coalesce(previous: str | None, action: str) -> str | None:
+    """Net effect of two actions on the same path within one batch.
 
-        now = time.time()
-        last_time = self._recent_events.get(path, 0)
-        if now - last_time < self._debounce_seconds:
-            return False
-        self._recent_events[path] = now
-        # Cleanup old entries
-        cutoff = now - 5.0
-        self._recent_events = {k: v for k, v in self._recent_events.items() if v > cutoff}
-        return True
-
-    def _emit_event(self, action: str, path: str, dest_path: str | None = None) -> None:
-        """Emit file change event."""
-        if self._should_ignore(path):
-            return
-        if not self._debounce(path):
-            return
+    Returns:
+        The combined action, or None if the path is back where it started
+    """
+    if previous is None:
+        return action
+    if previous == "created":
+        return None if action == "deleted" else "created"
+    if previous == "deleted" and action == "created":
+        return "modified"
+    return action
+
+
+@dataclass
+class FileChangeBatch:
+    """Coalesced file changes of one repository."""
+
+    repo_id: str
+    repo_path: Path
+    # Relative path -> net action (created, modified, deleted)
+    changes: dict[str, str] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.monotonic)
+    last_event_at: float = field(default_factory=time.monotonic)
+    raw_events: int = 0
 
-        event_data = {
-            "action": action,
-            "path": path,
-            "dest_path": dest_path,
+    @property
+    def paths(self) -> list[str]:
+        """Changed paths, relative to the repository root."""
+        return list(self.changes)
+
+    def to_event(self, max_paths: int) -> dict[str, Any]:
+        """SSE payload (path list capped at ``max_paths``)."""
+        changes = [
+            {"action": action, "path": path}
+            for path, action in list(self.changes.items())[:max_paths]
+        ]
+        return {
+            "type": "batch",
             "repo_id": self.repo_id,
+            "count": len(self.changes),
+            "raw_events": self.raw_events,
+            "changes": changes,
+            "truncated": len(self.changes) > max_paths,
         }
-        logger.debug(f"[FileWatcher] {action}: {path}")
-        self.service._broadcast(event_data)
 
-    # File events
-    def on_created(self, event: FileCreatedEvent | DirCreatedEvent) -> None:
-        if not event.is_directory:
-            self._emit_event("created", str(event.src_path))
 
-    def on_deleted(self, event: FileDeletedEvent | DirDeletedEvent) -> None:
-        if not event.is_directory:
-            self._emit_event("deleted", str(event.src_path))
+class FileChangeHandler(FileSystemEventHandler):
+    """Handler that forwards one repository's watchdog events to the hub."""
 
-    def on_modified(self, event: FileModifiedEvent | DirModifiedEvent) -> None:
-        if not event.is_directory:
-            self._emit_event("modified", str(event.src_path))
+    def __init__(self, service: FileWatcherService, repo_id: str, repo_path: Path) -> None:
+        super().__init__()
+        self.service = service
+        self.repo_id = repo_id
+        self.repo_path = repo_path
 
-    def on_moved(self, event: FileMovedEvent | DirMovedEvent) -> None:
-        if not event.is_directory:
-            dest = str(event.dest_path) if event.dest_path else None
-            self._emit_event("moved", str(event.src_path), dest)
+    def _relative(self, path: str) -> str | None:
+        """Repository-relative path, or None if the path should be ignored."""
+        try:
+            relative = Path(path).relative_to(self.repo_path)
+        except ValueError:
+            return None
+        for part in relative.parts:
+            if part in IGNORE_DIRS or (part.startswith(".") and part not in ALLOWED_HIDDEN):
+                return None
+        if relative.name.endswith(IGNORED_SUFFIXES):
+            return None
+        return relative.as_posix()
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.is_directory or event.event_type not in (
+            "created",
+            "deleted",
+            "modified",
+            "moved",
+        ):
+            return
+        src = self._relative(str(event.src_path))
+        if event.event_type == "moved":
+            # A move is a delete plus a create, so batches only hold net actions
+            dest = self._relative(str(event.dest_path)) if event.dest_path else None
+            if src is not None:
+                self.service._record(self.repo_id, "deleted", src)
+            if dest is not None:
+                self.service._record(self.repo_id, "created", dest)
+        elif src is not None:
+            self.service._record(self.repo_id, event.event_type, src)
+
+
+@dataclass
+class _WatchedRepo:
+    repo_id: str
+    path: Path
+    watch: Any  # watchdog ObservedWatch
+    batches_published: int = 0
+    last_batch_at: float | None = None
+
+
+@dataclass
+class _Subscriber:
+    queue: asyncio.Queue[dict[str, Any]]
+    loop: asyncio.AbstractEventLoop
+    repo_ids: set[str] | None
 
 
 class FileWatcherService:
-    """Singleton service for watching file changes in repositories.
-
-    Manages a watchdog observer that watches the current repository and
-    broadcasts file change events to SSE subscribers.
+    """Singleton hub watching file changes in several repositories.
 
     Usage:
         service = FileWatcherService.get_instance()
-        service.switch_repo(repo_id, repo_path)
-        queue = service.subscribe()
-        # ... receive events from queue ...
+        service.watch(repo_id, repo_path)
+        queue = service.subscribe()            # SSE: batch events
+        service.add_listener(on_batch)         # in-process consumers
+        # ... receive batches ...
         service.unsubscribe(queue)
     """
 
@@ -120,11 +161,23 @@ class FileWatcherService:
 
     def __init__(self) -> None:
         """Initialize the service (private - use get_instance())."""
-        self._current_repo_id: str | None = None
-        self._current_repo_path: Path | None = None
+        settings = get_settings().file_watcher
+        self.quiet_seconds = settings.quiet_seconds
+        self.max_batch_seconds = settings.max_batch_seconds
+        self.max_repos = settings.max_repos
+        self.max_event_paths = settings.max_event_paths
+
+        self._state_lock = threading.Lock()
         self._observer: Any = None  # Observer type not recognized by mypy
-        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
-        self._loop: asyncio.AbstractEventLoop | None = None
+        # Least recently requested first (evicted above max_repos)
+        self._repos: OrderedDict[str, _WatchedRepo] = OrderedDict()
+        self._pending: dict[str, FileChangeBatch] = {}
+        self._subscribers: list[_Subscriber] = []
+        self._listeners: list[BatchListener] = []
+        self._current_repo_id: str | None = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     @classmethod
     def get_instance(cls) -> FileWatcherService:
@@ -137,74 +190,113 @@ class FileWatcherService:
 
     @property
     def current_repo_id(self) -> str | None:
-        """Get the currently watched repository ID."""
+        """Get the most recently selected repository ID."""
         return self._current_repo_id
 
+    @property
+    def watched_repo_ids(self) -> list[str]:
+        """IDs of every watched repository."""
+        return list(self._repos)
+
     @property
     def subscriber_count(self) -> int:
         """Get the number of active subscribers."""
         return len(self._subscribers)
 
-    def switch_repo(self, repo_id: str | None, repo_path: str | None) -> bool:
-        """Switch to watching a different repository.
+    # -- Watching -------------------------------------------------------------
 
-        Args:
-            repo_id: Repository ID (or None to stop watching).
-            repo_path: Local path to repository (or None to stop watching).
+    def watch(self, repo_id: str, repo_path: str | Path) -> bool:
+        """Start watching a repository (no-op if it is already watched).
+
+        Watching more than ``max_repos`` repositories stops watching the
+        least recently requested one.
 
         Returns:
-            True if switch was successful.
+            True if the repository is being watched.
         """
-        # No change needed
-        if repo_id == self._current_repo_id:
-            return True
-
-        # Stop current observer
-        self._stop_observer()
-
-        if repo_id is None or repo_path is None:
-            self._current_repo_id = None
-            self._current_repo_path = None
-            logger.info("[FileWatcher] Stopped watching (no repo)")
-            return True
-
-        # Start new observer
-        path = Path(repo_path)
-        if not path.exists():
+        path = Path(repo_path).resolve()
+        with self._state_lock:
+            existing = self._repos.get(repo_id)
+            if existing is not None and existing.path == path:
+                self._repos.move_to_end(repo_id)
+                return True
+        if existing is not None:
+            self.unwatch(repo_id)
+        if not path.is_dir():
             logger.warning(f"[FileWatcher] Path does not exist: {repo_path}")
             return False
 
-        self._current_repo_id = repo_id
-        self._current_repo_path = path
-        self._start_observer()
+        try:
+            observer = self._ensure_running()
+            watch = observer.schedule(
+                FileChangeHandler(self, repo_id, path), str(path), recursive=True
+            )
+        except Exception as e:
+            logger.error(f"[FileWatcher] Failed to watch {repo_path}: {e}")
+            return False
 
-        logger.info(f"[FileWatcher] Now watching repo {repo_id}: {repo_path}")
-        return True
+        with self._state_lock:
+            self._repos[repo_id] = _WatchedRepo(repo_id=repo_id, path=path, watch=watch)
+            evicted = list(self._repos)[: max(0, len(self._repos) - self.max_repos)]
+        for old_id in evicted:
+            logger.info(
+                f"[FileWatcher] Watching more than {self.max_repos} repos, dropping {old_id}"
+            )
+            self.unwatch(old_id)
 
-    def _start_observer(self) -> None:
-        """Start the watchdog observer for current repo."""
-        if self._observer is not None:
-            self._stop_observer()
+        logger.info(f"[FileWatcher] Now watching repo {repo_id}: {path}")
+        return True
 
-        if self._current_repo_path is None or self._current_repo_id is None:
-            return
+    def unwatch(self, repo_id: str) -> bool:
+        """Stop watching a repository (pending changes are published first).
 
+        Returns:
+            True if the repository was being watched.
+        """
+        with self._state_lock:
+            repo = self._repos.pop(repo_id, None)
+            batch = self._pending.pop(repo_id, None)
+        if repo is None:
+            return False
+        if batch is not None:
+            self._publish(batch)
         try:
-            self._observer = Observer()
-            handler = FileChangeHandler(self, self._current_repo_id)
-            self._observer.schedule(
-                handler,
-                str(self._current_repo_path),
-                recursive=True,
-            )
-            self._observer.start()
-            logger.info(f"[FileWatcher] Observer started for {self._current_repo_path}")
+            self._observer.unschedule(repo.watch)
         except Exception as e:
-            logger.error(f"[FileWatcher] Failed to start observer: {e}")
-            self._observer = None
+            logger.warning(f"[FileWatcher] Error unscheduling {repo_id}: {e}")
+        if self._current_repo_id == repo_id:
+            self._current_repo_id = None
+        logger.info(f"[FileWatcher] Stopped watching repo {repo_id}")
+        return True
+
+    def switch_repo(self, repo_id: str | None, repo_path: str | None) -> bool:
+        """Mark a repository as the one in view and make sure it is watched.
+
+        Other watched repositories keep receiving updates.
+
+        Args:
+            repo_id: Repository ID (or None when no repository is selected).
+            repo_path: Local path to repository.
+
+        Returns:
+            True if the repository is being watched.
+        """
+        if repo_id is None or repo_path is None:
+            self._current_repo_id = None
+            return True
+        if not self.watch(repo_id, repo_path):
+            return False
+        self._current_repo_id = repo_id
+        return True
 
-    def _stop_observer(self) -> None:
-        """Stop the current watchdog observer."""
+    def stop(self) -> None:
+        """Publish pending batches and stop the observer and flush thread."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=2.0)
+            self._flusher = None
+        self._flush(force=True)
         if self._observer is not None:
             try:
                 self._observer.stop()
@@ -213,15 +305,125 @@ class FileWatcherService:
                 logger.warning(f"[FileWatcher] Error stopping observer: {e}")
             finally:
                 self._observer = None
+        with self._state_lock:
+            self._repos.clear()
+        self._current_repo_id = None
+        self._stopping.clear()
+
+    def _ensure_running(self) -> Any:
+        """Start the shared observer and the flush thread if needed."""
+        with self._state_lock:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.start()
+                logger.info("[FileWatcher] Observer started")
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="file-watcher-flush", daemon=True
+                )
+                self._flusher.start()
+            return self._observer
+
+    # -- Batching -------------------------------------------------------------
+
+    def _record(self, repo_id: str, action: str, path: str) -> None:
+        """Add one raw event to the repository's open batch (watchdog thread)."""
+        now = time.monotonic()
+        with self._state_lock:
+            repo = self._repos.get(repo_id)
+            if repo is None:
+                return
+            batch = self._pending.get(repo_id)
+            if batch is None:
+                batch = self._pending[repo_id] = FileChangeBatch(
+                    repo_id=repo_id, repo_path=repo.path, started_at=now
+                )
+                self._wakeup.set()
+            batch.raw_events += 1
+            batch.last_event_at = now
+            combined = _coalesce(batch.changes.pop(path, None), action)
+            if combined is not None:
+                batch.changes[path] = combined
+
+    def _flush_loop(self) -> None:
+        while not self._stopping.is_set():
+            with self._state_lock:
+                pending = bool(self._pending)
+            if not pending:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            time.sleep(min(self.quiet_seconds, self.max_batch_seconds) / 2)
+            self._flush()
+
+    def _flush(self, force: bool = False) -> int:
+        """Publish every batch that is complete.
+
+        Returns:
+            Number of batches published
+        """
+        now = time.monotonic()
+        ready: list[FileChangeBatch] = []
+        with self._state_lock:
+            for repo_id, batch in list(self._pending.items()):
+                quiet = now - batch.last_event_at >= self.quiet_seconds
+                too_long = now - batch.started_at >= self.max_batch_seconds
+                if force or quiet or too_long:
+                    ready.append(self._pending.pop(repo_id))
+        for batch in ready:
+            self._publish(batch)
+        return len(ready)
+
+    def _publish(self, batch: FileChangeBatch) -> None:
+        if not batch.changes:
+            return
+        with self._state_lock:
+            repo = self._repos.get(batch.repo_id)
+            if repo is not None:
+                repo.batches_published += 1
+                repo.last_batch_at = time.time()
+            listeners = list(self._listeners)
+        logger.debug(
+            f"[FileWatcher] {batch.repo_id}: {len(batch.changes)} files changed "
+            f"({batch.raw_events} events)"
+        )
+        for listener in listeners:
+            try:
+                listener(batch)
+            except Exception as e:
+                logger.warning(f"[FileWatcher] Listener {listener!r} failed: {e}")
+        self._broadcast(batch.to_event(self.max_event_paths))
 
-    def subscribe(self) -> asyncio.Queue[dict[str, Any]]:
-        """Subscribe to file change events.
+    # -- Consumers ------------------------------------------------------------
+
+    def add_listener(self, listener: BatchListener) -> None:
+        """Call ``listener(batch)`` for every published batch.
+
+        Listeners run on the watcher's flush thread and must not block.
+        """
+        with self._state_lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: BatchListener) -> None:
+        """Stop calling a listener."""
+        with self._state_lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def subscribe(self, repo_ids: set[str] | None = None) -> asyncio.Queue[dict[str, Any]]:
+        """Subscribe to batch events (call from the event loop).
+
+        Args:
+            repo_ids: Only receive batches of these repositories (default: all).
 
         Returns:
-            Queue that will receive file change events.
+            Queue that will receive batch events.
         """
         queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=100)
-        self._subscribers.append(queue)
+        subscriber = _Subscriber(queue=queue, loop=asyncio.get_running_loop(), repo_ids=repo_ids)
+        with self._state_lock:
+            self._subscribers.append(subscriber)
         logger.debug(f"[FileWatcher] New subscriber, total: {len(self._subscribers)}")
         return queue
 
@@ -231,31 +433,51 @@ class FileWatcherService:
         Args:
             queue: Queue to remove from subscribers.
         """
-        if queue in self._subscribers:
-            self._subscribers.remove(queue)
-            logger.debug(f"[FileWatcher] Subscriber removed, total: {len(self._subscribers)}")
+        with self._state_lock:
+            self._subscribers = [s for s in self._subscribers if s.queue is not queue]
+        logger.debug(f"[FileWatcher] Subscriber removed, total: {len(self._subscribers)}")
 
     def _broadcast(self, event: dict[str, Any]) -> None:
-        """Broadcast event to all subscribers.
-
-        Called from watchdog handler thread, so we need to be thread-safe.
-        """
-        dead_subscribers = []
-        for queue in self._subscribers:
+        """Hand an event to every interested subscriber's event loop."""
+        with self._state_lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.repo_ids is not None and event["repo_id"] not in subscriber.repo_ids:
+                continue
             try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                dead_subscribers.append(queue)
+                subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, event)
+            except RuntimeError:
+                # Loop closed: the client is gone
+                self.unsubscribe(subscriber.queue)
 
-        # Remove dead subscribers
-        for queue in dead_subscribers:
-            self._subscribers.remove(queue)
+    def _deliver(self, subscriber: _Subscriber, event: dict[str, Any]) -> None:
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("[FileWatcher] Dropping subscriber that stopped reading")
+            self.unsubscribe(subscriber.queue)
 
     def get_status(self) -> dict[str, Any]:
         """Get current watcher status."""
+        with self._state_lock:
+            repos = [
+                {
+                    "repo_id": repo.repo_id,
+                    "repo_path": str(repo.path),
+                    "pending_changes": len(self._pending[repo.repo_id].changes)
+                    if repo.repo_id in self._pending
+                    else 0,
+                    "batches_published": repo.batches_published,
+                    "last_batch_at": repo.last_batch_at,
+                }
+                for repo in self._repos.values()
+            ]
+        current = self._repos.get(self._current_repo_id or "")
         return {
             "repo_id": self._current_repo_id,
-            "repo_path": str(self._current_repo_path) if self._current_repo_path else None,
+            "repo_path": str(current.path) if current else None,
+            "repos": repos,
             "observer_running": self._observer is not None and self._observer.is_alive(),
             "subscriber_count": len(self._subscribers),
+            "listener_count": len(self._listeners),
         }
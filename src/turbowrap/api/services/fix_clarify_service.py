@@ -25,6 +25,7 @@ from turbowrap.api.services.operation_tracker import (
 )
 from turbowrap.config import get_settings
 from turbowrap.db.models import Issue, IssueStatus
+from turbowrap.llm.governor import Priority, llm_call_context
 from turbowrap.review.reviewers.utils.json_extraction import parse_llm_json
 from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
 
@@ -312,7 +313,9 @@ Respond ONLY with valid JSON:
             f"(turn {session.turn_count + 1}, issues: {len(issues)})"
         )
 
-        result = await session.send(prompt)
+        # The user is waiting on the clarification dialog
+        with llm_call_context(priority=Priority.INTERACTIVE):
+            result = await session.send(prompt)
 
         if not result.output:
             raise Exception("No response from Claude")
@@ -0,0 +1,326 @@
+"""Issue store service - fingerprint-based persistence of review issues.
+
+Every issue gets a stable fingerprint (see review/utils/fingerprint.py), so
+re-reviews update the existing row instead of inserting a duplicate. Rows
+are written in bulk: one SELECT per chunk of fingerprints, one executemany
+UPDATE and one executemany INSERT per review.
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from turbowrap.db.models import Issue, IssueStatus, Task, generate_uuid
+from turbowrap.db.models.base import now_utc
+from turbowrap.orchestration.report_utils import get_severity_rank
+from turbowrap.review.models.review import Issue as ReviewIssue
+from turbowrap.review.models.review import IssueCategory, IssueSeverity
+from turbowrap.review.utils.fingerprint import issue_fingerprint, normalize_issue_path
+
+logger = logging.getLogger(__name__)
+
+# Max bound parameters per IN (...) query (SQLite's limit is 999)
+FINGERPRINT_CHUNK = 500
+
+# Statuses where a re-reported issue updates the existing row
+ACTIVE_STATUSES = (
+    IssueStatus.OPEN.value,
+    IssueStatus.IN_PROGRESS.value,
+    IssueStatus.IN_REVIEW.value,
+)
+# Triaged as not-a-problem: re-reports are suppressed
+SUPPRESSED_STATUSES = (IssueStatus.IGNORED.value, IssueStatus.DUPLICATE.value)
+
+AUTO_RESOLVE_NOTE = "Auto-resolved: no longer reported by review"
+
+
+@dataclass
+class IssueUpsertResult:
+    """Outcome of an issue upsert."""
+
+    inserted: int = 0
+    updated: int = 0
+    reopened: int = 0
+    suppressed: int = 0
+    resolved: int = 0
+    # DB ids of the rows representing this review's issues (report order)
+    issue_ids: list[str] = field(default_factory=list)
+
+
+def review_issue_fingerprint(issue: ReviewIssue) -> str:
+    """Fingerprint of a review issue."""
+    category = issue.category.value if hasattr(issue.category, "value") else str(issue.category)
+    return issue_fingerprint(issue.file, category, issue.title, issue.current_code, issue.line)
+
+
+def _chunks(items: list[str], size: int = FINGERPRINT_CHUNK) -> Iterable[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class IssueStoreService:
+    """Service for upserting review issues by fingerprint."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def upsert_review_issues(
+        self,
+        task_id: str,
+        repository_id: str,
+        issues: list[ReviewIssue],
+        reviewed_files: list[str] | None = None,
+    ) -> IssueUpsertResult:
+        """Insert new issues, update known ones and resolve vanished ones.
+
+        Args:
+            task_id: Review task the issues belong to
+            repository_id: Repository ID
+            issues: Issues reported by the review
+            reviewed_files: Files the review covered. Open review issues in
+                these files that were not reported again are auto-resolved.
+                None disables auto-resolution (partial or late results).
+
+        Returns:
+            IssueUpsertResult with counts and the row ids of this review's issues
+
+        Note:
+            Does not commit; the caller owns the transaction.
+        """
+        result = IssueUpsertResult()
+        now = now_utc()
+
+        reported = self._collapse(issues)
+        self._backfill_fingerprints(repository_id)
+        existing = self._load_existing(repository_id, list(reported))
+
+        inserts: list[dict[str, Any]] = []
+        updates: list[dict[str, Any]] = []
+        for fingerprint, issue in reported.items():
+            row = existing.get(fingerprint)
+            values = self._issue_values(issue)
+
+            if row is not None and row.status in SUPPRESSED_STATUSES:
+                result.suppressed += 1
+                continue
+
+            auto_resolved = (
+                row is not None
+                and row.status == IssueStatus.RESOLVED.value
+                and row.resolution_note == AUTO_RESOLVE_NOTE
+            )
+            if row is not None and (row.status in ACTIVE_STATUSES or auto_resolved):
+                flagged_by = list(row.flagged_by or [])
+                flagged_by += [name for name in issue.flagged_by if name not in flagged_by]
+                values.update(
+                    id=row.id, task_id=task_id, flagged_by=flagged_by or None, updated_at=now
+                )
+                if auto_resolved:
+                    values.update(
+                        status=IssueStatus.OPEN.value, resolved_at=None, resolution_note=None
+                    )
+                    result.reopened += 1
+                updates.append(values)
+                result.issue_ids.append(cast(str, row.id))
+                continue
+
+            # New issue, or a regression of one that was fixed by hand
+            issue_id = generate_uuid()
+            values.update(
+                id=issue_id,
+                task_id=task_id,
+                repository_id=repository_id,
+                fingerprint=fingerprint,
+                status=IssueStatus.OPEN.value,
+                created_at=now,
+                updated_at=now,
+            )
+            inserts.append(values)
+            result.issue_ids.append(issue_id)
+
+        if updates:
+            self.db.execute(update(Issue), updates)
+        if inserts:
+            self.db.execute(insert(Issue), inserts)
+        result.inserted = len(inserts)
+        result.updated = len(updates) - result.reopened
+
+        if reviewed_files is not None:
+            result.resolved = self._resolve_missing(
+                task_id, repository_id, set(reported), reviewed_files, now
+            )
+
+        logger.info(
+            f"[ISSUES] Task {task_id}: {result.inserted} new, {result.updated} updated, "
+            f"{result.reopened} reopened, {result.resolved} resolved, "
+            f"{result.suppressed} suppressed"
+        )
+        return result
+
+    def get_task_issues(self, task_id: str) -> list[ReviewIssue]:
+        """Load the issues currently attributed to a task as review models."""
+        rows = (
+            self.db.query(Issue).filter(Issue.task_id == task_id, Issue.deleted_at.is_(None)).all()
+        )
+        issues: list[ReviewIssue] = []
+        for row in rows:
+            try:
+                severity = IssueSeverity(row.severity)
+            except ValueError:
+                severity = IssueSeverity.MEDIUM
+            try:
+                category = IssueCategory(row.category)
+            except ValueError:
+                category = IssueCategory.LOGIC
+            issues.append(
+                ReviewIssue(
+                    id=cast(str, row.issue_code),
+                    severity=severity,
+                    category=category,
+                    rule=row.rule,
+                    file=cast(str, row.file),
+                    line=row.line,
+                    title=cast(str, row.title),
+                    description=cast(str, row.description),
+                    current_code=row.current_code,
+                    suggested_fix=row.suggested_fix,
+                    flagged_by=list(row.flagged_by or []),
+                )
+            )
+        return issues
+
+    @staticmethod
+    def _collapse(issues: list[ReviewIssue]) -> dict[str, ReviewIssue]:
+        """Merge issues of one review that share a fingerprint."""
+        reported: dict[str, ReviewIssue] = {}
+        for issue in issues:
+            fingerprint = review_issue_fingerprint(issue)
+            existing = reported.get(fingerprint)
+            if existing is None:
+                reported[fingerprint] = issue.model_copy(deep=True)
+                continue
+            if get_severity_rank(issue.severity) > get_severity_rank(existing.severity):
+                existing.severity = issue.severity
+            for name in issue.flagged_by:
+                if name not in existing.flagged_by:
+                    existing.flagged_by.append(name)
+        return reported
+
+    @staticmethod
+    def _issue_values(issue: ReviewIssue) -> dict[str, Any]:
+        """Column values taken from the latest report of an issue."""
+        return {
+            "issue_code": issue.id,
+            "severity": (
+                issue.severity.value if hasattr(issue.severity, "value") else str(issue.severity)
+            ),
+            "category": (
+                issue.category.value if hasattr(issue.category, "value") else str(issue.category)
+            ),
+            "rule": issue.rule,
+            "file": issue.file,
+            "line": issue.line,
+            "title": issue.title,
+            "description": issue.description,
+            "current_code": issue.current_code,
+            "suggested_fix": issue.suggested_fix,
+            "references": issue.references if issue.references else None,
+            "flagged_by": issue.flagged_by if issue.flagged_by else None,
+            "estimated_effort": issue.estimated_effort,
+            "estimated_files_count": issue.estimated_files_count,
+        }
+
+    def _backfill_fingerprints(self, repository_id: str) -> None:
+        """Fingerprint rows saved before fingerprints existed (one-time per repository)."""
+        rows: list[Any] = (
+            self.db.query(
+                Issue.id, Issue.file, Issue.category, Issue.title, Issue.current_code, Issue.line
+            )
+            .filter(
+                Issue.repository_id == repository_id,
+                Issue.fingerprint.is_(None),
+                Issue.deleted_at.is_(None),
+            )
+            .all()
+        )
+        if not rows:
+            return
+        self.db.execute(
+            update(Issue),
+            [
+                {
+                    "id": row.id,
+                    "fingerprint": issue_fingerprint(
+                        row.file, row.category, row.title, row.current_code, row.line
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        logger.info(f"[ISSUES] Backfilled fingerprints for {len(rows)} issues in {repository_id}")
+
+    def _load_existing(self, repository_id: str, fingerprints: list[str]) -> dict[str, Issue]:
+        """Find the row to reuse for each fingerprint (active rows first, then newest)."""
+        candidates: list[Issue] = []
+        for chunk in _chunks(fingerprints):
+            candidates.extend(
+                self.db.query(Issue)
+                .filter(
+                    Issue.repository_id == repository_id,
+                    Issue.fingerprint.in_(chunk),
+                    Issue.deleted_at.is_(None),
+                )
+                .all()
+            )
+
+        def preference(row: Issue) -> tuple[bool, str]:
+            return row.status in ACTIVE_STATUSES, str(row.updated_at or row.created_at or "")
+
+        existing: dict[str, Issue] = {}
+        for row in candidates:
+            fingerprint = cast(str, row.fingerprint)
+            current = existing.get(fingerprint)
+            if current is None or preference(row) > preference(current):
+                existing[fingerprint] = row
+        return existing
+
+    def _resolve_missing(
+        self,
+        task_id: str,
+        repository_id: str,
+        reported: set[str],
+        reviewed_files: list[str],
+        now: Any,
+    ) -> int:
+        """Resolve open review issues in reviewed files that were not reported again."""
+        files = {normalize_issue_path(f) for f in reviewed_files}
+        rows: list[Any] = (
+            self.db.query(Issue.id, Issue.file, Issue.fingerprint)
+            .join(Task, Issue.task_id == Task.id)
+            .filter(
+                Issue.repository_id == repository_id,
+                Issue.status == IssueStatus.OPEN.value,
+                Issue.task_id != task_id,
+                Issue.deleted_at.is_(None),
+                Task.type == "review",
+            )
+            .all()
+        )
+        stale = [
+            {
+                "id": row.id,
+                "status": IssueStatus.RESOLVED.value,
+                "resolved_at": now,
+                "resolution_note": AUTO_RESOLVE_NOTE,
+                "updated_at": now,
+            }
+            for row in rows
+            if row.fingerprint not in reported and normalize_issue_path(row.file) in files
+        ]
+        if stale:
+            self.db.execute(update(Issue), stale)
+        return len(stale)
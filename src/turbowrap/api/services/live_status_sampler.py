@@ -0,0 +1,428 @@
+"""
+Background sampler for the live status endpoint.
+
+``GET /status/live`` is polled by every open status page every 2-5 seconds.
+It used to walk ``psutil.process_iter`` twice per request and fetch
+cmdline/cwd/cpu for each candidate process, so the cost grew with the
+number of viewers. This sampler does one scan per interval instead, keeps
+the snapshots in a ring buffer (for sparklines), and maps CLI process PIDs
+to ``CLIProcessManager`` sessions and ``OperationTracker`` operations.
+
+Usage:
+    sampler = get_live_status_sampler()
+    sampler.start()                   # in app lifespan
+    snapshot = sampler.get_latest()   # in the endpoint
+    await sampler.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ...config import get_settings
+
+logger = logging.getLogger(__name__)
+
+CLI_PROCESS_NAMES = ("claude", "gemini", "node")
+BUILD_PROCESS_NAMES = ("docker", "docker-compose", "podman", "buildah", "buildx", "containerd")
+BUILD_KEYWORDS = ("build", "push", "pull", "compose up", "run")
+
+# Max processes reported per category (same as the old per-request scan)
+MAX_REPORTED_PROCESSES = 10
+
+# Per-process attributes fetched in one oneshot() call by process_iter
+_ITER_ATTRS = ["name", "memory_percent", "cpu_percent", "create_time", "status"]
+
+
+@dataclass
+class LiveSnapshot:
+    """One sample of system and CLI/build process metrics."""
+
+    timestamp: float
+    system: dict[str, Any]
+    cli_processes: list[dict[str, Any]] = field(default_factory=list)
+    build_processes: list[dict[str, Any]] = field(default_factory=list)
+    scan_ms: float = 0.0
+
+
+def format_elapsed(elapsed_seconds: int) -> str:
+    """Format a process age as ``42s``, ``3m 5s`` or ``2h 10m``."""
+    if elapsed_seconds < 60:
+        return f"{elapsed_seconds}s"
+    if elapsed_seconds < 3600:
+        return f"{elapsed_seconds // 60}m {elapsed_seconds % 60}s"
+    return f"{elapsed_seconds // 3600}h {(elapsed_seconds % 3600) // 60}m"
+
+
+def _build_operation_type(cmdline: str) -> str:
+    if "build" in cmdline:
+        return "build"
+    if "push" in cmdline:
+        return "push"
+    if "pull" in cmdline:
+        return "pull"
+    if "compose up" in cmdline or "up -d" in cmdline:
+        return "up"
+    if "run" in cmdline:
+        return "run"
+    return "other"
+
+
+def _build_image_name(cmdline: str) -> str | None:
+    if "-t " in cmdline:
+        parts = cmdline.split("-t ")
+        if len(parts) > 1 and parts[1].split():
+            return parts[1].split()[0].split(":")[0]
+    elif "-f " in cmdline:
+        parts = cmdline.split("-f ")
+        if len(parts) > 1 and parts[1].split():
+            return parts[1].split()[0]
+    return None
+
+
+def _default_sessions() -> list[dict[str, Any]]:
+    from ...chat_cli.process_manager import get_process_manager
+
+    processes: list[dict[str, Any]] = get_process_manager().get_process_stats()["processes"]
+    return processes
+
+
+def _default_operations() -> list[Any]:
+    from .operation_tracker import get_tracker
+
+    # In-memory only: get_active() also queries the DB
+    return get_tracker().get_all()
+
+
+class LiveStatusSampler:
+    """Samples system and CLI process metrics on a fixed cadence.
+
+    Scans run in a worker thread; PID → session/operation mapping runs on
+    the event loop, which owns ``CLIProcessManager`` state. Sampling pauses
+    while nobody reads the snapshots (``idle_after``) and the next read
+    takes a fresh sample synchronously.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        history_size: int = 150,
+        idle_after: float = 60.0,
+        psutil_module: Any = None,
+        session_source: Callable[[], list[dict[str, Any]]] = _default_sessions,
+        operation_source: Callable[[], list[Any]] = _default_operations,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+            history_size: Snapshots kept in the ring buffer
+            idle_after: Pause when not read for this long (0 = never pause)
+            psutil_module: psutil (or a stand-in); imported lazily by default
+            session_source: Returns CLIProcessManager process stats
+            operation_source: Returns in-progress tracker operations
+            clock: Time source
+        """
+        self.interval = interval
+        self.idle_after = idle_after
+        self._psutil = psutil_module
+        self._session_source = session_source
+        self._operation_source = operation_source
+        self._clock = clock
+
+        self._history: deque[LiveSnapshot] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._sample_lock = threading.Lock()
+        # (pid, create_time) -> (cmdline_list, cwd); both are fixed for a process lifetime
+        self._proc_info: dict[tuple[int, float], tuple[list[str], str | None]] = {}
+        self._last_read = clock()
+        self._task: asyncio.Task[None] | None = None
+        self._samples = 0
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background sampling task (idempotent, needs a running loop)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"[LIVE STATUS] Sampler started (every {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Cancel the background sampling task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _is_idle(self) -> bool:
+        return self.idle_after > 0 and self._clock() - self._last_read > self.idle_after
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not self._is_idle():
+                    snapshot = await asyncio.to_thread(self._locked_scan)
+                    self._attach_owners(snapshot)
+                    self._record(snapshot)
+                await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[LIVE STATUS] Sampling failed: {e}")
+                await asyncio.sleep(self.interval)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def get_latest(self) -> LiveSnapshot:
+        """Get the latest snapshot, sampling synchronously if none is fresh.
+
+        Fresh means taken within two intervals; that covers the first read
+        after startup or after the sampler went idle.
+        """
+        self._last_read = self._clock()
+        with self._lock:
+            latest = self._history[-1] if self._history else None
+        if latest is not None and self._clock() - latest.timestamp <= self.interval * 2:
+            return latest
+        return self.sample_now()
+
+    def sample_now(self) -> LiveSnapshot:
+        """Take a sample in the calling thread (concurrent callers share one scan)."""
+        started = self._clock()
+        with self._sample_lock:
+            with self._lock:
+                latest = self._history[-1] if self._history else None
+            # Another caller sampled while we waited for the lock
+            if latest is not None and latest.timestamp >= started:
+                return latest
+            snapshot = self._scan()
+            self._attach_owners(snapshot)
+            self._record(snapshot)
+            return snapshot
+
+    def get_history(self, points: int) -> dict[str, list[Any]]:
+        """Get the last ``points`` snapshots as parallel series for sparklines."""
+        with self._lock:
+            snapshots = list(self._history)[-points:] if points > 0 else []
+        return {
+            "timestamps": [s.timestamp for s in snapshots],
+            "cpu_percent": [s.system.get("cpu_percent") for s in snapshots],
+            "memory_percent": [s.system.get("memory_percent") for s in snapshots],
+            "cli_processes": [len(s.cli_processes) for s in snapshots],
+            "build_processes": [len(s.build_processes) for s in snapshots],
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sampler state for diagnostics."""
+        with self._lock:
+            latest = self._history[-1] if self._history else None
+            history_len = len(self._history)
+        return {
+            "running": self.running,
+            "idle": self._is_idle(),
+            "interval_seconds": self.interval,
+            "samples": self._samples,
+            "history": history_len,
+            "last_scan_ms": latest.scan_ms if latest else None,
+            "age_seconds": round(self._clock() - latest.timestamp, 2) if latest else None,
+        }
+
+    def _record(self, snapshot: LiveSnapshot) -> None:
+        with self._lock:
+            self._history.append(snapshot)
+            self._samples += 1
+
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+
+    def _get_psutil(self) -> Any:
+        if self._psutil is None:
+            try:
+                import psutil
+
+                self._psutil = psutil
+            except ImportError:
+                return None
+        return self._psutil
+
+    def _locked_scan(self) -> LiveSnapshot:
+        with self._sample_lock:
+            return self._scan()
+
+    def _scan(self) -> LiveSnapshot:
+        """One pass over system metrics and the process table."""
+        started = time.perf_counter()
+        now = self._clock()
+        psutil = self._get_psutil()
+        if psutil is None:
+            return LiveSnapshot(timestamp=now, system={"error": "psutil not installed"})
+
+        memory = psutil.virtual_memory()
+        system = {
+            # Non-blocking: measured since the previous sample
+            "cpu_percent": round(psutil.cpu_percent(interval=None), 1),
+            "cpu_count": psutil.cpu_count(),
+            "memory_percent": round(memory.percent, 1),
+            "memory_used_gb": round((memory.total - memory.available) / (1024**3), 2),
+            "memory_total_gb": round(memory.total / (1024**3), 2),
+        }
+
+        cli_processes: list[dict[str, Any]] = []
+        build_processes: list[dict[str, Any]] = []
+        seen: set[tuple[int, float]] = set()
+
+        for proc in psutil.process_iter(_ITER_ATTRS):
+            try:
+                info = proc.info
+                name = (info.get("name") or "").lower()
+                if name not in CLI_PROCESS_NAMES and name not in BUILD_PROCESS_NAMES:
+                    continue
+
+                key = (proc.pid, info.get("create_time") or 0.0)
+                seen.add(key)
+                cached = self._proc_info.get(key)
+                if cached is None:
+                    cmdline_list = proc.cmdline()
+                    cwd = None
+                    try:
+                        cwd = proc.cwd()
+                    except (psutil.AccessDenied, psutil.NoSuchProcess):
+                        pass
+                    cached = (cmdline_list, cwd)
+                    self._proc_info[key] = cached
+                cmdline_list, cwd = cached
+                cmdline = " ".join(cmdline_list).lower()
+
+                elapsed_seconds = int(now - info["create_time"]) if info.get("create_time") else 0
+                base = {
+                    "pid": proc.pid,
+                    "memory_percent": round(info.get("memory_percent") or 0, 1),
+                    "cpu_percent": round(info.get("cpu_percent") or 0, 1),
+                    "status": info.get("status") or "unknown",
+                    "cwd": cwd,
+                    "elapsed": format_elapsed(elapsed_seconds),
+                    "elapsed_seconds": elapsed_seconds,
+                }
+
+                if name in CLI_PROCESS_NAMES:
+                    if "claude" not in cmdline and "gemini" not in cmdline:
+                        continue
+                    cmdline_short = " ".join(cmdline_list[1:4]) if len(cmdline_list) > 1 else ""
+                    if len(cmdline_short) > 60:
+                        cmdline_short = cmdline_short[:57] + "..."
+                    cli_processes.append(
+                        {
+                            "name": "claude" if "claude" in cmdline else "gemini",
+                            **base,
+                            "repo_name": cwd.rstrip("/").split("/")[-1] if cwd else None,
+                            "cmdline": cmdline_short,
+                            "session_id": None,
+                            "operation_id": None,
+                            "operation_type": None,
+                        }
+                    )
+                else:
+                    if not any(kw in cmdline for kw in BUILD_KEYWORDS):
+                        continue
+                    cmdline_short = " ".join(cmdline_list[:5]) if cmdline_list else ""
+                    if len(cmdline_short) > 80:
+                        cmdline_short = cmdline_short[:77] + "..."
+                    build_processes.append(
+                        {
+                            "tool": name,
+                            "operation": _build_operation_type(cmdline),
+                            **base,
+                            "project_name": cwd.rstrip("/").split("/")[-1] if cwd else None,
+                            "image_name": _build_image_name(cmdline),
+                            "cmdline": cmdline_short,
+                        }
+                    )
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        # Forget exited processes
+        for key in list(self._proc_info):
+            if key not in seen:
+                del self._proc_info[key]
+
+        return LiveSnapshot(
+            timestamp=now,
+            system=system,
+            cli_processes=cli_processes,
+            build_processes=build_processes,
+            scan_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    def _attach_owners(self, snapshot: LiveSnapshot) -> None:
+        """Map CLI PIDs to chat sessions and tracked operations.
+
+        Chat CLI processes are matched by PID, then to operations through
+        ``parent_session_id``. One-shot CLI runs (reviews, fixes) are not
+        managed sessions, so they fall back to the newest in-progress
+        operation with the same working directory.
+        """
+        if not snapshot.cli_processes:
+            return
+        try:
+            sessions = {s["pid"]: s["session_id"] for s in self._session_source() if s.get("pid")}
+            operations = self._operation_source()
+        except Exception as e:
+            logger.debug(f"[LIVE STATUS] Owner lookup failed: {e}")
+            return
+
+        by_session: dict[str, Any] = {}
+        by_working_dir: dict[str, Any] = {}
+        for op in operations:  # Newest first: keep the first match
+            if op.parent_session_id:
+                by_session.setdefault(op.parent_session_id, op)
+            working_dir = (op.details or {}).get("working_dir")
+            if working_dir:
+                by_working_dir.setdefault(working_dir.rstrip("/"), op)
+
+        for proc in snapshot.cli_processes:
+            session_id = sessions.get(proc["pid"])
+            proc["session_id"] = session_id
+            op = by_session.get(session_id) if session_id else None
+            if op is None and proc.get("cwd"):
+                op = by_working_dir.get(proc["cwd"].rstrip("/"))
+            if op is not None:
+                proc["operation_id"] = op.operation_id
+                proc["operation_type"] = op.operation_type.value
+
+
+_sampler: LiveStatusSampler | None = None
+
+
+def get_live_status_sampler() -> LiveStatusSampler:
+    """Get singleton LiveStatusSampler configured from settings."""
+    global _sampler
+    if _sampler is None:
+        settings = get_settings().live_status
+        _sampler = LiveStatusSampler(
+            interval=settings.interval_seconds,
+            history_size=settings.history_size,
+            idle_after=settings.idle_after_seconds,
+        )
+    return _sampler
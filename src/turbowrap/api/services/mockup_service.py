@@ -555,38 +555,22 @@ while ensuring the rest of the page remains functional.
             return None
 
     async def _fetch_from_s3(self, s3_url: str | None) -> str | None:
-        """Fetch content from S3 URL."""
+        """Fetch content from S3 URL (through the local artifact cache)."""
         if not s3_url:
             return None
 
         from botocore.exceptions import ClientError
 
-        from ...utils.aws_clients import get_s3_client
-
-        try:
-            # Parse S3 URL to get bucket and key
-            # URL format: https://bucket.s3.region.amazonaws.com/key
-            import re
-
-            match = re.match(
-                r"https://([^.]+)\.s3\.([^.]+)\.amazonaws\.com/(.+)",
-                s3_url,
-            )
-            if not match:
-                logger.warning(f"Invalid S3 URL format: {s3_url}")
-                return None
+        from ...utils.artifact_cache import get_artifact_cache, parse_s3_url
 
-            bucket, region, key = match.groups()
-            client = get_s3_client(region=region)
-
-            response = await asyncio.to_thread(
-                client.get_object,
-                Bucket=bucket,
-                Key=key,
-            )
-
-            return response["Body"].read().decode("utf-8")
+        location = parse_s3_url(s3_url)
+        if not location:
+            logger.warning(f"Invalid S3 URL format: {s3_url}")
+            return None
 
+        bucket, key = location
+        try:
+            return await get_artifact_cache().aget_text(bucket, key)
         except ClientError as e:
             logger.warning(f"[S3] Fetch failed: {e}")
             return None
@@ -15,8 +15,10 @@ Design Principles:
 from __future__ import annotations
 
 import logging
+import time
 import traceback
 import uuid
+from collections import deque
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -248,6 +250,34 @@ class Operation:
         }
 
 
+class OperationEventLog:
+    """Bounded history of one operation's stream events.
+
+    Events get monotonically increasing ids, so SSE clients can resume
+    after ``Last-Event-ID`` instead of re-downloading the whole output.
+    Only the most recent ``maxlen`` events are kept.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self.events: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self.last_id = 0
+        self.completed = False
+        self.touched_at = time.monotonic()
+
+    def append(self, event_type: str, data: dict[str, Any]) -> dict[str, Any]:
+        self.last_id += 1
+        self.touched_at = time.monotonic()
+        event = {"id": self.last_id, "type": event_type, "data": data}
+        self.events.append(event)
+        return event
+
+    def since(self, last_event_id: int) -> tuple[list[dict[str, Any]], int]:
+        """Events after ``last_event_id`` and how many of them were dropped."""
+        first_kept = self.events[0]["id"] if self.events else self.last_id + 1
+        missed = max(0, first_kept - last_event_id - 1)
+        return [e for e in self.events if e["id"] > last_event_id], missed
+
+
 class OperationTracker:
     """
     Singleton tracker for all operations.
@@ -281,6 +311,9 @@ class OperationTracker:
 
     STALE_THRESHOLD_SECONDS = 1800
 
+    # Stream events kept per operation for SSE resume (Last-Event-ID)
+    EVENT_LOG_SIZE = 2000
+
     def __new__(cls) -> OperationTracker:
         """Singleton pattern with double-checked locking."""
         if cls._instance is None:
@@ -296,6 +329,7 @@ class OperationTracker:
         self._operations: dict[str, Operation] = {}
         self._store_lock = RLock()
         self._subscribers: dict[str, list[Any]] = {}  # operation_id -> list of asyncio.Queue
+        self._event_logs: dict[str, OperationEventLog] = {}
 
     def _cleanup_expired(self) -> None:
         """Remove expired completed/failed operations."""
@@ -311,6 +345,13 @@ class OperationTracker:
 
         for op_id in expired_ids:
             del self._operations[op_id]
+            self._event_logs.pop(op_id, None)
+
+        # Logs of operations that were never registered
+        idle_cutoff = time.monotonic() - self.TTL_SECONDS
+        for op_id, log in list(self._event_logs.items()):
+            if op_id not in self._operations and log.touched_at < idle_cutoff:
+                del self._event_logs[op_id]
 
         if expired_ids:
             logger.debug(f"Cleaned up {len(expired_ids)} expired operations")
@@ -503,6 +544,7 @@ class OperationTracker:
             )
 
             self._persist_complete(op)
+            self._record_usage(op, merged_result, success=True)
 
             return op
 
@@ -559,6 +601,8 @@ class OperationTracker:
             logger.error(f"[TRACKER] Failed {op.operation_type.value}: {operation_id} - {error}")
 
             self._persist_fail(op)
+            # Failed calls are billed too; token counts come from update() details
+            self._record_usage(op, op.details, success=False)
 
             return op
 
@@ -746,25 +790,44 @@ class OperationTracker:
 
     # Pub/Sub Methods for SSE Streaming
 
-    def subscribe(self, operation_id: str) -> Any:
+    def subscribe(self, operation_id: str, last_event_id: int | None = None) -> Any:
         """
         Subscribe to operation events for SSE streaming.
 
+        The queue starts with the recorded events after ``last_event_id``
+        (all recorded events if None), so nothing emitted before the
+        subscription is missed. Registration and replay happen under the
+        same lock as publishing: no event is lost or delivered twice. If
+        some of the requested events were already dropped from the log, a
+        ``truncated`` event with the missing count comes first.
+
         Args:
             operation_id: Operation to subscribe to
+            last_event_id: Last event id the client has seen
 
         Returns:
-            asyncio.Queue to receive events from
+            asyncio.Queue to receive events from (None marks completion)
         """
         import asyncio
 
         queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
         with self._store_lock:
+            log = self._event_logs.get(operation_id)
+            if log is not None:
+                backlog, missed = log.since(last_event_id or 0)
+                if missed:
+                    queue.put_nowait(
+                        {"id": None, "type": "truncated", "data": {"missed_events": missed}}
+                    )
+                for event in backlog:
+                    queue.put_nowait(event)
+                if log.completed:
+                    queue.put_nowait(None)
             if operation_id not in self._subscribers:
                 self._subscribers[operation_id] = []
             self._subscribers[operation_id].append(queue)
             logger.debug(
-                f"[TRACKER] Subscribed to {operation_id[:8]}, "
+                f"[TRACKER] Subscribed to {operation_id[:8]} after event {last_event_id or 0}, "
                 f"total subscribers: {len(self._subscribers[operation_id])}"
             )
         return queue
@@ -790,6 +853,12 @@ class OperationTracker:
                 except ValueError:
                     pass  # Queue not in list
 
+    def _event_log(self, operation_id: str) -> OperationEventLog:
+        log = self._event_logs.get(operation_id)
+        if log is None:
+            log = self._event_logs[operation_id] = OperationEventLog(self.EVENT_LOG_SIZE)
+        return log
+
     async def publish_event(
         self,
         operation_id: str,
@@ -799,6 +868,9 @@ class OperationTracker:
         """
         Publish event to all subscribers of an operation.
 
+        The event is also recorded in the operation's event log, so clients
+        that subscribe later can replay it.
+
         Args:
             operation_id: Operation to publish to
             event_type: Event type (e.g., "chunk", "status", "complete")
@@ -808,15 +880,12 @@ class OperationTracker:
             Number of subscribers that received the event
         """
         with self._store_lock:
+            event = self._event_log(operation_id).append(event_type, data)
             subscribers = self._subscribers.get(operation_id, [])
-            if not subscribers:
-                return 0
-
-            event = {"type": event_type, "data": data}
             count = 0
             for queue in subscribers:
                 try:
-                    await queue.put(event)
+                    queue.put_nowait(event)
                     count += 1
                 except Exception as e:
                     logger.warning(f"[TRACKER] Failed to publish to subscriber: {e}")
@@ -830,13 +899,20 @@ class OperationTracker:
         Sends None to all subscriber queues to indicate end of stream.
         """
         with self._store_lock:
+            self._event_log(operation_id).completed = True
             subscribers = self._subscribers.get(operation_id, [])
             for queue in subscribers:
                 try:
-                    await queue.put(None)  # None signals completion
+                    queue.put_nowait(None)  # None signals completion
                 except Exception:
                     pass
 
+    def events_since(self, operation_id: str, last_event_id: int = 0) -> list[dict[str, Any]]:
+        """Recorded stream events after ``last_event_id`` (oldest first)."""
+        with self._store_lock:
+            log = self._event_logs.get(operation_id)
+            return log.since(last_event_id)[0] if log else []
+
     def has_subscribers(self, operation_id: str) -> bool:
         """Check if an operation has any subscribers."""
         with self._store_lock:
@@ -853,19 +929,26 @@ class OperationTracker:
 
     @contextmanager
     def _db_session(self) -> Generator[Session, None, None]:
-        """Context manager for database operations with auto-commit/rollback."""
-        from turbowrap.db.session import get_session_local
+        """Context manager for database operations with auto-commit/rollback.
 
-        SessionLocal = get_session_local()
-        db = SessionLocal()
-        try:
+        Tracker writes come from threads and the event loop at once, so they
+        go through the serialized SQLite write path.
+        """
+        from turbowrap.db.session import write_session
+
+        with write_session() as db:
             yield db
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+
+    def _record_usage(
+        self, operation: Operation, result: dict[str, Any] | None, success: bool
+    ) -> None:
+        """Hand the token/cost data of a finished operation to the usage ledger."""
+        try:
+            from .usage_ledger import get_usage_ledger
+
+            get_usage_ledger().record_operation(operation, result, success=success)
+        except Exception as e:
+            logger.error(f"[TRACKER] Failed to record usage for {operation.operation_id[:8]}: {e}")
 
     def _get_db_operation(self, db: Session, operation_id: str) -> Any:
         """Get DBOperation by ID. Returns None if not found."""
@@ -29,6 +29,7 @@ from ...db.models import Issue, Repository, Task
 from ...review.models.review import Issue as ReviewIssue
 from ...review.models.review import IssueCategory, IssueSeverity
 from ...utils.aws_clients import get_s3_client
+from ...utils.s3_upload_pipeline import read_s3_body
 
 logger = logging.getLogger(__name__)
 
@@ -304,7 +305,7 @@ class ReviewRecoveryService:
 
         # Download file
         response = self.s3_client.get_object(Bucket=S3_BUCKET, Key=s3_key)
-        content = response["Body"].read().decode("utf-8")
+        content = read_s3_body(response).decode("utf-8")
 
         # Strategy 1: Look for write_file tool calls
         review_json = self._extract_write_file_content(content)
@@ -13,8 +13,10 @@ from typing import Any, cast
 
 from sqlalchemy.orm import Session
 
-from ...db.models import Issue, Repository, Task
-from ...db.session import get_session_local
+from ...db.models import Repository, Task
+from ...db.session import get_session_local, serialized_write
+from ...llm.governor import Priority, llm_call_context
+from ...orchestration.report_utils import process_issues
 from ...review.models.progress import ProgressEvent, ProgressEventType
 from ...review.models.report import FinalReport
 from ...review.models.review import Issue as ReviewIssue
@@ -28,6 +30,7 @@ from ...review.models.review import (
 from ...review.orchestrator import Orchestrator
 from ..review_manager import ReviewManager, ReviewSession, get_review_manager
 from .checkpoint_service import CheckpointService
+from .issue_store_service import IssueStoreService
 
 # NOTE: Operation tracking is now handled atomically at the ClaudeCLI/GeminiCLI level
 
@@ -135,7 +138,7 @@ class ReviewStreamService:
 
             if failed_task:
                 checkpoint_service = CheckpointService(self.db)
-                checkpoints = checkpoint_service.get_completed_reviewers(cast(str, failed_task.id))
+                checkpoints = checkpoint_service.get_resumable_reviewers(cast(str, failed_task.id))
 
                 if checkpoints:
                     # We can resume! Update the task status
@@ -156,7 +159,7 @@ class ReviewStreamService:
 
                     logger.info(
                         f"Resuming task {resume_task_id} with "
-                        f"{len(completed_checkpoints)} completed reviewers"
+                        f"{len(completed_checkpoints)} checkpointed reviewers"
                     )
 
         # Create new task if not resuming
@@ -164,27 +167,8 @@ class ReviewStreamService:
             task = self.create_task_record(repository_id, mode)
             task_id = cast(str, task.id)
 
-            # Soft delete all "open" (TO DO) issues for this repository - fresh start
-            # Using soft_delete() instead of hard delete to preserve data history
-            from ...db.models import IssueStatus
-
-            issues_to_archive = (
-                self.db.query(Issue)
-                .filter(
-                    Issue.repository_id == repository_id,
-                    Issue.status == IssueStatus.OPEN.value,
-                    Issue.deleted_at.is_(None),  # Only non-deleted issues
-                )
-                .all()
-            )
-            if issues_to_archive:
-                for issue in issues_to_archive:
-                    issue.soft_delete()
-                self.db.commit()
-                logger.info(
-                    f"[REVIEW INIT] Soft-deleted {len(issues_to_archive)} open issues for "
-                    f"repository {repository_id} (fresh start, data preserved)"
-                )
+            # Open issues from earlier reviews are kept: _save_review_results
+            # upserts them by fingerprint and auto-resolves the vanished ones
         else:
             task_id = resume_task_id
 
@@ -209,6 +193,13 @@ class ReviewStreamService:
             """Run the review in background."""
             SessionLocal = get_session_local()
             review_db = SessionLocal()
+            # Late LLM results are merged only once the report has been stored
+            report_saved = asyncio.Event()
+
+            async def late_issues_callback(llm: str, issues: list[ReviewIssue]) -> None:
+                """Merge issues from an LLM that finished after the straggler cutoff."""
+                await report_saved.wait()
+                self._merge_late_issues(task_id, repository_id, llm, issues)
 
             try:
                 orchestrator = Orchestrator()
@@ -256,13 +247,16 @@ class ReviewStreamService:
                     ),
                 )
 
-                report = await orchestrator.review(
-                    request,
-                    progress_callback,
-                    completed_checkpoints=checkpoints_for_closure,
-                    checkpoint_callback=checkpoint_callback,
-                    parent_session_id=task_id,
-                )
+                # Reviews yield LLM capacity to chat and fixes, fair across repositories
+                with llm_call_context(priority=Priority.BATCH, repository=repository_id):
+                    report = await orchestrator.review(
+                        request,
+                        progress_callback,
+                        completed_checkpoints=checkpoints_for_closure,
+                        checkpoint_callback=checkpoint_callback,
+                        parent_session_id=task_id,
+                        late_issues_callback=late_issues_callback,
+                    )
 
                 # Save results
                 await self._save_review_results(review_db, task_id, repository_id, report)
@@ -294,6 +288,7 @@ class ReviewStreamService:
                     review_db.commit()
 
             finally:
+                report_saved.set()
                 review_db.close()
 
         # Start background review
@@ -317,46 +312,86 @@ class ReviewStreamService:
         repository_id: str,
         report: FinalReport,
     ) -> None:
-        """Save review results and issues to the database."""
+        """Save review results and issues to the database.
+
+        Issues are upserted by fingerprint (see IssueStoreService), so a
+        re-review updates the rows of known issues instead of duplicating
+        them. Task.result keeps a slim report that references issue rows.
+        """
         db_task = db.query(Task).filter(Task.id == task_id).first()
         if not db_task:
             return
 
-        db_task.status = "completed"  # type: ignore[assignment]
-        db_task.result = report.model_dump(mode="json")  # type: ignore[assignment]
-        db_task.completed_at = datetime.utcnow()  # type: ignore[assignment]
-
-        # Save issues to database for tracking
-        for issue in report.issues:
-            db_issue = Issue(
-                task_id=task_id,
-                repository_id=repository_id,
-                issue_code=issue.id,
-                severity=(
-                    issue.severity.value
-                    if hasattr(issue.severity, "value")
-                    else str(issue.severity)
-                ),
-                category=(
-                    issue.category.value
-                    if hasattr(issue.category, "value")
-                    else str(issue.category)
-                ),
-                rule=issue.rule,
-                file=issue.file,
-                line=issue.line,
-                title=issue.title,
-                description=issue.description,
-                current_code=issue.current_code,
-                suggested_fix=issue.suggested_fix,
-                references=issue.references if issue.references else None,
-                flagged_by=issue.flagged_by if issue.flagged_by else None,
-                estimated_effort=issue.estimated_effort,
-                estimated_files_count=issue.estimated_files_count,
+        # Only a review where every reviewer succeeded may auto-resolve vanished issues
+        complete = bool(report.reviewed_files) and all(
+            r.status != "error" for r in report.reviewers
+        )
+        with serialized_write(db):
+            upsert = IssueStoreService(db).upsert_review_issues(
+                task_id,
+                repository_id,
+                report.issues,
+                reviewed_files=report.reviewed_files if complete else None,
             )
-            db.add(db_issue)
 
-        db.commit()
+            db_task.status = "completed"  # type: ignore[assignment]
+            db_task.result = self._slim_report(report, upsert.issue_ids)  # type: ignore[assignment]
+            db_task.completed_at = datetime.utcnow()  # type: ignore[assignment]
+            db.commit()
+
+    @staticmethod
+    def _slim_report(report: FinalReport, issue_ids: list[str]) -> dict[str, Any]:
+        """Report as stored in Task.result: issue bodies live in the issues table."""
+        data = report.model_dump(mode="json", exclude={"issues", "reviewed_files"})
+        data["issue_ids"] = issue_ids
+        return data
+
+    def _merge_late_issues(
+        self,
+        task_id: str,
+        repository_id: str,
+        llm: str,
+        late_issues: list[ReviewIssue],
+    ) -> None:
+        """Merge a straggler LLM's issues into an already stored review.
+
+        Known issues only gain the LLM in ``flagged_by``; new ones are
+        inserted. The stored summary is recomputed from the task's issues.
+        """
+        SessionLocal = get_session_local()
+        db = SessionLocal()
+        try:
+            db_task = db.query(Task).filter(Task.id == task_id).first()
+            if not db_task or db_task.status != "completed" or not db_task.result:
+                logger.info(f"[REVIEW] Task {task_id} not completed, dropping late {llm} results")
+                return
+
+            store = IssueStoreService(db)
+            with serialized_write(db):
+                upsert = store.upsert_review_issues(task_id, repository_id, late_issues)
+
+                stored = cast(dict[str, Any], db_task.result)
+                report = FinalReport.model_validate(stored)
+                issues, by_severity, score, recommendation, next_steps = process_issues(
+                    store.get_task_issues(task_id)
+                )
+                report.next_steps = next_steps
+                report.summary.total_issues = len(issues)
+                report.summary.by_severity = by_severity
+                report.summary.overall_score = score
+                report.summary.recommendation = recommendation
+
+                issue_ids = list(stored.get("issue_ids") or [])
+                issue_ids += [i for i in upsert.issue_ids if i not in issue_ids]
+                db_task.result = self._slim_report(report, issue_ids)  # type: ignore[assignment]
+
+                db.commit()
+            logger.info(
+                f"[REVIEW] Merged late {llm} results into {task_id}: "
+                f"{upsert.inserted} new issues, {len(issues)} total"
+            )
+        finally:
+            db.close()
 
     async def generate_events(
         self,
@@ -1,7 +1,7 @@
 """Screenshot service for Live View.
 
-Uses Playwright to capture screenshots of production sites
-when iframe embedding is blocked.
+Uses Playwright (via the shared BrowserPool) to capture screenshots
+of production sites when iframe embedding is blocked.
 """
 
 import logging
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 
 from ...config import get_settings
 from ...utils.s3_artifact_saver import S3ArtifactSaver
+from .browser_pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -53,39 +54,12 @@ class ScreenshotService:
         Raises:
             RuntimeError: If Playwright is not installed or screenshot fails
         """
-        try:
-            from playwright.async_api import async_playwright
-        except ImportError as e:
-            raise RuntimeError(
-                "Playwright is not installed. Run: pip install playwright && playwright install chromium"
-            ) from e
-
-        screenshot_bytes: bytes | None = None
-
-        # Capture screenshot with Playwright
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                context = await browser.new_context(
-                    viewport={"width": viewport_width, "height": viewport_height},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                )
-                page = await context.new_page()
-
-                # Navigate with timeout
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-
-                # Wait a bit for any lazy-loaded content
-                await page.wait_for_timeout(1000)
-
-                # Capture full page screenshot
-                screenshot_bytes = await page.screenshot(
-                    full_page=True,
-                    type="png",
-                )
-
-            finally:
-                await browser.close()
+        # Capture on a warm pooled browser (queued and deduplicated)
+        screenshot_bytes = await get_browser_pool().capture(
+            url,
+            viewport_width=viewport_width,
+            viewport_height=viewport_height,
+        )
 
         if not screenshot_bytes:
             raise RuntimeError("Failed to capture screenshot")
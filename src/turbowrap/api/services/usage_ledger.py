@@ -0,0 +1,550 @@
+"""
+LLM usage ledger - one normalised row per LLM call, plus hourly rollups.
+
+Token and cost data used to live only in ``Operation.details``/``result``
+JSON, so per-repo spend meant scanning and parsing every operation. The
+tracker now hands each finished LLM operation to this ledger, which:
+
+- normalises the provider-specific usage (Claude ``model_usage``, Gemini
+  session stats, Grok token counts) into ``llm_usage`` rows, one per model;
+- buffers rows in memory and writes them in batches (size or interval);
+- folds every batch into ``llm_usage_hourly`` rollups in the same
+  transaction, so dashboards and budget checks read O(buckets) rows.
+
+Usage:
+    ledger = get_usage_ledger()
+    ledger.start()                                  # in app lifespan
+    ledger.record_operation(op, result)             # from OperationTracker
+    rows = ledger.query(db, since, group_by=["repository_id"])
+    await ledger.stop()                             # flushes the remainder
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import bindparam, func, insert, literal, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
+
+from ...config import get_settings
+from ...db.models import LLMUsage, LLMUsageHourly, generate_uuid
+from ...db.models.base import now_utc
+from ...db.session import serialized_write
+
+logger = logging.getLogger(__name__)
+
+# Dimensions a rollup query can group by ("day" folds hourly buckets)
+GROUP_BY_FIELDS = ("repository_id", "provider", "model", "operation_type", "day", "hour")
+
+_COUNTERS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_creation_tokens",
+    "cost_usd",
+)
+
+_SUMS = ("calls", "failed_calls", *_COUNTERS)
+
+# Max bound parameters per IN (...) query (SQLite's limit is 999)
+_BUCKET_CHUNK = 500
+
+
+@dataclass
+class UsageRecord:
+    """Usage of one model in one LLM call."""
+
+    provider: str
+    model: str
+    operation_type: str
+    repository_id: str | None = None
+    operation_id: str | None = None
+    parent_session_id: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: float = 0.0
+    duration_ms: int | None = None
+    success: bool = True
+    created_at: datetime = field(default_factory=now_utc)
+
+    @property
+    def bucket_key(self) -> tuple[datetime, str, str, str, str]:
+        return (
+            hour_bucket(self.created_at),
+            self.repository_id or "",
+            self.provider,
+            self.model,
+            self.operation_type,
+        )
+
+
+def hour_bucket(moment: datetime) -> datetime:
+    """Start of the UTC hour containing ``moment`` (naive values are UTC, as SQLite returns)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def infer_provider(model: str | None) -> str:
+    """Provider of a model name (``claude-opus-4-5`` -> ``claude``)."""
+    name = (model or "").lower()
+    if "gemini" in name:
+        return "gemini"
+    if "grok" in name:
+        return "grok"
+    if any(key in name for key in ("claude", "opus", "sonnet", "haiku")):
+        return "claude"
+    return "unknown"
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def extract_usage(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """Per-model token/cost entries from an operation result.
+
+    Uses the per-model ``model_usage`` list when present and falls back to
+    the ``total_*`` fields. Entries without any tokens or cost are dropped.
+    """
+    entries: list[dict[str, Any]] = []
+    model_usage = result.get("model_usage")
+    if isinstance(model_usage, list) and model_usage:
+        for usage in model_usage:
+            if not isinstance(usage, dict):
+                continue
+            entries.append(
+                {
+                    "model": usage.get("model") or result.get("model") or "unknown",
+                    "input_tokens": _int(usage.get("input_tokens")),
+                    "output_tokens": _int(usage.get("output_tokens")),
+                    # Gemini reports cache hits as "cache_reads"
+                    "cache_read_tokens": _int(
+                        usage.get("cache_read_tokens", usage.get("cache_reads"))
+                    ),
+                    "cache_creation_tokens": _int(usage.get("cache_creation_tokens")),
+                    "cost_usd": _float(usage.get("cost_usd")),
+                }
+            )
+    else:
+        entries.append(
+            {
+                "model": result.get("model") or "unknown",
+                "input_tokens": _int(result.get("total_input_tokens")),
+                "output_tokens": _int(result.get("total_output_tokens")),
+                "cache_read_tokens": _int(result.get("total_cache_read_tokens")),
+                "cache_creation_tokens": _int(result.get("total_cache_creation_tokens")),
+                "cost_usd": _float(result.get("cost_usd", result.get("total_cost_usd"))),
+            }
+        )
+    return [entry for entry in entries if any(entry[key] for key in _COUNTERS)]
+
+
+def _default_session_factory() -> Session:
+    from ...db.session import get_session_local
+
+    return get_session_local()()
+
+
+class UsageLedger:
+    """Buffers LLM usage records and writes them (with rollups) in batches."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        max_buffered: int = 10000,
+        session_factory: Callable[[], Session] = _default_session_factory,
+    ):
+        """Initialize ledger.
+
+        Args:
+            enabled: Record usage at all
+            batch_size: Flush inline once this many rows are buffered
+            flush_interval: Seconds between background flushes
+            max_buffered: Rows kept while flushes fail (oldest dropped)
+            session_factory: Returns a new DB session
+        """
+        self.enabled = enabled
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._session_factory = session_factory
+
+        self._buffer: list[UsageRecord] = []
+        self._lock = threading.Lock()
+        # Serialises flushes so rollup increments never race each other
+        self._flush_lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._written = 0
+        self._dropped = 0
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flush task (idempotent, needs a running loop)."""
+        if not self.enabled or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"[USAGE] Ledger started (batch={self.batch_size}, every {self.flush_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Cancel the background task and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"[USAGE] Background flush failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record(self, records: Iterable[UsageRecord]) -> None:
+        """Buffer records; flushes inline when the batch is full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._buffer.extend(records)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def record_operation(
+        self, operation: Any, result: dict[str, Any] | None, success: bool = True
+    ) -> int:
+        """Record the usage reported by a finished tracker operation.
+
+        Args:
+            operation: OperationTracker ``Operation``
+            result: Completion result (or details, for failed operations)
+            success: Whether the call succeeded
+
+        Returns:
+            Number of records buffered (0 if the operation reported no usage)
+        """
+        if not self.enabled or not result:
+            return 0
+        entries = extract_usage(result)
+        if not entries:
+            return 0
+
+        details = operation.details or {}
+        op_type = operation.operation_type
+        created_at = operation.completed_at or now_utc()
+        records = [
+            UsageRecord(
+                provider=details.get("cli") or infer_provider(entry["model"]),
+                operation_type=op_type.value if hasattr(op_type, "value") else str(op_type),
+                repository_id=operation.repository_id,
+                operation_id=operation.operation_id,
+                parent_session_id=operation.parent_session_id,
+                duration_ms=_int(result.get("duration_ms")) or None,
+                success=success,
+                created_at=created_at,
+                **entry,
+            )
+            for entry in entries
+        ]
+        self.record(records)
+        return len(records)
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write buffered records and their rollups in one transaction.
+
+        On failure the records go back to the buffer (bounded by
+        ``max_buffered``) and are retried on the next flush.
+
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+            try:
+                try:
+                    self._write(batch)
+                except IntegrityError:
+                    # Another writer created one of our buckets first; re-read and retry
+                    self._write(batch)
+            except Exception as e:
+                self._requeue(batch)
+                logger.error(f"[USAGE] Failed to write {len(batch)} usage records: {e}")
+                return 0
+            self._written += len(batch)
+            logger.debug(f"[USAGE] Flushed {len(batch)} usage records")
+            return len(batch)
+
+    def _requeue(self, batch: list[UsageRecord]) -> None:
+        with self._lock:
+            self._buffer = batch + self._buffer
+            overflow = len(self._buffer) - self.max_buffered
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self._dropped += overflow
+                logger.warning(f"[USAGE] Buffer full, dropped {overflow} oldest usage records")
+
+    def _write(self, batch: list[UsageRecord]) -> None:
+        db = self._session_factory()
+        try:
+            with serialized_write(db):
+                db.execute(
+                    insert(LLMUsage),
+                    [
+                        {
+                            "id": generate_uuid(),
+                            "operation_id": r.operation_id,
+                            "operation_type": r.operation_type,
+                            "parent_session_id": r.parent_session_id,
+                            "repository_id": r.repository_id,
+                            "provider": r.provider,
+                            "model": r.model,
+                            "input_tokens": r.input_tokens,
+                            "output_tokens": r.output_tokens,
+                            "cache_read_tokens": r.cache_read_tokens,
+                            "cache_creation_tokens": r.cache_creation_tokens,
+                            "cost_usd": r.cost_usd,
+                            "duration_ms": r.duration_ms,
+                            "success": r.success,
+                            "created_at": r.created_at,
+                        }
+                        for r in batch
+                    ],
+                )
+                self._upsert_rollups(db, batch)
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _upsert_rollups(self, db: Session, batch: list[UsageRecord]) -> None:
+        """Fold a batch into hourly buckets: one SELECT, one UPDATE and one INSERT batch."""
+        totals: dict[tuple[datetime, str, str, str, str], dict[str, Any]] = {}
+        for r in batch:
+            bucket = totals.setdefault(r.bucket_key, dict.fromkeys(_SUMS, 0))
+            bucket["calls"] += 1
+            bucket["failed_calls"] += 0 if r.success else 1
+            for counter in _COUNTERS:
+                bucket[counter] += getattr(r, counter)
+
+        buckets = sorted({bucket_key[0] for bucket_key in totals})
+        existing: dict[tuple[datetime, str, str, str, str], str] = {}
+        for start in range(0, len(buckets), _BUCKET_CHUNK):
+            rows: list[Any] = (
+                db.query(
+                    LLMUsageHourly.id,
+                    LLMUsageHourly.bucket_start,
+                    LLMUsageHourly.repository_id,
+                    LLMUsageHourly.provider,
+                    LLMUsageHourly.model,
+                    LLMUsageHourly.operation_type,
+                )
+                .filter(LLMUsageHourly.bucket_start.in_(buckets[start : start + _BUCKET_CHUNK]))
+                .all()
+            )
+            for row in rows:
+                existing[(hour_bucket(row[1]), row[2], row[3], row[4], row[5])] = row[0]
+
+        updates: list[dict[str, Any]] = []
+        inserts: list[dict[str, Any]] = []
+        for bucket_key, values in totals.items():
+            if bucket_key in existing:
+                updates.append(
+                    {"row_id": existing[bucket_key], **{f"d_{k}": v for k, v in values.items()}}
+                )
+            else:
+                bucket_start, repository_id, provider, model, operation_type = bucket_key
+                inserts.append(
+                    {
+                        "id": generate_uuid(),
+                        "bucket_start": bucket_start,
+                        "repository_id": repository_id,
+                        "provider": provider,
+                        "model": model,
+                        "operation_type": operation_type,
+                        **values,
+                    }
+                )
+
+        if updates:
+            # Increment in SQL so concurrent flushes never lose counts
+            db.connection().execute(
+                update(LLMUsageHourly)
+                .where(LLMUsageHourly.id == bindparam("row_id"))
+                .values(
+                    {
+                        column: getattr(LLMUsageHourly, column) + bindparam(f"d_{column}")
+                        for column in _SUMS
+                    }
+                ),
+                updates,
+            )
+        if inserts:
+            db.execute(insert(LLMUsageHourly), inserts)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        db: Session,
+        since: datetime,
+        until: datetime | None = None,
+        group_by: Sequence[str] = ("repository_id",),
+        repository_id: str | None = None,
+        provider: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate the hourly rollups (flushed data only).
+
+        Args:
+            db: Database session
+            since: Start of the range (rounded down to the hour)
+            until: End of the range (exclusive), defaults to now
+            group_by: Any of GROUP_BY_FIELDS
+            repository_id: Only this repository
+            provider: Only this provider
+
+        Returns:
+            One dict per group with the group fields, calls and token/cost sums;
+            chronological when grouped by day/hour, then most expensive first
+        """
+        unknown = set(group_by) - set(GROUP_BY_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown group_by fields: {sorted(unknown)}")
+
+        dims = [name for name in group_by if name not in ("day", "hour")]
+        period = "day" if "day" in group_by else "hour" if "hour" in group_by else None
+        columns = [getattr(LLMUsageHourly, name) for name in dims]
+        if period:
+            columns.append(LLMUsageHourly.bucket_start)
+        sums = [func.sum(getattr(LLMUsageHourly, name)) for name in _SUMS]
+
+        q = db.query(*columns, *sums).filter(LLMUsageHourly.bucket_start >= hour_bucket(since))
+        if until is not None:
+            q = q.filter(LLMUsageHourly.bucket_start < until)
+        if repository_id is not None:
+            q = q.filter(LLMUsageHourly.repository_id == repository_id)
+        if provider is not None:
+            q = q.filter(LLMUsageHourly.provider == provider)
+        if columns:
+            q = q.group_by(*columns)
+
+        # Hourly rows are folded into days here, which keeps the SQL portable
+        groups: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for row in q.all():
+            group_values = dict(zip(dims, row, strict=False))
+            if "repository_id" in group_values:
+                group_values["repository_id"] = group_values["repository_id"] or None
+            if period:
+                bucket = hour_bucket(row[len(dims)])
+                moment: date | datetime = bucket.date() if period == "day" else bucket
+                group_values[period] = moment.isoformat()
+            group = groups.setdefault(
+                tuple(group_values.values()), {**group_values, **dict.fromkeys(_SUMS, 0)}
+            )
+            for name, value in zip(_SUMS, row[len(columns) :], strict=True):
+                group[name] += value or 0
+
+        result = list(groups.values())
+        for group in result:
+            group["cost_usd"] = round(group["cost_usd"], 6)
+        result.sort(key=lambda g: g["cost_usd"], reverse=True)
+        if period:
+            result.sort(key=lambda g: g[period])
+        return result
+
+    def spend(self, db: Session, since: datetime, repository_id: str | None = None) -> float:
+        """Total cost since ``since`` (rollups plus not-yet-flushed records).
+
+        Cheap enough to call before starting a batch job to enforce a budget.
+        """
+        # literal() keeps this a column expression for mypy (the columns are untyped)
+        rollup: Query[Any] = db.query(func.sum(LLMUsageHourly.cost_usd)).filter(
+            literal(hour_bucket(since)) <= LLMUsageHourly.bucket_start
+        )
+        if repository_id is not None:
+            rollup = rollup.filter(LLMUsageHourly.repository_id == repository_id)
+        total = float(rollup.scalar() or 0.0)
+
+        start = hour_bucket(since)
+        with self._lock:
+            total += sum(
+                r.cost_usd
+                for r in self._buffer
+                if hour_bucket(r.created_at) >= start
+                and (repository_id is None or r.repository_id == repository_id)
+            )
+        return total
+
+    def stats(self) -> dict[str, Any]:
+        """Ledger counters for monitoring."""
+        with self._lock:
+            buffered = len(self._buffer)
+        return {
+            "enabled": self.enabled,
+            "buffered": buffered,
+            "written": self._written,
+            "dropped": self._dropped,
+        }
+
+
+# Singleton
+_ledger: UsageLedger | None = None
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Get singleton UsageLedger configured from settings."""
+    global _ledger
+    if _ledger is None:
+        settings = get_settings().usage_ledger
+        _ledger = UsageLedger(
+            enabled=settings.enabled,
+            batch_size=settings.batch_size,
+            flush_interval=settings.flush_interval_seconds,
+            max_buffered=settings.max_buffered,
+        )
+    return _ledger
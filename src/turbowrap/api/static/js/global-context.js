@@ -243,31 +243,30 @@ document.addEventListener('alpine:init', () => {
             });
         },
 
-        // Handle file change event
+        // Handle a coalesced batch of file changes
         _onFileChange(event) {
-            const { action, path, repo_id } = event;
+            const { repo_id, count, changes = [], truncated } = event;
 
             // Only process if it's for the current repo
             if (repo_id !== this.selectedRepoId) return;
 
-            // Extract relative path from full path
-            const repo = this.selectedRepo;
-            let relativePath = path;
-            if (repo && repo.local_path && path.startsWith(repo.local_path)) {
-                relativePath = path.substring(repo.local_path.length + 1);
-            }
+            // Paths are relative to the repository root
+            const paths = changes.map(c => c.path);
+            const single = count === 1 && changes.length === 1 ? changes[0] : null;
 
-            console.log(`[FileWatcher] ${action}: ${relativePath}`);
+            console.log(`[FileWatcher] ${count} file(s) changed`, paths);
 
             // Determine if we're on the files page
             const onFilesPage = window.location.pathname.startsWith('/files');
 
-            // Emit global event
+            // Emit one global event per batch
             window.dispatchEvent(new CustomEvent('file-change', {
                 detail: {
-                    action,
-                    path: relativePath,
-                    fullPath: path,
+                    action: single ? single.action : 'batch',
+                    path: single ? single.path : null,
+                    paths,
+                    count,
+                    truncated,
                     repoId: repo_id,
                     onFilesPage
                 }
@@ -278,18 +277,22 @@ document.addEventListener('alpine:init', () => {
                 const actionLabels = {
                     created: 'New file',
                     modified: 'Modified',
-                    deleted: 'Deleted',
-                    moved: 'Moved'
+                    deleted: 'Deleted'
                 };
-                const label = actionLabels[action] || action;
-                const filename = relativePath.split('/').pop();
+                let message = `${count} files changed`;
+                let clickUrl = '/files';
+                if (single) {
+                    const label = actionLabels[single.action] || single.action;
+                    message = `${label}: ${single.path.split('/').pop()}`;
+                    clickUrl = `/files?path=${encodeURIComponent(single.path)}`;
+                }
 
                 // Show clickable toast
                 window.dispatchEvent(new CustomEvent('show-toast', {
                     detail: {
-                        message: `${label}: ${filename}`,
+                        message,
                         type: 'success',
-                        clickUrl: `/files?path=${encodeURIComponent(relativePath)}`,
+                        clickUrl,
                         duration: 5000
                     }
                 }));
@@ -123,7 +123,8 @@ function getOperationState(operationId) {
             output: [],
             status: 'connecting',
             connected: false,
-            lineCount: 0
+            lineCount: 0,
+            lastEventId: null  // Resume point for reconnects (server keeps a bounded log)
         });
     }
     return operationState.get(operationId);
@@ -159,7 +160,10 @@ async function subscribe(operationId) {
     });
 
     try {
-        const url = `/api/operations/${operationId}/stream`;
+        // EventSource resends Last-Event-ID on its own reconnects; a new
+        // subscription after a disconnect passes it explicitly
+        const resume = state.lastEventId ? `?last_event_id=${state.lastEventId}` : '';
+        const url = `/api/operations/${operationId}/stream${resume}`;
         const eventSource = new EventSource(url);
 
         activeStreams.set(operationId, { eventSource });
@@ -190,6 +194,9 @@ async function subscribe(operationId) {
             try {
                 const data = JSON.parse(e.data);
                 const content = data.content || '';
+                if (e.lastEventId) {
+                    state.lastEventId = e.lastEventId;
+                }
 
                 // Buffer output (limit to 1000 lines)
                 state.output.push(content);
@@ -1,15 +1,34 @@
-"""WebSocket chat handler for streaming responses."""
+"""WebSocket chat handler for streaming responses.
+
+Protocol (server -> client): ``message_received``, ``generating``, then one
+``delta`` frame per batch of tokens as they arrive, then ``message`` with the
+full saved answer. A ``cancel`` frame from the client (or closing the socket)
+stops generation right away; ``cancelled`` confirms it.
+
+Outgoing frames go through a bounded per-connection buffer. When the client
+reads slower than the model writes, the stream is no longer pulled (the model
+connection is throttled instead of memory growing), and deltas waiting in the
+buffer are merged into a single frame.
+"""
 
 import asyncio
+import contextlib
 import json
+import logging
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 from ...db.models import ChatMessage, ChatSession
+from ...db.session import serialized_write
 from ...llm import ClaudeClient
 
+logger = logging.getLogger(__name__)
+
+# Frames buffered per connection before the model stream is paused
+SEND_BUFFER_FRAMES = 64
+
 
 class SessionInvalidatedError(Exception):
     """Raised when a chat session is deleted or invalidated during operation."""
@@ -20,18 +39,27 @@ class SessionInvalidatedError(Exception):
 class ChatWebSocketHandler:
     """Handles WebSocket chat connections with session validation."""
 
-    def __init__(self, websocket: WebSocket, session_id: str, db: Session):
+    def __init__(
+        self,
+        websocket: WebSocket,
+        session_id: str,
+        db: Session,
+        send_buffer: int = SEND_BUFFER_FRAMES,
+    ):
         """Initialize handler.
 
         Args:
             websocket: WebSocket connection.
             session_id: Chat session ID.
             db: Database session.
+            send_buffer: Outgoing frames buffered before the stream pauses.
         """
         self.websocket = websocket
         self.session_id = session_id
         self.db = db
         self._claude: ClaudeClient | None = None
+        self._outbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=send_buffer)
+        self._closed = False
 
     @property
     def claude(self) -> ClaudeClient:
@@ -60,25 +88,59 @@ class ChatWebSocketHandler:
         return session
 
     async def handle(self) -> None:
-        """Main handler loop with session validation."""
+        """Main handler loop with session validation.
+
+        Keeps reading the socket while an answer is generated, so a
+        disconnect or ``cancel`` stops the model stream immediately.
+        """
         await self.websocket.accept()
+        sender = asyncio.create_task(self._send_loop())
 
         # Verify session exists at connection time
         try:
             self._validate_session()
         except SessionInvalidatedError:
             await self.send_error("Session not found")
+            await self._flush()
             await self.websocket.close()
+            sender.cancel()
             return
 
+        receiver: asyncio.Task[str] | None = None
+        generation: asyncio.Task[None] | None = None
         try:
+            receiver = asyncio.create_task(self.websocket.receive_text())
             while True:
+                waiting: set[asyncio.Task[Any]] = {receiver}
+                if generation:
+                    waiting.add(generation)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if generation in done:
+                    task, generation = generation, None
+                    if not task.cancelled():
+                        task.result()  # Re-raise SessionInvalidatedError
+
+                if receiver not in done:
+                    continue
                 # Receive message
-                data = await self.websocket.receive_text()
-                message = json.loads(data)
+                message = json.loads(receiver.result())
+                receiver = asyncio.create_task(self.websocket.receive_text())
 
                 if message.get("type") == "message":
-                    await self.handle_message(message.get("content", ""))
+                    if generation:
+                        await self.send_error("A response is already being generated")
+                    else:
+                        generation = asyncio.create_task(
+                            self.handle_message(message.get("content", ""))
+                        )
+                elif message.get("type") == "cancel":
+                    if generation:
+                        generation.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await generation
+                        generation = None
+                        await self.send_json({"type": "cancelled"})
                 elif message.get("type") == "ping":
                     await self.send_json({"type": "pong"})
 
@@ -87,9 +149,19 @@ class ChatWebSocketHandler:
         except SessionInvalidatedError as e:
             # Session was deleted during operation - close gracefully
             await self.send_error(str(e))
+            await self._flush()
             await self.websocket.close(code=4001, reason="Session invalidated")
         except Exception as e:
             await self.send_error(str(e))
+            await self._flush()
+        finally:
+            # Abandoned chats stop consuming model time right away
+            for pending in (generation, receiver, sender):
+                if pending and not pending.done():
+                    pending.cancel()
+            await asyncio.gather(
+                *(t for t in (generation, receiver, sender) if t), return_exceptions=True
+            )
 
     async def handle_message(self, content: str) -> None:
         """Handle incoming chat message with session validation.
@@ -116,8 +188,9 @@ class ChatWebSocketHandler:
                 role="user",
                 content=content,
             )
-            self.db.add(user_message)
-            self.db.commit()
+            with serialized_write(self.db):
+                self.db.add(user_message)
+                self.db.commit()
         except Exception:
             self.db.rollback()
             # Check if session was deleted (foreign key constraint)
@@ -158,9 +231,14 @@ Respond helpfully as an AI assistant for code development."""
         await self.send_json({"type": "generating"})
 
         try:
-            # Run Claude in thread pool to not block
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, lambda: self.claude.generate(prompt))
+            # Forward tokens as they arrive; put() waits while the client is
+            # behind, which stops pulling from the model stream
+            chunks: list[str] = []
+            async for chunk in self.claude.astream(prompt):
+                if chunk:
+                    chunks.append(chunk)
+                    await self.send_json({"type": "delta", "content": chunk})
+            response = "".join(chunks)
 
             # Validate session before saving response
             # (session could be deleted during AI generation)
@@ -173,15 +251,16 @@ Respond helpfully as an AI assistant for code development."""
                     role="assistant",
                     content=response,
                 )
-                self.db.add(assistant_message)
-                self.db.commit()
+                with serialized_write(self.db):
+                    self.db.add(assistant_message)
+                    self.db.commit()
             except Exception:
                 self.db.rollback()
                 # Check if session was deleted
                 self._validate_session()
                 raise
 
-            # Send response
+            # Send full response (clients that ignore deltas still get the answer)
             await self.send_json(
                 {
                     "type": "message",
@@ -198,8 +277,47 @@ Respond helpfully as an AI assistant for code development."""
             await self.send_error(f"AI error: {e}")
 
     async def send_json(self, data: dict[str, Any]) -> None:
-        """Send JSON message."""
-        await self.websocket.send_text(json.dumps(data))
+        """Queue JSON message (waits while the send buffer is full)."""
+        if not self._closed:
+            await self._outbox.put(data)
+
+    async def _send_loop(self) -> None:
+        """Write queued frames in order, merging deltas that piled up."""
+        pending: dict[str, Any] | None = None
+        try:
+            while True:
+                frame = pending or await self._outbox.get()
+                pending = None
+                taken = 1
+                if frame["type"] == "delta":
+                    while not self._outbox.empty():
+                        following = self._outbox.get_nowait()
+                        taken += 1
+                        if following["type"] != "delta":
+                            pending = following
+                            taken -= 1  # Accounted for when it is sent
+                            break
+                        frame = {**frame, "content": frame["content"] + following["content"]}
+                try:
+                    await self.websocket.send_text(json.dumps(frame))
+                finally:
+                    for _ in range(taken):
+                        self._outbox.task_done()
+        except Exception as e:
+            # Socket gone: the receive loop sees the disconnect and cleans up
+            logger.debug(f"[CHAT WS] Send failed for session {self.session_id}: {e}")
+            self._closed = True
+            # Unblock anyone waiting for buffer space
+            while not self._outbox.empty():
+                self._outbox.get_nowait()
+                self._outbox.task_done()
+
+    async def _flush(self, timeout: float = 5.0) -> None:
+        """Wait until queued frames are written (before closing the socket)."""
+        if self._closed:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._outbox.join(), timeout)
 
     async def send_error(self, message: str) -> None:
         """Send error message."""
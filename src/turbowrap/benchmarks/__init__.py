@@ -0,0 +1,38 @@
+"""
+Offline benchmarks for the LLM CLI runners.
+
+Runs the real CLI wrappers and ParallelTripleLLMRunner against a scripted
+fake CLI binary (fake_llm.py), so throughput, parse CPU, event-loop lag,
+memory and SSE fan-out latency can be tracked without API keys. The
+sqlite_writes suite measures commit latency and lock errors of concurrent
+writers against a temporary database, per SQLite concurrency profile.
+
+Usage:
+    python -m turbowrap.benchmarks --output bench.json
+    python -m turbowrap.benchmarks cli_stream --issues 200 --rate 500
+    python -m turbowrap.benchmarks sqlite_writes --writers 16 --commits 100
+    python -m turbowrap.benchmarks --baseline bench.json --max-regression 0.2
+"""
+
+from turbowrap.benchmarks.fake_llm import FakeLLMScenario
+from turbowrap.benchmarks.harness import fake_llm_environment, measure
+from turbowrap.benchmarks.suites import (
+    BENCHMARKS,
+    BenchmarkConfig,
+    BenchmarkResult,
+    compare_results,
+    results_document,
+    run_benchmarks,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkConfig",
+    "BenchmarkResult",
+    "FakeLLMScenario",
+    "compare_results",
+    "fake_llm_environment",
+    "measure",
+    "results_document",
+    "run_benchmarks",
+]
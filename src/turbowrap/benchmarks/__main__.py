@@ -0,0 +1,121 @@
+"""Run the offline benchmarks.
+
+Usage:
+    python -m turbowrap.benchmarks [SUITE ...] [--output FILE] [--baseline FILE]
+
+Exit codes:
+    0 = done (no regressions against the baseline)
+    1 = at least one metric regressed more than --max-regression
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from turbowrap.benchmarks.fake_llm import FAILURE_MODES, FakeLLMScenario
+from turbowrap.benchmarks.suites import (
+    BENCHMARKS,
+    BenchmarkConfig,
+    compare_results,
+    results_document,
+    run_benchmarks,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m turbowrap.benchmarks",
+        description="Offline benchmarks for the LLM CLI runners (fake CLI binary)",
+    )
+    parser.add_argument("suites", nargs="*", help=f"Suites to run ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced memory run")
+    parser.add_argument("--issues", type=int, default=10, help="Issues per specialist")
+    parser.add_argument("--description-chars", type=int, default=200)
+    parser.add_argument("--chunk-chars", type=int, default=64)
+    parser.add_argument("--thinking-chars", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=0.0, help="Events/s (0 = unthrottled)")
+    parser.add_argument("--failure", choices=FAILURE_MODES, default="none")
+    parser.add_argument("--stall-seconds", type=float, default=3600.0)
+    parser.add_argument(
+        "--failing-provider",
+        choices=["claude", "gemini", "grok"],
+        help="Apply --failure to this provider only",
+    )
+    parser.add_argument("--replay", type=Path, help="Recorded stream to replay")
+    parser.add_argument("--subscribers", type=int, default=50, help="SSE subscribers")
+    parser.add_argument("--files", type=int, default=20, help="Files in the synthetic repo")
+    parser.add_argument("--writers", type=int, default=8, help="SQLite writer threads")
+    parser.add_argument("--readers", type=int, default=2, help="SQLite reader threads")
+    parser.add_argument("--commits", type=int, default=50, help="Operations per SQLite writer")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.suites if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+    return args
+
+
+def _config(args: argparse.Namespace) -> BenchmarkConfig:
+    scenario = FakeLLMScenario(
+        issues_per_specialist=args.issues,
+        files_count=args.files,
+        description_chars=args.description_chars,
+        chunk_chars=args.chunk_chars,
+        thinking_chars=args.thinking_chars,
+        events_per_second=args.rate,
+        stall_seconds=args.stall_seconds,
+        replay_path=str(args.replay) if args.replay else None,
+    )
+    overrides: dict[str, FakeLLMScenario] = {}
+    if args.failing_provider:
+        failing = FakeLLMScenario(**scenario.to_dict())
+        failing.failure = args.failure
+        overrides[args.failing_provider] = failing
+    else:
+        scenario.failure = args.failure
+    return BenchmarkConfig(
+        scenario=scenario,
+        provider_scenarios=overrides,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory,
+        sse_subscribers=args.subscribers,
+        files_count=args.files,
+        db_writers=args.writers,
+        db_readers=args.readers,
+        db_commits=args.commits,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    results = asyncio.run(run_benchmarks(_config(args), args.suites or None))
+    document = results_document(results)
+
+    for bench in document["benchmarks"]:
+        metrics = ", ".join(f"{k}={v}" for k, v in bench["metrics"].items())
+        print(f"{bench['name']}: {metrics}")
+
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_results(document, baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Scripted stand-in for the claude/gemini/grok CLIs.
+
+Emits the same stream-json traffic as the real CLIs (synthetic specialist
+reviews, or a recorded stream replayed verbatim) at a configurable rate,
+size and failure mode. Used by the benchmark harness through shims named
+``claude``, ``gemini`` and ``grok`` placed first on PATH.
+
+Standard library only: the process is spawned once per CLI run and must
+start fast.
+
+Usage:
+    TURBOWRAP_FAKE_LLM_SCENARIO='{"default": {"issues_per_specialist": 20}}' \\
+        python fake_llm.py --dialect claude --print "review prompt"
+
+The scenario (JSON string or path to a JSON file) maps a dialect (or
+"default") to FakeLLMScenario fields.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any
+
+SCENARIO_ENV = "TURBOWRAP_FAKE_LLM_SCENARIO"
+
+DIALECTS = ("claude", "gemini", "grok")
+
+# Failure modes
+FAILURE_NONE = "none"
+FAILURE_EXIT_ERROR = "exit_error"  # Non-zero exit after part of the stream
+FAILURE_TRUNCATE = "truncate"  # Clean exit without the rest (and no result event)
+FAILURE_STALL = "stall"  # Go silent for stall_seconds mid-stream
+FAILURE_MALFORMED = "malformed"  # Truncated and non-JSON lines mid-stream
+FAILURE_MODES = (
+    FAILURE_NONE,
+    FAILURE_EXIT_ERROR,
+    FAILURE_TRUNCATE,
+    FAILURE_STALL,
+    FAILURE_MALFORMED,
+)
+
+DEFAULT_SPECIALISTS = ["reviewer_be_quality", "reviewer_be_architecture"]
+
+_SPECIALIST_RE = re.compile(r"\b((?:reviewer|analyst)_[a-z]+(?:_[a-z]+)*)\b")
+_SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+_CATEGORIES = ("security", "logic", "performance", "architecture", "style")
+
+
+@dataclass
+class FakeLLMScenario:
+    """What one fake CLI run emits."""
+
+    # Specialists to review as (None = the ones named in the prompt)
+    specialists: list[str] | None = None
+    issues_per_specialist: int = 10
+    files_count: int = 20
+    # Padding added to each issue description (response size knob)
+    description_chars: int = 200
+    # Text per streamed event (grok always sends one message per review block)
+    chunk_chars: int = 64
+    # Thinking text streamed before the answer (claude only)
+    thinking_chars: int = 0
+    # Stream events per second (0 = as fast as possible)
+    events_per_second: float = 0.0
+    startup_delay_seconds: float = 0.0
+    failure: str = FAILURE_NONE
+    # Fraction of the stream emitted before the failure kicks in
+    fail_after_fraction: float = 0.5
+    stall_seconds: float = 3600.0
+    exit_code: int = 1
+    # Recorded stream (one event per line) replayed instead of synthetic output
+    replay_path: str | None = None
+    seed: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FakeLLMScenario:
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Emitter:
+    """Writes stream lines at the scenario rate and applies the failure mode."""
+
+    scenario: FakeLLMScenario
+    total_events: int
+    sent: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def emit(self, line: str) -> None:
+        scenario = self.scenario
+        if scenario.failure != FAILURE_NONE and self.sent >= self._failure_point():
+            self._fail()
+        if scenario.events_per_second > 0:
+            due = self.started + self.sent / scenario.events_per_second
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+        self.sent += 1
+
+    def _failure_point(self) -> int:
+        return int(self.total_events * self.scenario.fail_after_fraction)
+
+    def _fail(self) -> None:
+        failure = self.scenario.failure
+        if failure == FAILURE_STALL:
+            time.sleep(self.scenario.stall_seconds)
+            self.scenario.failure = FAILURE_NONE  # Resume after the stall
+        elif failure == FAILURE_EXIT_ERROR:
+            sys.stderr.write("fake-llm: simulated API error (overloaded_error)\n")
+            sys.stderr.flush()
+            sys.exit(self.scenario.exit_code)
+        elif failure == FAILURE_TRUNCATE:
+            sys.exit(0)
+        elif failure == FAILURE_MALFORMED:
+            sys.stdout.write('{"type": "stream_event", "event": {"type": "content_blo\n')
+            sys.stdout.write("<<<not json>>>\n")
+            self.scenario.failure = FAILURE_NONE
+
+
+def load_scenario(dialect: str, raw: str | None = None) -> FakeLLMScenario:
+    """Resolve the scenario for a dialect from the environment (or ``raw``)."""
+    raw = raw if raw is not None else os.environ.get(SCENARIO_ENV, "")
+    if not raw.strip():
+        return FakeLLMScenario()
+    if not raw.lstrip().startswith("{"):
+        with open(raw, encoding="utf-8") as fh:
+            raw = fh.read()
+    config = json.loads(raw)
+    merged = dict(config.get("default", {}))
+    merged.update(config.get(dialect, {}))
+    return FakeLLMScenario.from_dict(merged)
+
+
+def build_review_text(scenario: FakeLLMScenario, prompt: str, dialect: str) -> list[str]:
+    """Build the answer as one ```json block per specialist."""
+    rng = random.Random(f"{scenario.seed}:{dialect}")  # noqa: S311
+    specialists = scenario.specialists or sorted(set(_SPECIALIST_RE.findall(prompt)))
+    specialists = specialists or DEFAULT_SPECIALISTS
+    padding = ("Detailed explanation of the problem. " * 50)[: scenario.description_chars]
+
+    blocks: list[str] = []
+    for s_index, specialist in enumerate(specialists):
+        issues = []
+        for i in range(scenario.issues_per_specialist):
+            file_index = rng.randrange(max(1, scenario.files_count))
+            issues.append(
+                {
+                    "id": f"{dialect[:2].upper()}-{s_index:02d}-{i:04d}",
+                    "severity": rng.choice(_SEVERITIES),
+                    "category": rng.choice(_CATEGORIES),
+                    "file": f"src/module_{file_index}.py",
+                    "line": rng.randrange(1, 400),
+                    "title": f"Synthetic finding {i} in module {file_index}",
+                    "description": f"{specialist} finding {i}. {padding}",
+                    "current_code": f"value_{i} = compute(input_{i})",
+                    "suggested_fix": f"value_{i} = compute(validate(input_{i}))",
+                }
+            )
+        review = {
+            "summary": {"files_reviewed": scenario.files_count, "score": 7.5},
+            "issues": issues,
+        }
+        payload = json.dumps({"specialist": specialist, "review": review}, indent=2)
+        blocks.append(f"## SPECIALIST {s_index + 1}: {specialist}\n\n```json\n{payload}\n```\n\n")
+    return blocks
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    size = max(1, size)
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _claude_events(scenario: FakeLLMScenario, blocks: list[str], model: str) -> list[str]:
+    session_id = str(uuid.uuid4())
+    text = "".join(blocks)
+
+    def delta(index: int, payload: dict[str, Any]) -> str:
+        event = {"type": "content_block_delta", "index": index, "delta": payload}
+        return json.dumps({"type": "stream_event", "event": event})
+
+    def block(event_type: str, index: int, block_type: str | None = None) -> str:
+        event: dict[str, Any] = {"type": event_type, "index": index}
+        if block_type:
+            event["content_block"] = {"type": block_type}
+        return json.dumps({"type": "stream_event", "event": event})
+
+    events = [json.dumps({"type": "system", "subtype": "init", "session_id": session_id})]
+    index = 0
+    if scenario.thinking_chars > 0:
+        thinking = ("Considering the code paths. " * 1000)[: scenario.thinking_chars]
+        events.append(block("content_block_start", index, "thinking"))
+        events += [
+            delta(index, {"type": "thinking_delta", "thinking": chunk})
+            for chunk in _chunks(thinking, scenario.chunk_chars)
+        ]
+        events.append(block("content_block_stop", index))
+        index += 1
+    events.append(block("content_block_start", index, "text"))
+    events += [
+        delta(index, {"type": "text_delta", "text": chunk})
+        for chunk in _chunks(text, scenario.chunk_chars)
+    ]
+    events.append(block("content_block_stop", index))
+    events.append(
+        json.dumps(
+            {
+                "type": "result",
+                "subtype": "success",
+                "is_error": False,
+                "result": text,
+                "session_id": session_id,
+                "duration_api_ms": 0,
+                "num_turns": 1,
+                "modelUsage": {
+                    model: {
+                        "inputTokens": 1000,
+                        "outputTokens": len(text) // 4,
+                        "cacheReadInputTokens": 0,
+                        "cacheCreationInputTokens": 0,
+                        "costUSD": 0.0,
+                    }
+                },
+            }
+        )
+    )
+    return events
+
+
+def _gemini_events(scenario: FakeLLMScenario, blocks: list[str], model: str) -> list[str]:
+    text = "".join(blocks)
+    events = [json.dumps({"type": "init", "session_id": str(uuid.uuid4()), "model": model})]
+    events += [
+        json.dumps({"type": "message", "role": "assistant", "content": chunk, "delta": True})
+        for chunk in _chunks(text, scenario.chunk_chars)
+    ]
+    events.append(
+        json.dumps(
+            {
+                "type": "result",
+                "status": "success",
+                "stats": {
+                    "total_tokens": 1000 + len(text) // 4,
+                    "input_tokens": 1000,
+                    "output_tokens": len(text) // 4,
+                    "duration_ms": 0,
+                    "tool_calls": 0,
+                },
+            }
+        )
+    )
+    return events
+
+
+def _grok_events(scenario: FakeLLMScenario, blocks: list[str], model: str) -> list[str]:
+    # Grok joins messages with newlines, so each message is a whole block
+    return [json.dumps({"role": "assistant", "content": block}) for block in blocks]
+
+
+_EVENT_BUILDERS = {"claude": _claude_events, "gemini": _gemini_events, "grok": _grok_events}
+
+
+def _parse_args(argv: list[str]) -> tuple[str, str, str]:
+    """Extract (dialect, model, prompt) from the real CLIs' argument lists."""
+    dialect = os.path.basename(sys.argv[0]).split(".")[0]
+    model = "fake-model"
+    args = list(argv)
+    if "--dialect" in args:
+        i = args.index("--dialect")
+        dialect = args[i + 1]
+        del args[i : i + 2]
+    for flag in ("--model", "-m"):
+        if flag in args and args.index(flag) + 1 < len(args):
+            model = args[args.index(flag) + 1]
+    if "-p" in args and args.index("-p") + 1 < len(args):
+        prompt = args[args.index("-p") + 1]
+    else:
+        prompt = args[-1] if args else ""
+    if dialect not in DIALECTS:
+        raise SystemExit(f"fake-llm: unknown dialect {dialect!r}")
+    return dialect, model, prompt
+
+
+def main(argv: list[str] | None = None) -> int:
+    dialect, model, prompt = _parse_args(sys.argv[1:] if argv is None else argv)
+    scenario = load_scenario(dialect)
+    if scenario.failure not in FAILURE_MODES:
+        raise SystemExit(f"fake-llm: unknown failure mode {scenario.failure!r}")
+
+    if scenario.replay_path:
+        with open(scenario.replay_path, encoding="utf-8") as fh:
+            events = [line.rstrip("\n") for line in fh if line.strip()]
+    else:
+        blocks = build_review_text(scenario, prompt, dialect)
+        events = _EVENT_BUILDERS[dialect](scenario, blocks, model)
+
+    if scenario.startup_delay_seconds > 0:
+        time.sleep(scenario.startup_delay_seconds)
+
+    emitter = _Emitter(scenario, total_events=len(events))
+    for line in events:
+        emitter.emit(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""Benchmark harness: fake CLI environment and measurement helpers.
+
+``fake_llm_environment`` puts ``claude``/``gemini``/``grok`` shims first on
+PATH so the unmodified CLI wrappers spawn the scripted stand-in in
+fake_llm.py. ``measure`` records wall time, CPU time of this process
+(stream parsing and callbacks; the fake CLI runs in its own process),
+event-loop lag and, optionally, the Python memory high-water mark.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from turbowrap.benchmarks.fake_llm import DIALECTS, SCENARIO_ENV, FakeLLMScenario
+
+FAKE_LLM_SCRIPT = Path(__file__).with_name("fake_llm.py")
+
+# Dummy keys so the wrappers don't bail out before spawning the CLI
+FAKE_API_KEYS = {
+    "ANTHROPIC_API_KEY": "fake-anthropic-key",
+    "GEMINI_API_KEY": "fake-gemini-key",
+    "GROK_API_KEY": "fake-grok-key",
+}
+
+# How often the event-loop lag probe wakes up
+LOOP_LAG_INTERVAL = 0.005
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@contextmanager
+def fake_llm_environment(
+    scenarios: dict[str, FakeLLMScenario] | None = None,
+    work_dir: Path | None = None,
+) -> Iterator[Path]:
+    """Route the claude/gemini/grok CLIs to the fake binary.
+
+    Args:
+        scenarios: Dialect (or "default") -> scenario
+        work_dir: Where to create the shim directory (temp dir if None)
+
+    Yields:
+        The shim directory (first entry of PATH while active)
+    """
+    with tempfile.TemporaryDirectory(prefix="tw-fake-llm-", dir=work_dir) as tmp:
+        bin_dir = Path(tmp)
+        for dialect in DIALECTS:
+            shim = bin_dir / dialect
+            shim.write_text(
+                f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_LLM_SCRIPT}" --dialect {dialect} "$@"\n'
+            )
+            shim.chmod(0o755)
+
+        scenario_file = bin_dir / "scenario.json"
+        scenario_file.write_text(
+            json.dumps({name: s.to_dict() for name, s in (scenarios or {}).items()})
+        )
+
+        overrides = {
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            SCENARIO_ENV: str(scenario_file),
+            **FAKE_API_KEYS,
+        }
+        saved = {key: os.environ.get(key) for key in overrides}
+        os.environ.update(overrides)
+        try:
+            yield bin_dir
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a periodic probe."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+@dataclass
+class Measurement:
+    """Resources used by one measured block."""
+
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    loop_lag_max_ms: float = 0.0
+    loop_lag_p95_ms: float = 0.0
+    peak_mem_mb: float | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@asynccontextmanager
+async def measure(trace_memory: bool = False) -> AsyncIterator[Measurement]:
+    """Measure the enclosed block (fills the yielded Measurement on exit).
+
+    Memory tracing slows allocation-heavy code down, so callers measure
+    time and memory in separate runs.
+    """
+    result = Measurement()
+    monitor = LoopLagMonitor()
+    if trace_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    monitor.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield result
+    finally:
+        result.cpu_s = time.process_time() - cpu_start
+        result.wall_s = time.perf_counter() - wall_start
+        await monitor.stop()
+        if trace_memory:
+            result.peak_mem_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+        if monitor.samples:
+            result.loop_lag_max_ms = max(monitor.samples) * 1000
+            result.loop_lag_p95_ms = percentile(monitor.samples, 95) * 1000
+
+
+def summarize(runs: list[Measurement], memory: Measurement | None = None) -> dict[str, Any]:
+    """Median timings over repeated runs plus the memory high-water mark."""
+    metrics: dict[str, Any] = {
+        "wall_s": statistics.median(m.wall_s for m in runs),
+        "cpu_s": statistics.median(m.cpu_s for m in runs),
+        "loop_lag_max_ms": max(m.loop_lag_max_ms for m in runs),
+        "loop_lag_p95_ms": statistics.median(m.loop_lag_p95_ms for m in runs),
+    }
+    if memory is not None and memory.peak_mem_mb is not None:
+        metrics["peak_mem_mb"] = memory.peak_mem_mb
+    for key in runs[-1].extra:
+        values = [m.extra[key] for m in runs if isinstance(m.extra.get(key), (int, float))]
+        metrics[key] = statistics.median(values) if values else runs[-1].extra[key]
+    return {k: round(v, 4) if isinstance(v, float) else v for k, v in metrics.items()}
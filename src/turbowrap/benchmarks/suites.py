@@ -0,0 +1,516 @@
+"""Benchmark suites for the CLI runners, SSE fan-out, full reviews and SQLite writes.
+
+Every suite runs offline (the LLM suites against the fake CLI binary, the
+SQLite suite against a temporary database) and returns BenchmarkResult
+entries that ``results_document`` serialises for regression tracking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, cast
+
+from turbowrap.benchmarks.fake_llm import FakeLLMScenario
+from turbowrap.benchmarks.harness import (
+    Measurement,
+    fake_llm_environment,
+    measure,
+    percentile,
+    summarize,
+)
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SCHEMA_VERSION = 1
+
+# Metrics where a higher value is a regression
+LOWER_IS_BETTER = (
+    "wall_s",
+    "cpu_s",
+    "loop_lag_max_ms",
+    "loop_lag_p95_ms",
+    "peak_mem_mb",
+    "sse_latency_p50_ms",
+    "sse_latency_p95_ms",
+    "commit_p99_ms",
+)
+
+# Changes smaller than this are timer noise, whatever the relative change
+NOISE_FLOOR = {
+    "wall_s": 0.05,
+    "cpu_s": 0.02,
+    "loop_lag_max_ms": 5.0,
+    "loop_lag_p95_ms": 5.0,
+    "peak_mem_mb": 1.0,
+    "sse_latency_p50_ms": 1.0,
+    "sse_latency_p95_ms": 1.0,
+    "commit_p99_ms": 5.0,
+}
+
+BENCH_SPECIALISTS = ["reviewer_be_quality", "reviewer_be_architecture"]
+
+
+@dataclass
+class BenchmarkConfig:
+    """Parameters shared by all suites."""
+
+    scenario: FakeLLMScenario = field(default_factory=FakeLLMScenario)
+    # Per-provider overrides, e.g. {"grok": FakeLLMScenario(failure="stall")}
+    provider_scenarios: dict[str, FakeLLMScenario] = field(default_factory=dict)
+    repeat: int = 3
+    trace_memory: bool = True
+    sse_subscribers: int = 50
+    files_count: int = 20
+    timeout: int = 300
+    # sqlite_writes: concurrent writer/reader threads and commits per writer
+    db_writers: int = 8
+    db_readers: int = 2
+    db_commits: int = 50
+
+    def scenarios(self) -> dict[str, FakeLLMScenario]:
+        return {"default": self.scenario, **self.provider_scenarios}
+
+
+@dataclass
+class BenchmarkResult:
+    """Metrics of one benchmark."""
+
+    name: str
+    params: dict[str, Any]
+    metrics: dict[str, Any]
+
+
+RunOnce = Callable[[Measurement], Awaitable[None]]
+
+
+async def _repeat(config: BenchmarkConfig, run_once: RunOnce) -> dict[str, Any]:
+    """Run a measured block ``repeat`` times (+1 traced run for memory)."""
+    runs: list[Measurement] = []
+    for _ in range(config.repeat):
+        async with measure() as m:
+            await run_once(m)
+        runs.append(m)
+    memory = None
+    if config.trace_memory:
+        async with measure(trace_memory=True) as memory:
+            await run_once(memory)
+    return summarize(runs, memory)
+
+
+def _bench_prompt() -> str:
+    return "Review these files as " + ", ".join(BENCH_SPECIALISTS)
+
+
+def _create_cli(provider: str, working_dir: Path, timeout: int) -> Any:
+    """CLI wrapper with the default no-op artifact saver and tracker."""
+    from turbowrap_llm import ClaudeCLI, GeminiCLI, GrokCLI
+
+    if provider == "claude":
+        return ClaudeCLI(working_dir=working_dir, model="opus", timeout=timeout)
+    if provider == "gemini":
+        return GeminiCLI(working_dir=working_dir, timeout=timeout)
+    return GrokCLI(working_dir=working_dir, timeout=timeout)
+
+
+# =============================================================================
+# CLI streaming
+# =============================================================================
+
+
+async def bench_cli_stream(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Stream throughput and parse cost of each CLI wrapper."""
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as tmp, fake_llm_environment(config.scenarios()):
+        for provider in ("claude", "gemini", "grok"):
+
+            async def run_once(m: Measurement, provider: str = provider) -> None:
+                chunks = 0
+                text_bytes = 0
+
+                async def on_chunk(chunk: str) -> None:
+                    nonlocal chunks, text_bytes
+                    chunks += 1
+                    text_bytes += len(chunk)
+
+                cli = _create_cli(provider, Path(tmp), config.timeout)
+                result = await cli.run(_bench_prompt(), on_chunk=on_chunk, save_artifacts=False)
+                m.extra.update(
+                    success=bool(result.success),
+                    chunks=chunks,
+                    text_kb=text_bytes / 1024,
+                    output_kb=len(result.output or "") / 1024,
+                )
+
+            metrics = await _repeat(config, run_once)
+            if metrics["wall_s"] > 0:
+                metrics["text_kb_per_s"] = round(metrics["text_kb"] / metrics["wall_s"], 2)
+            results.append(
+                BenchmarkResult(
+                    name=f"cli_stream[{provider}]",
+                    params=config.scenarios().get(provider, config.scenario).to_dict(),
+                    metrics=metrics,
+                )
+            )
+    return results
+
+
+# =============================================================================
+# SSE fan-out
+# =============================================================================
+
+
+async def bench_sse_fanout(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Latency from a streamed chunk to every SSE subscriber."""
+    from turbowrap.api.review_manager import ReviewSession
+    from turbowrap.review.models.progress import ProgressEvent, ProgressEventType
+
+    async def run_once(m: Measurement) -> None:
+        session = ReviewSession(task_id="bench", repository_id="bench")
+        latencies: list[float] = []
+        received = 0
+        published = 0
+
+        async def subscriber(queue: asyncio.Queue[ProgressEvent | None]) -> None:
+            nonlocal received
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                event.model_dump_json()  # What the SSE route sends
+                latencies.append((datetime.utcnow() - event.timestamp).total_seconds())
+                received += 1
+
+        consumers = [
+            asyncio.create_task(subscriber(session.subscribe()))
+            for _ in range(config.sse_subscribers)
+        ]
+
+        async def on_chunk(chunk: str) -> None:
+            nonlocal published
+            published += 1
+            session.add_event(
+                ProgressEvent(
+                    type=ProgressEventType.REVIEWER_STREAMING,
+                    reviewer_name="claude",
+                    content=chunk,
+                )
+            )
+            await asyncio.sleep(0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cli = _create_cli("claude", Path(tmp), config.timeout)
+            await cli.run(_bench_prompt(), on_chunk=on_chunk, save_artifacts=False)
+
+        for queue in session.subscribers:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+
+        m.extra.update(
+            events=published,
+            dropped=published * config.sse_subscribers - received,
+            sse_latency_p50_ms=percentile(latencies, 50) * 1000,
+            sse_latency_p95_ms=percentile(latencies, 95) * 1000,
+            sse_latency_max_ms=max(latencies, default=0.0) * 1000,
+        )
+
+    with fake_llm_environment(config.scenarios()):
+        metrics = await _repeat(config, run_once)
+    return [
+        BenchmarkResult(
+            name="sse_fanout",
+            params={"subscribers": config.sse_subscribers, **config.scenario.to_dict()},
+            metrics=metrics,
+        )
+    ]
+
+
+# =============================================================================
+# End-to-end review
+# =============================================================================
+
+
+def _make_bench_runner(config: BenchmarkConfig) -> Any:
+    """ParallelTripleLLMRunner with no-op artifact savers and trackers."""
+    from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMRunner
+
+    class BenchRunner(ParallelTripleLLMRunner):
+        def _create_claude_cli(self, context: Any, shard: Any = None) -> Any:
+            return _create_cli("claude", context.repo_path, self.timeout)
+
+        def _create_gemini_cli(self, context: Any, shard: Any = None) -> Any:
+            return _create_cli("gemini", context.repo_path, self.timeout)
+
+        def _create_grok_cli(self, context: Any, shard: Any = None) -> Any:
+            return _create_cli("grok", context.repo_path, self.timeout)
+
+    runner = BenchRunner(specialists=BENCH_SPECIALISTS, timeout=config.timeout)
+    # Single shard: sharding would count tokens with tiktoken (needs a download)
+    runner.settings = runner.settings.model_copy(
+        update={
+            "review_sharding": runner.settings.review_sharding.model_copy(update={"enabled": False})
+        }
+    )
+    return runner
+
+
+async def bench_review_e2e(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Full three-LLM review: fan-out, parsing, merge and dedup."""
+    from turbowrap.review.models.review import ReviewRequest, ReviewRequestSource
+    from turbowrap.review.reviewers.base import ReviewContext
+
+    with tempfile.TemporaryDirectory() as tmp, fake_llm_environment(config.scenarios()):
+        repo = Path(tmp)
+        files = [f"src/module_{i}.py" for i in range(config.files_count)]
+        for i, name in enumerate(files):
+            (repo / name).parent.mkdir(parents=True, exist_ok=True)
+            (repo / name).write_text(f"def handler_{i}(value):\n    return value * {i}\n")
+
+        async def run_once(m: Measurement) -> None:
+            runner = _make_bench_runner(config)
+            context = ReviewContext(
+                request=ReviewRequest(type="directory", source=ReviewRequestSource()),
+                repo_path=repo,
+                files=files,
+            )
+            result = await runner.run(context)
+            m.extra.update(
+                merged_issues=result.merged_issues_count,
+                overlap=result.overlap_count,
+                failed_providers=sum(
+                    status != "ok"
+                    for status in (result.claude_status, result.gemini_status, result.grok_status)
+                ),
+                late_providers=len(result.late_providers),
+            )
+
+        metrics = await _repeat(config, run_once)
+    return [BenchmarkResult(name="review_e2e", params=config.scenario.to_dict(), metrics=metrics)]
+
+
+# =============================================================================
+# SQLite write contention
+# =============================================================================
+
+# Concurrency profiles compared by bench_sqlite_writes
+SQLITE_PROFILES = ("default", "tuned", "serialized")
+
+
+def _sqlite_engine(path: Path, profile: str) -> Any:
+    """Engine as get_engine() builds it: "default" without the concurrency profile."""
+    from sqlalchemy import create_engine
+
+    from turbowrap.config import get_settings
+    from turbowrap.db.session import configure_sqlite_engine
+
+    database = get_settings().database
+    connect_args: dict[str, Any] = {"check_same_thread": False}
+    if profile != "default":
+        connect_args["timeout"] = database.sqlite_busy_timeout_ms / 1000
+    engine = create_engine(f"sqlite:///{path}", connect_args=connect_args)
+    if profile != "default":
+        configure_sqlite_engine(engine, database)
+    return engine
+
+
+def _run_sqlite_writers(config: BenchmarkConfig, path: Path, profile: str) -> dict[str, Any]:
+    """Writer threads insert and update operations (like OperationTracker) while
+    reader threads poll the table; returns commit latencies and lock errors."""
+    from sqlalchemy import Table, func, select
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm import sessionmaker
+
+    from turbowrap.db.base import Base
+    from turbowrap.db.models.operation import Operation as DBOperation
+    from turbowrap.db.session import serialized_write
+
+    engine = _sqlite_engine(path, profile)
+    Base.metadata.create_all(engine, tables=[cast(Table, DBOperation.__table__)])
+    session_factory = sessionmaker(bind=engine)
+    latencies: list[float] = []
+    lock_errors = 0
+    counter_lock = threading.Lock()
+    writers_done = threading.Event()
+
+    def commit(db: Any, apply: Callable[[Any], None]) -> None:
+        nonlocal lock_errors
+        started = time.perf_counter()
+        try:
+            if profile == "serialized":
+                with serialized_write(db):
+                    apply(db)
+                    db.commit()
+            else:
+                apply(db)
+                db.commit()
+        except OperationalError:
+            db.rollback()
+            with counter_lock:
+                lock_errors += 1
+            return
+        with counter_lock:
+            latencies.append(time.perf_counter() - started)
+
+    def writer(index: int) -> None:
+        db = session_factory()
+        try:
+            for i in range(config.db_commits):
+                op = DBOperation(id=f"bench-{index}-{i}", operation_type="review", details={"i": i})
+                commit(db, lambda db, op=op: db.add(op))
+                commit(db, lambda db, op=op: setattr(op, "status", "completed"))
+        finally:
+            db.close()
+
+    def reader() -> None:
+        db = session_factory()
+        try:
+            while not writers_done.is_set():
+                try:
+                    db.execute(select(func.count()).select_from(DBOperation)).scalar()
+                    db.commit()
+                except OperationalError:
+                    db.rollback()
+        finally:
+            db.close()
+
+    readers = [threading.Thread(target=reader) for _ in range(config.db_readers)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(config.db_writers)]
+    started = time.perf_counter()
+    for thread in [*readers, *writers]:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    writers_done.set()
+    for thread in readers:
+        thread.join()
+    engine.dispose()
+
+    return {
+        "commits": len(latencies),
+        "lock_errors": lock_errors,
+        "commits_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "commit_p50_ms": percentile(latencies, 50) * 1000,
+        "commit_p99_ms": percentile(latencies, 99) * 1000,
+        "commit_max_ms": max(latencies, default=0.0) * 1000,
+    }
+
+
+async def bench_sqlite_writes(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Commit latency and lock errors of concurrent SQLite writers per profile."""
+    from turbowrap.config import get_settings
+
+    database = get_settings().database
+    # Threads are not traced; the memory run would only repeat the timing run
+    timed = dataclasses.replace(config, trace_memory=False)
+    results: list[BenchmarkResult] = []
+    for profile in SQLITE_PROFILES:
+        with tempfile.TemporaryDirectory(prefix="tw-bench-db-") as tmp:
+            runs = 0
+
+            async def run_once(m: Measurement, profile: str = profile, tmp: str = tmp) -> None:
+                nonlocal runs
+                runs += 1
+                path = Path(tmp) / f"bench-{runs}.db"
+                m.extra.update(await asyncio.to_thread(_run_sqlite_writers, config, path, profile))
+
+            metrics = await _repeat(timed, run_once)
+        params: dict[str, Any] = {
+            "writers": config.db_writers,
+            "readers": config.db_readers,
+            "commits_per_writer": config.db_commits * 2,
+        }
+        if profile != "default":
+            params.update(
+                journal_mode=database.sqlite_journal_mode,
+                synchronous=database.sqlite_synchronous,
+                busy_timeout_ms=database.sqlite_busy_timeout_ms,
+            )
+        results.append(
+            BenchmarkResult(name=f"sqlite_writes[{profile}]", params=params, metrics=metrics)
+        )
+    return results
+
+
+BENCHMARKS: dict[str, Callable[[BenchmarkConfig], Awaitable[list[BenchmarkResult]]]] = {
+    "cli_stream": bench_cli_stream,
+    "sse_fanout": bench_sse_fanout,
+    "review_e2e": bench_review_e2e,
+    "sqlite_writes": bench_sqlite_writes,
+}
+
+
+async def run_benchmarks(
+    config: BenchmarkConfig, names: list[str] | None = None
+) -> list[BenchmarkResult]:
+    """Run the selected suites (all by default) in order."""
+    results: list[BenchmarkResult] = []
+    for name in names or list(BENCHMARKS):
+        logger.info(f"[BENCH] Running {name}")
+        results.extend(await BENCHMARKS[name](config))
+    return results
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+
+def _git_sha() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def results_document(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """Machine-readable results with environment metadata."""
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_sha": _git_sha(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "benchmarks": [dataclasses.asdict(r) for r in results],
+    }
+
+
+def compare_results(
+    current: dict[str, Any], baseline: dict[str, Any], max_regression: float = 0.2
+) -> list[str]:
+    """List metrics that got worse than the baseline by more than ``max_regression``.
+
+    Differences below NOISE_FLOOR are ignored so tiny timings don't flap.
+    """
+    previous = {b["name"]: b["metrics"] for b in baseline.get("benchmarks", [])}
+    regressions: list[str] = []
+    for bench in current.get("benchmarks", []):
+        old = previous.get(bench["name"])
+        if not old:
+            continue
+        for key in LOWER_IS_BETTER:
+            before, after = old.get(key), bench["metrics"].get(key)
+            if not isinstance(before, (int, float)) or not isinstance(after, (int, float)):
+                continue
+            if after - before < NOISE_FLOOR.get(key, 0.0):
+                continue
+            if before > 0 and after > before * (1 + max_regression):
+                regressions.append(
+                    f"{bench['name']}.{key}: {before:g} -> {after:g} "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
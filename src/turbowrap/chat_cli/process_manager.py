@@ -22,6 +22,13 @@ Usage:
         print(chunk, end="")
 
     await manager.terminate("abc123")
+
+Admission:
+    Slots cap the live CLI processes, not the sessions. A spawn or message
+    that needs a process when all slots are taken first evicts the least
+    recently used idle process (revived with --resume on its next message),
+    otherwise waits in a bounded FIFO queue until a slot frees up or the
+    admission timeout expires.
 """
 
 import asyncio
@@ -30,13 +37,19 @@ import json
 import logging
 import os
 import tempfile
+import time
 import uuid
+from collections import deque
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from turbowrap_llm.hooks import estimate_tokens
+
+from ..config import get_settings
+from ..llm.governor import Priority, get_llm_governor
 from ..utils.async_utils import asyncio_timeout
 from ..utils.env_utils import build_env_with_api_keys
 from ..utils.file_utils import validate_working_dir
@@ -84,6 +97,8 @@ class CLIProcess:
     gemini_context: str | None = None  # Context to prepend to first message
     context_used: bool = False  # Whether context has been prepended
     message_history_callback: Callable[[], str] | None = None  # Callback to load history from DB
+    conversation_started: bool = False  # Claude session has a message to --resume from
+    last_used: float = 0.0  # Manager clock at last spawn/message (LRU eviction)
 
     @property
     def pid(self) -> int | None:
@@ -112,16 +127,34 @@ class CLIProcessManager:
     with streaming output and lifecycle management.
     """
 
-    def __init__(self, max_processes: int = 10):
+    def __init__(
+        self,
+        max_processes: int = 10,
+        max_queue: int = 50,
+        admission_timeout: float | None = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """Initialize manager.
 
         Args:
-            max_processes: Maximum concurrent processes allowed
+            max_processes: Maximum concurrent live processes
+            max_queue: Maximum spawns/messages waiting for a process slot
+            admission_timeout: Seconds to wait for a slot (None = forever)
+            clock: Monotonic clock used for idle times (stubbed in tests)
         """
         self._processes: dict[str, CLIProcess] = {}
         self._lock = asyncio.Lock()
         self._max_processes = max_processes
+        self._max_queue = max_queue
+        self._admission_timeout = admission_timeout
+        self._clock = clock
         self._shared_resume_ids: dict[str, str] = {}
+        # Admission state. Only touched between awaits, so no lock is needed.
+        self._slots: set[str] = set()  # Sessions holding a live process
+        # Spawns/messages in flight per session (busy sessions are never evicted)
+        self._busy: dict[str, int] = {}
+        self._waiters: deque[tuple[str, asyncio.Future[None]]] = deque()
+        self._reapers: set[asyncio.Task[None]] = set()
 
     def set_shared_resume_id(self, session_id: str, claude_session_id: str) -> None:
         """Store a shared claude_session_id for a forked session.
@@ -147,6 +180,121 @@ class CLIProcessManager:
         """
         return self._shared_resume_ids.pop(session_id, None)
 
+    # -- Admission ----------------------------------------------------------------
+
+    async def _acquire_slot(self, session_id: str, timeout: float | None = None) -> None:
+        """Take a process slot for a session, waiting in FIFO order if needed.
+
+        Raises:
+            RuntimeError: If the queue is full or no slot frees up in time
+        """
+        if not self._waiters and self._make_room():
+            self._slots.add(session_id)
+            return
+
+        if len(self._waiters) >= self._max_queue:
+            raise RuntimeError(
+                f"Max processes ({self._max_processes}) reached and "
+                f"{len(self._waiters)} requests already waiting"
+            )
+
+        timeout = self._admission_timeout if timeout is None else timeout
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (session_id, waiter)
+        self._waiters.append(entry)
+        queued_at = self._clock()
+        logger.info(
+            f"[CLI] Session {session_id} queued for a process slot "
+            f"(position {len(self._waiters)}, max_processes={self._max_processes})"
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # Granted while we were giving up: hand the slot on
+                self._release_slot(session_id)
+            else:
+                waiter.cancel()
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+            if isinstance(e, asyncio.TimeoutError):
+                raise RuntimeError(
+                    f"No CLI process slot freed up within {timeout}s "
+                    f"(max processes {self._max_processes})"
+                ) from e
+            raise
+        logger.info(
+            f"[CLI] Session {session_id} admitted after {self._clock() - queued_at:.1f}s in queue"
+        )
+
+    def _release_slot(self, session_id: str) -> None:
+        """Give back a session's slot (no-op if it holds none)."""
+        if session_id in self._slots:
+            self._slots.discard(session_id)
+            self._grant_waiters()
+
+    def _grant_waiters(self) -> None:
+        """Admit queued sessions, oldest first, while slots can be made."""
+        while self._waiters:
+            session_id, waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if not self._make_room():
+                return
+            self._waiters.popleft()
+            self._slots.add(session_id)
+            waiter.set_result(None)
+
+    def _mark_busy(self, session_id: str) -> None:
+        self._busy[session_id] = self._busy.get(session_id, 0) + 1
+
+    def _mark_done(self, session_id: str) -> None:
+        remaining = self._busy.get(session_id, 0) - 1
+        if remaining > 0:
+            self._busy[session_id] = remaining
+        else:
+            self._busy.pop(session_id, None)
+
+    def _make_room(self) -> bool:
+        """Ensure a free slot, evicting the least recently used idle process."""
+        if len(self._slots) < self._max_processes:
+            return True
+        idle = [
+            proc
+            for session_id in self._slots - self._busy.keys()
+            if (proc := self._processes.get(session_id)) is not None
+        ]
+        if not idle:
+            return False
+        self._evict(min(idle, key=lambda proc: proc.last_used))
+        return True
+
+    def _evict(self, proc: CLIProcess) -> None:
+        """Stop an idle session's process; its next message respawns it."""
+        self._slots.discard(proc.session_id)
+        process, proc.process = proc.process, None
+        proc.status = SessionStatus.IDLE
+        if process is None or process.returncode is not None:
+            return
+        logger.info(
+            f"[{proc.cli_type.value.upper()}] Evicting idle process PID={process.pid} "
+            f"(session={proc.session_id}, idle {self._clock() - proc.last_used:.0f}s)"
+        )
+        task = asyncio.create_task(self._reap(process))
+        self._reapers.add(task)
+        task.add_done_callback(self._reapers.discard)
+
+    async def _reap(self, process: asyncio.subprocess.Process) -> None:
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            logger.warning(f"[CLI] Force killing evicted PID={process.pid}")
+            process.kill()
+
     async def spawn_claude(
         self,
         session_id: str,
@@ -173,7 +321,8 @@ class CLIProcessManager:
             CLIProcess instance
 
         Raises:
-            RuntimeError: If max processes reached or session already exists
+            RuntimeError: If the session already exists, or no process slot
+                frees up (queue full or admission timeout)
             SecurityError: If working directory is outside allowed paths
         """
         validated_working_dir = validate_working_dir(working_dir)
@@ -182,9 +331,6 @@ class CLIProcessManager:
             if session_id in self._processes:
                 raise RuntimeError(f"Session {session_id} already exists")
 
-            if len(self._processes) >= self._max_processes:
-                raise RuntimeError(f"Max processes ({self._max_processes}) reached")
-
         # Build environment with API keys from config
         env = build_env_with_api_keys()
         env["TMPDIR"] = "/tmp"  # Workaround for Bun file watcher bug
@@ -268,14 +414,25 @@ class CLIProcessManager:
             logger.debug("MCP config loaded")
 
         # Create subprocess (not started yet - will start on first message)
-        process = await asyncio.create_subprocess_exec(
-            *args,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(validated_working_dir),
-            env=env,
-        )
+        self._mark_busy(session_id)
+        try:
+            await self._acquire_slot(session_id)
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(validated_working_dir),
+                env=env,
+            )
+        except BaseException:
+            self._mark_done(session_id)
+            self._release_slot(session_id)
+            if temp_prompt_file:
+                temp_prompt_file.unlink(missing_ok=True)
+            if shared_resume_id:
+                self._shared_resume_ids[session_id] = shared_resume_id
+            raise
 
         if process.stdout:
             process.stdout._limit = 1024 * 1024  # type: ignore[attr-defined]
@@ -293,10 +450,14 @@ class CLIProcessManager:
             thinking_budget=thinking_budget,
             mcp_config=mcp_config,
             message_history_callback=message_history_callback,
+            conversation_started=use_resume,
+            last_used=self._clock(),
         )
 
         async with self._lock:
             self._processes[session_id] = cli_proc
+        self._mark_done(session_id)
+        self._grant_waiters()
 
         logger.info(f"Claude process spawned for session {session_id}")
         return cli_proc
@@ -335,9 +496,6 @@ class CLIProcessManager:
             if session_id in self._processes:
                 raise RuntimeError(f"Session {session_id} already exists")
 
-            if len(self._processes) >= self._max_processes:
-                raise RuntimeError(f"Max processes ({self._max_processes}) reached")
-
         # Create a placeholder process (Gemini starts fresh per message)
         # Note: Environment with API keys is built in _send_gemini_message
         cli_proc = CLIProcess(
@@ -348,6 +506,7 @@ class CLIProcessManager:
             model=model,
             agent_name=None,  # Gemini doesn't support custom agents
             status=SessionStatus.IDLE,
+            last_used=self._clock(),
         )
 
         if context:
@@ -368,9 +527,11 @@ class CLIProcessManager:
     ) -> None:
         """Respawn Claude process with --resume to continue conversation.
 
-        When a Claude process ends (after processing a message), this method
-        spawns a new process that resumes the same conversation using
-        Claude CLI's --resume flag.
+        When a Claude process ends (after processing a message) or was
+        evicted while idle, this method spawns a new process that resumes
+        the same conversation using Claude CLI's --resume flag. A session
+        evicted before its first message has nothing to resume: it is
+        started again with its session ID and system prompt.
 
         Args:
             proc: The CLIProcess to respawn
@@ -429,6 +590,10 @@ Continue naturally from where we left off. The user's new message follows this c
                         args.extend(["--system-prompt-file", str(recovery_prompt_file)])
                 except Exception as e:
                     logger.error(f"[CLAUDE] Failed to load message history: {e}")
+        elif not proc.conversation_started:
+            args.extend(["--session-id", proc.claude_session_id])
+            if proc.temp_prompt_file and proc.temp_prompt_file.exists():
+                args.extend(["--system-prompt-file", str(proc.temp_prompt_file)])
         else:
             args.extend(["--resume", proc.claude_session_id])
 
@@ -484,19 +649,42 @@ Continue naturally from where we left off. The user's new message follows this c
             Response chunks as they arrive
 
         Raises:
-            RuntimeError: If session not found
+            RuntimeError: If session not found, or no process slot frees up
+                (queue full or admission timeout)
         """
         async with self._lock:
             if session_id not in self._processes:
                 raise RuntimeError(f"Session {session_id} not found")
             proc = self._processes[session_id]
 
-        if proc.cli_type == CLIType.CLAUDE:
-            async for chunk in self._send_claude_message(proc, message, timeout):
-                yield chunk
-        else:
-            async for chunk in self._send_gemini_message(proc, message, timeout):
-                yield chunk
+        self._mark_busy(session_id)
+        try:
+            if session_id not in self._slots:
+                await self._acquire_slot(session_id)
+
+            # Chat is interactive: it goes ahead of queued reviews and fixes
+            async with get_llm_governor().slot(
+                proc.cli_type.value,
+                proc.model,
+                input_tokens=estimate_tokens(message),
+                priority=Priority.INTERACTIVE,
+                repository=str(proc.working_dir),
+            ):
+                if proc.cli_type == CLIType.CLAUDE:
+                    async for chunk in self._send_claude_message(proc, message, timeout):
+                        yield chunk
+                else:
+                    async for chunk in self._send_gemini_message(proc, message, timeout):
+                        yield chunk
+        finally:
+            self._mark_done(session_id)
+            proc.last_used = self._clock()
+            # Claude exits after each message and Gemini runs one process per
+            # message: the slot is only kept while a process is still alive.
+            if proc.is_running:
+                self._grant_waiters()
+            else:
+                self._release_slot(session_id)
 
     async def _send_claude_message(
         self,
@@ -551,6 +739,7 @@ Continue naturally from where we left off. The user's new message follows this c
             await process.stdin.drain()
             process.stdin.close()
             await process.stdin.wait_closed()
+            proc.conversation_started = True
             logger.debug("[CLAUDE] Stdin closed (EOF sent)")
         except (ConnectionResetError, RuntimeError) as e:
             # Handle closed transport errors - respawn and retry
@@ -564,6 +753,7 @@ Continue naturally from where we left off. The user's new message follows this c
                 await process.stdin.drain()
                 process.stdin.close()
                 await process.stdin.wait_closed()
+                proc.conversation_started = True
                 logger.debug("[CLAUDE] Stdin closed (EOF sent) after respawn")
             else:
                 raise
@@ -741,6 +931,7 @@ Continue naturally from where we left off. The user's new message follows this c
                 return False
 
             proc = self._processes.pop(session_id)
+        self._release_slot(session_id)
 
         if proc.process and proc.process.returncode is None:
             logger.info(f"[{proc.cli_type.value.upper()}] Terminating PID={proc.pid}")
@@ -766,6 +957,9 @@ Continue naturally from where we left off. The user's new message follows this c
         for sid in session_ids:
             if await self.terminate(sid):
                 count += 1
+        # Wait for evicted processes still shutting down
+        if self._reapers:
+            await asyncio.gather(*self._reapers, return_exceptions=True)
         return count
 
     def get_active_sessions(self) -> list[str]:
@@ -817,6 +1011,31 @@ Continue naturally from where we left off. The user's new message follows this c
 
         return count
 
+    def evict_idle_processes(self, max_idle_seconds: float) -> int:
+        """Stop processes that have not been used for a while.
+
+        Sessions stay registered: their next message respawns the process.
+
+        Args:
+            max_idle_seconds: Idle time after which a process is stopped
+
+        Returns:
+            Number of processes stopped
+        """
+        now = self._clock()
+        idle = [
+            proc
+            for session_id in self._slots - self._busy.keys()
+            if (proc := self._processes.get(session_id)) is not None
+            and now - proc.last_used >= max_idle_seconds
+        ]
+        for proc in idle:
+            self._evict(proc)
+        if idle:
+            logger.info(f"[CLEANUP] Stopped {len(idle)} idle processes")
+            self._grant_waiters()
+        return len(idle)
+
     def get_process_stats(self) -> dict[str, Any]:
         """Get statistics about running processes.
 
@@ -842,6 +1061,9 @@ Continue naturally from where we left off. The user's new message follows this c
         stats: dict[str, Any] = {
             "total_processes": len(self._processes),
             "max_processes": self._max_processes,
+            "live_processes": len(self._slots),
+            "queued": len(self._waiters),
+            "max_queue": self._max_queue,
             "processes": processes_list,
         }
 
@@ -855,5 +1077,10 @@ def get_process_manager() -> CLIProcessManager:
     """Get singleton CLIProcessManager instance."""
     global _manager
     if _manager is None:
-        _manager = CLIProcessManager()
+        settings = get_settings().chat_cli
+        _manager = CLIProcessManager(
+            max_processes=settings.max_processes,
+            max_queue=settings.max_queue,
+            admission_timeout=settings.admission_timeout_seconds or None,
+        )
     return _manager
@@ -23,6 +23,21 @@ class DatabaseSettings(BaseSettings):
     pool_recycle: int = Field(default=3600, ge=60, description="Pool recycle time in seconds")
     pool_timeout: int = Field(default=30, ge=5, le=120, description="Pool checkout timeout")
 
+    # SQLite concurrency profile (applied to every pooled connection)
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = Field(
+        default="WAL", description="SQLite journal mode (WAL lets readers run during writes)"
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL", description="SQLite fsync level (NORMAL is durable enough with WAL)"
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=15000, ge=0, le=300000, description="Wait this long for a lock before failing"
+    )
+    sqlite_serialize_writes: bool = Field(
+        default=True,
+        description="Serialize write transactions of this process (see db.session.write_session)",
+    )
+
     @field_validator("url")
     @classmethod
     def validate_url(cls, v: str) -> str:
@@ -124,6 +139,16 @@ class AuthSettings(BaseSettings):
         description="Email patterns that are auto-promoted to admin on first login. "
         "Matches if pattern is contained in email (case-insensitive).",
     )
+    principal_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        le=3600,
+        description="Max seconds to cache verified token claims, role and repo access "
+        "(never beyond token expiry, 0 to disable)",
+    )
+    principal_cache_max_entries: int = Field(
+        default=1000, ge=10, le=100000, description="Max cached principals (LRU)"
+    )
 
 
 class LogsSettings(BaseSettings):
@@ -211,6 +236,9 @@ class ThinkingSettings(BaseSettings):
         description="S3 bucket for storing thinking logs and review checkpoints (10-day retention)",
     )
     s3_region: str = Field(default="eu-west-3", description="AWS region for S3 bucket")
+    retention_days: int = Field(
+        default=10, ge=1, le=365, description="Days of logs the bucket keeps (bounds lookups)"
+    )
     stream_to_websocket: bool = Field(
         default=True, description="Stream thinking to WebSocket clients"
     )
@@ -259,6 +287,309 @@ class SelfReportSettings(BaseSettings):
     )
 
 
+class ScreenshotSettings(BaseSettings):
+    """Headless browser pool configuration for Live View screenshots."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_SCREENSHOT_")
+
+    pool_size: int = Field(default=2, ge=1, le=8, description="Warm Chromium instances")
+    warm_on_startup: bool = Field(
+        default=True, description="Launch the pool's browsers when the server starts"
+    )
+    max_concurrent_captures: int = Field(
+        default=4, ge=1, le=32, description="Max captures running at once (others queue)"
+    )
+    max_queued_captures: int = Field(
+        default=50, ge=1, le=1000, description="Max captures waiting for a slot"
+    )
+    max_pages_per_browser: int = Field(
+        default=50,
+        ge=1,
+        le=10000,
+        description="Recycle a browser after serving this many captures",
+    )
+    navigation_timeout_ms: int = Field(
+        default=30000, ge=1000, le=120000, description="Page navigation timeout"
+    )
+
+
+class ArtifactCacheSettings(BaseSettings):
+    """Local disk cache for artifacts read back from S3 (mockups, logs, prompts)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_ARTIFACT_CACHE_")
+
+    enabled: bool = Field(default=True, description="Enable the read-through artifact cache")
+    dir: Path = Field(
+        default=Path.home() / ".turbowrap" / "cache" / "artifacts",
+        description="Directory for cached artifact bodies",
+    )
+    max_mb: int = Field(default=512, ge=1, le=102400, description="Max cache size on disk (LRU)")
+    revalidate_seconds: int = Field(
+        default=60,
+        ge=0,
+        le=86400,
+        description="Serve a cached artifact without an ETag check for this long",
+    )
+
+
+class ArtifactUploadSettings(BaseSettings):
+    """Background upload pipeline for S3 artifacts (prompts, outputs, thinking)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_ARTIFACT_UPLOAD_")
+
+    background: bool = Field(
+        default=True, description="Upload in background workers instead of inline"
+    )
+    workers: int = Field(default=2, ge=1, le=16, description="Upload worker threads")
+    max_queue: int = Field(
+        default=500, ge=1, le=100000, description="Max queued uploads (overflow spills to disk)"
+    )
+    compression: Literal["none", "gzip", "zstd"] = Field(
+        default="gzip",
+        description="Content-Encoding for text artifacts (zstd requires the zstandard package)",
+    )
+    min_compress_bytes: int = Field(
+        default=1024, ge=0, description="Don't compress bodies smaller than this"
+    )
+    multipart_threshold_mb: int = Field(
+        default=8, ge=5, le=5120, description="Use multipart upload above this size"
+    )
+    max_retries: int = Field(default=3, ge=0, le=10, description="Retries before spilling")
+    spill_dir: Path = Field(
+        default=Path.home() / ".turbowrap" / "spill" / "s3",
+        description="Where failed uploads wait for S3 to come back",
+    )
+
+
+class LiveStatusSettings(BaseSettings):
+    """Background sampler behind the /status/live endpoint."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_LIVE_STATUS_")
+
+    interval_seconds: float = Field(
+        default=2.0, ge=0.5, le=60.0, description="Seconds between process/system scans"
+    )
+    history_size: int = Field(
+        default=150, ge=1, le=10000, description="Snapshots kept for sparklines (ring buffer)"
+    )
+    idle_after_seconds: float = Field(
+        default=60.0,
+        ge=0.0,
+        description="Pause sampling when nobody polled for this long (0 = always sample)",
+    )
+
+
+class LintSettings(BaseSettings):
+    """Native lint engine behind /analysis/lint (utils/lint_engine.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_LINT_")
+
+    cache_dir: Path = Field(
+        default=Path.home() / ".turbowrap" / "cache" / "lint",
+        description="Per-repository lint result cache (keyed by file content hash)",
+    )
+    max_parallel: int = Field(default=4, ge=1, le=32, description="Linter processes at once")
+    batch_size: int = Field(
+        default=200, ge=1, le=5000, description="Files passed to one per-file linter process"
+    )
+    timeout_seconds: int = Field(default=300, ge=10, le=3600, description="Per-process timeout")
+
+
+class FileWatcherSettings(BaseSettings):
+    """Repository file watching hub (api/services/file_watcher.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_FILE_WATCHER_")
+
+    quiet_seconds: float = Field(
+        default=0.3, ge=0.05, le=10.0, description="Close a change batch after this much quiet"
+    )
+    max_batch_seconds: float = Field(
+        default=2.0, ge=0.1, le=60.0, description="Close a change batch after this long regardless"
+    )
+    max_repos: int = Field(default=8, ge=1, le=128, description="Repositories watched at once")
+    max_event_paths: int = Field(
+        default=200, ge=1, le=10000, description="Paths listed per batch in SSE events"
+    )
+
+
+class FileIndexSettings(BaseSettings):
+    """In-memory directory index behind the file APIs (api/services/file_index.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_FILE_INDEX_")
+
+    max_repos: int = Field(default=16, ge=1, le=256, description="Repositories indexed at once")
+    unwatched_ttl_seconds: float = Field(
+        default=30.0, ge=0, description="Rescan indexes of repositories the watcher isn't watching"
+    )
+    max_incremental_changes: int = Field(
+        default=2000, ge=1, description="Larger change batches drop the index instead of patching"
+    )
+
+
+class ChatCLISettings(BaseSettings):
+    """Claude/Gemini CLI chat processes (chat_cli/process_manager.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_CHAT_CLI_")
+
+    max_processes: int = Field(default=10, ge=1, le=256, description="Live CLI processes at once")
+    max_queue: int = Field(
+        default=50, ge=0, description="Spawns and messages allowed to wait for a process slot"
+    )
+    admission_timeout_seconds: float = Field(
+        default=120.0,
+        ge=0.0,
+        description="Give up waiting for a process slot after this long (0 = never)",
+    )
+    idle_eviction_seconds: float = Field(
+        default=900.0,
+        ge=0.0,
+        description="Stop processes idle this long (0 = only when a slot is needed)",
+    )
+
+
+class EndpointDetectionSettings(BaseSettings):
+    """Static endpoint detection (api/services/endpoint_extractor.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_ENDPOINTS_")
+
+    cache_dir: Path = Field(
+        default=Path.home() / ".turbowrap" / "cache" / "endpoints",
+        description="Per-repository extraction cache (keyed by file content hash)",
+    )
+    workers: int = Field(default=4, ge=1, le=32, description="Parser processes for large batches")
+    pool_min_files: int = Field(
+        default=1000, ge=1, description="Parse changed files inline below this count"
+    )
+    enrich_max_endpoints: int = Field(
+        default=60, ge=0, le=1000, description="Max new endpoints described by the LLM per run"
+    )
+
+
+class ReviewShardingSettings(BaseSettings):
+    """Split large parallel reviews into token-balanced shards per provider."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_REVIEW_SHARDING_")
+
+    enabled: bool = Field(default=True, description="Shard reviews that exceed the token budget")
+    max_shard_tokens: int = Field(
+        default=150000, ge=1000, description="Target max source tokens per shard"
+    )
+    max_shards: int = Field(default=8, ge=1, le=64, description="Max shards per review")
+    workers_per_provider: int = Field(
+        default=2, ge=1, le=16, description="Concurrent CLI processes per provider"
+    )
+    max_concurrent_clis: int = Field(
+        default=6, ge=1, le=64, description="Concurrent CLI processes across all providers"
+    )
+
+
+class ReviewHedgingSettings(BaseSettings):
+    """Completion policy for the three-LLM review fan-out."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_REVIEW_HEDGING_")
+
+    enabled: bool = Field(default=True, description="Stop waiting for stragglers after quorum")
+    quorum: int = Field(
+        default=2, ge=1, le=3, description="Providers that must succeed before the cutoff starts"
+    )
+    grace_factor: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Straggler grace period as a fraction of the fastest provider's duration",
+    )
+    min_grace_seconds: float = Field(
+        default=120.0, ge=0.0, description="Minimum straggler grace period"
+    )
+    stall_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Start a hedged restart after this long without stream output (0 = off)",
+    )
+    max_hedges: int = Field(default=1, ge=0, le=3, description="Hedged restarts per provider")
+    merge_late_results: bool = Field(
+        default=True, description="Merge stragglers into the stored report when they finish"
+    )
+
+
+class ReviewContextSettings(BaseSettings):
+    """File contents loaded for reviewers (review/utils/file_view.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_REVIEW_CONTEXT_")
+
+    max_file_bytes: int = Field(
+        default=50000, ge=1, description="Files larger than this are left to the CLI tools"
+    )
+    max_cached_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description="Hard ceiling on file contents held in memory per review",
+    )
+    structure_max_tokens: int = Field(
+        default=8000,
+        ge=0,
+        description="Structure docs budget in diff reviews, touched directories first (0: whole)",
+    )
+
+
+class LLMGovernorSettings(BaseSettings):
+    """Global rate limits and concurrency for LLM calls (llm/governor.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_LLM_GOVERNOR_")
+
+    enabled: bool = Field(default=True, description="Queue LLM calls through the governor")
+    # Keyed by provider or "provider:model" (both apply to a call); 0 = unlimited.
+    # From env as JSON: TURBOWRAP_LLM_GOVERNOR_LIMITS='{"claude": {"max_concurrent": 4}}'
+    limits: dict[str, dict[str, float]] = Field(
+        default_factory=lambda: {
+            "claude": {
+                "requests_per_minute": 50.0,
+                "input_tokens_per_minute": 400_000.0,
+                "max_concurrent": 8.0,
+            },
+            "gemini": {
+                "requests_per_minute": 60.0,
+                "input_tokens_per_minute": 1_000_000.0,
+                "max_concurrent": 8.0,
+            },
+            "grok": {
+                "requests_per_minute": 60.0,
+                "input_tokens_per_minute": 1_000_000.0,
+                "max_concurrent": 6.0,
+            },
+        },
+        description="Per-provider/model limits: requests_per_minute, "
+        "input_tokens_per_minute, max_concurrent",
+    )
+    interactive_reserve: int = Field(
+        default=1, ge=0, description="Concurrency slots per provider kept for interactive calls"
+    )
+    rate_limit_backoff_seconds: float = Field(
+        default=30.0, ge=0.0, description="Pause a provider after it answers with a rate limit"
+    )
+    max_wait_seconds: float = Field(
+        default=3600.0, ge=0.0, description="Give up waiting for a slot after this long (0 = never)"
+    )
+
+
+class UsageLedgerSettings(BaseSettings):
+    """Per-call LLM token/cost ledger (api/services/usage_ledger.py)."""
+
+    model_config = SettingsConfigDict(env_prefix="TURBOWRAP_USAGE_LEDGER_")
+
+    enabled: bool = Field(default=True, description="Record LLM usage in the llm_usage tables")
+    batch_size: int = Field(
+        default=50, ge=1, le=10000, description="Flush as soon as this many rows are buffered"
+    )
+    flush_interval_seconds: float = Field(
+        default=5.0, ge=0.1, le=300.0, description="Flush buffered rows at least this often"
+    )
+    max_buffered: int = Field(
+        default=10000,
+        ge=1,
+        description="Rows kept while the DB is unavailable (oldest are dropped beyond this)",
+    )
+
+
 class Settings(BaseSettings):
     """Main TurboWrap settings."""
 
@@ -278,6 +609,20 @@ class Settings(BaseSettings):
     logs: LogsSettings = Field(default_factory=LogsSettings)
     self_report: SelfReportSettings = Field(default_factory=SelfReportSettings)
     fix_planner: FixPlannerSettings = Field(default_factory=FixPlannerSettings)
+    screenshot: ScreenshotSettings = Field(default_factory=ScreenshotSettings)
+    artifact_cache: ArtifactCacheSettings = Field(default_factory=ArtifactCacheSettings)
+    artifact_upload: ArtifactUploadSettings = Field(default_factory=ArtifactUploadSettings)
+    live_status: LiveStatusSettings = Field(default_factory=LiveStatusSettings)
+    lint: LintSettings = Field(default_factory=LintSettings)
+    endpoints: EndpointDetectionSettings = Field(default_factory=EndpointDetectionSettings)
+    file_watcher: FileWatcherSettings = Field(default_factory=FileWatcherSettings)
+    file_index: FileIndexSettings = Field(default_factory=FileIndexSettings)
+    review_sharding: ReviewShardingSettings = Field(default_factory=ReviewShardingSettings)
+    review_hedging: ReviewHedgingSettings = Field(default_factory=ReviewHedgingSettings)
+    review_context: ReviewContextSettings = Field(default_factory=ReviewContextSettings)
+    llm_governor: LLMGovernorSettings = Field(default_factory=LLMGovernorSettings)
+    usage_ledger: UsageLedgerSettings = Field(default_factory=UsageLedgerSettings)
+    chat_cli: ChatCLISettings = Field(default_factory=ChatCLISettings)
 
     # Paths
     repos_dir: Path = Field(
@@ -5,11 +5,13 @@ Import models directly from turbowrap.db.models instead.
 """
 
 from .base import Base
-from .session import SessionLocal, get_db, get_engine
+from .session import SessionLocal, get_db, get_engine, serialized_write, write_session
 
 __all__ = [
     "Base",
     "get_db",
     "get_engine",
     "SessionLocal",
+    "serialized_write",
+    "write_session",
 ]
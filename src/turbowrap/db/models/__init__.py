@@ -13,6 +13,7 @@ This package organizes all SQLAlchemy ORM models by domain:
 - endpoint.py: API endpoint detection
 - database_connection.py: External database connections
 - operation.py: Operation tracking
+- llm_usage.py: LLM usage ledger and hourly rollups
 - mockup.py: UI mockup models
 """
 
@@ -72,6 +73,9 @@ from .linear import LinearIssue, LinearIssueRepositoryLink
 # Live View models
 from .live_view import LiveViewScreenshot
 
+# LLM usage ledger
+from .llm_usage import LLMUsage, LLMUsageHourly
+
 # Mockup models
 from .mockup import Mockup, MockupProject, MockupStatus
 
@@ -153,6 +157,9 @@ __all__ = [
     "RepositoryDatabaseConnection",
     # Operation
     "Operation",
+    # LLM usage ledger
+    "LLMUsage",
+    "LLMUsageHourly",
     # Live View
     "LiveViewScreenshot",
     # Mockup
@@ -43,6 +43,8 @@ class Issue(Base, SoftDeleteMixin):
     severity = Column(String(20), nullable=False)  # CRITICAL, HIGH, MEDIUM, LOW
     category = Column(String(50), nullable=False)  # security, performance, architecture, etc.
     rule = Column(String(100), nullable=True)  # Linting rule code if applicable
+    # Cross-review identity (see review/utils/fingerprint.py); re-reviews update the same row
+    fingerprint = Column(String(40), nullable=True)
 
     # Location
     file = Column(String(500), nullable=False)
@@ -112,6 +114,7 @@ class Issue(Base, SoftDeleteMixin):
         Index("idx_issues_file", "file"),
         Index("idx_issues_linear_id", "linear_id"),
         Index("idx_issues_linear_identifier", "linear_identifier"),
+        Index("idx_issues_repo_fingerprint", "repository_id", "fingerprint"),
         {"extend_existing": True},
     )
 
@@ -133,7 +136,7 @@ class ReviewCheckpoint(Base):
     reviewer_name = Column(String(100), nullable=False)  # e.g., 'reviewer_be_architecture'
 
     # Status
-    status = Column(String(20), nullable=False, default="completed")  # completed, failed
+    status = Column(String(20), nullable=False, default="completed")  # completed, partial, failed
 
     # Checkpoint data
     issues_data = Column(JSON, nullable=False)  # Serialized Issue list
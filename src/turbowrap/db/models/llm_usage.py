@@ -0,0 +1,114 @@
+"""LLM usage ledger models."""
+
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import Boolean, Column, Float, Index, Integer, String, UniqueConstraint
+
+from turbowrap.db.base import Base
+from turbowrap.utils.datetime_utils import format_iso, now_utc
+
+from .base import TZDateTime, generate_uuid
+
+
+class LLMUsage(Base):
+    """One row per LLM call: tokens and cost, normalised across providers.
+
+    A call that used several models (e.g. Claude with Haiku sub-agents)
+    produces one row per model. Written in batches by UsageLedger
+    (api/services/usage_ledger.py).
+    """
+
+    __tablename__ = "llm_usage"
+
+    id = Column(String(36), primary_key=True, default=generate_uuid)
+
+    # Call identity (operation_id is the tracker operation, not a foreign key:
+    # operations may be cleaned up while spend history is kept)
+    operation_id = Column(String(100), nullable=True, index=True)
+    operation_type = Column(String(50), nullable=False)
+    parent_session_id = Column(String(100), nullable=True, index=True)
+    repository_id = Column(String(36), nullable=True)
+
+    provider = Column(String(20), nullable=False)  # claude, gemini, grok
+    model = Column(String(100), nullable=False)
+
+    input_tokens = Column(Integer, nullable=False, default=0)
+    output_tokens = Column(Integer, nullable=False, default=0)
+    cache_read_tokens = Column(Integer, nullable=False, default=0)
+    cache_creation_tokens = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+
+    duration_ms = Column(Integer, nullable=True)
+    success = Column(Boolean, nullable=False, default=True)
+
+    created_at = Column(TZDateTime(), nullable=False, default=now_utc)
+
+    __table_args__ = (
+        Index("idx_llm_usage_repo_created", "repository_id", "created_at"),
+        Index("idx_llm_usage_created", "created_at"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self) -> str:
+        return f"<LLMUsage {self.provider}:{self.model} ${self.cost_usd:.4f}>"
+
+
+class LLMUsageHourly(Base):
+    """Pre-aggregated LLM usage per hour, repository, provider, model and operation type.
+
+    Cost dashboards and budget checks read these rollups instead of scanning
+    llm_usage or Operation.details JSON.
+    """
+
+    __tablename__ = "llm_usage_hourly"
+
+    id = Column(String(36), primary_key=True, default=generate_uuid)
+
+    bucket_start = Column(TZDateTime(), nullable=False)  # Truncated to the hour (UTC)
+    # "" instead of NULL so the unique constraint also covers calls without a repo
+    repository_id = Column(String(36), nullable=False, default="")
+    provider = Column(String(20), nullable=False)
+    model = Column(String(100), nullable=False)
+    operation_type = Column(String(50), nullable=False)
+
+    calls = Column(Integer, nullable=False, default=0)
+    failed_calls = Column(Integer, nullable=False, default=0)
+    input_tokens = Column(Integer, nullable=False, default=0)
+    output_tokens = Column(Integer, nullable=False, default=0)
+    cache_read_tokens = Column(Integer, nullable=False, default=0)
+    cache_creation_tokens = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "bucket_start",
+            "repository_id",
+            "provider",
+            "model",
+            "operation_type",
+            name="uq_llm_usage_hourly_bucket",
+        ),
+        Index("idx_llm_usage_hourly_repo_bucket", "repository_id", "bucket_start"),
+        {"extend_existing": True},
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "bucket_start": format_iso(cast(datetime, self.bucket_start)),
+            "repository_id": self.repository_id or None,
+            "provider": self.provider,
+            "model": self.model,
+            "operation_type": self.operation_type,
+            "calls": self.calls,
+            "failed_calls": self.failed_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "cost_usd": self.cost_usd,
+        }
+
+    def __repr__(self) -> str:
+        return f"<LLMUsageHourly {self.bucket_start} {self.provider}:{self.model}>"
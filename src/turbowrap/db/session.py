@@ -1,19 +1,60 @@
-"""Database session management."""
-
-from collections.abc import Generator
+"""Database session management.
+
+SQLite is shared by the event loop and worker threads (operation tracker,
+review results, chat, test runs). Every pooled SQLite connection gets the
+concurrency profile from DatabaseSettings (journal mode, synchronous level,
+busy timeout), and write-heavy call sites use ``write_session()`` (or
+``serialized_write()`` around an existing session) so this process sends
+SQLite one writer at a time instead of letting writers fight over the lock.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from ..config import get_settings
+from ..config import DatabaseSettings, get_settings
 from .base import Base
 
+logger = logging.getLogger(__name__)
+
 # Module-level engine cache
 _engine: Engine | None = None
 _SessionLocal: sessionmaker[Session] | None = None
 
+# Process-wide SQLite writer lock (re-entrant: write helpers may nest)
+_write_lock = threading.RLock()
+
+# Waits for the writer lock longer than this are logged
+SLOW_WRITE_WAIT_SECONDS = 1.0
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, database: DatabaseSettings) -> None:
+    """Apply the SQLite concurrency profile to a new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        # Busy timeout first: switching to WAL needs a lock
+        cursor.execute(f"PRAGMA busy_timeout = {int(database.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA journal_mode = {database.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous = {database.sqlite_synchronous}")
+    finally:
+        cursor.close()
+
+
+def configure_sqlite_engine(engine: Engine, database: DatabaseSettings) -> None:
+    """Apply the SQLite concurrency profile to every connection of ``engine``."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        apply_sqlite_pragmas(dbapi_connection, database)
+
 
 def get_engine() -> Engine:
     """Get or create the database engine."""
@@ -32,9 +73,13 @@ def get_engine() -> Engine:
         if db_url.startswith("sqlite"):
             _engine = create_engine(
                 db_url,
-                connect_args={"check_same_thread": False},
+                connect_args={
+                    "check_same_thread": False,
+                    "timeout": settings.database.sqlite_busy_timeout_ms / 1000,
+                },
                 echo=settings.database.echo,
             )
+            configure_sqlite_engine(_engine, settings.database)
         else:
             # PostgreSQL
             _engine = create_engine(
@@ -75,6 +120,51 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def serialized_write(db: Session | None = None) -> Iterator[None]:
+    """Hold the process-wide writer lock around a write transaction.
+
+    Only SQLite with ``sqlite_serialize_writes`` enabled is serialized;
+    for PostgreSQL this is a no-op. Keep the block short: commit inside it
+    and don't await anything while holding it.
+
+    Args:
+        db: Session that will write (its bind decides the dialect);
+            the shared engine if None
+    """
+    bind = db.get_bind() if db is not None else get_engine()
+    if bind.dialect.name != "sqlite" or not get_settings().database.sqlite_serialize_writes:
+        yield
+        return
+
+    started = time.perf_counter()
+    with _write_lock:
+        waited = time.perf_counter() - started
+        if waited > SLOW_WRITE_WAIT_SECONDS:
+            logger.warning(f"[DB] Waited {waited:.1f}s for the SQLite writer lock")
+        yield
+
+
+@contextmanager
+def write_session() -> Iterator[Session]:
+    """Session for a short write transaction, committed on exit.
+
+    Usage:
+        with write_session() as db:
+            db.add(row)
+    """
+    db = get_session_local()()
+    try:
+        with serialized_write(db):
+            yield db
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def init_db() -> None:
     """Initialize database tables."""
     engine = get_engine()
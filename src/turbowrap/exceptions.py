@@ -61,6 +61,12 @@ class GrokError(AgentError):
     pass
 
 
+class LLMQueueTimeoutError(AgentError):
+    """Waited too long for an LLM call slot (rate limit or concurrency cap)."""
+
+    pass
+
+
 class DatabaseError(TurboWrapError):
     """Database operation error."""
 
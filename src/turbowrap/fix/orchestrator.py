@@ -53,6 +53,13 @@ from turbowrap.fix.models import (
     MasterTodoSummary,
 )
 from turbowrap.fix.todo_manager import TodoManager
+from turbowrap.llm.governor import llm_call_context
+from turbowrap.llm.prompt_layout import (
+    PromptLayout,
+    RenderedPrompt,
+    Stability,
+    get_prompt_cache_monitor,
+)
 from turbowrap.review.reviewers.utils.json_extraction import parse_llm_json
 from turbowrap.utils.context_utils import load_structure_documentation
 from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
@@ -207,18 +214,19 @@ class FixOrchestrator:
                 session_id, branch_name, issues, request
             )
 
-            # Run fix rounds
-            all_results, gemini_feedback = await self._run_fix_rounds(
-                cli,
-                challenger,
-                master_todo_path,
-                session_id,
-                parent_session_id,
-                branch_name,
-                issues,
-                request,
-                emit,
-            )
+            # Run fix rounds (standard LLM priority, fair across repositories)
+            with llm_call_context(repository=request.repository_id):
+                all_results, gemini_feedback = await self._run_fix_rounds(
+                    cli,
+                    challenger,
+                    master_todo_path,
+                    session_id,
+                    parent_session_id,
+                    branch_name,
+                    issues,
+                    request,
+                    emit,
+                )
 
             # Mark remaining pending issues as failed
             self._mark_remaining_failed(issues, all_results)
@@ -443,6 +451,7 @@ class FixOrchestrator:
         )
 
         # Build prompt
+        prompt: str
         if round_num == 1:
             prompt = self._build_fix_prompt(master_todo_path, branch_name, request.workspace_path)
         else:
@@ -465,6 +474,7 @@ class FixOrchestrator:
         )
 
         result = await session.send(prompt)
+        get_prompt_cache_monitor().observe("claude", prompt, result)
 
         if not result.success:
             logger.error(f"[FIX] Claude CLI failed: {result.error}")
@@ -855,36 +865,52 @@ class FixOrchestrator:
         master_todo_path: Path,
         branch_name: str,
         workspace_path: str | None = None,
-    ) -> str:
-        """Build prompt for first fix round."""
-        parts = [
-            f"""# Fix Issues
-
-## Master TODO
-Read the execution plan: `{master_todo_path}`
+    ) -> RenderedPrompt:
+        """Build prompt for first fix round.
 
-## Branch
-{branch_name}
-"""
-        ]
+        Stable parts (structure docs, monorepo scope) come before the
+        session-specific TODO path and branch so the prefix stays cacheable.
+        """
+        layout = PromptLayout()
+        layout.add("header", "# Fix Issues\n")
 
         # Structure documentation
         structure_doc = load_structure_documentation(self.repo_path, workspace_path)
         if structure_doc:
-            parts.append(f"""
+            layout.add(
+                "structure",
+                f"""
 ## Repository Structure
 {structure_doc}
-""")
+""",
+                Stability.REPOSITORY,
+            )
 
         # Monorepo restriction
         if workspace_path:
-            parts.append(f"""
+            layout.add(
+                "monorepo_scope",
+                f"""
 ## CRITICAL: Monorepo Scope
 ONLY modify files within: `{workspace_path}/`
 Changes outside this folder will be BLOCKED and REVERTED.
-""")
+""",
+                Stability.REPOSITORY,
+            )
+
+        layout.add(
+            "session",
+            f"""
+## Master TODO
+Read the execution plan: `{master_todo_path}`
+
+## Branch
+{branch_name}
+""",
+            Stability.VOLATILE,
+        )
 
-        return "\n".join(parts)
+        return layout.render(separator="\n")
 
     def _build_refix_prompt(
         self,
@@ -3,6 +3,7 @@
 from .base import AgentResponse, BaseAgent
 from .claude import ClaudeClient
 from .gemini import GeminiClient, GeminiProClient
+from .governor import LLMGovernor, Priority, get_llm_governor, llm_call_context
 from .grok import GrokCLI
 from .prompts import get_available_prompts, load_prompt, reload_prompts
 
@@ -13,6 +14,10 @@ __all__ = [
     "GeminiProClient",
     "ClaudeClient",
     "GrokCLI",
+    "LLMGovernor",
+    "Priority",
+    "get_llm_governor",
+    "llm_call_context",
     "load_prompt",
     "get_available_prompts",
     "reload_prompts",
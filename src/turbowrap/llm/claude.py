@@ -4,10 +4,12 @@ from collections.abc import AsyncIterator, Iterator
 from typing import Literal
 
 import httpx
+from turbowrap_llm.hooks import estimate_tokens
 
 from turbowrap.config import get_settings
 from turbowrap.exceptions import ClaudeError
 from turbowrap.llm.base import AgentResponse, BaseAgent
+from turbowrap.llm.governor import get_llm_governor
 
 # Default system prompt for code review
 DEFAULT_SYSTEM_PROMPT = (
@@ -94,12 +96,15 @@ class ClaudeClient(BaseAgent):
             ClaudeError: If API call fails or times out.
         """
         try:
-            message = self._client.messages.create(
-                model=self._model,
-                max_tokens=self._max_tokens,
-                system=system_prompt or DEFAULT_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            with get_llm_governor().slot_sync(
+                "claude", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                message = self._client.messages.create(
+                    model=self._model,
+                    max_tokens=self._max_tokens,
+                    system=system_prompt or DEFAULT_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                )
             first_block = message.content[0]
             if not hasattr(first_block, "text"):
                 raise ClaudeError("Unexpected response block type from Claude API")
@@ -128,12 +133,15 @@ class ClaudeClient(BaseAgent):
             ClaudeError: If API call fails or times out.
         """
         try:
-            message = self._client.messages.create(
-                model=self._model,
-                max_tokens=self._max_tokens,
-                system=system_prompt or DEFAULT_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            with get_llm_governor().slot_sync(
+                "claude", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                message = self._client.messages.create(
+                    model=self._model,
+                    max_tokens=self._max_tokens,
+                    system=system_prompt or DEFAULT_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                )
 
             first_block = message.content[0]
             if not hasattr(first_block, "text"):
@@ -169,13 +177,16 @@ class ClaudeClient(BaseAgent):
             ClaudeError: If API call fails or times out.
         """
         try:
-            with self._client.messages.stream(
-                model=self._model,
-                max_tokens=self._max_tokens,
-                system=system_prompt or DEFAULT_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            ) as stream:
-                yield from stream.text_stream
+            with get_llm_governor().slot_sync(
+                "claude", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                with self._client.messages.stream(
+                    model=self._model,
+                    max_tokens=self._max_tokens,
+                    system=system_prompt or DEFAULT_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                ) as stream:
+                    yield from stream.text_stream
         except httpx.TimeoutException as e:
             raise ClaudeError(f"Claude streaming timeout after {self._timeout}s.") from e
         except httpx.ConnectError as e:
@@ -197,14 +208,17 @@ class ClaudeClient(BaseAgent):
             ClaudeError: If API call fails or times out.
         """
         try:
-            async with self._async_client.messages.stream(
-                model=self._model,
-                max_tokens=self._max_tokens,
-                system=system_prompt or DEFAULT_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            ) as stream:
-                async for text in stream.text_stream:
-                    yield text
+            async with get_llm_governor().slot(
+                "claude", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                async with self._async_client.messages.stream(
+                    model=self._model,
+                    max_tokens=self._max_tokens,
+                    system=system_prompt or DEFAULT_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
         except httpx.TimeoutException as e:
             raise ClaudeError(f"Claude async streaming timeout after {self._timeout}s.") from e
         except httpx.ConnectError as e:
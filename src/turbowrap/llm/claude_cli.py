@@ -41,7 +41,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
+from turbowrap_llm.hooks import estimate_tokens
+
 from turbowrap.config import get_settings
+from turbowrap.llm.governor import get_llm_governor
 from turbowrap.llm.mixins import OperationTrackingMixin
 from turbowrap.utils.aws_secrets import get_anthropic_api_key
 from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
@@ -278,21 +281,26 @@ class ClaudeCLI(OperationTrackingMixin):
             )
 
         try:
-            return await self._run_with_tracking(
-                prompt=prompt,
-                context_id=context_id,
-                thinking_budget=thinking_budget,
-                save_prompt=save_prompt,
-                save_output=save_output,
-                save_thinking=save_thinking,
-                on_chunk=on_chunk,
-                on_thinking=on_thinking,
-                on_stderr=on_stderr,
-                operation=operation,
-                start_time=start_time,
-                session_id=session_id,  # Claude CLI session (resume if resuming)
-                is_resume=is_resume,
-            )
+            async with get_llm_governor().slot(
+                "claude", self.model, input_tokens=estimate_tokens(prompt)
+            ) as lease:
+                result = await self._run_with_tracking(
+                    prompt=prompt,
+                    context_id=context_id,
+                    thinking_budget=thinking_budget,
+                    save_prompt=save_prompt,
+                    save_output=save_output,
+                    save_thinking=save_thinking,
+                    on_chunk=on_chunk,
+                    on_thinking=on_thinking,
+                    on_stderr=on_stderr,
+                    operation=operation,
+                    start_time=start_time,
+                    session_id=session_id,  # Claude CLI session (resume if resuming)
+                    is_resume=is_resume,
+                )
+                lease.observe(result.error)
+                return result
         except Exception as e:
             if operation:
                 self._fail_operation(operation.operation_id, f"Unexpected error: {e!s}"[:200])
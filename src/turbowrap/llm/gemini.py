@@ -16,9 +16,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
+from turbowrap_llm.hooks import estimate_tokens
+
 from turbowrap.config import get_settings
 from turbowrap.exceptions import GeminiError
 from turbowrap.llm.base import AgentResponse, BaseAgent
+from turbowrap.llm.governor import get_llm_governor
 from turbowrap.llm.mixins import OperationTrackingMixin
 from turbowrap.utils.aws_secrets import get_google_api_key
 from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
@@ -152,10 +155,13 @@ class GeminiClient(BaseAgent):
         contents.append({"role": "user", "parts": [{"text": prompt}]})
 
         try:
-            response = self._client.models.generate_content(
-                model=self._model,
-                contents=contents,
-            )
+            with get_llm_governor().slot_sync(
+                "gemini", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                response = self._client.models.generate_content(
+                    model=self._model,
+                    contents=contents,
+                )
             if response.text is None:
                 raise GeminiError("Gemini returned empty response")
             return response.text
@@ -186,10 +192,13 @@ class GeminiClient(BaseAgent):
         contents.append({"role": "user", "parts": [{"text": prompt}]})
 
         try:
-            response = self._client.models.generate_content(
-                model=self._model,
-                contents=contents,
-            )
+            with get_llm_governor().slot_sync(
+                "gemini", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                response = self._client.models.generate_content(
+                    model=self._model,
+                    contents=contents,
+                )
 
             # Extract token counts if available
             usage = getattr(response, "usage_metadata", None)
@@ -275,10 +284,13 @@ class GeminiProClient(GeminiClient):
 
         # Make API call with multimodal content
         try:
-            response = self._client.models.generate_content(
-                model=self._model,
-                contents=[{"role": "user", "parts": parts}],
-            )
+            with get_llm_governor().slot_sync(
+                "gemini", self._model, input_tokens=estimate_tokens(prompt)
+            ):
+                response = self._client.models.generate_content(
+                    model=self._model,
+                    contents=[{"role": "user", "parts": parts}],
+                )
             if response.text is None:
                 raise GeminiError("Gemini Vision returned empty response")
             return response.text
@@ -541,6 +553,39 @@ class GeminiCLI(OperationTrackingMixin):
         Returns:
             GeminiCLIResult with output and S3 URLs
         """
+        async with get_llm_governor().slot(
+            "gemini", self.model, input_tokens=estimate_tokens(prompt)
+        ) as lease:
+            result = await self._run_internal(
+                prompt,
+                operation_type=operation_type,
+                repo_name=repo_name,
+                context_id=context_id,
+                save_prompt=save_prompt,
+                save_output=save_output,
+                on_chunk=on_chunk,
+                track_operation=track_operation,
+                user_name=user_name,
+                operation_details=operation_details,
+            )
+            lease.observe(result.error)
+            return result
+
+    async def _run_internal(
+        self,
+        prompt: str,
+        # Required operation tracking parameters
+        operation_type: str,
+        repo_name: str,
+        context_id: str | None = None,
+        save_prompt: bool = True,
+        save_output: bool = True,
+        on_chunk: Callable[[str], Awaitable[None]] | None = None,
+        track_operation: bool = True,
+        user_name: str | None = None,
+        operation_details: dict[str, Any] | None = None,
+    ) -> GeminiCLIResult:
+        """Run the CLI process (called with a governor slot held)."""
         import time
 
         start_time = time.time()
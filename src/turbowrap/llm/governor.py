@@ -0,0 +1,675 @@
+"""
+Global rate limiter and concurrency governor for LLM calls.
+
+Every CLI run and API call asks the governor for a slot before it starts.
+Limits are token buckets per provider (optionally also per
+"provider:model"): requests per minute, input tokens per minute and
+concurrent calls. Waiting calls are served by priority class (interactive
+chat before fixes before batch reviews) and, within a class, round-robin
+across repositories so one large review can't starve the others. A provider
+that answers with a rate limit is paused for a backoff period instead of
+being hit again by every queued call.
+
+Usage:
+    governor = get_llm_governor()
+
+    with llm_call_context(priority=Priority.BATCH, repository="owner/repo"):
+        async with governor.slot("claude", "opus", input_tokens=12_000) as lease:
+            result = await cli.run(prompt)
+            lease.observe(result.error)
+
+The turbowrap_llm CLI wrappers go through it once ``install_llm_governor()``
+has made it their default CallLimiter; priority and repository then come
+from the enclosing ``llm_call_context``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from turbowrap_llm.hooks import set_default_limiter
+
+from turbowrap.config import get_settings
+from turbowrap.exceptions import LLMQueueTimeoutError
+
+if TYPE_CHECKING:
+    from turbowrap.config import LLMGovernorSettings
+
+logger = logging.getLogger(__name__)
+
+# Longest a waiter sleeps before re-checking the buckets (refills are time-based)
+MAX_POLL_SECONDS = 1.0
+
+# Wait times kept per limit key for the p50/p95 metrics
+WAIT_SAMPLES = 200
+
+RATE_LIMIT_PATTERN = re.compile(
+    r"\b429\b|rate.?limit|too many requests|resource.?exhausted|overloaded",
+    re.IGNORECASE,
+)
+
+
+class Priority(IntEnum):
+    """Scheduling class of an LLM call (lower is served first)."""
+
+    INTERACTIVE = 0  # A user is waiting on the answer (chat, clarifications)
+    STANDARD = 1  # User-triggered jobs (fixes, mockups, Linear analysis)
+    BATCH = 2  # Background bulk work (reviews, structure, endpoint detection)
+
+
+@dataclass(frozen=True)
+class LLMCallContext:
+    """Who an LLM call is made for."""
+
+    priority: Priority = Priority.STANDARD
+    repository: str | None = None
+
+
+_DEFAULT_CONTEXT = LLMCallContext()
+_call_context: ContextVar[LLMCallContext | None] = ContextVar("llm_call_context", default=None)
+
+
+@contextmanager
+def llm_call_context(
+    priority: Priority | None = None,
+    repository: str | None = None,
+) -> Iterator[LLMCallContext]:
+    """Set the priority and repository of the LLM calls made in this block.
+
+    Nested blocks inherit the fields they don't set. asyncio tasks created
+    inside the block inherit it; worker threads don't (set it in the worker).
+    """
+    current = current_call_context()
+    context = LLMCallContext(
+        priority=current.priority if priority is None else priority,
+        repository=repository or current.repository,
+    )
+    token = _call_context.set(context)
+    try:
+        yield context
+    finally:
+        _call_context.reset(token)
+
+
+def current_call_context() -> LLMCallContext:
+    """Priority and repository of the enclosing ``llm_call_context``."""
+    return _call_context.get() or _DEFAULT_CONTEXT
+
+
+def is_rate_limit_error(error: str | BaseException | None) -> bool:
+    """Whether an error message looks like a provider rate limit (429)."""
+    if error is None:
+        return False
+    return bool(RATE_LIMIT_PATTERN.search(str(error)))
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Limits of one provider or model (0 = unlimited)."""
+
+    requests_per_minute: float = 0.0
+    input_tokens_per_minute: float = 0.0
+    max_concurrent: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, float]) -> RateLimit:
+        return cls(
+            requests_per_minute=float(data.get("requests_per_minute", 0)),
+            input_tokens_per_minute=float(data.get("input_tokens_per_minute", 0)),
+            max_concurrent=int(data.get("max_concurrent", 0)),
+        )
+
+
+class _TokenBucket:
+    """Continuously refilled bucket holding one minute of budget."""
+
+    def __init__(self, per_minute: float, now: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def cost(self, amount: float) -> float:
+        # A request larger than the bucket waits for a full bucket, not forever
+        return min(amount, self.capacity)
+
+    def seconds_until(self, amount: float) -> float:
+        return max(0.0, (self.cost(amount) - self.level) / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.level -= self.cost(amount)
+
+
+class _LimitState:
+    """Buckets, in-flight count and metrics of one limit key."""
+
+    def __init__(self, limit: RateLimit, now: float):
+        self.limit = limit
+        self.requests = (
+            _TokenBucket(limit.requests_per_minute, now) if limit.requests_per_minute > 0 else None
+        )
+        self.tokens = (
+            _TokenBucket(limit.input_tokens_per_minute, now)
+            if limit.input_tokens_per_minute > 0
+            else None
+        )
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.granted = 0
+        self.rate_limited = 0
+        self.wait_samples: deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+
+@dataclass(eq=False)
+class _Ticket:
+    """A call waiting for (or holding) a slot."""
+
+    provider: str
+    model: str | None
+    priority: Priority
+    repository: str
+    input_tokens: int
+    keys: tuple[str, ...]
+    seq: int
+    enqueued_at: float
+    wake: Callable[[], None]
+    granted: bool = False
+    waited: float = 0.0
+
+
+class LLMLease:
+    """A granted slot. Released by the ``slot`` helpers when the call ends."""
+
+    def __init__(self, governor: LLMGovernor, ticket: _Ticket | None):
+        self._governor = governor
+        self._ticket = ticket
+        self._released = False
+
+    @property
+    def waited_seconds(self) -> float:
+        return self._ticket.waited if self._ticket else 0.0
+
+    def observe(self, error: str | BaseException | None) -> None:
+        """Report the call's error (None on success); rate limits pause the provider."""
+        if self._ticket is not None and is_rate_limit_error(error):
+            self._governor.report_rate_limited(self._ticket.provider, self._ticket.model)
+
+    def release(self) -> None:
+        if self._ticket is not None and not self._released:
+            self._released = True
+            self._governor._release(self._ticket)
+
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class LLMGovernor:
+    """Admission control for LLM calls across the whole process.
+
+    State is guarded by a threading lock so async callers, worker threads
+    and sync API clients share the same limits.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] | None = None,
+        *,
+        enabled: bool = True,
+        interactive_reserve: int = 1,
+        rate_limit_backoff_seconds: float = 30.0,
+        max_wait_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            limits: Limits keyed by provider or "provider:model"
+            enabled: When False every call is admitted immediately
+            interactive_reserve: Concurrency slots per key only interactive calls may use
+            rate_limit_backoff_seconds: Pause after a provider rate-limits us
+            max_wait_seconds: Default queue timeout (0 = wait forever)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.enabled = enabled
+        self.interactive_reserve = interactive_reserve
+        self.rate_limit_backoff_seconds = rate_limit_backoff_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self._limits = dict(limits or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: dict[str, _LimitState] = {}
+        self._waiting: list[_Ticket] = []
+        self._seq = itertools.count()
+        # Fairness clock: when each (priority, repository) was last served
+        self._served = itertools.count(1)
+        self._last_served: dict[tuple[Priority, str], int] = {}
+
+    @classmethod
+    def from_settings(cls, settings: LLMGovernorSettings) -> LLMGovernor:
+        return cls(
+            limits={key: RateLimit.from_dict(value) for key, value in settings.limits.items()},
+            enabled=settings.enabled,
+            interactive_reserve=settings.interactive_reserve,
+            rate_limit_backoff_seconds=settings.rate_limit_backoff_seconds,
+            max_wait_seconds=settings.max_wait_seconds,
+        )
+
+    # -------------------------------------------------------------------------
+    # Scheduling (call with self._lock held)
+    # -------------------------------------------------------------------------
+
+    def _keys(self, provider: str, model: str | None) -> tuple[str, ...]:
+        model_key = f"{provider}:{model}"
+        return (provider, model_key) if model and model_key in self._limits else (provider,)
+
+    def _state(self, key: str, now: float) -> _LimitState:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _LimitState(self._limits.get(key, RateLimit()), now)
+        return state
+
+    def _delay(self, ticket: _Ticket, now: float) -> float:
+        """Seconds until the ticket fits (0 = now, inf = waits for a release)."""
+        delay = 0.0
+        for key in ticket.keys:
+            state = self._state(key, now)
+            if now < state.paused_until:
+                delay = max(delay, state.paused_until - now)
+            cap = state.limit.max_concurrent
+            if cap > 0:
+                if ticket.priority != Priority.INTERACTIVE and cap > self.interactive_reserve:
+                    cap -= self.interactive_reserve
+                if state.in_flight >= cap:
+                    return math.inf
+            if state.requests:
+                state.requests.refill(now)
+                delay = max(delay, state.requests.seconds_until(1))
+            if state.tokens and ticket.input_tokens:
+                state.tokens.refill(now)
+                delay = max(delay, state.tokens.seconds_until(ticket.input_tokens))
+        return delay
+
+    def _grant(self, ticket: _Ticket, now: float) -> None:
+        ticket.waited = now - ticket.enqueued_at
+        for key in ticket.keys:
+            state = self._state(key, now)
+            if state.requests:
+                state.requests.refill(now)
+                state.requests.take(1)
+            if state.tokens and ticket.input_tokens:
+                state.tokens.refill(now)
+                state.tokens.take(ticket.input_tokens)
+            state.in_flight += 1
+            state.granted += 1
+            state.wait_samples.append(ticket.waited)
+        self._last_served[(ticket.priority, ticket.repository)] = next(self._served)
+        ticket.granted = True
+
+    def _order(self, ticket: _Ticket) -> tuple[int, int, int]:
+        # Priority class first, then the repository served least recently, then FIFO
+        return (
+            ticket.priority,
+            self._last_served.get((ticket.priority, ticket.repository), 0),
+            ticket.seq,
+        )
+
+    def _dispatch(self, now: float) -> float:
+        """Grant every waiting ticket that fits, best first.
+
+        A ticket that doesn't fit blocks the tickets behind it on the same
+        keys, so a batch call can't overtake a waiting interactive one.
+
+        Returns:
+            Seconds until a blocked ticket may fit on its own (bucket refill
+            or pause end); inf if all remaining tickets wait for a release.
+        """
+        retry = math.inf
+        blocked: set[str] = set()
+        granted: list[_Ticket] = []
+        for ticket in sorted(self._waiting, key=self._order):
+            if blocked.intersection(ticket.keys):
+                continue
+            delay = self._delay(ticket, now)
+            if delay <= 0:
+                self._grant(ticket, now)
+                granted.append(ticket)
+            else:
+                blocked.update(ticket.keys)
+                retry = min(retry, delay)
+        if granted:
+            self._waiting = [t for t in self._waiting if not t.granted]
+            for ticket in granted:
+                ticket.wake()
+        return retry
+
+    def _enqueue(
+        self,
+        provider: str,
+        model: str | None,
+        input_tokens: int,
+        priority: Priority | None,
+        repository: str | None,
+        wake: Callable[[], None],
+    ) -> _Ticket:
+        context = current_call_context()
+        with self._lock:
+            ticket = _Ticket(
+                provider=provider,
+                model=model,
+                priority=context.priority if priority is None else priority,
+                repository=repository or context.repository or "",
+                input_tokens=max(0, input_tokens),
+                keys=self._keys(provider, model),
+                seq=next(self._seq),
+                enqueued_at=self._clock(),
+                wake=wake,
+            )
+            self._waiting.append(ticket)
+        return ticket
+
+    def _poll(self, ticket: _Ticket, deadline: float | None) -> float | None:
+        """Try to admit the ticket; seconds to sleep before retrying, None once granted."""
+        with self._lock:
+            now = self._clock()
+            retry = self._dispatch(now)
+            if ticket.granted:
+                return None
+        if deadline is not None and now >= deadline:
+            raise LLMQueueTimeoutError(
+                f"No {ticket.provider} slot after {now - ticket.enqueued_at:.0f}s "
+                f"({ticket.priority.name.lower()}, repository={ticket.repository or '-'})"
+            )
+        wait = min(retry, MAX_POLL_SECONDS)
+        if deadline is not None:
+            wait = min(wait, deadline - now)
+        return max(wait, 0.0)
+
+    def _deadline(self, timeout: float | None) -> float | None:
+        timeout = self.max_wait_seconds if timeout is None else timeout
+        return self._clock() + timeout if timeout > 0 else None
+
+    def _abandon(self, ticket: _Ticket) -> None:
+        """Drop a ticket whose caller gave up (timeout or cancellation)."""
+        with self._lock:
+            if ticket.granted:
+                self._release_locked(ticket)
+            elif ticket in self._waiting:
+                self._waiting.remove(ticket)
+            self._dispatch(self._clock())
+
+    def _release_locked(self, ticket: _Ticket) -> None:
+        for key in ticket.keys:
+            state = self._states[key]
+            state.in_flight = max(0, state.in_flight - 1)
+
+    def _release(self, ticket: _Ticket) -> None:
+        with self._lock:
+            self._release_locked(ticket)
+            self._dispatch(self._clock())
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    async def acquire(
+        self,
+        provider: str,
+        model: str | None = None,
+        *,
+        input_tokens: int = 0,
+        priority: Priority | None = None,
+        repository: str | None = None,
+        timeout: float | None = None,
+    ) -> LLMLease:
+        """Wait for a slot (prefer ``slot``, which also releases it).
+
+        Args:
+            provider: "claude", "gemini" or "grok"
+            model: Model id (matches "provider:model" limits)
+            input_tokens: Estimated prompt tokens
+            priority: Defaults to the enclosing llm_call_context
+            repository: Fairness key; defaults to the enclosing llm_call_context
+            timeout: Queue timeout in seconds (None = settings default, 0 = forever)
+
+        Raises:
+            LLMQueueTimeoutError: If no slot was free before the timeout
+        """
+        if not self.enabled:
+            return LLMLease(self, None)
+
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+
+        def _wake() -> None:
+            loop.call_soon_threadsafe(event.set)
+
+        ticket = self._enqueue(provider, model, input_tokens, priority, repository, _wake)
+        deadline = self._deadline(timeout)
+        try:
+            while True:
+                event.clear()
+                wait = self._poll(ticket, deadline)
+                if wait is None:
+                    break
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._abandon(ticket)
+            raise
+
+        self._log_wait(ticket)
+        return LLMLease(self, ticket)
+
+    def acquire_sync(
+        self,
+        provider: str,
+        model: str | None = None,
+        *,
+        input_tokens: int = 0,
+        priority: Priority | None = None,
+        repository: str | None = None,
+        timeout: float | None = None,
+    ) -> LLMLease:
+        """Blocking ``acquire`` for worker threads and sync API clients.
+
+        On an event-loop thread it can't wait without stalling the loop (and
+        the calls that would free a slot), so there the call is admitted at
+        once and only counted against the limits.
+        """
+        if not self.enabled:
+            return LLMLease(self, None)
+
+        event = threading.Event()
+        ticket = self._enqueue(provider, model, input_tokens, priority, repository, event.set)
+
+        if _on_event_loop_thread():
+            with self._lock:
+                self._waiting.remove(ticket)
+                self._grant(ticket, self._clock())
+            return LLMLease(self, ticket)
+
+        deadline = self._deadline(timeout)
+        try:
+            while True:
+                event.clear()
+                wait = self._poll(ticket, deadline)
+                if wait is None:
+                    break
+                event.wait(wait)
+        except BaseException:
+            self._abandon(ticket)
+            raise
+
+        self._log_wait(ticket)
+        return LLMLease(self, ticket)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        model: str | None = None,
+        *,
+        input_tokens: int = 0,
+        priority: Priority | None = None,
+        repository: str | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[LLMLease]:
+        """Hold a slot for the enclosed call (see ``acquire``)."""
+        lease = await self.acquire(
+            provider,
+            model,
+            input_tokens=input_tokens,
+            priority=priority,
+            repository=repository,
+            timeout=timeout,
+        )
+        try:
+            yield lease
+        except Exception as e:
+            lease.observe(e)
+            raise
+        finally:
+            lease.release()
+
+    @contextmanager
+    def slot_sync(
+        self,
+        provider: str,
+        model: str | None = None,
+        *,
+        input_tokens: int = 0,
+        priority: Priority | None = None,
+        repository: str | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[LLMLease]:
+        """Blocking ``slot`` (see ``acquire_sync``)."""
+        lease = self.acquire_sync(
+            provider,
+            model,
+            input_tokens=input_tokens,
+            priority=priority,
+            repository=repository,
+            timeout=timeout,
+        )
+        try:
+            yield lease
+        except Exception as e:
+            lease.observe(e)
+            raise
+        finally:
+            lease.release()
+
+    def limit(
+        self, provider: str, model: str, input_tokens: int = 0
+    ) -> AbstractAsyncContextManager[LLMLease]:
+        """turbowrap_llm CallLimiter hook (priority comes from llm_call_context)."""
+        return self.slot(provider, model, input_tokens=input_tokens)
+
+    def report_rate_limited(
+        self, provider: str, model: str | None = None, retry_after: float | None = None
+    ) -> None:
+        """Pause new calls to a provider after it answered with a rate limit."""
+        pause = retry_after if retry_after is not None else self.rate_limit_backoff_seconds
+        with self._lock:
+            now = self._clock()
+            for key in self._keys(provider, model):
+                state = self._state(key, now)
+                state.paused_until = max(state.paused_until, now + pause)
+                state.rate_limited += 1
+        logger.warning(
+            f"[LLM GOVERNOR] {provider} rate limited, pausing new calls for {pause:.0f}s"
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Live metrics per limit key: in-flight, queue depth, budgets, waits."""
+        with self._lock:
+            now = self._clock()
+            keys: dict[str, Any] = {}
+            for key, state in sorted(self._states.items()):
+                waiting = [t for t in self._waiting if key in t.keys]
+                if state.requests:
+                    state.requests.refill(now)
+                if state.tokens:
+                    state.tokens.refill(now)
+                samples = list(state.wait_samples)
+                keys[key] = {
+                    "in_flight": state.in_flight,
+                    "max_concurrent": state.limit.max_concurrent or None,
+                    "waiting": {
+                        p.name.lower(): sum(t.priority == p for t in waiting) for p in Priority
+                    },
+                    "oldest_wait_s": round(
+                        max((now - t.enqueued_at for t in waiting), default=0.0), 2
+                    ),
+                    "requests_available": round(state.requests.level, 1)
+                    if state.requests
+                    else None,
+                    "input_tokens_available": int(state.tokens.level) if state.tokens else None,
+                    "paused_for_s": round(max(0.0, state.paused_until - now), 1),
+                    "granted": state.granted,
+                    "rate_limited": state.rate_limited,
+                    "wait_p50_s": round(_percentile(samples, 50), 3),
+                    "wait_p95_s": round(_percentile(samples, 95), 3),
+                }
+            return {"enabled": self.enabled, "waiting": len(self._waiting), "limits": keys}
+
+    def _log_wait(self, ticket: _Ticket) -> None:
+        if ticket.waited >= 1.0:
+            logger.info(
+                f"[LLM GOVERNOR] {ticket.provider} {ticket.priority.name.lower()} call "
+                f"waited {ticket.waited:.1f}s (repository={ticket.repository or '-'})"
+            )
+
+
+# Global singleton
+_governor: LLMGovernor | None = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Get the process-wide LLM governor (built from settings on first use)."""
+    global _governor
+    if _governor is None:
+        _governor = LLMGovernor.from_settings(get_settings().llm_governor)
+    return _governor
+
+
+def install_llm_governor() -> LLMGovernor:
+    """Make the governor the default CallLimiter of the turbowrap_llm CLIs."""
+    governor = get_llm_governor()
+    set_default_limiter(governor)
+    return governor
+
+
+def uninstall_llm_governor() -> None:
+    """Restore the turbowrap_llm no-op limiter."""
+    set_default_limiter(None)
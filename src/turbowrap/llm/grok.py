@@ -15,7 +15,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from turbowrap_llm.hooks import estimate_tokens
+
 from turbowrap.config import get_settings
+from turbowrap.llm.governor import get_llm_governor
 from turbowrap.llm.mixins import OperationTrackingMixin
 from turbowrap.utils.aws_secrets import get_grok_api_key
 from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
@@ -174,6 +177,42 @@ class GrokCLI(OperationTrackingMixin):
         Returns:
             GrokCLIResult with output, messages, and stats
         """
+        async with get_llm_governor().slot(
+            "grok", self.model, input_tokens=estimate_tokens(prompt)
+        ) as lease:
+            result = await self._run_internal(
+                prompt,
+                operation_type=operation_type,
+                repo_name=repo_name,
+                context_id=context_id,
+                save_prompt=save_prompt,
+                save_output=save_output,
+                on_chunk=on_chunk,
+                headless=headless,
+                track_operation=track_operation,
+                user_name=user_name,
+                operation_details=operation_details,
+            )
+            lease.observe(result.error)
+            return result
+
+    async def _run_internal(
+        self,
+        prompt: str,
+        # Required operation tracking parameters
+        operation_type: str,
+        repo_name: str,
+        # Optional parameters
+        context_id: str | None = None,
+        save_prompt: bool = True,
+        save_output: bool = True,
+        on_chunk: Callable[[str], Awaitable[None]] | None = None,
+        headless: bool = True,
+        track_operation: bool = True,
+        user_name: str | None = None,
+        operation_details: dict[str, Any] | None = None,
+    ) -> GrokCLIResult:
+        """Run the CLI process (called with a governor slot held)."""
         import time
 
         start_time = time.time()
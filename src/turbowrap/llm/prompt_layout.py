@@ -0,0 +1,324 @@
+"""Cache-friendly prompt assembly and prompt-cache hit tracking.
+
+Provider prompt caches (Anthropic, Gemini implicit caching, xAI) only reuse
+an identical *prefix* of the input. Prompts that interleave volatile values
+(output paths, IDs, file lists) with stable instructions therefore miss the
+cache on every run.
+
+PromptLayout collects named segments tagged with a Stability class and
+renders them from most to least stable, so the longest possible prefix is
+shared between runs, shards and reviewers. Each segment is fingerprinted;
+PromptCacheMonitor remembers recently sent prefixes per provider/model and
+compares the cache-read tokens we should get with what the CLI reports.
+
+Usage:
+    layout = PromptLayout()
+    layout.add("instructions", agent_md, Stability.STATIC)
+    layout.add("structure", structure_xml, Stability.REPOSITORY)
+    layout.add("files", file_list, Stability.SHARD)
+    layout.add("output", f"Save to {path}", Stability.VOLATILE)
+    prompt = layout.render()
+
+    result = await cli.run(prompt)
+    get_prompt_cache_monitor().observe("claude", prompt, result)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from turbowrap_llm.hooks import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Anthropic's default ephemeral cache lifetime; Gemini/xAI keep prefixes similarly short
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+# Prefixes shorter than this are never cached (Anthropic's minimum for Opus/Sonnet)
+MIN_CACHEABLE_TOKENS = 1024
+# Prefix fingerprints remembered per provider/model
+MAX_TRACKED_PREFIXES = 2048
+
+
+class Stability(IntEnum):
+    """How often a prompt segment changes; lower values render first."""
+
+    STATIC = 0  # Agent instructions, output schema: change with a deploy
+    REPOSITORY = 1  # structure.xml, business context: change with the repo
+    SHARD = 2  # File lists: change per review shard / issue batch
+    VOLATILE = 3  # Output paths, IDs, timestamps, branch names: change every run
+
+
+def fingerprint(text: str) -> str:
+    """Short content hash of a segment."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    """One named block of a prompt."""
+
+    name: str
+    text: str
+    stability: Stability
+
+    @property
+    def fingerprint(self) -> str:
+        return fingerprint(self.text)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+@dataclass
+class PromptLayout:
+    """Ordered prompt segments; render() sorts them by stability (stable sort)."""
+
+    segments: list[PromptSegment] = field(default_factory=list)
+
+    def add(self, name: str, text: str, stability: Stability = Stability.STATIC) -> PromptLayout:
+        """Append a segment (empty text is skipped)."""
+        if text:
+            self.segments.append(PromptSegment(name, text, stability))
+        return self
+
+    def ordered(self) -> list[PromptSegment]:
+        return sorted(self.segments, key=lambda s: s.stability)
+
+    def render(self, separator: str = "") -> RenderedPrompt:
+        """Join segments from most to least stable."""
+        ordered = self.ordered()
+        prompt = RenderedPrompt(separator.join(s.text for s in ordered))
+        prompt.segments = ordered
+        prompt.separator = separator
+        return prompt
+
+
+class RenderedPrompt(str):
+    """A prompt string that remembers the segments it was rendered from.
+
+    Behaves exactly like ``str`` (CLIs, ``.replace()``, logging); string
+    operations return plain ``str`` without the layout.
+    """
+
+    segments: list[PromptSegment]
+    separator: str
+
+    def prefix_fingerprints(self) -> list[tuple[str, int]]:
+        """``(fingerprint, cumulative tokens)`` of every segment prefix."""
+        chain: list[tuple[str, int]] = []
+        digest = ""
+        tokens = 0
+        for i, segment in enumerate(self.segments):
+            digest = fingerprint(digest + segment.fingerprint)
+            tokens += segment.tokens + (estimate_tokens(self.separator) if i else 0)
+            chain.append((digest, tokens))
+        return chain
+
+    def describe(self) -> list[dict[str, Any]]:
+        """Segment names, stability, size and fingerprint (for logs/debugging)."""
+        return [
+            {
+                "name": s.name,
+                "stability": s.stability.name.lower(),
+                "tokens": s.tokens,
+                "fingerprint": s.fingerprint,
+            }
+            for s in self.segments
+        ]
+
+
+def _cache_usage(result: Any) -> tuple[int, int] | None:
+    """``(uncached input tokens, cache-read tokens)`` from a CLI result or usage list.
+
+    Understands Claude ``model_usage`` (ModelUsage / ModelUsageInfo) and Gemini
+    ``session_stats.model_usage`` (``cache_reads``). None when the provider
+    reports no usage (Grok).
+    """
+    usage: Iterable[Any] | None
+    if isinstance(result, list):
+        usage = result
+    else:
+        usage = getattr(result, "model_usage", None)
+        if usage is None:
+            stats = getattr(result, "session_stats", None)
+            usage = getattr(stats, "model_usage", None)
+    if not usage:
+        return None
+
+    input_tokens = 0
+    cache_read = 0
+    for entry in usage:
+        input_tokens += int(getattr(entry, "input_tokens", 0) or 0)
+        input_tokens += int(getattr(entry, "cache_creation_tokens", 0) or 0)
+        read = getattr(entry, "cache_read_tokens", None)
+        if read is None:
+            read = getattr(entry, "cache_reads", 0)
+        cache_read += int(read or 0)
+    return input_tokens, cache_read
+
+
+@dataclass
+class _ProviderCacheStats:
+    calls: int = 0
+    prompt_tokens: int = 0
+    input_tokens: int = 0
+    expected_cache_read_tokens: int = 0
+    actual_cache_read_tokens: int = 0
+
+
+@dataclass
+class CacheObservation:
+    """Expected vs reported cache reads for one call."""
+
+    provider: str
+    model: str
+    prompt_tokens: int
+    expected_cache_read_tokens: int
+    actual_cache_read_tokens: int | None
+    input_tokens: int | None
+    matched_segments: list[str]
+
+
+class PromptCacheMonitor:
+    """Predicts cache-read tokens from recently sent prefixes and tracks hit rates.
+
+    The prediction only covers our own prompt: CLIs prepend their own system
+    prompt and tool definitions, which are cached too, so actual reads are
+    usually a little higher than expected.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        min_cacheable_tokens: int = MIN_CACHEABLE_TOKENS,
+        max_prefixes: int = MAX_TRACKED_PREFIXES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize monitor.
+
+        Args:
+            ttl_seconds: How long a provider keeps a prefix cached
+            min_cacheable_tokens: Shorter prefixes are never cached
+            max_prefixes: Prefix fingerprints remembered per provider/model
+            clock: Time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.min_cacheable_tokens = min_cacheable_tokens
+        self.max_prefixes = max_prefixes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seen: dict[tuple[str, str], OrderedDict[str, float]] = {}
+        self._stats: dict[str, _ProviderCacheStats] = {}
+
+    def expected_cache_read(
+        self, provider: str, prompt: str, model: str = ""
+    ) -> tuple[int, list[str]]:
+        """Tokens of the longest prefix sent within the TTL, and its segment names."""
+        segments = getattr(prompt, "segments", None)
+        if not isinstance(prompt, RenderedPrompt) or not segments:
+            return 0, []
+        now = self._clock()
+        with self._lock:
+            seen = self._seen.get((provider, model), OrderedDict())
+            expected = 0
+            matched = 0
+            for i, (digest, tokens) in enumerate(prompt.prefix_fingerprints()):
+                sent_at = seen.get(digest)
+                if sent_at is None or now - sent_at > self.ttl_seconds:
+                    break
+                if tokens >= self.min_cacheable_tokens:
+                    expected, matched = tokens, i + 1
+        return expected, [s.name for s in segments[:matched]]
+
+    def observe(
+        self, provider: str, prompt: str, result: Any = None, model: str = ""
+    ) -> CacheObservation | None:
+        """Record a sent prompt and compare expected with reported cache reads.
+
+        Args:
+            provider: claude, gemini or grok
+            prompt: The RenderedPrompt sent (before any ``.replace()``)
+            result: CLI result (or model usage list) with token usage
+            model: Model name, if several models share a provider
+
+        Returns:
+            The observation, or None for prompts not built with PromptLayout
+        """
+        if not isinstance(prompt, RenderedPrompt) or not getattr(prompt, "segments", None):
+            return None
+        expected, matched = self.expected_cache_read(provider, prompt, model)
+        chain = prompt.prefix_fingerprints()
+        usage = _cache_usage(result) if result is not None else None
+        now = self._clock()
+
+        with self._lock:
+            seen = self._seen.setdefault((provider, model), OrderedDict())
+            for digest, _tokens in chain:
+                seen[digest] = now
+                seen.move_to_end(digest)
+            while len(seen) > self.max_prefixes:
+                seen.popitem(last=False)
+
+            stats = self._stats.setdefault(provider, _ProviderCacheStats())
+            stats.calls += 1
+            stats.prompt_tokens += chain[-1][1]
+            stats.expected_cache_read_tokens += expected
+            if usage is not None:
+                stats.input_tokens += usage[0] + usage[1]
+                stats.actual_cache_read_tokens += usage[1]
+
+        observation = CacheObservation(
+            provider=provider,
+            model=model,
+            prompt_tokens=chain[-1][1],
+            expected_cache_read_tokens=expected,
+            actual_cache_read_tokens=usage[1] if usage else None,
+            input_tokens=usage[0] + usage[1] if usage else None,
+            matched_segments=matched,
+        )
+        logger.info(
+            f"[PROMPT CACHE] {provider}: ~{observation.prompt_tokens} prompt tokens, "
+            f"expected cache read ~{expected} ({'+'.join(matched) or 'none'}), "
+            f"actual {observation.actual_cache_read_tokens}"
+        )
+        return observation
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-provider expected vs actual cache reads and hit rate."""
+        with self._lock:
+            providers = {
+                provider: {
+                    "calls": s.calls,
+                    "prompt_tokens": s.prompt_tokens,
+                    "expected_cache_read_tokens": s.expected_cache_read_tokens,
+                    "actual_cache_read_tokens": s.actual_cache_read_tokens,
+                    "cache_hit_rate": (
+                        round(s.actual_cache_read_tokens / s.input_tokens, 3)
+                        if s.input_tokens
+                        else None
+                    ),
+                }
+                for provider, s in self._stats.items()
+            }
+        return {"ttl_seconds": self.ttl_seconds, "providers": providers}
+
+
+# Singleton
+_monitor: PromptCacheMonitor | None = None
+
+
+def get_prompt_cache_monitor() -> PromptCacheMonitor:
+    """Get the global PromptCacheMonitor instance."""
+    global _monitor
+    if _monitor is None:
+        _monitor = PromptCacheMonitor()
+    return _monitor
@@ -2,7 +2,7 @@
 Issue processing utilities for TurboWrap orchestrators.
 
 Provides common functions for:
-- Issue deduplication (merging same issues from multiple reviewers)
+- Issue deduplication (merging same and near-duplicate issues from multiple reviewers)
 - Issue prioritization (sorting by severity and category)
 - Score calculation (overall quality score)
 - Recommendation determination (approve/request changes)
@@ -12,6 +12,7 @@ from typing import Any
 
 from turbowrap.review.models.report import NextStep, Recommendation, SeveritySummary
 from turbowrap.review.models.review import Issue, IssueSeverity
+from turbowrap.review.utils.similarity import SIMILARITY_THRESHOLD, cluster_similar_issues
 
 # Severity ranking for comparisons
 SEVERITY_RANKS = {
@@ -55,7 +56,25 @@ def get_severity_rank(severity: IssueSeverity) -> int:
     return SEVERITY_RANKS.get(severity, 0)
 
 
-def deduplicate_issues(issues: list[Issue]) -> list[Issue]:
+def _merge_issue(target: Issue, duplicate: Issue) -> None:
+    """Fold a duplicate into the issue that is kept."""
+    # Keep highest severity
+    if get_severity_rank(duplicate.severity) > get_severity_rank(target.severity):
+        target.severity = duplicate.severity
+    # Merge flagged_by
+    for reviewer in duplicate.flagged_by:
+        if reviewer not in target.flagged_by:
+            target.flagged_by.append(reviewer)
+    # Fill details the kept report is missing
+    if not target.current_code and duplicate.current_code:
+        target.current_code = duplicate.current_code
+    if not target.suggested_fix and duplicate.suggested_fix:
+        target.suggested_fix = duplicate.suggested_fix
+
+
+def deduplicate_issues(
+    issues: list[Issue], similarity_threshold: float | None = SIMILARITY_THRESHOLD
+) -> list[Issue]:
     """
     Deduplicate issues from multiple reviewers.
 
@@ -64,12 +83,17 @@ def deduplicate_issues(issues: list[Issue]) -> list[Issue]:
     - line
     - category
 
+    or, with similarity enabled, if different reviewers reported them in the
+    same file a few lines apart and their title, description and code are
+    similar enough (see review/utils/similarity.py).
+
     When duplicates are found:
-    - Keep the highest severity
+    - Keep the first report, with the highest severity
     - Merge flagged_by lists
 
     Args:
         issues: List of issues (may contain duplicates)
+        similarity_threshold: Min similarity for near-duplicates (None = exact only)
 
     Returns:
         Deduplicated list of issues
@@ -80,18 +104,22 @@ def deduplicate_issues(issues: list[Issue]) -> list[Issue]:
         key = (issue.file, issue.line, issue.category)
 
         if key in unique:
-            existing = unique[key]
-            # Keep highest severity
-            if get_severity_rank(issue.severity) > get_severity_rank(existing.severity):
-                existing.severity = issue.severity
-            # Merge flagged_by
-            for reviewer in issue.flagged_by:
-                if reviewer not in existing.flagged_by:
-                    existing.flagged_by.append(reviewer)
+            _merge_issue(unique[key], issue)
         else:
             unique[key] = issue
 
-    return list(unique.values())
+    exact = list(unique.values())
+    if similarity_threshold is None or len(exact) < 2:
+        return exact
+
+    merged: list[Issue] = []
+    for cluster in cluster_similar_issues(exact, threshold=similarity_threshold):
+        kept = exact[cluster[0]]
+        for index in cluster[1:]:
+            _merge_issue(kept, exact[index])
+        merged.append(kept)
+
+    return merged
 
 
 def calculate_priority_score(issue: Issue) -> float:
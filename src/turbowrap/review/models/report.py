@@ -149,6 +149,10 @@ class FinalReport(BaseModel):
 
     issues: list[Issue] = Field(default_factory=list, description="All deduplicated issues")
 
+    reviewed_files: list[str] = Field(
+        default_factory=list, description="Files covered by the review (relative paths)"
+    )
+
     checklists: dict[str, ChecklistResult] = Field(
         default_factory=dict, description="Aggregated checklist results"
     )
@@ -38,14 +38,19 @@ from turbowrap.review.models.report import (
     RepoType,
     ReviewerResult,
 )
-from turbowrap.review.models.review import Issue, ReviewMode, ReviewRequest
-from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMRunner
+from turbowrap.review.models.review import Issue, ReviewMode, ReviewOutput, ReviewRequest
+from turbowrap.review.parallel_triple_llm_runner import (
+    ParallelTripleLLMResult,
+    ParallelTripleLLMRunner,
+)
 from turbowrap.review.reviewers.base import ReviewContext
 from turbowrap.review.reviewers.claude_evaluator import ClaudeEvaluator
+from turbowrap.review.utils.file_view import ReviewFileView
 from turbowrap.review.utils.repo_detector import RepoDetector
 from turbowrap.tools.structure_generator import StructureGenerator
-from turbowrap.utils.file_utils import is_text_file, read_file
+from turbowrap.utils.file_utils import is_text_file
 from turbowrap.utils.git_utils import GitUtils
+from turbowrap.utils.structure_docs import STRUCTURE_XML_PATH, get_structure_cache
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +63,9 @@ CheckpointCallback = Callable[
     Awaitable[None],
 ]
 
+# Called with (llm, issues) when a straggler LLM finishes after the report was built
+LateIssuesCallback = Callable[[str, list[Issue]], Awaitable[None]]
+
 
 class Orchestrator:
     """
@@ -82,19 +90,24 @@ class Orchestrator:
         completed_checkpoints: CheckpointData | None = None,
         checkpoint_callback: CheckpointCallback | None = None,
         parent_session_id: str | None = None,
+        late_issues_callback: LateIssuesCallback | None = None,
     ) -> FinalReport:
         """Perform a complete code review.
 
         Args:
             request: Review request with source and options
             progress_callback: Optional async callback for progress events
-            completed_checkpoints: Dict of already completed reviewers (for resume).
+            completed_checkpoints: Dict of reviewers checkpointed by a failed run (for
+                resume). Their issues are restored and they are not run again; this
+                includes "partial" checkpoints saved as results streamed in.
                 Keys are reviewer names, values are checkpoint dicts with:
                 - issues_data: list of issue dicts
                 - final_satisfaction: float
                 - iterations: int
             checkpoint_callback: Optional callback to save checkpoint after each reviewer
             parent_session_id: Optional parent session ID for operation tracking
+            late_issues_callback: Optional callback to merge issues from an LLM that
+                finished after the straggler cutoff into the stored report
 
         Returns:
             FinalReport with all findings
@@ -137,6 +150,37 @@ class Orchestrator:
         reviewer_results: list[ReviewerResult] = []
         all_issues: list[Issue] = []
 
+        # Resume: restore checkpointed specialists, run only the others
+        resumed = {
+            name: completed_checkpoints[name]
+            for name in reviewers
+            if completed_checkpoints and name in completed_checkpoints
+        }
+        for reviewer_name, checkpoint in resumed.items():
+            restored = self._restore_checkpoint_issues(reviewer_name, checkpoint)
+            all_issues.extend(restored)
+            reviewer_results.append(
+                ReviewerResult(
+                    name=reviewer_name,
+                    status="completed",
+                    issues_found=len(restored),
+                    iterations=int(checkpoint.get("iterations") or 1),
+                    final_satisfaction=float(checkpoint.get("final_satisfaction") or 0.0),
+                )
+            )
+            await emit(
+                ProgressEvent(
+                    type=ProgressEventType.REVIEWER_COMPLETED,
+                    reviewer_name=reviewer_name,
+                    reviewer_display_name=reviewer_name,
+                    issues_found=len(restored),
+                    message=f"{reviewer_name}: {len(restored)} issues (restored from checkpoint)",
+                )
+            )
+        if resumed:
+            await emit_log("INFO", f"↻ Resumed {len(resumed)} specialists from checkpoints")
+        reviewers = [name for name in reviewers if name not in resumed]
+
         # Parallel Triple-LLM mode: 3 CLI processes instead of 15
         # Each LLM (Claude, Gemini, Grok) runs IN PARALLEL
         # This shares cache within each LLM session, reducing costs by ~80%
@@ -200,16 +244,63 @@ class Orchestrator:
                 )
             )
 
+        # Specialist results published while the CLIs are still running
+        streamed_issues: dict[str, list[Issue]] = {}
+        streamed_llms: dict[str, set[str]] = {}
+
+        async def on_specialist_result(llm: str, review: ReviewOutput) -> None:
+            spec_name = review.reviewer
+            streamed_issues.setdefault(spec_name, []).extend(review.issues)
+            streamed_llms.setdefault(spec_name, set()).add(llm)
+            issues_so_far = len(streamed_issues[spec_name])
+
+            await emit(
+                ProgressEvent(
+                    type=ProgressEventType.REVIEWER_COMPLETED,
+                    reviewer_name=spec_name,
+                    reviewer_display_name=f"{spec_name} ({llm.title()})",
+                    issues_found=issues_so_far,
+                    message=f"{spec_name} ({llm.title()}): {len(review.issues)} issues",
+                )
+            )
+            await emit_log("INFO", f"✓ {spec_name} ({llm.title()}): {len(review.issues)} issues")
+
+            # Partial checkpoint: a crash now loses at most the specialist in flight
+            if checkpoint_callback:
+                await checkpoint_callback(
+                    spec_name,
+                    "partial",
+                    list(streamed_issues[spec_name]),
+                    len(streamed_llms[spec_name]) * 33.33,
+                    1,
+                    [],
+                    started_at,
+                )
+
+        async def on_late_result(llm: str, reviews: dict[str, ReviewOutput]) -> None:
+            late_issues = [issue for review in reviews.values() for issue in review.issues]
+            await emit_log("INFO", f"✓ {llm.title()} finished late: {len(late_issues)} issues")
+            if late_issues_callback:
+                await late_issues_callback(llm, late_issues)
+
         try:
             # Run the parallel triple-LLM review (3 CLIs in parallel)
             runner = ParallelTripleLLMRunner(specialists=reviewers)
-            par_result = await runner.run(
-                context=context,
-                file_list=context.files,
-                on_claude_chunk=on_claude_chunk,
-                on_gemini_chunk=on_gemini_chunk,
-                on_grok_chunk=on_grok_chunk,
-            )
+            if reviewers:
+                par_result = await runner.run(
+                    context=context,
+                    file_list=context.files,
+                    on_claude_chunk=on_claude_chunk,
+                    on_gemini_chunk=on_gemini_chunk,
+                    on_grok_chunk=on_grok_chunk,
+                    on_specialist_result=on_specialist_result,
+                    on_late_result=on_late_result if late_issues_callback else None,
+                )
+            else:
+                # Every specialist was restored from checkpoints
+                par_result = ParallelTripleLLMResult(
+                    final_review=ReviewOutput(reviewer="parallel_triple_llm")
+                )
 
             # Emit completion events for each LLM
             await emit(
@@ -245,8 +336,15 @@ class Orchestrator:
                 "INFO",
                 f"✓ Parallel review: {par_result.merged_issues_count} issues "
                 f"(C:{par_result.claude_issues_count} G:{par_result.gemini_issues_count} "
-                f"X:{par_result.grok_issues_count}, overlap={par_result.overlap_count})",
+                f"X:{par_result.grok_issues_count}, overlap={par_result.overlap_count}, "
+                f"shards={par_result.shards_count})",
             )
+            if par_result.late_providers:
+                await emit_log(
+                    "WARNING",
+                    f"⏱ Continuing without {', '.join(par_result.late_providers)} "
+                    "(results will be merged when ready)",
+                )
 
             # Build reviewer_results for each specialist from merged data
             for reviewer_name in reviewers:
@@ -349,7 +447,8 @@ class Orchestrator:
                     )
                 )
 
-                if checkpoint_callback:
+                # Keep the partial checkpoint of specialists that streamed results
+                if checkpoint_callback and reviewer_name not in streamed_issues:
                     await checkpoint_callback(
                         reviewer_name,
                         "failed",
@@ -424,6 +523,9 @@ class Orchestrator:
             evaluation=evaluation,
         )
 
+        # Reviewers and evaluator are done with the files
+        context.file_contents.release()
+
         logger.info(
             f"Review {report_id} completed: "
             f"{report.summary.total_issues} issues, "
@@ -550,6 +652,7 @@ class Orchestrator:
                 else:
                     context.files = self._scan_directory(context.repo_path)
 
+            self._focus_structure_docs(context)
             await self._load_file_contents(context)
 
         try:
@@ -625,7 +728,9 @@ class Orchestrator:
         Load repository structure documentation for LLM context.
 
         Only uses .llms/structure.xml (consolidated XML format, optimized for LLM).
-        No fallback to STRUCTURE.md.
+        No fallback to STRUCTURE.md. The parsed document comes from the
+        process-wide structure cache, so consecutive reviews of a repository
+        don't re-read it.
 
         For monorepo: loads from workspace/.llms/structure.xml if workspace_path is set.
         """
@@ -633,25 +738,43 @@ class Orchestrator:
             return
 
         if context.workspace_path:
-            xml_path = context.repo_path / context.workspace_path / ".llms" / "structure.xml"
+            xml_path = context.repo_path / context.workspace_path / STRUCTURE_XML_PATH
         else:
-            xml_path = context.repo_path / ".llms" / "structure.xml"
+            xml_path = context.repo_path / STRUCTURE_XML_PATH
 
-        if xml_path.exists():
-            try:
-                content = xml_path.read_text(encoding="utf-8")
-                context.structure_docs["structure.xml"] = content
-                logger.info(
-                    f"Loaded {xml_path.relative_to(context.repo_path)} "
-                    f"({xml_path.stat().st_size:,} bytes)"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to read {xml_path}: {e}")
+        document = get_structure_cache().get(xml_path)
+        if document is not None:
+            context.structure_document = document
+            context.structure_docs["structure.xml"] = document.text
+            logger.info(
+                f"Loaded {xml_path.relative_to(context.repo_path)} ({len(document.text):,} chars)"
+            )
         else:
             logger.info(
                 f"No {xml_path.relative_to(context.repo_path)} found - structure docs not available"
             )
 
+    def _focus_structure_docs(self, context: ReviewContext) -> None:
+        """Keep only the structure of the directories a diff review touches.
+
+        Every reviewer prompt embeds the structure docs; for a diff the
+        directories of the changed files (and their parents) are what
+        matters, within the review_context.structure_max_tokens budget.
+        """
+        document = context.structure_document
+        max_tokens = get_settings().review_context.structure_max_tokens
+        if document is None or not context.files or not max_tokens:
+            return
+
+        prefix = f"{context.workspace_path.strip('/')}/" if context.workspace_path else ""
+        paths = [f.removeprefix(prefix) for f in context.files]
+        focused = document.render(paths=paths, max_tokens=max_tokens)
+        context.structure_docs["structure.xml"] = focused
+        logger.info(
+            f"Structure docs focused on {len(paths)} changed files "
+            f"({len(focused):,} of {len(document.text):,} chars)"
+        )
+
     async def _auto_generate_structure(
         self,
         context: ReviewContext,
@@ -793,16 +916,14 @@ class Orchestrator:
             raise
 
     async def _load_file_contents(self, context: ReviewContext) -> None:
-        """Load content of files in context."""
-        for file_path in context.files:
-            try:
-                full_path = context.repo_path / file_path if context.repo_path else Path(file_path)
-                if full_path.exists() and is_text_file(full_path):
-                    content = read_file(full_path)
-                    if len(content) < 50000:
-                        context.file_contents[file_path] = content
-            except Exception as e:
-                logger.warning(f"Failed to read {file_path}: {e}")
+        """Register the files in context; contents are read on demand."""
+        settings = get_settings().review_context
+        context.file_contents = ReviewFileView(
+            context.repo_path,
+            context.files,
+            max_file_bytes=settings.max_file_bytes,
+            max_cached_bytes=settings.max_cached_bytes,
+        )
 
     def _detect_repo_type(
         self,
@@ -828,10 +949,10 @@ class Orchestrator:
         # Priority 1: Parse type from structure.xml (authoritative source)
         if structure_docs:
             for path, content in structure_docs.items():
-                # XML format: <repository ... type="backend" ...>
+                # XML format: <repository ... type="backend" ...> (compact: <r ...>)
                 if "structure.xml" in path or content.strip().startswith("<?xml"):
                     match = re.search(
-                        r'<repository[^>]+type=["\'](\w+)["\']',
+                        r'<(?:repository|r)\s[^>]*type=["\'](\w+)["\']',
                         content,
                         re.IGNORECASE,
                     )
@@ -869,11 +990,21 @@ class Orchestrator:
             return detected
 
         logger.warning(
-            "No repo type found in structure docs. "
-            "Run structure generator to create structure.xml."
+            "No repo type found in structure docs. Run structure generator to create structure.xml."
         )
         return RepoType.UNKNOWN
 
+    @staticmethod
+    def _restore_checkpoint_issues(reviewer_name: str, checkpoint: dict[str, Any]) -> list[Issue]:
+        """Rebuild the issues saved in a reviewer checkpoint, skipping invalid entries."""
+        issues: list[Issue] = []
+        for data in checkpoint.get("issues_data") or []:
+            try:
+                issues.append(Issue.model_validate(data))
+            except ValueError as e:
+                logger.warning(f"Skipping invalid checkpointed issue of {reviewer_name}: {e}")
+        return issues
+
     def _get_reviewers(self, repo_type: RepoType, include_functional: bool) -> list[str]:
         """Get list of reviewers to run based on repo type.
 
@@ -1090,6 +1221,7 @@ class Orchestrator:
             reviewers=reviewer_results,
             challenger=challenger_metadata,
             issues=issues,
+            reviewed_files=list(context.files),
             next_steps=next_steps,
             evaluation=evaluation,
         )
@@ -20,6 +20,15 @@ Benefits vs old approach (15 CLI processes):
 - Cache shared within each LLM session
 - ~80% reduction in cache creation costs
 
+Large reviews are split into token-balanced shards (see
+review/utils/sharding.py); each provider then runs up to
+``workers_per_provider`` CLI processes at once, under a global cap.
+
+The fan-out follows a completion policy (see review/utils/hedging.py):
+once a quorum of providers succeeded, stragglers get a grace period and
+are then merged into the stored report in the background; a provider
+whose stream stalls gets a hedged restart.
+
 Uses turbowrap_llm package with TurboWrapTrackerAdapter for operation tracking.
 """
 
@@ -38,6 +47,12 @@ from typing import TYPE_CHECKING, Any
 from turbowrap_llm import ClaudeCLI, GeminiCLI, GrokCLI
 
 from turbowrap.config import get_settings
+from turbowrap.llm.prompt_layout import (
+    PromptLayout,
+    RenderedPrompt,
+    Stability,
+    get_prompt_cache_monitor,
+)
 from turbowrap.orchestration.report_utils import deduplicate_issues
 from turbowrap.review.models.review import (
     Issue,
@@ -45,7 +60,13 @@ from turbowrap.review.models.review import (
     ReviewOutput,
     ReviewSummary,
 )
-from turbowrap.review.reviewers.utils import convert_dict_to_review_output, parse_review_output
+from turbowrap.review.reviewers.utils import (
+    IncrementalJSONExtractor,
+    convert_dict_to_review_output,
+    parse_review_output,
+)
+from turbowrap.review.utils.hedging import CompletionPolicy, HedgedFanOut
+from turbowrap.review.utils.sharding import ReviewShard, plan_review_shards
 from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
 
 if TYPE_CHECKING:
@@ -56,6 +77,15 @@ logger = logging.getLogger(__name__)
 # Timeout for parallel review (longer since each CLI runs all specialists)
 PARALLEL_TIMEOUT = 900  # 15 minutes
 
+# Called with (llm, review) as soon as a specialist's JSON block closes in the stream
+SpecialistResultCallback = Callable[[str, ReviewOutput], Awaitable[None]]
+
+# Called with (llm, reviews) when a provider finishes after the straggler cutoff
+LateResultCallback = Callable[[str, dict[str, ReviewOutput]], Awaitable[None]]
+
+# Background deliveries of straggler results (kept referenced until done)
+_late_deliveries: set[asyncio.Task[None]] = set()
+
 
 # Agent descriptions extracted from frontmatter (avoid loading full MD content)
 AGENT_DESCRIPTIONS: dict[str, str] = {
@@ -118,6 +148,14 @@ class ParallelTripleLLMResult:
     gemini_reviews: dict[str, ReviewOutput] = field(default_factory=dict)
     grok_reviews: dict[str, ReviewOutput] = field(default_factory=dict)
 
+    # Number of file shards each LLM reviewed (1 = unsharded)
+    shards_count: int = 1
+
+    # Providers still running at the straggler cutoff (merged later if enabled)
+    late_providers: list[str] = field(default_factory=list)
+    # Provider -> number of hedged restarts
+    hedged_restarts: dict[str, int] = field(default_factory=dict)
+
 
 class ParallelTripleLLMRunner:
     """
@@ -155,6 +193,8 @@ class ParallelTripleLLMRunner:
         on_claude_chunk: Callable[[str], Awaitable[None]] | None = None,
         on_gemini_chunk: Callable[[str], Awaitable[None]] | None = None,
         on_grok_chunk: Callable[[str], Awaitable[None]] | None = None,
+        on_specialist_result: SpecialistResultCallback | None = None,
+        on_late_result: LateResultCallback | None = None,
     ) -> ParallelTripleLLMResult:
         """
         Run all 3 LLMs in PARALLEL, each executing all specialists.
@@ -165,35 +205,108 @@ class ParallelTripleLLMRunner:
             on_claude_chunk: Optional callback for Claude streaming output
             on_gemini_chunk: Optional callback for Gemini streaming output
             on_grok_chunk: Optional callback for Grok streaming output
+            on_specialist_result: Optional callback receiving each specialist review
+                as soon as it appears in an LLM's stream (before the CLI exits)
+            on_late_result: Optional callback receiving the reviews of a provider
+                that finished after the straggler cutoff (stragglers are
+                cancelled when not provided)
 
         Returns:
             ParallelTripleLLMResult with merged issues and per-LLM stats
         """
         start_time = time.time()
         files = file_list or context.files
-
-        # Build the parallel prompt (same for all LLMs)
-        prompt = self._build_parallel_prompt(context, files)
+        shards = self._plan_shards(context, files)
 
         logger.info(
             f"[PARALLEL-LLM] Starting review with {len(self.specialists)} specialists "
-            f"across 3 LLMs IN PARALLEL ({len(files)} files)"
+            f"across 3 LLMs IN PARALLEL ({len(files)} files, {len(shards)} shards)"
         )
 
-        # Launch 3 CLI IN PARALLEL
-        claude_task = asyncio.create_task(self._run_claude(context, prompt, on_claude_chunk))
-        gemini_task = asyncio.create_task(self._run_gemini(context, prompt, on_gemini_chunk))
-        grok_task = asyncio.create_task(self._run_grok(context, prompt, on_grok_chunk))
+        fan_out = HedgedFanOut(
+            self._completion_policy(),
+            accept=lambda result: isinstance(result, tuple) and bool(result[0]),
+        )
 
-        # Wait for all with exception handling
-        results = await asyncio.gather(claude_task, gemini_task, grok_task, return_exceptions=True)
+        def track(
+            llm: str, on_chunk: Callable[[str], Awaitable[None]] | None
+        ) -> Callable[[str], Awaitable[None]]:
+            """Record stream activity for stall detection before forwarding."""
+
+            async def on_tracked_chunk(chunk: str) -> None:
+                fan_out.touch(llm)
+                if on_chunk:
+                    await on_chunk(chunk)
+
+            return on_tracked_chunk
+
+        run_fns = {"claude": self._run_claude, "gemini": self._run_gemini, "grok": self._run_grok}
+        chunk_fns = {
+            "claude": track("claude", on_claude_chunk),
+            "gemini": track("gemini", on_gemini_chunk),
+            "grok": track("grok", on_grok_chunk),
+        }
+        starters: dict[str, Callable[[], Awaitable[tuple[dict[str, ReviewOutput], float]]]]
+        # Hedged restarts write their own output file ("_hedge1", ...) and only
+        # publish specialists that no earlier attempt of the provider published
+        attempts = dict.fromkeys(run_fns, 0)
+        published: dict[str, set[str]] = {llm: set() for llm in run_fns}
+
+        def attempt_suffix(llm: str) -> str:
+            attempts[llm] += 1
+            return f"_hedge{attempts[llm] - 1}" if attempts[llm] > 1 else ""
+
+        if len(shards) == 1:
+
+            def single(llm: str) -> Callable[[], Awaitable[tuple[dict[str, ReviewOutput], float]]]:
+                def start() -> Awaitable[tuple[dict[str, ReviewOutput], float]]:
+                    suffix = attempt_suffix(llm)
+                    # Every attempt (including hedged restarts) gets a fresh extractor
+                    return run_fns[llm](
+                        context,
+                        self._build_parallel_prompt(context, files, output_suffix=suffix),
+                        self._stream_specialists(
+                            llm, len(files), chunk_fns[llm], on_specialist_result, published[llm]
+                        ),
+                        output_suffix=suffix,
+                    )
 
-        claude_result, gemini_result, grok_result = results
+                return start
+
+            starters = {llm: single(llm) for llm in run_fns}
+        else:
+            sharding = self.settings.review_sharding
+            cli_slots = asyncio.Semaphore(sharding.max_concurrent_clis)
+
+            def sharded(llm: str) -> Callable[[], Awaitable[tuple[dict[str, ReviewOutput], float]]]:
+                return lambda: self._run_sharded(
+                    run_fns[llm],
+                    context,
+                    shards,
+                    chunk_fns[llm],
+                    cli_slots,
+                    llm,
+                    on_specialist_result,
+                    attempt_suffix=attempt_suffix(llm),
+                    published=published[llm],
+                )
+
+            starters = {llm: sharded(llm) for llm in run_fns}
+
+        # Launch 3 CLI IN PARALLEL, returning at the quorum/straggler cutoff
+        outcome = await fan_out.run(starters)
+        late_providers = sorted(outcome.stragglers)
+        if outcome.stragglers:
+            self._handle_stragglers(outcome.stragglers, on_late_result)
+
+        claude_result = outcome.results.get("claude")
+        gemini_result = outcome.results.get("gemini")
+        grok_result = outcome.results.get("grok")
 
         # Process results
-        claude_ok = not isinstance(claude_result, Exception)
-        gemini_ok = not isinstance(gemini_result, Exception)
-        grok_ok = not isinstance(grok_result, Exception)
+        claude_ok = not isinstance(claude_result, BaseException)
+        gemini_ok = not isinstance(gemini_result, BaseException)
+        grok_ok = not isinstance(grok_result, BaseException)
 
         claude_reviews: dict[str, ReviewOutput] = {}
         gemini_reviews: dict[str, ReviewOutput] = {}
@@ -203,49 +316,29 @@ class ParallelTripleLLMRunner:
             claude_reviews, claude_duration = claude_result
         else:
             claude_duration = 0.0
-            if isinstance(claude_result, Exception):
+            if isinstance(claude_result, BaseException):
                 logger.error(f"[PARALLEL-LLM] Claude failed: {claude_result}")
 
         if gemini_ok and isinstance(gemini_result, tuple):
             gemini_reviews, gemini_duration = gemini_result
         else:
             gemini_duration = 0.0
-            if isinstance(gemini_result, Exception):
+            if isinstance(gemini_result, BaseException):
                 logger.error(f"[PARALLEL-LLM] Gemini failed: {gemini_result}")
 
         if grok_ok and isinstance(grok_result, tuple):
             grok_reviews, grok_duration = grok_result
         else:
             grok_duration = 0.0
-            if isinstance(grok_result, Exception):
+            if isinstance(grok_result, BaseException):
                 logger.error(f"[PARALLEL-LLM] Grok failed: {grok_result}")
 
         # Collect all issues with source tagging
         all_issues: list[Issue] = []
 
-        for spec_name, review in claude_reviews.items():
-            for issue in review.issues:
-                if "claude" not in issue.flagged_by:
-                    issue.flagged_by.append("claude")
-                if spec_name not in issue.flagged_by:
-                    issue.flagged_by.append(spec_name)
-            all_issues.extend(review.issues)
-
-        for spec_name, review in gemini_reviews.items():
-            for issue in review.issues:
-                if "gemini" not in issue.flagged_by:
-                    issue.flagged_by.append("gemini")
-                if spec_name not in issue.flagged_by:
-                    issue.flagged_by.append(spec_name)
-            all_issues.extend(review.issues)
-
-        for spec_name, review in grok_reviews.items():
-            for issue in review.issues:
-                if "grok" not in issue.flagged_by:
-                    issue.flagged_by.append("grok")
-                if spec_name not in issue.flagged_by:
-                    issue.flagged_by.append(spec_name)
-            all_issues.extend(review.issues)
+        all_issues.extend(self._tag_issues("claude", claude_reviews))
+        all_issues.extend(self._tag_issues("gemini", gemini_reviews))
+        all_issues.extend(self._tag_issues("grok", grok_reviews))
 
         # Merge and deduplicate issues
         merged_issues = deduplicate_issues(all_issues)
@@ -284,16 +377,18 @@ class ParallelTripleLLMRunner:
         grok_issues_count = sum(len(r.issues) for r in grok_reviews.values())
 
         # Determine statuses
-        def _get_status(ok: bool, reviews: dict[str, ReviewOutput], result: Any) -> str:
+        def _get_status(llm: str, ok: bool, reviews: dict[str, ReviewOutput], result: Any) -> str:
             if ok and reviews:
                 return "ok"
+            if llm in outcome.stragglers:
+                return "late"
             if not ok:
                 return str(result)[:50]
             return "no_output"
 
-        claude_status = _get_status(claude_ok, claude_reviews, claude_result)
-        gemini_status = _get_status(gemini_ok, gemini_reviews, gemini_result)
-        grok_status = _get_status(grok_ok, grok_reviews, grok_result)
+        claude_status = _get_status("claude", claude_ok, claude_reviews, claude_result)
+        gemini_status = _get_status("gemini", gemini_ok, gemini_reviews, gemini_result)
+        grok_status = _get_status("grok", grok_ok, grok_reviews, grok_result)
 
         # Log results
         logger.info(
@@ -322,21 +417,253 @@ class ParallelTripleLLMRunner:
             claude_reviews=claude_reviews,
             gemini_reviews=gemini_reviews,
             grok_reviews=grok_reviews,
+            shards_count=len(shards),
+            late_providers=late_providers,
+            hedged_restarts=outcome.hedges,
+        )
+
+    def _completion_policy(self) -> CompletionPolicy:
+        """Build the fan-out completion policy from settings."""
+        hedging = self.settings.review_hedging
+        if not hedging.enabled:
+            # Wait for every provider, no hedged restarts (plain gather semantics)
+            return CompletionPolicy(quorum=3, stall_seconds=0.0)
+        return CompletionPolicy(
+            quorum=hedging.quorum,
+            grace_factor=hedging.grace_factor,
+            min_grace_seconds=hedging.min_grace_seconds,
+            stall_seconds=hedging.stall_seconds,
+            max_hedges=hedging.max_hedges,
+        )
+
+    @staticmethod
+    def _tag_issues(llm: str, reviews: dict[str, ReviewOutput]) -> list[Issue]:
+        """Tag every issue with its LLM and specialist; return them flattened."""
+        issues: list[Issue] = []
+        for spec_name, review in reviews.items():
+            for issue in review.issues:
+                if llm not in issue.flagged_by:
+                    issue.flagged_by.append(llm)
+                if spec_name not in issue.flagged_by:
+                    issue.flagged_by.append(spec_name)
+            issues.extend(review.issues)
+        return issues
+
+    def _handle_stragglers(
+        self,
+        stragglers: dict[str, asyncio.Task[Any]],
+        on_late_result: LateResultCallback | None,
+    ) -> None:
+        """Deliver straggler results in the background, or cancel them."""
+        if on_late_result is None or not self.settings.review_hedging.merge_late_results:
+            for task in stragglers.values():
+                task.cancel()
+            return
+
+        async def deliver(llm: str, task: asyncio.Task[Any]) -> None:
+            try:
+                reviews, duration = await asyncio.wait_for(task, timeout=self.timeout)
+            except Exception as e:
+                logger.warning(f"[PARALLEL-{llm.upper()}] Late run failed: {e}")
+                return
+            if not reviews:
+                return
+            self._tag_issues(llm, reviews)
+            logger.info(
+                f"[PARALLEL-{llm.upper()}] Late result after {duration:.0f}s: "
+                f"{sum(len(r.issues) for r in reviews.values())} issues"
+            )
+            try:
+                await on_late_result(llm, reviews)
+            except Exception as e:
+                logger.exception(f"[PARALLEL-{llm.upper()}] Late merge failed: {e}")
+
+        for llm, task in stragglers.items():
+            delivery = asyncio.create_task(deliver(llm, task))
+            _late_deliveries.add(delivery)
+            delivery.add_done_callback(_late_deliveries.discard)
+
+    def _plan_shards(self, context: ReviewContext, files: list[str]) -> list[ReviewShard]:
+        """Split the file list into token-balanced shards (one shard if disabled/small)."""
+        sharding = self.settings.review_sharding
+        if not sharding.enabled or len(files) < 2:
+            return [ReviewShard(index=0, files=list(files))]
+
+        # File paths are relative to the repo root, even in monorepo workspaces
+        shards = plan_review_shards(
+            files,
+            context.repo_path,
+            max_shard_tokens=sharding.max_shard_tokens,
+            max_shards=sharding.max_shards,
+        )
+        if len(shards) > 1:
+            sizes = ", ".join(f"{len(s.files)} files/{s.tokens} tok" for s in shards)
+            logger.info(f"[PARALLEL-LLM] Sharded review: {sizes}")
+        return shards
+
+    async def _run_sharded(
+        self,
+        run_fn: Callable[..., Awaitable[tuple[dict[str, ReviewOutput], float]]],
+        context: ReviewContext,
+        shards: list[ReviewShard],
+        on_chunk: Callable[[str], Awaitable[None]] | None,
+        cli_slots: asyncio.Semaphore,
+        llm: str,
+        on_specialist_result: SpecialistResultCallback | None = None,
+        attempt_suffix: str = "",
+        published: set[str] | None = None,
+    ) -> tuple[dict[str, ReviewOutput], float]:
+        """Run one provider over all shards with bounded concurrency.
+
+        At most ``workers_per_provider`` shards run at once for this provider,
+        and at most ``max_concurrent_clis`` CLI processes across providers.
+        Failed shards are logged and skipped; the provider only fails if
+        every shard failed. ``attempt_suffix`` and ``published`` keep hedged
+        restarts apart (see ``run``).
+        """
+        start_time = time.time()
+        provider_slots = asyncio.Semaphore(self.settings.review_sharding.workers_per_provider)
+
+        async def run_shard(shard: ReviewShard) -> dict[str, ReviewOutput]:
+            async with provider_slots, cli_slots:
+                suffix = f"_{shard.label}{attempt_suffix}"
+                prompt = self._build_parallel_prompt(context, shard.files, output_suffix=suffix)
+                # Each shard is a separate CLI stream, so it gets its own extractor
+                shard_chunk = self._stream_specialists(
+                    llm,
+                    len(shard.files),
+                    on_chunk,
+                    on_specialist_result,
+                    published,
+                    scope=f"{shard.label}:",
+                )
+                reviews, _ = await run_fn(
+                    context, prompt, shard_chunk, shard=shard, output_suffix=suffix
+                )
+                return reviews
+
+        results = await asyncio.gather(
+            *(run_shard(shard) for shard in shards), return_exceptions=True
         )
 
+        shard_reviews: list[dict[str, ReviewOutput]] = []
+        errors: list[BaseException] = []
+        for shard, result in zip(shards, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"[PARALLEL-{llm.upper()}] {shard.label} failed: {result}")
+                errors.append(result)
+            else:
+                shard_reviews.append(result)
+
+        if errors and not shard_reviews:
+            raise errors[0]
+
+        return self._merge_shard_reviews(shard_reviews), time.time() - start_time
+
+    def _stream_specialists(
+        self,
+        llm: str,
+        files_count: int,
+        on_chunk: Callable[[str], Awaitable[None]] | None,
+        on_specialist_result: SpecialistResultCallback | None,
+        published: set[str] | None = None,
+        scope: str = "",
+    ) -> Callable[[str], Awaitable[None]] | None:
+        """Wrap a CLI chunk callback to publish specialist reviews as they stream.
+
+        Each ``{"specialist": ..., "review": ...}`` object is converted and
+        passed to ``on_specialist_result`` as soon as its closing brace
+        arrives. The final result still comes from ``_parse_output``.
+
+        ``published`` is shared by the attempts of one provider: a specialist
+        (within ``scope``, e.g. a shard) is published once, by the first
+        attempt that streams it.
+        """
+        if on_specialist_result is None:
+            return on_chunk
+
+        extractor = IncrementalJSONExtractor(required_keys=("specialist", "review"))
+
+        async def on_stream_chunk(chunk: str) -> None:
+            if on_chunk:
+                await on_chunk(chunk)
+            for data in extractor.feed(chunk):
+                spec_name = str(data["specialist"])
+                review = convert_dict_to_review_output(
+                    data["review"], spec_name, files_count, flagged_by=[llm, spec_name]
+                )
+                if review is None:
+                    continue
+                if published is not None:
+                    if f"{scope}{spec_name}" in published:
+                        continue
+                    published.add(f"{scope}{spec_name}")
+                logger.info(
+                    f"[PARALLEL-{llm.upper()}] Streamed {spec_name}: {len(review.issues)} issues"
+                )
+                try:
+                    await on_specialist_result(llm, review)
+                except Exception as e:
+                    # A failing consumer must not abort the CLI stream
+                    logger.warning(f"[PARALLEL-{llm.upper()}] Specialist callback failed: {e}")
+
+        return on_stream_chunk
+
+    @staticmethod
+    def _merge_shard_reviews(
+        shard_reviews: list[dict[str, ReviewOutput]],
+    ) -> dict[str, ReviewOutput]:
+        """Combine per-shard specialist reviews into one review per specialist.
+
+        Shards cover disjoint files, so issues are concatenated; cross-LLM
+        duplicates are removed later by ``deduplicate_issues``.
+        """
+        merged: dict[str, ReviewOutput] = {}
+        for reviews in shard_reviews:
+            for spec_name, review in reviews.items():
+                existing = merged.get(spec_name)
+                if existing is None:
+                    merged[spec_name] = review.model_copy(deep=True)
+                    continue
+
+                a, b = existing.summary, review.summary
+                files_total = a.files_reviewed + b.files_reviewed
+                # Weight scores by files reviewed in each shard
+                if files_total:
+                    score = (a.score * a.files_reviewed + b.score * b.files_reviewed) / files_total
+                else:
+                    score = (a.score + b.score) / 2
+                existing.summary = ReviewSummary(
+                    files_reviewed=files_total,
+                    critical_issues=a.critical_issues + b.critical_issues,
+                    high_issues=a.high_issues + b.high_issues,
+                    medium_issues=a.medium_issues + b.medium_issues,
+                    low_issues=a.low_issues + b.low_issues,
+                    score=score,
+                )
+                existing.issues.extend(review.issues)
+                existing.model_usage.extend(review.model_usage)
+                existing.duration_seconds = max(existing.duration_seconds, review.duration_seconds)
+        return merged
+
     def _build_parallel_prompt(
         self,
         context: ReviewContext,
         file_list: list[str],
-    ) -> str:
+        output_suffix: str = "",
+    ) -> RenderedPrompt:
         """
         Build the prompt for parallel specialist execution.
 
         Key design: Does NOT embed full agent MD content.
         Instead, points to agents/ directory and provides short descriptions.
         Each CLI will read the MD files as needed.
+
+        Segments are ordered from most to least stable (instructions and output
+        schema, repository docs, shard file list, output path) so every run,
+        shard and re-review shares the longest possible cached prefix.
         """
-        sections = []
+        layout = PromptLayout()
 
         # Header with MANDATORY parallel execution instruction
         task_calls = "\n".join(
@@ -344,7 +671,8 @@ class ParallelTripleLLMRunner:
             for spec in self.specialists
         )
 
-        sections.append(
+        layout.add(
+            "header",
             f"""# Parallel Multi-Specialist Code Review
 
 ═══════════════════════════════════════════════════════════════════════════════
@@ -368,50 +696,96 @@ Each agent will:
 DO NOT execute specialists sequentially. Use PARALLEL Task calls.
 
 ═══════════════════════════════════════════════════════════════════════════════
-"""
+""",
         )
 
         # Specialist list with descriptions
-        sections.append("\n## Specialists to Launch\n")
+        specialists = ["\n## Specialists to Launch\n"]
         for i, spec_name in enumerate(self.specialists, 1):
             description = AGENT_DESCRIPTIONS.get(spec_name, f"Review specialist: {spec_name}")
-            sections.append(
+            specialists.append(
                 f"""
 ### {i}. {spec_name}
 - **Agent file**: `{self.settings.agents_dir}/{spec_name}.md`
 - **Focus**: {description}
 """
             )
+        layout.add("specialists", "".join(specialists))
+
+        layout.add(
+            "output_format",
+            """
+---
+## OUTPUT FORMAT
+
+For EACH specialist, output a JSON block:
+
+```json
+{"specialist": "<specialist_name>", "review": {
+  "summary": {
+    "files_reviewed": <int>,
+    "critical_issues": <int>,
+    "high_issues": <int>,
+    "medium_issues": <int>,
+    "low_issues": <int>,
+    "score": <float 1-10>
+  },
+  "issues": [
+    {
+      "code": "SPEC-001",
+      "severity": "critical|high|medium|low",
+      "category": "security|performance|architecture|style|logic|ux|testing|documentation",
+      "file": "path/to/file.py",
+      "line": <int or null>,
+      "title": "Brief title",
+      "description": "Detailed description",
+      "suggested_fix": "How to fix",
+      "effort": <1-5>
+    }
+  ]
+}}
+```
+""",
+        )
 
         # Repository context (brief)
         if context.structure_docs:
-            sections.append("\n## Repository Structure\n")
+            structure = ["\n## Repository Structure\n"]
             for path, content in context.structure_docs.items():
                 # Only include first 5000 chars of structure docs
                 if len(content) > 5000:
                     content = content[:5000] + "\n... (see full file)"
-                sections.append(f"### {path}\n{content}\n")
+                structure.append(f"### {path}\n{content}\n")
+            layout.add("structure", "".join(structure), Stability.REPOSITORY)
 
         if context.business_context:
-            sections.append(f"\n## Business Context\n{context.business_context}\n")
-
-        # File list
-        sections.append("\n## Files to Review\n")
-        for f in file_list:
-            sections.append(f"- `{f}`\n")
+            layout.add(
+                "business_context",
+                f"\n## Business Context\n{context.business_context}\n",
+                Stability.REPOSITORY,
+            )
 
         # Workspace constraint for monorepos
         if context.workspace_path:
-            sections.append(
+            layout.add(
+                "monorepo_scope",
                 f"""
 ## Monorepo Scope
 This is a monorepo review. Only analyze files within: `{context.workspace_path}/`
-"""
+""",
+                Stability.REPOSITORY,
             )
 
-        # Output format - use LLM-specific file names to avoid conflicts
+        # File list
+        layout.add(
+            "files",
+            "\n## Files to Review\n" + "".join(f"- `{f}`\n" for f in file_list),
+            Stability.SHARD,
+        )
+
+        # Output file - use LLM-specific file names to avoid conflicts
         # Note: llm_name will be substituted by each CLI's prompt builder
-        output_file = ".turbowrap_review_parallel_{llm}.json"
+        output_file = ".turbowrap_review_parallel_{llm}" + output_suffix + ".json"
         if context.repo_path:
             if context.workspace_path:
                 output_path = str(context.repo_path / context.workspace_path / output_file)
@@ -420,54 +794,27 @@ This is a monorepo review. Only analyze files within: `{context.workspace_path}/
         else:
             output_path = output_file
 
-        sections.append(
+        layout.add(
+            "instructions",
             f"""
----
-## OUTPUT FORMAT
-
-For EACH specialist, output a JSON block:
-
-```json
-{{"specialist": "<specialist_name>", "review": {{
-  "summary": {{
-    "files_reviewed": <int>,
-    "critical_issues": <int>,
-    "high_issues": <int>,
-    "medium_issues": <int>,
-    "low_issues": <int>,
-    "score": <float 1-10>
-  }},
-  "issues": [
-    {{
-      "code": "SPEC-001",
-      "severity": "critical|high|medium|low",
-      "category": "security|performance|architecture|style|logic|ux|testing|documentation",
-      "file": "path/to/file.py",
-      "line": <int or null>,
-      "title": "Brief title",
-      "description": "Detailed description",
-      "suggested_fix": "How to fix",
-      "effort": <1-5>
-    }}
-  ]
-}}}}
-```
-
 ## Instructions
 
 1. Read the files listed above
 2. Read each specialist's `.md` file from `{self.settings.agents_dir}/`
-3. Apply each specialist's perspective and output their JSON block
+3. Apply each specialist's perspective and output their JSON block (format above)
 4. Save all JSON blocks to: `{output_path}`
 5. Confirm: "Review saved to {output_path}"
 
 Output {len(self.specialists)} JSON blocks total, one per specialist.
-"""
+""",
+            Stability.VOLATILE,
         )
 
-        return "".join(sections)
+        return layout.render()
 
-    def _create_claude_cli(self, context: ReviewContext) -> ClaudeCLI:
+    def _create_claude_cli(
+        self, context: ReviewContext, shard: ReviewShard | None = None
+    ) -> ClaudeCLI:
         """Create ClaudeCLI instance with tracker adapter."""
         # Lazy import to avoid circular dependency
         from turbowrap.api.services.llm_adapters import TurboWrapTrackerAdapter
@@ -494,7 +841,8 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
                 "review_id": review_id,
                 "specialists": self.specialists,
                 "workspace_path": context.workspace_path,
-                "files_count": len(context.files) if context.files else 0,
+                "files_count": len(shard.files) if shard else len(context.files or []),
+                **({"shard": shard.label} if shard else {}),
             },
         )
 
@@ -511,18 +859,25 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         context: ReviewContext,
         prompt: str,
         on_chunk: Callable[[str], Awaitable[None]] | None,
+        shard: ReviewShard | None = None,
+        output_suffix: str = "",
     ) -> tuple[dict[str, ReviewOutput], float]:
-        """Run Claude CLI with parallel specialists."""
+        """Run Claude CLI with parallel specialists (optionally on one shard).
+
+        ``output_suffix`` must match the one the prompt was built with.
+        """
         start_time = time.time()
         # Substitute LLM name in output filename
         llm_prompt = prompt.replace("{llm}", "claude")
         try:
-            cli = self._create_claude_cli(context)
+            cli = self._create_claude_cli(context, shard)
             result = await cli.run(
                 prompt=llm_prompt,
                 on_chunk=on_chunk,
             )
 
+            get_prompt_cache_monitor().observe("claude", prompt, result)
+
             if not result.success:
                 logger.error(f"[PARALLEL-CLAUDE] Failed: {result.error}")
                 return {}, time.time() - start_time
@@ -530,9 +885,10 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
             reviews = self._parse_output(
                 result.output,
                 "claude",
-                len(context.files),
+                len(shard.files) if shard else len(context.files),
                 repo_path=context.repo_path,
                 workspace_path=context.workspace_path,
+                output_suffix=output_suffix,
             )
             return reviews, time.time() - start_time
 
@@ -540,7 +896,9 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
             logger.exception(f"[PARALLEL-CLAUDE] Exception: {e}")
             raise
 
-    def _create_gemini_cli(self, context: ReviewContext) -> GeminiCLI:
+    def _create_gemini_cli(
+        self, context: ReviewContext, shard: ReviewShard | None = None
+    ) -> GeminiCLI:
         """Create GeminiCLI instance with tracker adapter."""
         # Lazy import to avoid circular dependency
         from turbowrap.api.services.llm_adapters import TurboWrapTrackerAdapter
@@ -567,7 +925,8 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
                 "review_id": review_id,
                 "specialists": self.specialists,
                 "workspace_path": context.workspace_path,
-                "files_count": len(context.files) if context.files else 0,
+                "files_count": len(shard.files) if shard else len(context.files or []),
+                **({"shard": shard.label} if shard else {}),
             },
         )
 
@@ -583,18 +942,25 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         context: ReviewContext,
         prompt: str,
         on_chunk: Callable[[str], Awaitable[None]] | None,
+        shard: ReviewShard | None = None,
+        output_suffix: str = "",
     ) -> tuple[dict[str, ReviewOutput], float]:
-        """Run Gemini CLI with parallel specialists."""
+        """Run Gemini CLI with parallel specialists (optionally on one shard).
+
+        ``output_suffix`` must match the one the prompt was built with.
+        """
         start_time = time.time()
         # Substitute LLM name in output filename
         llm_prompt = prompt.replace("{llm}", "gemini")
         try:
-            cli = self._create_gemini_cli(context)
+            cli = self._create_gemini_cli(context, shard)
             result = await cli.run(
                 prompt=llm_prompt,
                 on_chunk=on_chunk,
             )
 
+            get_prompt_cache_monitor().observe("gemini", prompt, result)
+
             if not result.success:
                 logger.error(f"[PARALLEL-GEMINI] Failed: {result.error}")
                 return {}, time.time() - start_time
@@ -602,9 +968,10 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
             reviews = self._parse_output(
                 result.output,
                 "gemini",
-                len(context.files),
+                len(shard.files) if shard else len(context.files),
                 repo_path=context.repo_path,
                 workspace_path=context.workspace_path,
+                output_suffix=output_suffix,
             )
             return reviews, time.time() - start_time
 
@@ -612,7 +979,7 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
             logger.exception(f"[PARALLEL-GEMINI] Exception: {e}")
             raise
 
-    def _create_grok_cli(self, context: ReviewContext) -> GrokCLI:
+    def _create_grok_cli(self, context: ReviewContext, shard: ReviewShard | None = None) -> GrokCLI:
         """Create GrokCLI instance with tracker adapter."""
         # Lazy import to avoid circular dependency
         from turbowrap.api.services.llm_adapters import TurboWrapTrackerAdapter
@@ -639,7 +1006,8 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
                 "review_id": review_id,
                 "specialists": self.specialists,
                 "workspace_path": context.workspace_path,
-                "files_count": len(context.files) if context.files else 0,
+                "files_count": len(shard.files) if shard else len(context.files or []),
+                **({"shard": shard.label} if shard else {}),
             },
         )
 
@@ -655,18 +1023,25 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         context: ReviewContext,
         prompt: str,
         on_chunk: Callable[[str], Awaitable[None]] | None,
+        shard: ReviewShard | None = None,
+        output_suffix: str = "",
     ) -> tuple[dict[str, ReviewOutput], float]:
-        """Run Grok CLI with parallel specialists."""
+        """Run Grok CLI with parallel specialists (optionally on one shard).
+
+        ``output_suffix`` must match the one the prompt was built with.
+        """
         start_time = time.time()
         # Substitute LLM name in output filename
         llm_prompt = prompt.replace("{llm}", "grok")
         try:
-            cli = self._create_grok_cli(context)
+            cli = self._create_grok_cli(context, shard)
             result = await cli.run(
                 prompt=llm_prompt,
                 on_chunk=on_chunk,
             )
 
+            get_prompt_cache_monitor().observe("grok", prompt, result)
+
             if not result.success:
                 logger.error(f"[PARALLEL-GROK] Failed: {result.error}")
                 return {}, time.time() - start_time
@@ -674,9 +1049,10 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
             reviews = self._parse_output(
                 result.output,
                 "grok",
-                len(context.files),
+                len(shard.files) if shard else len(context.files),
                 repo_path=context.repo_path,
                 workspace_path=context.workspace_path,
+                output_suffix=output_suffix,
             )
             return reviews, time.time() - start_time
 
@@ -691,6 +1067,7 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         files_count: int,
         repo_path: Path | None = None,
         workspace_path: str | None = None,
+        output_suffix: str = "",
     ) -> dict[str, ReviewOutput]:
         """
         Parse multi-specialist JSON output from single CLI session.
@@ -699,8 +1076,9 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         and converts them to ReviewOutput objects.
 
         Strategy (in order):
-        1. Parse JSON blocks from stream output
-        2. Fallback: Read from saved .turbowrap_review_parallel.json file
+        1. Parse JSON objects from stream output (linear scan)
+        2. Fallback: Markdown "## SPECIALIST N:" sections
+        3. Fallback: Read from saved .turbowrap_review_parallel.json file
         """
         results: dict[str, ReviewOutput] = {}
 
@@ -708,62 +1086,21 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
             logger.warning(f"[PARALLEL-{llm.upper()}] Empty output")
             return results
 
-        # Strategy 1: Extract JSON blocks between ``` markers
-        json_blocks = re.findall(r"```json\s*(.*?)\s*```", output, re.DOTALL)
-
-        for block in json_blocks:
-            try:
-                data = json.loads(block.strip())
-                if isinstance(data, dict) and "specialist" in data and "review" in data:
-                    spec_name = data["specialist"]
-                    review_data = data["review"]
-                    # Use centralized converter with LLM and specialist tagging
-                    review = convert_dict_to_review_output(
-                        review_data, spec_name, files_count, flagged_by=[llm, spec_name]
-                    )
-                    if review:
-                        results[spec_name] = review
-                        n_issues = len(review.issues)
-                        logger.debug(
-                            f"[PARALLEL-{llm.upper()}] Parsed {spec_name}: {n_issues} issues"
-                        )
-            except json.JSONDecodeError as e:
-                logger.debug(f"[PARALLEL-{llm.upper()}] JSON block parse error: {e}")
-                continue
-
-        # Strategy 2: Find JSON objects without code blocks
-        if not results:
-            specialist_matches = list(re.finditer(r'\{\s*"specialist"\s*:', output))
-            for match in specialist_matches:
-                start = match.start()
-                brace_count = 0
-                end = start
-                for i, char in enumerate(output[start:], start):
-                    if char == "{":
-                        brace_count += 1
-                    elif char == "}":
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end = i + 1
-                            break
-
-                if end > start:
-                    try:
-                        json_str = output[start:end]
-                        data = json.loads(json_str)
-                        if "specialist" in data and "review" in data:
-                            spec_name = data["specialist"]
-                            review_data = data["review"]
-                            # Use centralized converter
-                            review = convert_dict_to_review_output(
-                                review_data, spec_name, files_count, flagged_by=[llm, spec_name]
-                            )
-                            if review:
-                                results[spec_name] = review
-                    except json.JSONDecodeError:
-                        continue
+        # Strategy 1: Extract {"specialist": ..., "review": ...} objects in a single
+        # linear pass (fenced ```json blocks and bare objects alike)
+        extractor = IncrementalJSONExtractor(required_keys=("specialist", "review"))
+        for data in extractor.feed(output):
+            spec_name = str(data["specialist"])
+            # Use centralized converter with LLM and specialist tagging
+            review = convert_dict_to_review_output(
+                data["review"], spec_name, files_count, flagged_by=[llm, spec_name]
+            )
+            if review:
+                results[spec_name] = review
+                n_issues = len(review.issues)
+                logger.debug(f"[PARALLEL-{llm.upper()}] Parsed {spec_name}: {n_issues} issues")
 
-        # Strategy 3: Fallback to markdown-style parsing
+        # Strategy 2: Fallback to markdown-style parsing
         if not results:
             logger.warning(f"[PARALLEL-{llm.upper()}] No JSON blocks found, trying markdown parse")
             for spec_name in self.specialists:
@@ -776,9 +1113,11 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
                         if review and review.issues:
                             results[spec_name] = review
 
-        # Strategy 4: Read from saved file (most reliable fallback)
+        # Strategy 3: Read from saved file (most reliable fallback)
         if not results and repo_path:
-            results = self._parse_from_saved_file(repo_path, workspace_path, llm, files_count)
+            results = self._parse_from_saved_file(
+                repo_path, workspace_path, llm, files_count, output_suffix
+            )
 
         logger.info(f"[PARALLEL-{llm.upper()}] Parsed {len(results)} specialist reviews")
         return results
@@ -789,6 +1128,7 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         workspace_path: str | None,
         llm: str,
         files_count: int,
+        output_suffix: str = "",
     ) -> dict[str, ReviewOutput]:
         """
         Read reviews from saved .turbowrap_review_parallel_{llm}.json file.
@@ -797,7 +1137,7 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         Each LLM has its own output file to avoid conflicts.
         """
         results: dict[str, ReviewOutput] = {}
-        output_file = f".turbowrap_review_parallel_{llm}.json"
+        output_file = f".turbowrap_review_parallel_{llm}{output_suffix}.json"
 
         # Determine file path (monorepo vs single repo)
         if workspace_path:
@@ -805,6 +1145,11 @@ Output {len(self.specialists)} JSON blocks total, one per specialist.
         else:
             file_path = Path(repo_path) / output_file
 
+        if not file_path.exists() and output_suffix:
+            # Shard outputs never use the legacy name (it would be shared by all shards)
+            logger.debug(f"[PARALLEL-{llm.upper()}] Saved file not found: {file_path}")
+            return results
+
         if not file_path.exists():
             # Fallback to legacy filename (without LLM suffix)
             legacy_file = ".turbowrap_review_parallel.json"
@@ -14,11 +14,13 @@ from typing import TYPE_CHECKING, Any
 
 from turbowrap.review.models.challenger import ChallengerFeedback
 from turbowrap.review.models.review import ReviewOutput, ReviewRequest, ReviewSummary
+from turbowrap.review.utils.file_view import ReviewFileView
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from turbowrap.review.reviewers.utils.s3_logger import S3Logger
+    from turbowrap.utils.structure_docs import StructureDocument
 
 
 @dataclass
@@ -30,7 +32,8 @@ class ReviewContext:
 
     # Files to review
     files: list[str] = field(default_factory=list)
-    file_contents: dict[str, str] = field(default_factory=dict)
+    # Read on demand, shared by all reviewers, capped in memory (see file_view.py)
+    file_contents: ReviewFileView = field(default_factory=ReviewFileView)
 
     # Git info
     diff: str | None = None
@@ -48,6 +51,8 @@ class ReviewContext:
 
     # Structure documentation (.llms/structure.xml)
     structure_docs: dict[str, str] = field(default_factory=dict)
+    # Parsed form of structure.xml, shared across reviews (see utils/structure_docs.py)
+    structure_document: StructureDocument | None = None
 
     # Business context (extracted from structure.xml or provided)
     business_context: str | None = None
@@ -59,6 +64,10 @@ class ReviewContext:
     # Metadata (e.g., review_id for S3 logging)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.file_contents, ReviewFileView):
+            self.file_contents = ReviewFileView.from_dict(self.file_contents)
+
     def get_files_summary(self) -> str:
         """Get a summary of files being reviewed."""
         if not self.files:
@@ -129,14 +138,20 @@ class ReviewContext:
         if structure_context:
             sections.append(structure_context)
 
-        for file_path, content in self.file_contents.items():
-            if total_chars + len(content) > max_chars:
-                remaining = max_chars - total_chars
-                if remaining > 1000:
-                    content = content[:remaining] + "\n... (truncated)"
-                else:
-                    sections.append(f"\n... ({len(self.file_contents) - len(sections)} more files)")
+        # Read only as much of each file as still fits, so the whole file set
+        # is never materialised at once
+        paths = list(self.file_contents)
+        for index, file_path in enumerate(paths):
+            remaining = max_chars - total_chars
+            try:
+                content = self.file_contents.read_prefix(file_path, remaining + 1)
+            except KeyError:
+                continue
+            if len(content) > remaining:
+                if remaining <= 1000:
+                    sections.append(f"\n... ({len(paths) - index} more files)")
                     break
+                content = content[:remaining] + "\n... (truncated)"
 
             sections.append(f"### {file_path}\n```\n{content}\n```\n")
             total_chars += len(content)
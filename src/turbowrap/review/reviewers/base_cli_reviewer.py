@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from turbowrap.config import get_settings
+from turbowrap.llm.prompt_layout import PromptLayout, RenderedPrompt, Stability
 from turbowrap.review.models.challenger import ChallengerFeedback
 from turbowrap.review.models.review import ReviewOutput
 from turbowrap.review.reviewers.base import BaseReviewer, ReviewContext
@@ -220,37 +221,39 @@ class BaseCLIReviewer(BaseReviewer):
         self,
         context: ReviewContext,
         file_list: list[str],
-    ) -> str:
-        """Build the review prompt for CLI."""
-        sections = []
+    ) -> RenderedPrompt:
+        """Build the review prompt for CLI.
+
+        Segments go from most to least stable (specialist prompt, repository
+        docs, file list, output path) to maximise provider prompt-cache hits.
+        """
+        layout = PromptLayout()
 
         # Include specialist prompt if available
         if context.agent_prompt:
-            sections.append(context.agent_prompt)
-            sections.append("\n---\n")
+            layout.add("agent_prompt", f"{context.agent_prompt}\n---\n")
 
         # Include structure docs for architectural context
         if context.structure_docs:
-            sections.append("## Repository Structure Documentation\n")
+            structure = ["## Repository Structure Documentation\n"]
             for path, content in context.structure_docs.items():
-                sections.append(f"### {path}\n{content}\n")
-            sections.append("\n---\n")
+                structure.append(f"### {path}\n{content}\n")
+            structure.append("\n---\n")
+            layout.add("structure", "".join(structure), Stability.REPOSITORY)
 
         # Include business context if available
         if context.business_context:
-            sections.append("## Business Context\n")
-            sections.append(context.business_context)
-            sections.append("\n\n---\n")
-
-        # File list to analyze
-        sections.append("## Files to Analyze\n")
-        sections.append("Read and analyze the following files:\n")
-        for f in file_list:
-            sections.append(f"- {f}\n")
+            layout.add(
+                "business_context",
+                f"## Business Context\n{context.business_context}\n\n---\n",
+                Stability.REPOSITORY,
+            )
 
         # Add workspace constraint for monorepos
         if context.workspace_path:
-            workspace_constraint = f"""
+            layout.add(
+                "monorepo_scope",
+                f"""
 ## IMPORTANT: Monorepo Workspace Scope
 
 This is a **monorepo** review. You MUST only analyze files within the workspace:
@@ -259,8 +262,17 @@ This is a **monorepo** review. You MUST only analyze files within the workspace:
 - **DO NOT** navigate to other apps/packages in the monorepo
 - If you need to explore imports, only follow them if they're within `{context.workspace_path}/`
 
-"""
-            sections.append(workspace_constraint)
+""",
+                Stability.REPOSITORY,
+            )
+
+        # File list to analyze
+        layout.add(
+            "files",
+            "## Files to Analyze\nRead and analyze the following files:\n"
+            + "".join(f"- {f}\n" for f in file_list),
+            Stability.SHARD,
+        )
 
         # Output file for this reviewer - use ABSOLUTE path
         output_file = str(self._get_output_file_path(context))
@@ -278,7 +290,8 @@ This is a **monorepo** review. You MUST only analyze files within the workspace:
                 "(imports, dependencies, tests) if needed"
             )
 
-        sections.append(
+        layout.add(
+            "instructions",
             f"""
 ## Important Instructions
 
@@ -289,10 +302,11 @@ This is a **monorepo** review. You MUST only analyze files within the workspace:
 5. **CRITICAL**: Save output to the ABSOLUTE path: `{output_file}`
 
 After writing, confirm with: "Review saved to {output_file}"
-"""
+""",
+            Stability.VOLATILE,
         )
 
-        return "".join(sections)
+        return layout.render()
 
     def _build_refinement_prompt(
         self,
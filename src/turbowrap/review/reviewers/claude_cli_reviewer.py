@@ -14,6 +14,7 @@ from typing import Any
 from turbowrap_llm import ClaudeCLI
 
 from turbowrap.config import get_settings
+from turbowrap.llm.prompt_layout import get_prompt_cache_monitor
 from turbowrap.review.models.challenger import ChallengerFeedback
 from turbowrap.review.models.review import ModelUsageInfo, ReviewOutput
 from turbowrap.review.reviewers.base import ReviewContext
@@ -148,6 +149,7 @@ class ClaudeCLIReviewer(BaseCLIReviewer):
             prompt=prompt,
             on_chunk=on_chunk,
         )
+        get_prompt_cache_monitor().observe("claude", prompt, result, model=self.model)
 
         # Check if CLI failed
         if not result.success:
@@ -17,7 +17,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Literal
 
+from turbowrap_llm.hooks import estimate_tokens
+
 from turbowrap.config import get_settings
+from turbowrap.llm.governor import get_llm_governor
 from turbowrap.review.models.challenger import ChallengerFeedback, ChallengerStatus, DimensionScores
 from turbowrap.review.models.review import ReviewOutput
 from turbowrap.review.reviewers.base import BaseReviewer, ReviewContext, S3LoggingMixin
@@ -181,11 +184,16 @@ class GeminiChallenger(BaseReviewer, S3LoggingMixin):
             from google import genai
 
             client = genai.Client(api_key=self.api_key)
-            response = await asyncio.to_thread(
-                client.models.generate_content,
-                model=self.settings.agents.gemini_model,
-                contents=prompt,
-            )
+            async with get_llm_governor().slot(
+                "gemini",
+                self.settings.agents.gemini_model,
+                input_tokens=estimate_tokens(prompt),
+            ):
+                response = await asyncio.to_thread(
+                    client.models.generate_content,
+                    model=self.settings.agents.gemini_model,
+                    contents=prompt,
+                )
             text_result: str | None = response.text
             if text_result is None:
                 return self._get_fallback_response()
@@ -204,6 +212,18 @@ class GeminiChallenger(BaseReviewer, S3LoggingMixin):
         on_chunk: Callable[[str], Awaitable[None]] | None,
     ) -> str | None:
         """Call Gemini via CLI subprocess."""
+        async with get_llm_governor().slot(
+            "gemini", self.settings.agents.gemini_model, input_tokens=estimate_tokens(prompt)
+        ):
+            return await self._run_cli_process(prompt, repo_path, on_chunk)
+
+    async def _run_cli_process(
+        self,
+        prompt: str,
+        repo_path: Path | None,
+        on_chunk: Callable[[str], Awaitable[None]] | None,
+    ) -> str | None:
+        """Run the Gemini CLI subprocess (called with a governor slot held)."""
         from turbowrap.utils.aws_secrets import get_google_api_key
 
         cwd = str(repo_path) if repo_path else None
@@ -15,6 +15,7 @@ from collections.abc import Awaitable, Callable
 from turbowrap_llm import GeminiCLI
 
 from turbowrap.config import get_settings
+from turbowrap.llm.prompt_layout import get_prompt_cache_monitor
 from turbowrap.review.reviewers.base import ReviewContext
 from turbowrap.review.reviewers.base_cli_reviewer import BaseCLIReviewer
 from turbowrap.review.reviewers.constants import DEFAULT_CLI_TIMEOUT
@@ -121,6 +122,7 @@ class GeminiCLIReviewer(BaseCLIReviewer):
                 prompt=prompt,
                 on_chunk=on_chunk,
             )
+            get_prompt_cache_monitor().observe("gemini", prompt, result, model=self.model)
 
             if not result.success:
                 return None, result.error or "GeminiCLI failed"
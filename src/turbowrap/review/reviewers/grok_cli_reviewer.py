@@ -13,6 +13,7 @@ import logging
 from collections.abc import Awaitable, Callable
 
 from turbowrap.llm.grok import DEFAULT_GROK_MODEL, GrokCLI
+from turbowrap.llm.prompt_layout import get_prompt_cache_monitor
 from turbowrap.review.reviewers.base import ReviewContext
 from turbowrap.review.reviewers.base_cli_reviewer import BaseCLIReviewer
 from turbowrap.review.reviewers.constants import DEFAULT_CLI_TIMEOUT
@@ -102,6 +103,7 @@ class GrokCLIReviewer(BaseCLIReviewer):
                     "workspace_path": context.workspace_path,
                 },
             )
+            get_prompt_cache_monitor().observe("grok", prompt, result, model=self.model)
 
             if not result.success:
                 return None, result.error or "GrokCLI failed"
@@ -9,6 +9,7 @@ Centralized modules for:
 """
 
 from turbowrap.review.reviewers.utils.json_extraction import (
+    IncrementalJSONExtractor,
     JSONExtractionError,
     extract_json,
     extract_json_from_llm,
@@ -35,6 +36,7 @@ __all__ = [
     "parse_json_safe",
     "parse_llm_json",
     "JSONExtractionError",
+    "IncrementalJSONExtractor",
     # S3 logging
     "S3Logger",
     "S3ArtifactMetadata",
@@ -222,3 +222,97 @@ def parse_llm_json(output: str, default: Any = None) -> Any:
         except json.JSONDecodeError:
             pass
     return default
+
+
+class IncrementalJSONExtractor:
+    """
+    Extract top-level JSON objects from streamed text as they complete.
+
+    Feed output chunks as they arrive; each call returns the objects whose
+    closing brace was in the new data. Every character is scanned once, so
+    extraction is linear in the output size. Prose around the objects
+    (markdown fences, explanations) is skipped; a ``{`` only opens an
+    object when followed by ``"`` or ``}``.
+
+    Usage:
+        extractor = IncrementalJSONExtractor(required_keys=("specialist", "review"))
+        async def on_chunk(chunk: str) -> None:
+            for obj in extractor.feed(chunk):
+                handle(obj)
+    """
+
+    def __init__(self, required_keys: tuple[str, ...] = ()):
+        """
+        Args:
+            required_keys: Only return objects containing all of these keys
+        """
+        self.required_keys = required_keys
+        self._buffer = ""
+        self._pos = 0  # Next character to scan
+        self._start = -1  # Start of the current object (-1 = outside objects)
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Add a chunk of output and return newly completed objects."""
+        self._buffer += chunk
+        found: list[dict[str, Any]] = []
+        buffer = self._buffer
+        i = self._pos
+
+        while i < len(buffer):
+            char = buffer[i]
+
+            if self._start < 0:
+                if char == "{":
+                    # Look ahead for the first non-space character
+                    j = i + 1
+                    while j < len(buffer) and buffer[j].isspace():
+                        j += 1
+                    if j == len(buffer):
+                        break  # Need more data to decide
+                    if buffer[j] in '"}':
+                        self._start = i
+                        self._depth = 1
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    obj = self._decode(buffer[self._start : i + 1])
+                    if obj is not None:
+                        found.append(obj)
+                    self._start = -1
+            i += 1
+
+        # Drop scanned text that can't be part of a pending object
+        keep_from = self._start if self._start >= 0 else i
+        self._buffer = buffer[keep_from:]
+        self._pos = i - keep_from
+        if self._start >= 0:
+            self._start = 0
+        return found
+
+    def _decode(self, text: str) -> dict[str, Any] | None:
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(obj, dict):
+            return None
+        if any(key not in obj for key in self.required_keys):
+            return None
+        return cast(dict[str, Any], obj)
@@ -91,7 +91,10 @@ class S3Logger:
             return None
 
         md_content = self._build_thinking_markdown(content, metadata, files_reviewed)
-        return await self._upload(md_content, "thinking", metadata)
+        s3_url = await self._upload(md_content, "thinking", metadata)
+        if s3_url:
+            await self._index_thinking(s3_url, metadata, len(md_content.encode("utf-8")))
+        return s3_url
 
     async def save_review(
         self,
@@ -171,6 +174,24 @@ class S3Logger:
             logger.warning(f"[S3_LOGGER] Upload failed: {e}")
             return None
 
+    async def _index_thinking(
+        self, s3_url: str, metadata: S3ArtifactMetadata, size_bytes: int
+    ) -> None:
+        """Record the log key so the thinking API finds it without listing."""
+        from turbowrap.utils.thinking_logs import ThinkingLogIndex
+
+        s3_key = s3_url.removeprefix(f"s3://{self.bucket}/")
+        try:
+            await asyncio.to_thread(
+                ThinkingLogIndex(self.client, self.bucket).record,
+                metadata.review_id,
+                metadata.component,
+                s3_key,
+                size_bytes,
+            )
+        except ClientError as e:
+            logger.warning(f"[S3_LOGGER] Thinking index update failed: {e}")
+
     def _build_thinking_markdown(
         self,
         content: str,
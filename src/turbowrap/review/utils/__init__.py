@@ -2,7 +2,11 @@
 Utilities for TurboWrap review.
 """
 
+from turbowrap.review.utils.file_view import ReviewFileView
+from turbowrap.review.utils.fingerprint import issue_fingerprint
 from turbowrap.review.utils.repo_detector import RepoDetector, detect_repo_type
+from turbowrap.review.utils.sharding import ReviewShard, plan_review_shards
+from turbowrap.review.utils.similarity import cluster_similar_issues
 from turbowrap.utils.git_utils import CommitInfo, GitUtils, PRInfo
 
 __all__ = [
@@ -11,4 +15,9 @@ __all__ = [
     "CommitInfo",
     "RepoDetector",
     "detect_repo_type",
+    "ReviewShard",
+    "plan_review_shards",
+    "issue_fingerprint",
+    "cluster_similar_issues",
+    "ReviewFileView",
 ]
@@ -0,0 +1,267 @@
+"""
+Lazy, memory-capped view of the files under review.
+
+ReviewContext used to read every reviewed file into a dict up front, so each
+review held its whole file set in memory for its entire lifetime - and
+several large-repo reviews at once could exhaust the API container.
+
+ReviewFileView only registers paths (a stat per file). Contents are read on
+demand through mmap, kept in an LRU bounded by a hard byte ceiling per
+review, shared by every reviewer using the same context, and dropped with
+release() when the review ends. Files that would not fit under the ceiling
+are returned without being cached.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any
+
+from turbowrap_llm.hooks import estimate_tokens
+
+from turbowrap.utils.file_utils import is_text_file
+
+logger = logging.getLogger(__name__)
+
+# Same limit the orchestrator used when loading contents eagerly
+DEFAULT_MAX_FILE_BYTES = 50000
+DEFAULT_MAX_CACHED_BYTES = 32 * 1024 * 1024
+
+
+def read_text_mapped(path: Path, max_bytes: int | None = None) -> str:
+    """Read a UTF-8 file through mmap.
+
+    Args:
+        path: File to read
+        max_bytes: Only decode this many leading bytes (a split trailing
+            character is dropped)
+
+    Returns:
+        File content
+
+    Raises:
+        OSError, UnicodeDecodeError: If the file can't be read as UTF-8
+    """
+    with path.open("rb") as fh:
+        size = path.stat().st_size
+        if size == 0:
+            return ""
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if max_bytes is None or max_bytes >= size:
+                return mapped[:].decode("utf-8")
+            return mapped[:max_bytes].decode("utf-8", errors="ignore")
+
+
+class ReviewFileView(MutableMapping[str, str]):
+    """``file_contents`` of a ReviewContext: path -> content, read on demand.
+
+    Behaves like the dict it replaces. Keys are the registered paths that
+    exist, look like text and are within ``max_file_bytes``; assigned items
+    are kept as-is (never evicted) for callers that provide content
+    themselves.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        paths: Iterable[str] = (),
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES,
+    ):
+        """Initialize view.
+
+        Args:
+            root: Repository root the paths are relative to
+            paths: Files to make available
+            max_file_bytes: Larger files are skipped
+            max_cached_bytes: Ceiling on decoded content kept in memory
+        """
+        self.root = root
+        self.max_file_bytes = max_file_bytes
+        self.max_cached_bytes = max_cached_bytes
+        self._lock = threading.Lock()
+        self._paths: dict[str, Path] = {}
+        self._pinned: dict[str, str] = {}
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cached_bytes = 0
+        self._stats = {"reads": 0, "hits": 0, "evictions": 0, "uncached": 0, "peak_bytes": 0}
+        self.register(paths)
+
+    @classmethod
+    def from_dict(cls, contents: Mapping[str, str]) -> ReviewFileView:
+        """View over content that is already in memory."""
+        view = cls()
+        view.update(contents)
+        return view
+
+    def register(self, paths: Iterable[str]) -> int:
+        """Make files available without reading them.
+
+        Returns:
+            Number of files registered
+        """
+        added = 0
+        for file_path in paths:
+            full_path = self.root / file_path if self.root else Path(file_path)
+            try:
+                if not full_path.is_file() or not is_text_file(full_path):
+                    continue
+                if full_path.stat().st_size >= self.max_file_bytes:
+                    continue
+            except OSError as e:
+                logger.warning(f"Failed to stat {file_path}: {e}")
+                continue
+            self._paths[file_path] = full_path
+            added += 1
+        return added
+
+    # -- Mapping protocol ---------------------------------------------------
+
+    def __getitem__(self, file_path: str) -> str:
+        with self._lock:
+            if file_path in self._pinned:
+                return self._pinned[file_path]
+            if file_path in self._cache:
+                self._cache.move_to_end(file_path)
+                self._stats["hits"] += 1
+                return self._cache[file_path]
+            full_path = self._paths.get(file_path)
+        if full_path is None:
+            raise KeyError(file_path)
+
+        try:
+            content = read_text_mapped(full_path)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to read {file_path}: {e}")
+            self._paths.pop(file_path, None)
+            raise KeyError(file_path) from e
+
+        self._admit(file_path, content)
+        return content
+
+    def __setitem__(self, file_path: str, content: str) -> None:
+        with self._lock:
+            self._drop(file_path)
+            self._pinned[file_path] = content
+            self._paths.pop(file_path, None)
+
+    def __delitem__(self, file_path: str) -> None:
+        with self._lock:
+            if file_path not in self._pinned and file_path not in self._paths:
+                raise KeyError(file_path)
+            self._drop(file_path)
+            self._pinned.pop(file_path, None)
+            self._paths.pop(file_path, None)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._pinned)
+        yield from list(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._paths)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._pinned or file_path in self._paths
+
+    def __repr__(self) -> str:
+        return f"ReviewFileView(files={len(self)}, cached_bytes={self._cached_bytes})"
+
+    # -- Streaming access ---------------------------------------------------
+
+    def read_prefix(self, file_path: str, max_chars: int) -> str:
+        """At most ``max_chars`` leading characters, without reading the rest.
+
+        Raises:
+            KeyError: If the file isn't available
+        """
+        with self._lock:
+            content = self._pinned.get(file_path, self._cache.get(file_path))
+            full_path = self._paths.get(file_path)
+        if content is not None:
+            return content[:max_chars]
+        if full_path is None:
+            raise KeyError(file_path)
+        try:
+            if full_path.stat().st_size <= max_chars:
+                return self[file_path]
+            # UTF-8 is at least one byte per character
+            return read_text_mapped(full_path, max_bytes=max_chars)
+        except OSError as e:
+            logger.warning(f"Failed to read {file_path}: {e}")
+            raise KeyError(file_path) from e
+
+    def iter_chunks(self, max_tokens: int) -> Iterator[list[tuple[str, str]]]:
+        """Group files into chunks of at most ``max_tokens`` estimated tokens.
+
+        A file larger than the budget forms its own chunk. Only the current
+        chunk is held by the generator; earlier ones can be evicted.
+        """
+        chunk: list[tuple[str, str]] = []
+        chunk_tokens = 0
+        for file_path in self:
+            content = self.get(file_path)
+            if content is None:
+                continue
+            tokens = estimate_tokens(content)
+            if chunk and chunk_tokens + tokens > max_tokens:
+                yield chunk
+                chunk, chunk_tokens = [], 0
+            chunk.append((file_path, content))
+            chunk_tokens += tokens
+        if chunk:
+            yield chunk
+
+    # -- Memory management --------------------------------------------------
+
+    def release(self) -> None:
+        """Drop every cached and assigned content (paths stay registered)."""
+        with self._lock:
+            self._cache.clear()
+            self._pinned.clear()
+            self._cached_bytes = 0
+        logger.info(
+            f"[REVIEW FILES] Released {len(self._paths)} files "
+            f"(reads={self._stats['reads']}, hits={self._stats['hits']}, "
+            f"evictions={self._stats['evictions']}, peak={self._stats['peak_bytes']} bytes)"
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters and current memory use."""
+        with self._lock:
+            return {
+                **self._stats,
+                "files": len(self),
+                "cached_files": len(self._cache),
+                "cached_bytes": self._cached_bytes,
+                "max_cached_bytes": self.max_cached_bytes,
+            }
+
+    def _admit(self, file_path: str, content: str) -> None:
+        size = sys.getsizeof(content)
+        with self._lock:
+            self._stats["reads"] += 1
+            if file_path in self._pinned or file_path not in self._paths:
+                return
+            if size > self.max_cached_bytes:
+                self._stats["uncached"] += 1
+                return
+            self._drop(file_path)
+            while self._cache and self._cached_bytes + size > self.max_cached_bytes:
+                _evicted, old = self._cache.popitem(last=False)
+                self._cached_bytes -= sys.getsizeof(old)
+                self._stats["evictions"] += 1
+            self._cache[file_path] = content
+            self._cached_bytes += size
+            self._stats["peak_bytes"] = max(self._stats["peak_bytes"], self._cached_bytes)
+
+    def _drop(self, file_path: str) -> None:
+        """Remove a cached entry (lock held)."""
+        old = self._cache.pop(file_path, None)
+        if old is not None:
+            self._cached_bytes -= sys.getsizeof(old)
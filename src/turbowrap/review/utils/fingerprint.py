@@ -0,0 +1,104 @@
+"""
+Stable issue fingerprints for cross-review identity.
+
+The same problem reported by different reviews (or LLMs) usually differs
+in issue code, exact line and wording. The fingerprint only uses the parts
+that survive re-reviews: the normalised file path, the category, a hash of
+the flagged code window and the significant words of the title.
+"""
+
+import hashlib
+import re
+
+# Lines per bucket when an issue has no code snippet to hash
+LINE_BUCKET = 20
+
+# Words ignored when building title keys
+_STOPWORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "from",
+        "into",
+        "that",
+        "this",
+        "are",
+        "not",
+        "missing",
+        "potential",
+        "possible",
+        "should",
+        "could",
+        "use",
+        "using",
+        "issue",
+    }
+)
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_issue_path(path: str | None) -> str:
+    """Normalise a file path as reported by reviewers (``./src\\a.py`` -> ``src/a.py``)."""
+    if not path:
+        return ""
+    normalized = path.strip().replace("\\", "/")
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    return re.sub(r"/+", "/", normalized).lstrip("/")
+
+
+def title_tokens(text: str | None) -> list[str]:
+    """Significant lowercase words of a title, sorted and unique."""
+    if not text:
+        return []
+    words = {
+        word
+        for word in _WORD_RE.findall(text.lower())
+        if len(word) > 2 and word not in _STOPWORDS and not word.isdigit()
+    }
+    return sorted(words)
+
+
+def code_window_hash(code: str | None) -> str | None:
+    """Whitespace-insensitive hash of a code snippet (None if empty)."""
+    if not code or not code.strip():
+        return None
+    normalized = _SPACE_RE.sub(" ", code).strip()
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+
+def issue_fingerprint(
+    file: str | None,
+    category: str,
+    title: str | None,
+    current_code: str | None = None,
+    line: int | None = None,
+) -> str:
+    """Compute the cross-review fingerprint of an issue.
+
+    Args:
+        file: Reported file path
+        category: Issue category value (e.g. "security")
+        title: Issue title
+        current_code: Flagged code snippet, if any
+        line: Line number, used (bucketed) only when there is no snippet
+
+    Returns:
+        40-character hex digest
+    """
+    location = code_window_hash(current_code)
+    if location is None:
+        location = f"L{(line or 0) // LINE_BUCKET}"
+    key = "|".join(
+        [
+            normalize_issue_path(file),
+            category.lower(),
+            location,
+            " ".join(title_tokens(title)),
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:40]
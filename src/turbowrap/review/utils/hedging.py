@@ -0,0 +1,173 @@
+"""
+Completion policy for fanning out one review to several LLM providers.
+
+Instead of waiting for the slowest provider, the fan-out returns once a
+quorum of providers succeeded and the stragglers used up their grace
+period. A provider whose stream goes quiet for too long gets a hedged
+restart: a second attempt runs alongside the first and whichever finishes
+first wins. Stragglers are not cancelled; the caller receives their tasks
+and can merge their results later.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# How often provider attempts are checked for stalled streams
+STALL_POLL_INTERVAL = 1.0
+
+
+@dataclass
+class CompletionPolicy:
+    """When to stop waiting for providers."""
+
+    quorum: int = 3
+    grace_factor: float = 0.5
+    min_grace_seconds: float = 120.0
+    stall_seconds: float = 0.0  # 0 = no hedged restarts
+    max_hedges: int = 1
+    poll_interval: float = STALL_POLL_INTERVAL
+
+
+@dataclass
+class FanOutResult:
+    """Outcome of a hedged fan-out."""
+
+    # Provider name -> result or exception, for providers that finished in time
+    results: dict[str, Any] = field(default_factory=dict)
+    # Provider name -> seconds from start to finish
+    durations: dict[str, float] = field(default_factory=dict)
+    # Provider name -> task still running after the cutoff
+    stragglers: dict[str, asyncio.Task[Any]] = field(default_factory=dict)
+    # Provider name -> number of hedged restarts started
+    hedges: dict[str, int] = field(default_factory=dict)
+
+
+class HedgedFanOut:
+    """Run providers concurrently under a CompletionPolicy.
+
+    Call ``touch(name)`` whenever a provider streams output; providers that
+    stay silent for ``stall_seconds`` are restarted (up to ``max_hedges``).
+
+    Usage:
+        fan_out = HedgedFanOut(policy, accept=lambda r: bool(r[0]))
+        result = await fan_out.run({"claude": start_claude, "gemini": start_gemini})
+    """
+
+    def __init__(
+        self,
+        policy: CompletionPolicy,
+        accept: Callable[[Any], bool] = bool,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            policy: Quorum, grace and hedging parameters
+            accept: Whether a provider result counts towards the quorum
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.policy = policy
+        self.accept = accept
+        self.clock = clock
+        self._last_activity: dict[str, float] = {}
+        self._hedges: dict[str, int] = {}
+
+    def touch(self, name: str) -> None:
+        """Record stream activity for a provider."""
+        self._last_activity[name] = self.clock()
+
+    async def run(self, starters: dict[str, Callable[[], Awaitable[Any]]]) -> FanOutResult:
+        """Start every provider and return at the quorum/grace cutoff.
+
+        Args:
+            starters: Provider name -> factory returning a new attempt coroutine
+
+        Returns:
+            FanOutResult; providers still running are in ``stragglers``
+        """
+        start = self.clock()
+        tasks = {
+            asyncio.create_task(self._run_hedged(name, starter)): name
+            for name, starter in starters.items()
+        }
+        result = FanOutResult()
+        pending = set(tasks)
+        deadline: float | None = None
+
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - self.clock())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break  # Grace period over
+
+            for task in done:
+                name = tasks[task]
+                result.durations[name] = self.clock() - start
+                error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                result.results[name] = error if error is not None else task.result()
+
+            succeeded = [
+                name
+                for name, value in result.results.items()
+                if not isinstance(value, BaseException) and self.accept(value)
+            ]
+            if deadline is None and pending and len(succeeded) >= self.policy.quorum:
+                fastest = min(result.durations[name] for name in succeeded)
+                grace = max(self.policy.min_grace_seconds, self.policy.grace_factor * fastest)
+                deadline = self.clock() + grace
+                logger.info(
+                    f"[HEDGE] Quorum reached ({', '.join(sorted(succeeded))}), "
+                    f"waiting {grace:.0f}s for stragglers"
+                )
+
+        result.stragglers = {tasks[task]: task for task in pending}
+        result.hedges = dict(self._hedges)
+        if result.stragglers:
+            logger.warning(f"[HEDGE] Cutoff: continuing without {sorted(result.stragglers)}")
+        return result
+
+    async def _run_hedged(self, name: str, starter: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one provider, starting a second attempt if its stream stalls."""
+        self.touch(name)
+        attempts: set[asyncio.Future[Any]] = {asyncio.ensure_future(starter())}
+        errors: list[BaseException] = []
+        try:
+            while attempts:
+                done, attempts = await asyncio.wait(
+                    attempts, timeout=self.policy.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                    if error is None:
+                        return task.result()
+                    errors.append(error)
+
+                if not attempts:
+                    break
+
+                hedges = self._hedges.get(name, 0)
+                idle = self.clock() - self._last_activity.get(name, 0.0)
+                if (
+                    self.policy.stall_seconds > 0
+                    and hedges < self.policy.max_hedges
+                    and idle >= self.policy.stall_seconds
+                ):
+                    self._hedges[name] = hedges + 1
+                    self.touch(name)
+                    logger.warning(
+                        f"[HEDGE] {name} silent for {idle:.0f}s, starting hedged attempt {hedges + 1}"
+                    )
+                    attempts.add(asyncio.ensure_future(starter()))
+
+            raise errors[-1]
+        finally:
+            # First successful attempt wins; losers (or all, on cancel) are stopped
+            for task in attempts:
+                task.cancel()
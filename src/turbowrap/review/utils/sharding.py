@@ -0,0 +1,90 @@
+"""
+Token-balanced sharding of review file lists.
+
+Large repositories are split into shards so several CLI workers per
+provider can review them concurrently. Shards are contiguous runs of the
+path-sorted file list, so files from the same directory stay together and
+each shard's prompt keeps a stable, cache-friendly shape.
+"""
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from turbowrap.utils.file_utils import count_file_tokens
+
+# How far past an even cut point (fraction of a shard) to look for a directory boundary
+DIRECTORY_SLACK = 0.25
+
+
+@dataclass
+class ReviewShard:
+    """A slice of the review file list."""
+
+    index: int
+    files: list[str] = field(default_factory=list)
+    tokens: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"shard{self.index + 1}"
+
+
+def plan_review_shards(
+    files: list[str],
+    repo_path: Path | None,
+    max_shard_tokens: int,
+    max_shards: int,
+    token_counter: Callable[[Path], int] = count_file_tokens,
+) -> list[ReviewShard]:
+    """Partition files into token-balanced, directory-local shards.
+
+    The shard count is the smallest that keeps shards under
+    ``max_shard_tokens`` (capped at ``max_shards``). Files are sorted by
+    path and cut into contiguous runs at even fractions of the total token
+    count, so a shard boundary only splits a directory when that directory
+    alone is larger than a shard.
+
+    Args:
+        files: Relative file paths to review
+        repo_path: Repository root (token counts are 0 without it)
+        max_shard_tokens: Target upper bound of tokens per shard
+        max_shards: Maximum number of shards
+        token_counter: Returns the token count of a file
+
+    Returns:
+        Non-empty shards in path order (one shard if no split is needed)
+    """
+    ordered = sorted(files, key=lambda f: (str(Path(f).parent), Path(f).name))
+    counts = [token_counter(repo_path / f) if repo_path else 0 for f in ordered]
+    total = sum(counts)
+
+    shard_count = max(1, min(max_shards, len(ordered), math.ceil(total / max_shard_tokens)))
+    if shard_count == 1:
+        return [ReviewShard(index=0, files=list(files), tokens=total)]
+
+    target = total / shard_count
+    shards = [ReviewShard(index=0)]
+    cumulative = 0
+    previous_dir: Path | None = None
+    for path, tokens in zip(ordered, counts, strict=True):
+        current = shards[-1]
+        directory = Path(path).parent
+        # Cut once the running total passes the next even fraction of the total,
+        # preferring a directory boundary within DIRECTORY_SLACK of that point
+        boundary = target * len(shards)
+        if (
+            current.files
+            and cumulative >= boundary
+            and len(shards) < shard_count
+            and (directory != previous_dir or cumulative >= boundary + target * DIRECTORY_SLACK)
+        ):
+            current = ReviewShard(index=len(shards))
+            shards.append(current)
+        current.files.append(path)
+        current.tokens += tokens
+        cumulative += tokens
+        previous_dir = directory
+
+    return shards
@@ -0,0 +1,189 @@
+"""
+Near-duplicate detection for review issues.
+
+Different LLMs report the same problem a few lines apart, under another
+category or with different wording. Issues are grouped per file and only
+compared with issues within a small line window, so the work stays
+near-linear in the number of issues. Candidates are scored with shingle
+(Jaccard) similarity on title, description and flagged code.
+
+Only reports from different reviewers are merged: two findings of the same
+reviewer a few lines apart are two problems, however alike they read.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from turbowrap.review.models.review import Issue
+from turbowrap.review.utils.fingerprint import normalize_issue_path, title_tokens
+
+# Max line distance between two reports of the same problem
+LINE_WINDOW = 8
+
+# Min weighted similarity to merge two issues
+SIMILARITY_THRESHOLD = 0.45
+
+# Extra similarity required when the categories differ
+CATEGORY_MISMATCH_PENALTY = 0.1
+
+# Max earlier clusters compared per issue, and members compared per cluster
+# (bounds the work on dense files)
+MAX_CANDIDATES = 32
+MAX_MEMBERS = 4
+
+# Min code similarity to merge when both issues flag code
+CODE_MATCH_THRESHOLD = 0.5
+
+# flagged_by entries that identify the LLM that reported an issue
+LLM_REVIEWERS = frozenset({"claude", "gemini", "grok"})
+
+# Weights of the similarity components (code is dropped if either side lacks it)
+TITLE_WEIGHT = 0.5
+TEXT_WEIGHT = 0.3
+CODE_WEIGHT = 0.2
+
+_CODE_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+|\S")
+
+
+@dataclass
+class IssueSignature:
+    """Pre-computed shingle sets of one issue."""
+
+    title: frozenset[str]
+    text: frozenset[str]
+    code: frozenset[str] | None
+
+
+def _word_shingles(tokens: Sequence[str]) -> frozenset[str]:
+    """Unigrams plus bigrams of a token sequence."""
+    shingles = set(tokens)
+    shingles.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False))
+    return frozenset(shingles)
+
+
+def _code_shingles(code: str | None) -> frozenset[str] | None:
+    """Token trigrams of a code snippet (whitespace-insensitive)."""
+    if not code or not code.strip():
+        return None
+    tokens = _CODE_TOKEN_RE.findall(code)
+    if len(tokens) < 3:
+        return frozenset([" ".join(tokens)])
+    return frozenset(" ".join(tokens[i : i + 3]) for i in range(len(tokens) - 2))
+
+
+def issue_signature(issue: Issue) -> IssueSignature:
+    """Build the similarity signature of an issue."""
+    text_words = [
+        word
+        for word in re.findall(r"[a-z0-9_]+", f"{issue.title} {issue.description}".lower())
+        if len(word) > 2 and not word.isdigit()
+    ]
+    return IssueSignature(
+        title=frozenset(title_tokens(issue.title)),
+        text=_word_shingles(text_words),
+        code=_code_shingles(issue.current_code),
+    )
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+def issue_reporters(issue: Issue) -> frozenset[str]:
+    """Reviewers that reported an issue: its LLMs, else every flagged_by name."""
+    names = frozenset(issue.flagged_by)
+    return (names & LLM_REVIEWERS) or names
+
+
+def signature_similarity(a: IssueSignature, b: IssueSignature) -> float:
+    """Weighted similarity of two issues in [0, 1]."""
+    score = TITLE_WEIGHT * _jaccard(a.title, b.title) + TEXT_WEIGHT * _jaccard(a.text, b.text)
+    if a.code is None or b.code is None:
+        return score / (TITLE_WEIGHT + TEXT_WEIGHT)
+    return score + CODE_WEIGHT * _jaccard(a.code, b.code)
+
+
+def cluster_similar_issues(
+    issues: Sequence[Issue],
+    threshold: float = SIMILARITY_THRESHOLD,
+    line_window: int = LINE_WINDOW,
+) -> list[list[int]]:
+    """Group near-duplicate issues.
+
+    Issues are processed per file in line order. Each issue is compared with
+    the members of the clusters that started within ``line_window`` lines
+    above it and joins the best match above the threshold. A cluster is
+    skipped if one of its members shares a reviewer with the issue, and a
+    member is skipped if both flag code that is not similar enough.
+
+    Args:
+        issues: Issues to cluster
+        threshold: Min similarity to join a cluster
+        line_window: Max line distance between an issue and a cluster
+
+    Returns:
+        Clusters as lists of indexes into ``issues``, ordered by first index
+    """
+    by_file: dict[str, list[int]] = defaultdict(list)
+    for index, issue in enumerate(issues):
+        by_file[normalize_issue_path(issue.file)].append(index)
+
+    signatures: dict[int, IssueSignature] = {}
+    clusters: list[list[int]] = []
+    # Reviewers of each cluster, keyed by its first index
+    cluster_reporters: dict[int, set[str]] = {}
+
+    for indexes in by_file.values():
+        # Issues without a line only match each other (sorted first, at -1)
+        indexes.sort(key=lambda i: (issues[i].line if issues[i].line is not None else -1, i))
+        window: list[tuple[int, list[int]]] = []  # (line, cluster) of recent clusters
+
+        for index in indexes:
+            issue = issues[index]
+            line = issue.line if issue.line is not None else -1
+            window = [
+                (start, cluster)
+                for start, cluster in window
+                if (start < 0) == (line < 0) and line - start <= line_window
+            ][-MAX_CANDIDATES:]
+            signature = signatures[index] = issue_signature(issue)
+            reporters = issue_reporters(issue)
+
+            best: list[int] | None = None
+            best_score = 0.0
+            for _, cluster in window:
+                if reporters & cluster_reporters[cluster[0]]:
+                    continue
+                for member in cluster[:MAX_MEMBERS]:
+                    code = signatures[member].code
+                    if (
+                        code is not None
+                        and signature.code is not None
+                        and _jaccard(code, signature.code) < CODE_MATCH_THRESHOLD
+                    ):
+                        continue
+                    required = threshold
+                    if issues[member].category != issue.category:
+                        required += CATEGORY_MISMATCH_PENALTY
+                    score = signature_similarity(signatures[member], signature)
+                    if score >= required and score > best_score:
+                        best, best_score = cluster, score
+
+            if best is not None:
+                best.append(index)
+                cluster_reporters[best[0]] |= reporters
+            else:
+                cluster = [index]
+                clusters.append(cluster)
+                cluster_reporters[index] = set(reporters)
+                window.append((line, cluster))
+
+    for cluster in clusters:
+        cluster.sort()
+    clusters.sort(key=lambda c: c[0])
+    return clusters
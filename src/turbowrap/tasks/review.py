@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from ..db.models import Task
+from ..llm.governor import Priority, llm_call_context
 from ..review.models.report import FinalReport
 from ..review.models.review import (
     IssueSeverity,
@@ -68,7 +69,10 @@ class ReviewTask(BaseTask):
 
             # Run orchestrator (async)
             orchestrator = Orchestrator()
-            report = asyncio.run(orchestrator.review(request))
+            with llm_call_context(
+                priority=Priority.BATCH, repository=context.config.get("repository_id")
+            ):
+                report = asyncio.run(orchestrator.review(request))
 
             # Update task with results
             completed_at = datetime.utcnow()
@@ -11,6 +11,7 @@ from typing import Any
 from pydantic import Field
 
 from ..db.models import Repository, TestCase, TestRun, TestSuite
+from ..db.session import serialized_write
 from .base import BaseTask, TaskConfig, TaskContext, TaskResult
 from .test_parsers import PytestParser
 from .test_parsers.base import BaseTestParser
@@ -117,23 +118,24 @@ class TestTask(BaseTask):
             # Parse results
             parsed = parser.parse(result["output"], result["exit_code"])
 
-            # Save test cases
-            self._save_test_cases(context.db, run, parsed.test_cases)
-
             # Update run with results
             duration = time.time() - start_time
             completed_at = datetime.utcnow()
 
-            run.status = "passed" if parsed.failed == 0 and parsed.errors == 0 else "failed"  # type: ignore[assignment]
-            run.completed_at = completed_at  # type: ignore[assignment]
-            run.duration_seconds = parsed.duration_seconds or duration  # type: ignore[assignment]
-            run.total_tests = parsed.total  # type: ignore[assignment]
-            run.passed = parsed.passed  # type: ignore[assignment]
-            run.failed = parsed.failed  # type: ignore[assignment]
-            run.skipped = parsed.skipped  # type: ignore[assignment]
-            run.errors = parsed.errors  # type: ignore[assignment]
+            # One test case per row: a large write, kept to a single writer
+            with serialized_write(context.db):
+                self._save_test_cases(context.db, run, parsed.test_cases)
 
-            context.db.commit()
+                run.status = "passed" if parsed.failed == 0 and parsed.errors == 0 else "failed"  # type: ignore[assignment]
+                run.completed_at = completed_at  # type: ignore[assignment]
+                run.duration_seconds = parsed.duration_seconds or duration  # type: ignore[assignment]
+                run.total_tests = parsed.total  # type: ignore[assignment]
+                run.passed = parsed.passed  # type: ignore[assignment]
+                run.failed = parsed.failed  # type: ignore[assignment]
+                run.skipped = parsed.skipped  # type: ignore[assignment]
+                run.errors = parsed.errors  # type: ignore[assignment]
+
+                context.db.commit()
 
             return TaskResult(
                 status="completed",
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Literal
 if TYPE_CHECKING:
     from turbowrap.llm.base import BaseAgent
 
+from turbowrap.llm.governor import Priority, llm_call_context
 from turbowrap.utils.file_utils import (
     BE_EXTENSIONS,
     FE_EXTENSIONS,
@@ -400,7 +401,7 @@ DESCRIPTION: <description>
         assert self.gemini_client is not None
 
         try:
-            result = self.gemini_client.generate(prompt)
+            result = self._llm_generate(prompt)
 
             for line in result.split("\n"):
                 if line.startswith("PATTERN:"):
@@ -449,7 +450,7 @@ models: Data models and schemas
         assert self.gemini_client is not None
 
         try:
-            result = self.gemini_client.generate(prompt)
+            result = self._llm_generate(prompt)
 
             # Parse response
             purposes: dict[str, str] = {}
@@ -540,6 +541,12 @@ models: Data models and schemas
 
         return directories
 
+    def _llm_generate(self, prompt: str) -> str:
+        """Call Gemini as batch LLM work (worker threads don't inherit the caller's context)."""
+        assert self.gemini_client is not None
+        with llm_call_context(priority=Priority.BATCH, repository=str(self.repo_path)):
+            return self.gemini_client.generate(prompt)
+
     def _extract_file_elements(self, file_struct: FileStructure) -> FileStructure:
         """
         Extract semantic elements from a file.
@@ -606,7 +613,7 @@ Be concise. Only list the most important elements (max 10).
         assert self.gemini_client is not None
 
         try:
-            result = self.gemini_client.generate(prompt)
+            result = self._llm_generate(prompt)
             return self._parse_elements_response(result, file_struct.file_type)
         except Exception:
             return []
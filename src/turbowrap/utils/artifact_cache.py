@@ -0,0 +1,437 @@
+"""Read-through local cache for S3 artifacts.
+
+Mockup HTML, fix logs and operation prompts/outputs are written to S3 once
+and then read back many times (every preview, every modify, every page
+view). This module keeps their bodies in a size-bounded LRU directory on
+local disk, keyed by bucket, key and ETag, so repeat reads cost at most a
+HEAD request.
+
+Usage:
+    from turbowrap.utils.artifact_cache import get_artifact_cache, parse_s3_url
+
+    bucket, key = parse_s3_url(s3_url)
+    html = await get_artifact_cache().aget_text(bucket, key)
+
+For offline use and tests, pass a LocalObjectStore instead of S3ObjectStore.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import unquote, urlparse
+
+from ..config import get_settings
+from .aws_clients import get_s3_client
+from .s3_upload_pipeline import read_s3_body
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Object stores
+# =============================================================================
+
+
+@dataclass
+class StoredObject:
+    """Object body plus its ETag (quotes stripped)."""
+
+    data: bytes
+    etag: str
+
+
+class ObjectStore(Protocol):
+    """Minimal read interface of an S3-like object store."""
+
+    def head(self, bucket: str, key: str) -> str:
+        """Return the current ETag of an object."""
+        ...
+
+    def get(
+        self, bucket: str, key: str, byte_range: tuple[int, int | None] | None = None
+    ) -> StoredObject:
+        """Fetch an object, or an inclusive byte range of it."""
+        ...
+
+
+def _range_header(byte_range: tuple[int, int | None]) -> str:
+    start, end = byte_range
+    return f"bytes={start}-{'' if end is None else end}"
+
+
+class S3ObjectStore:
+    """ObjectStore backed by boto3."""
+
+    def __init__(self, region: str | None = None):
+        self.region = region
+        self._client: Any = None
+
+    @property
+    def client(self) -> Any:
+        """Lazy-load S3 client."""
+        if self._client is None:
+            self._client = get_s3_client(region=self.region)
+        return self._client
+
+    def head(self, bucket: str, key: str) -> str:
+        response = self.client.head_object(Bucket=bucket, Key=key)
+        return str(response.get("ETag", "")).strip('"')
+
+    def get(
+        self, bucket: str, key: str, byte_range: tuple[int, int | None] | None = None
+    ) -> StoredObject:
+        kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
+        if byte_range is not None:
+            kwargs["Range"] = _range_header(byte_range)
+        response = self.client.get_object(**kwargs)
+        etag = str(response.get("ETag", "")).strip('"')
+        if byte_range is not None and response.get("ContentEncoding"):
+            # Ranges apply to the compressed bytes: decode the whole object instead
+            response["Body"].close()
+            full = self.get(bucket, key)
+            start, end = byte_range
+            return StoredObject(data=full.data[start : None if end is None else end + 1], etag=etag)
+        return StoredObject(data=read_s3_body(response), etag=etag)
+
+
+class LocalObjectStore:
+    """Filesystem stand-in for S3 (``root/bucket/key``), for offline use and tests.
+
+    ETags are the MD5 of the content, like single-part S3 uploads.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.head_calls = 0
+        self.get_calls = 0
+
+    def _path(self, bucket: str, key: str) -> Path:
+        path = (self.root / bucket / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid object key: {key}")
+        return path
+
+    def put(self, bucket: str, key: str, data: bytes) -> str:
+        """Store an object and return its ETag."""
+        path = self._path(bucket, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+    def head(self, bucket: str, key: str) -> str:
+        self.head_calls += 1
+        data = self._path(bucket, key).read_bytes()
+        return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+    def get(
+        self, bucket: str, key: str, byte_range: tuple[int, int | None] | None = None
+    ) -> StoredObject:
+        self.get_calls += 1
+        data = self._path(bucket, key).read_bytes()
+        etag = hashlib.md5(data, usedforsecurity=False).hexdigest()
+        if byte_range is not None:
+            start, end = byte_range
+            data = data[start : None if end is None else end + 1]
+        return StoredObject(data=data, etag=etag)
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+@dataclass
+class _Validation:
+    """Last ETag seen for a (bucket, key) and when it was checked."""
+
+    digest: str
+    validated_at: float
+
+
+class ArtifactCache:
+    """Size-bounded disk LRU in front of an ObjectStore.
+
+    - Bodies are stored as ``sha256(bucket/key/etag)`` files, so a changed
+      object never serves stale content and files survive restarts.
+    - Within ``revalidate_seconds`` of the last check, reads skip the HEAD.
+    - Concurrent reads of the same object share one download.
+    - Thread-safe; use ``aget``/``aget_text`` from async code.
+    """
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        cache_dir: Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        revalidate_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.store = store
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.revalidate_seconds = revalidate_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # digest -> size, in LRU order (oldest first)
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._validations: dict[tuple[str, str], _Validation] = {}
+        self._inflight: dict[tuple[str, str], Future[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_existing()
+
+    def _load_existing(self) -> None:
+        """Adopt bodies left by a previous run, oldest first."""
+        files = [p for p in self.cache_dir.iterdir() if p.is_file() and not p.name.startswith(".")]
+        for path in sorted(files, key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self._total_bytes += size
+        with self._lock:
+            self._evict()
+
+    @staticmethod
+    def _digest(bucket: str, key: str, etag: str) -> str:
+        return hashlib.sha256(f"{bucket}/{key}/{etag}".encode()).hexdigest()
+
+    def _read_entry(self, digest: str) -> bytes | None:
+        """Read a cached body and mark it recently used. Caller holds the lock."""
+        if digest not in self._entries:
+            path = self.cache_dir / digest
+            if not path.exists():
+                return None
+            # Written by another process sharing the directory
+            size = path.stat().st_size
+            self._entries[digest] = size
+            self._total_bytes += size
+        try:
+            data = (self.cache_dir / digest).read_bytes()
+        except FileNotFoundError:
+            self._forget(digest)
+            return None
+        self._entries.move_to_end(digest)
+        return data
+
+    def _write_entry(self, digest: str, data: bytes) -> None:
+        """Atomically store a body and enforce the size bound. Caller holds the lock."""
+        if len(data) > self.max_bytes:
+            return
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, self.cache_dir / digest)
+        except OSError as e:
+            logger.warning(f"[ARTIFACT CACHE] Failed to write cache entry: {e}")
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+        self._forget(digest)
+        self._entries[digest] = len(data)
+        self._total_bytes += len(data)
+        self._evict()
+
+    def _forget(self, digest: str) -> None:
+        size = self._entries.pop(digest, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """Delete least recently used bodies until under ``max_bytes``. Caller holds the lock."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            digest, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            (self.cache_dir / digest).unlink(missing_ok=True)
+
+    def get(self, bucket: str, key: str) -> bytes:
+        """Get an object's body, from the local cache when it is still current.
+
+        Raises whatever the underlying store raises (e.g. botocore ClientError).
+        """
+        ident = (bucket, key)
+        with self._lock:
+            validation = self._validations.get(ident)
+            if (
+                validation is not None
+                and self._clock() - validation.validated_at < self.revalidate_seconds
+            ):
+                data = self._read_entry(validation.digest)
+                if data is not None:
+                    self.hits += 1
+                    return data
+
+            future = self._inflight.get(ident)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._inflight[ident] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            data = self._load(bucket, key)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(ident, None)
+
+    def _load(self, bucket: str, key: str) -> bytes:
+        """Revalidate by ETag and download on miss."""
+        etag = self.store.head(bucket, key)
+        digest = self._digest(bucket, key, etag)
+        with self._lock:
+            data = self._read_entry(digest)
+            if data is not None:
+                self.hits += 1
+                self._validations[(bucket, key)] = _Validation(digest, self._clock())
+                return data
+
+        obj = self.store.get(bucket, key)
+        digest = self._digest(bucket, key, obj.etag or etag)
+        with self._lock:
+            self.misses += 1
+            self._write_entry(digest, obj.data)
+            self._validations[(bucket, key)] = _Validation(digest, self._clock())
+        logger.debug(f"[ARTIFACT CACHE] Cached s3://{bucket}/{key} ({len(obj.data)} bytes)")
+        return obj.data
+
+    def get_text(self, bucket: str, key: str, encoding: str = "utf-8") -> str:
+        """Get an object's body decoded as text."""
+        return self.get(bucket, key).decode(encoding)
+
+    def get_range(self, bucket: str, key: str, start: int, end: int | None = None) -> bytes:
+        """Get bytes ``start..end`` (inclusive, like HTTP Range) of an object.
+
+        Served from the cached body when present, otherwise a ranged GET
+        is issued without caching the partial body.
+        """
+        with self._lock:
+            validation = self._validations.get((bucket, key))
+            if validation is not None and validation.digest in self._entries:
+                try:
+                    with open(self.cache_dir / validation.digest, "rb") as f:
+                        f.seek(start)
+                        data = f.read(-1 if end is None else end - start + 1)
+                    self._entries.move_to_end(validation.digest)
+                    self.hits += 1
+                    return data
+                except FileNotFoundError:
+                    self._forget(validation.digest)
+
+        return self.store.get(bucket, key, byte_range=(start, end)).data
+
+    async def aget(self, bucket: str, key: str) -> bytes:
+        """Async version of ``get`` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.get, bucket, key)
+
+    async def aget_text(self, bucket: str, key: str, encoding: str = "utf-8") -> str:
+        """Async version of ``get_text``."""
+        return await asyncio.to_thread(self.get_text, bucket, key, encoding)
+
+    def invalidate(self, bucket: str, key: str) -> None:
+        """Force the next read of an object to revalidate."""
+        with self._lock:
+            self._validations.pop((bucket, key), None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class _PassthroughCache(ArtifactCache):
+    """ArtifactCache stand-in used when caching is disabled."""
+
+    def __init__(self, store: ObjectStore):
+        self.store = store
+
+    def get(self, bucket: str, key: str) -> bytes:
+        return self.store.get(bucket, key).data
+
+    def get_range(self, bucket: str, key: str, start: int, end: int | None = None) -> bytes:
+        return self.store.get(bucket, key, byte_range=(start, end)).data
+
+    def invalidate(self, bucket: str, key: str) -> None:
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        return {}
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def parse_s3_url(url: str) -> tuple[str, str] | None:
+    """Extract ``(bucket, key)`` from an S3 URL.
+
+    Supports ``s3://bucket/key`` and virtual-hosted HTTPS URLs
+    (``https://bucket.s3[.region].amazonaws.com/key``), including
+    pre-signed ones (the query string is ignored).
+
+    Returns:
+        (bucket, key) or None if the URL is not an S3 object URL
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "s3":
+        key = parsed.path.lstrip("/")
+        return (parsed.netloc, key) if parsed.netloc and key else None
+
+    if parsed.scheme != "https" or not parsed.hostname:
+        return None
+    host = parsed.hostname
+    if not host.endswith(".amazonaws.com") or ".s3" not in host:
+        return None
+    bucket = host.split(".s3", 1)[0]
+    key = unquote(parsed.path.lstrip("/"))
+    return (bucket, key) if bucket and key else None
+
+
+# Singleton instance
+_cache: ArtifactCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Get singleton ArtifactCache backed by S3 and configured from settings."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                settings = get_settings()
+                config = settings.artifact_cache
+                store = S3ObjectStore(region=settings.thinking.s3_region)
+                if config.enabled:
+                    _cache = ArtifactCache(
+                        store=store,
+                        cache_dir=config.dir.expanduser(),
+                        max_bytes=config.max_mb * 1024 * 1024,
+                        revalidate_seconds=config.revalidate_seconds,
+                    )
+                else:
+                    _cache = _PassthroughCache(store)
+    return _cache
@@ -3,42 +3,37 @@
 import logging
 from pathlib import Path
 
+from .structure_docs import load_structure_document
+
 logger = logging.getLogger(__name__)
 
 
 def load_structure_documentation(
     repo_path: Path | str,
     workspace_path: str | None = None,
+    paths: list[str] | None = None,
+    max_tokens: int | None = None,
 ) -> str | None:
     """Load repository structure documentation for context injection.
 
     Only uses .llms/structure.xml (consolidated XML format, optimized for LLM).
-    No fallback to STRUCTURE.md.
+    No fallback to STRUCTURE.md. The parsed document is shared process-wide
+    (see structure_docs.py), so repeated calls don't re-read the file.
 
     Args:
         repo_path: Path to the repository root
         workspace_path: Optional monorepo workspace subfolder
+        paths: Only include the directories of these files (relative to the
+            workspace) and their parents
+        max_tokens: Token budget for the returned documentation
 
     Returns:
         Structure documentation content, or None if not found
     """
-    base = Path(repo_path)
-    if workspace_path:
-        workspace_base = base / workspace_path
-        if workspace_base.exists():
-            base = workspace_base
-
-    # Load .llms/structure.xml (only supported format)
-    xml_path = base / ".llms" / "structure.xml"
-    if xml_path.exists():
-        try:
-            content = xml_path.read_text(encoding="utf-8")
-            logger.info(f"Loaded structure from {xml_path} ({xml_path.stat().st_size:,} bytes)")
-            return content
-        except Exception as e:
-            logger.warning(f"Failed to read {xml_path}: {e}")
-
-    return None
+    document = load_structure_document(repo_path, workspace_path)
+    if document is None:
+        return None
+    return document.render(paths=paths, max_tokens=max_tokens)
 
 
 __all__ = ["load_structure_documentation"]
@@ -0,0 +1,505 @@
+"""Per-file parsing of HTTP endpoint definitions and calls.
+
+Pure functions over one file's source, used by the endpoint extractor
+(api/services/endpoint_extractor.py). Kept free of app imports so process
+pool workers start quickly.
+
+- Python (``ast``): FastAPI/Starlette and Flask route decorators, router
+  objects and their prefixes, imports and ``include_router`` /
+  ``register_blueprint`` calls, Django ``path()``/``re_path()`` in urls.py
+- JavaScript/TypeScript (patterns): Express routes, Next.js app and pages
+  API routes, and consumed calls (fetch, axios, useSWR, $fetch/ofetch,
+  api/client wrappers)
+
+Each file yields a facts dict (endpoints, routers, imports, includes,
+framework) that is JSON-serializable so it can be cached.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import re
+from collections import Counter
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+PYTHON_EXTENSIONS = (".py",)
+JS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".vue", ".svelte", ".html")
+
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+PY_METHOD_DECORATORS = {m.lower() for m in HTTP_METHODS}
+PY_ROUTE_DECORATORS = {"route", "api_route"}
+PY_APP_FACTORIES = {
+    "FastAPI": ("fastapi", "prefix"),
+    "APIRouter": ("fastapi", "prefix"),
+    "Flask": ("flask", "url_prefix"),
+    "Blueprint": ("flask", "url_prefix"),
+}
+PY_PARAM_FUNCTIONS = {
+    "Query": "query",
+    "Path": "path",
+    "Body": "body",
+    "Header": "header",
+    "Cookie": "header",
+    "Form": "body",
+    "File": "body",
+}
+PY_SKIPPED_ANNOTATIONS = {
+    "Request",
+    "Response",
+    "WebSocket",
+    "BackgroundTasks",
+    "Session",
+    "AsyncSession",
+    "HTTPConnection",
+}
+PY_SIMPLE_TYPES = {"int", "str", "bool", "float", "list", "List", "date", "datetime", "UUID"}
+PY_ROUTING_HINT_RE = re.compile(
+    r"APIRouter|FastAPI|Blueprint|Flask|include_router|register_blueprint|urlpatterns"
+    r"|@[\w.]+\.(?:get|post|put|delete|patch|head|options|route|api_route)\("
+)
+AUTH_DEPENDENCY_RE = re.compile(r"auth|user|token|principal|api_key|apikey|login", re.IGNORECASE)
+
+
+# =============================================================================
+# Path helpers
+# =============================================================================
+
+
+def join_paths(*parts: str) -> str:
+    """Join URL path fragments (``/api`` + ``/users/`` + ``{id}``)."""
+    joined = "/".join(p.strip("/") for p in parts if p and p.strip("/"))
+    trailing = "/" if parts and parts[-1].endswith("/") and len(parts[-1]) > 1 else ""
+    return "/" + joined + trailing if joined else "/"
+
+
+def normalize_route_path(path: str) -> str:
+    """Use ``{param}`` for Flask/Django/Express/Next placeholders."""
+    path = re.sub(r"<(?:\w+:)?(\w+)>", r"{\1}", path)  # Flask/Django <int:id>
+    path = re.sub(r"\$\{[^}]*?(\w+)\s*\}", r"{\1}", path)  # JS template ${user.id}
+    path = re.sub(r"(?<=/):(\w+)", r"{\1}", path)  # Express :id
+    return re.sub(r"\{(\w+):[^}]+\}", r"{\1}", path)  # Starlette {id:int}
+
+
+def _next_route_path(segments: list[str]) -> str:
+    parts = []
+    for segment in segments:
+        if segment.startswith("(") and segment.endswith(")"):
+            continue  # Route group
+        if segment.startswith("@") or segment.startswith("_"):
+            continue  # Parallel route / private folder
+        match = re.fullmatch(r"\[{1,2}(?:\.\.\.)?(\w+)\]{1,2}", segment)
+        parts.append(f"{{{match.group(1)}}}" if match else segment)
+    return join_paths(*parts)
+
+
+# =============================================================================
+# Python extraction
+# =============================================================================
+
+
+def _dotted(node: ast.AST) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return f"{base}.{node.attr}" if base else node.attr
+    if isinstance(node, ast.Call):
+        return _dotted(node.func)
+    return ""
+
+
+def _const_str(node: ast.AST | None) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return "".join(
+            v.value if isinstance(v, ast.Constant) else f"{{{_dotted(v.value).split('.')[-1]}}}"
+            for v in node.values
+            if isinstance(v, ast.Constant | ast.FormattedValue)
+        )
+    return None
+
+
+def _keyword(call: ast.Call, *names: str) -> ast.expr | None:
+    for kw in call.keywords:
+        if kw.arg in names:
+            return kw.value
+    return None
+
+
+def _str_list(node: ast.AST | None) -> list[str]:
+    if isinstance(node, ast.List | ast.Tuple | ast.Set):
+        return [v for v in (_const_str(e) for e in node.elts) if v is not None]
+    return []
+
+
+def _resolve_module(rel_path: str, module: str | None, level: int) -> str:
+    """Repository-relative module base path for an import (no extension)."""
+    if level == 0:
+        return (module or "").replace(".", "/")
+    base = PurePosixPath(rel_path).parent
+    for _ in range(level - 1):
+        base = base.parent
+    suffix = (module or "").replace(".", "/")
+    return str(base / suffix) if suffix else str(base)
+
+
+def _depends_names(node: ast.AST | None) -> list[str]:
+    names = []
+    for sub in ast.walk(node) if node is not None else []:
+        if isinstance(sub, ast.Call) and _dotted(sub.func).split(".")[-1] == "Depends" and sub.args:
+            names.append(_dotted(sub.args[0]))
+    return names
+
+
+def _python_parameters(
+    func: ast.FunctionDef | ast.AsyncFunctionDef, path: str
+) -> tuple[list[dict[str, Any]], bool]:
+    """Parameters of a FastAPI-style handler, and whether it depends on auth."""
+    path_params = set(re.findall(r"\{(\w+)", path))
+    args = [*func.args.posonlyargs, *func.args.args]
+    defaults: list[ast.expr | None] = [None] * (len(args) - len(func.args.defaults))
+    defaults += list(func.args.defaults)
+    pairs = list(zip(args, defaults, strict=True))
+    pairs += list(zip(func.args.kwonlyargs, func.args.kw_defaults, strict=True))
+
+    params: list[dict[str, Any]] = []
+    auth = False
+    for arg, default in pairs:
+        if arg.arg in {"self", "cls"}:
+            continue
+        annotation = ast.unparse(arg.annotation) if arg.annotation else ""
+        base_type = re.split(r"[\[|. ]", annotation.replace("Annotated[", ""))[0]
+        depends = _depends_names(default) + _depends_names(arg.annotation)
+        if depends:
+            auth = auth or any(AUTH_DEPENDENCY_RE.search(name) for name in depends)
+            continue
+        if base_type in PY_SKIPPED_ANNOTATIONS:
+            continue
+
+        param_type = "path" if arg.arg in path_params else ""
+        required = default is None
+        if isinstance(default, ast.Call):
+            kind = PY_PARAM_FUNCTIONS.get(_dotted(default.func).split(".")[-1])
+            if kind:
+                param_type = param_type or kind
+                first = default.args[0] if default.args else _keyword(default, "default")
+                required = first is None or (
+                    isinstance(first, ast.Constant) and first.value is Ellipsis
+                )
+        elif isinstance(default, ast.Constant) and default.value is Ellipsis:
+            required = True
+        if not param_type:
+            simple = not annotation or base_type in PY_SIMPLE_TYPES or "None" in annotation
+            param_type = "query" if simple else "body"
+        params.append(
+            {
+                "name": arg.arg,
+                "param_type": param_type,
+                "data_type": annotation or "str",
+                "required": required or param_type == "path",
+                "description": "",
+            }
+        )
+
+    for name in sorted(path_params - {p["name"] for p in params}):
+        params.append(
+            {
+                "name": name,
+                "param_type": "path",
+                "data_type": "str",
+                "required": True,
+                "description": "",
+            }
+        )
+    return params, auth
+
+
+def _route_decorators(
+    func: ast.FunctionDef | ast.AsyncFunctionDef, routers: dict[str, dict[str, Any]]
+) -> list[tuple[str, list[str], str, ast.Call]]:
+    """``(owner, methods, path, decorator)`` for each route decorator of a function."""
+    found = []
+    for decorator in func.decorator_list:
+        if not isinstance(decorator, ast.Call) or not isinstance(decorator.func, ast.Attribute):
+            continue
+        name = decorator.func.attr
+        if name not in PY_METHOD_DECORATORS and name not in PY_ROUTE_DECORATORS:
+            continue
+        owner = _dotted(decorator.func.value)
+        path = _const_str(decorator.args[0]) if decorator.args else None
+        if path is None:
+            path = _const_str(_keyword(decorator, "path", "rule"))
+        if path is None or (owner not in routers and not path.startswith("/")):
+            continue
+        if name in PY_METHOD_DECORATORS:
+            methods = [name.upper()]
+        else:
+            methods = [m.upper() for m in _str_list(_keyword(decorator, "methods"))] or ["GET"]
+        found.append((owner, methods, path, decorator))
+    return found
+
+
+def extract_python(rel_path: str, source: str) -> dict[str, Any]:
+    """Routes, routers, imports and router includes of one Python module."""
+    facts: dict[str, Any] = {
+        "endpoints": [],
+        "routers": {},
+        "imports": {},
+        "includes": [],
+        "framework": "",
+    }
+    has_routing = PY_ROUTING_HINT_RE.search(source) is not None
+    if not has_routing and PurePosixPath(rel_path).name != "__init__.py":
+        return facts  # Only packages re-export routers from elsewhere
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return facts
+
+    routers: dict[str, dict[str, Any]] = facts["routers"]
+    frameworks: Counter[str] = Counter()
+    is_urls_module = PurePosixPath(rel_path).name == "urls.py"
+    functions: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
+    url_calls: list[ast.Call] = []
+    # Packages without routing code only matter for their re-exports
+    nodes = ast.walk(tree) if has_routing else iter(tree.body)
+    for node in nodes:
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            if node.decorator_list:
+                functions.append(node)
+        elif isinstance(node, ast.ImportFrom):
+            base = _resolve_module(rel_path, node.module, node.level)
+            for alias in node.names:
+                facts["imports"][alias.asname or alias.name] = [base, alias.name]
+            root = (node.module or "").split(".")[0]
+            if node.level == 0 and root in {"fastapi", "flask", "django", "starlette"}:
+                frameworks["fastapi" if root == "starlette" else root] += 1
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    facts["imports"][alias.asname] = [alias.name.replace(".", "/"), ""]
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            factory = _dotted(node.value.func).split(".")[-1]
+            if factory in PY_APP_FACTORIES:
+                framework, prefix_kw = PY_APP_FACTORIES[factory]
+                for target in node.targets:
+                    routers[_dotted(target)] = {
+                        "prefix": _const_str(_keyword(node.value, prefix_kw)) or "",
+                        "tags": _str_list(_keyword(node.value, "tags")),
+                        "framework": framework,
+                    }
+        elif isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Attribute) and node.args:
+                if node.func.attr in {"include_router", "register_blueprint"}:
+                    prefix = _const_str(_keyword(node, "prefix", "url_prefix")) or ""
+                    facts["includes"].append(
+                        [_dotted(node.func.value), _dotted(node.args[0]), prefix]
+                    )
+            if is_urls_module:
+                url_calls.append(node)
+
+    lines = source.splitlines()
+    for node in functions:
+        for owner, methods, path, decorator in _route_decorators(node, routers):
+            path = normalize_route_path(path)
+            params, auth = _python_parameters(node, path)
+            auth = auth or any(
+                AUTH_DEPENDENCY_RE.search(name)
+                for name in _depends_names(_keyword(decorator, "dependencies"))
+            )
+            response = _keyword(decorator, "response_model")
+            docstring = (ast.get_docstring(node) or "").strip().split("\n\n")[0]
+            body = "\n".join(lines[node.lineno - 1 : node.end_lineno])
+            for method in methods:
+                facts["endpoints"].append(
+                    {
+                        "method": method,
+                        "path": path,
+                        "router": owner,
+                        "line": node.lineno,
+                        "handler": node.name,
+                        "description": " ".join(docstring.split()),
+                        "parameters": params,
+                        "response_type": ast.unparse(response)
+                        if response is not None
+                        else (ast.unparse(node.returns) if node.returns else ""),
+                        "auth_required": auth,
+                        "tags": _str_list(_keyword(decorator, "tags")),
+                        "source": "served",
+                        "framework": routers.get(owner, {}).get("framework")
+                        or (frameworks.most_common(1)[0][0] if frameworks else "python"),
+                        "body_hash": hashlib.sha256(body.encode()).hexdigest()[:16],
+                    }
+                )
+
+    for node in url_calls:
+        if _dotted(node.func).split(".")[-1] not in {"path", "re_path", "url"}:
+            continue
+        route = _const_str(node.args[0]) if node.args else None
+        if route is None or (node.args[1:] and _dotted(node.args[1]).endswith("include")):
+            continue
+        route = normalize_route_path(route.lstrip("^").rstrip("$"))
+        facts["endpoints"].append(
+            {
+                "method": "ANY",
+                "path": join_paths(route),
+                "router": "",
+                "line": node.lineno,
+                "handler": _dotted(node.args[1]) if len(node.args) > 1 else "",
+                "description": "",
+                "parameters": [],
+                "response_type": "",
+                "auth_required": False,
+                "tags": [],
+                "source": "served",
+                "framework": "django",
+                "body_hash": hashlib.sha256(ast.unparse(node).encode()).hexdigest()[:16],
+            }
+        )
+
+    if frameworks:
+        facts["framework"] = frameworks.most_common(1)[0][0]
+    return facts
+
+
+# =============================================================================
+# JavaScript / TypeScript extraction
+# =============================================================================
+
+_STRING = r"""(?P<quote>['"`])(?P<url>(?:\\.|(?!(?P=quote))[^\n])*?)(?P=quote)"""
+EXPRESS_RE = re.compile(
+    r"\b(app|router|server|api|\w+Router)\s*\.\s*(get|post|put|delete|patch|all|options|head)"
+    r"\s*\(\s*" + _STRING
+)
+NEXT_EXPORT_RE = re.compile(
+    r"export\s+(?:async\s+)?(?:function\s+|const\s+)(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\b"
+)
+FETCH_RE = re.compile(
+    r"(?<![\w.])(fetch|\$fetch|ofetch|useFetch|ky)\s*(?:<[^>()]*>)?\s*\(\s*" + _STRING
+)
+CLIENT_RE = re.compile(
+    r"\b(axios|api|apiClient|client|http|instance|ky)\s*\.\s*(get|post|put|delete|patch)"
+    r"\s*(?:<[^>()]*>)?\s*\(\s*" + _STRING
+)
+SWR_RE = re.compile(r"\b(useSWR|useSWRImmutable|useSWRInfinite)\s*(?:<[^>()]*>)?\s*\(\s*" + _STRING)
+FETCH_METHOD_RE = re.compile(r"""method\s*:\s*['"](\w+)['"]""", re.IGNORECASE)
+NEXT_APP_ROUTE_RE = re.compile(r"(?:^|/)app/((?:[^/]+/)*)route\.(?:js|jsx|ts|tsx|mjs)$")
+NEXT_PAGES_API_RE = re.compile(r"(?:^|/)pages/(api/(?:[^/]+/)*[^/]+?)\.(?:js|jsx|ts|tsx|mjs)$")
+
+
+def _consumed_url(raw: str) -> str | None:
+    """Normalised path of a consumed URL, or None if it isn't one."""
+    url = normalize_route_path(raw.split("?")[0].split("#")[0])
+    if url.startswith("{") and "/" in url:
+        url = url[url.index("/") :]  # ${API_BASE}/users -> /users
+    if url.startswith(("http://", "https://")):
+        return url
+    if not url.startswith("/") or url.startswith("//") or re.search(r"[\s'\"`(),;]", url):
+        return None
+    return url
+
+
+def extract_javascript(rel_path: str, source: str) -> dict[str, Any]:
+    """Served and consumed endpoints of one JavaScript/TypeScript file."""
+    facts: dict[str, Any] = {
+        "endpoints": [],
+        "routers": {},
+        "imports": {},
+        "includes": [],
+        "framework": "",
+    }
+
+    def add(method: str, path: str, offset: int, source_kind: str, framework: str) -> None:
+        start = source.rfind("\n", 0, offset) + 1
+        end = source.find("\n", offset)
+        text = source[start : end if end != -1 else None]
+        facts["endpoints"].append(
+            {
+                "method": method,
+                "path": path,
+                "router": "",
+                "line": source.count("\n", 0, offset) + 1,
+                "handler": "",
+                "description": "",
+                "parameters": [
+                    {
+                        "name": name,
+                        "param_type": "path",
+                        "data_type": "str",
+                        "required": True,
+                        "description": "",
+                    }
+                    for name in re.findall(r"\{(\w+)\}", path)
+                ],
+                "response_type": "",
+                "auth_required": False,
+                "tags": [],
+                "source": source_kind,
+                "framework": framework,
+                "body_hash": hashlib.sha256(text.strip().encode()).hexdigest()[:16],
+            }
+        )
+
+    app_route = NEXT_APP_ROUTE_RE.search(rel_path)
+    pages_api = NEXT_PAGES_API_RE.search(rel_path)
+    if app_route:
+        path = _next_route_path([s for s in app_route.group(1).split("/") if s])
+        for match in NEXT_EXPORT_RE.finditer(source):
+            add(match.group(1), path, match.start(), "served", "nextjs")
+    elif pages_api:
+        segments = pages_api.group(1).split("/")
+        if segments[-1] == "index":
+            segments = segments[:-1]
+        add("ANY", _next_route_path(segments), 0, "served", "nextjs")
+
+    if "express" in source or "Router(" in source:
+        for match in EXPRESS_RE.finditer(source):
+            path = match.group("url")
+            if path.startswith("/") and "${" not in path:
+                method = "ANY" if match.group(2) == "all" else match.group(2).upper()
+                add(method, normalize_route_path(path), match.start(), "served", "express")
+
+    for match in FETCH_RE.finditer(source):
+        url = _consumed_url(match.group("url"))
+        if url is None:
+            continue
+        tail = source[match.end() : match.end() + 300]
+        next_call = FETCH_RE.search(tail)
+        method = FETCH_METHOD_RE.search(tail[: next_call.start()] if next_call else tail)
+        add(method.group(1).upper() if method else "GET", url, match.start(), "consumed", "")
+    for match in CLIENT_RE.finditer(source):
+        url = _consumed_url(match.group("url"))
+        if url is not None:
+            add(match.group(2).upper(), url, match.start(), "consumed", "")
+    for match in SWR_RE.finditer(source):
+        url = _consumed_url(match.group("url"))
+        if url is not None:
+            add("GET", url, match.start(), "consumed", "")
+
+    served = [e["framework"] for e in facts["endpoints"] if e["source"] == "served"]
+    if served:
+        facts["framework"] = Counter(served).most_common(1)[0][0]
+    return facts
+
+
+def extract_file_facts(repo_root: str, rel_path: str) -> dict[str, Any] | None:
+    """Extract endpoint facts from one file (runs in worker processes).
+
+    Returns:
+        Facts dict, or None if the file can't be read
+    """
+    try:
+        source = (Path(repo_root) / rel_path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if rel_path.endswith(PYTHON_EXTENSIONS):
+        return extract_python(rel_path, source)
+    return extract_javascript(rel_path, source)
+
+
+def extract_batch(repo_root: str, rel_paths: list[str]) -> list[dict[str, Any] | None]:
+    """extract_file_facts() for several files (one worker task)."""
+    return [extract_file_facts(repo_root, p) for p in rel_paths]
@@ -116,6 +116,28 @@ def calculate_tokens_for_file(file_path: Path) -> dict[str, int]:
         return {"chars": 0, "lines": 0, "words": 0, "tokens": 0}
 
 
+@lru_cache(maxsize=16384)
+def _cached_file_tokens(path: str, mtime_ns: int, size: int) -> int:
+    """Token count keyed by path + mtime + size (a modified file misses the cache)."""
+    return calculate_tokens_for_file(Path(path))["tokens"]
+
+
+def count_file_tokens(file_path: Path) -> int:
+    """Get the tiktoken count for a file, cached until the file changes.
+
+    Args:
+        file_path: Path to file.
+
+    Returns:
+        Token count (0 if the file can't be read).
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return 0
+    return _cached_file_tokens(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
 def should_ignore(path: Path) -> bool:
     """Check if path should be ignored.
 
@@ -0,0 +1,542 @@
+"""Native lint engine: runs the configured linters directly, in parallel.
+
+Linting used to mean a Claude CLI session that ran ruff/eslint/mypy and
+transcribed their output. The tools already emit JSON, so this module runs
+them itself:
+
+1. Detect which linters apply (files present, tool installed, config found)
+2. Hash the candidate files and skip those whose content, linter config and
+   engine version match the per-repository result cache
+3. Run the remaining files through each linter in batches, several
+   processes at once, with JSON output
+4. Return cached + fresh issues, with paths relative to the repository
+
+Per-file linters (ruff, eslint) only re-lint changed files. mypy results
+depend on other modules, so mypy re-checks every file as soon as one
+changed (its own .mypy_cache keeps that fast) and is skipped entirely when
+nothing changed.
+
+Usage:
+    from turbowrap.utils.lint_engine import LintEngine
+
+    run = await LintEngine(repo_path).run()
+    for issue in run.issues:
+        print(issue.linter, issue.file, issue.code, issue.message)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..config import get_settings
+from .file_utils import should_ignore
+from .lint_utils import LintIssue, parse_eslint_output, parse_mypy_output, parse_ruff_output
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing/mapping changes so old cache entries are ignored
+CACHE_VERSION = 1
+
+ESLINT_CONFIGS = (
+    ".eslintrc",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.json",
+    ".eslintrc.yaml",
+    ".eslintrc.yml",
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+    "eslint.config.ts",
+)
+MYPY_CONFIGS = ("mypy.ini", ".mypy.ini")
+
+
+# =============================================================================
+# Linter specs
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class LinterSpec:
+    """How to find, run and parse one linter."""
+
+    name: str
+    extensions: tuple[str, ...]
+    # Files whose content invalidates the whole cache for this linter
+    config_files: tuple[str, ...]
+    build_command: Callable[[Path, list[str]], list[str] | None]
+    parse: Callable[[str], list[LintIssue]]
+    # Whether the linter is configured for this repository
+    is_configured: Callable[[Path], bool] = lambda _repo: True
+    # False for linters whose results depend on other files (type checkers)
+    per_file: bool = True
+    # Exit codes that mean "ran fine" (findings included)
+    ok_returncodes: tuple[int, ...] = (0, 1)
+
+
+def _ruff_command(repo_path: Path, files: list[str]) -> list[str] | None:
+    if not shutil.which("ruff"):
+        return None
+    return ["ruff", "check", "--output-format", "json", "--no-fix", "--exit-zero", *files]
+
+
+def _eslint_command(repo_path: Path, files: list[str]) -> list[str] | None:
+    # Only a locally installed ESLint: npx would download one on every run
+    binary = repo_path / "node_modules" / ".bin" / "eslint"
+    if not binary.exists():
+        return None
+    return [str(binary), "--format", "json", "--no-error-on-unmatched-pattern", *files]
+
+
+def _mypy_command(repo_path: Path, files: list[str]) -> list[str] | None:
+    if not shutil.which("mypy"):
+        return None
+    return ["mypy", "--output", "json", "--no-error-summary", "--no-pretty", *files]
+
+
+def _has_eslint_config(repo_path: Path) -> bool:
+    if any((repo_path / name).exists() for name in ESLINT_CONFIGS):
+        return True
+    package_json = repo_path / "package.json"
+    if not package_json.exists():
+        return False
+    try:
+        data = json.loads(package_json.read_text())
+    except (OSError, json.JSONDecodeError):
+        return False
+    return "eslintConfig" in data
+
+
+def _has_mypy_config(repo_path: Path) -> bool:
+    if any((repo_path / name).exists() for name in MYPY_CONFIGS):
+        return True
+    for name, section in (("pyproject.toml", "[tool.mypy]"), ("setup.cfg", "[mypy]")):
+        path = repo_path / name
+        try:
+            if path.exists() and section in path.read_text():
+                return True
+        except OSError:
+            continue
+    return False
+
+
+RUFF = LinterSpec(
+    name="ruff",
+    extensions=(".py", ".pyi"),
+    config_files=("pyproject.toml", "ruff.toml", ".ruff.toml"),
+    build_command=_ruff_command,
+    parse=parse_ruff_output,
+    ok_returncodes=(0,),
+)
+ESLINT = LinterSpec(
+    name="eslint",
+    extensions=(".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx"),
+    config_files=(*ESLINT_CONFIGS, "package.json"),
+    build_command=_eslint_command,
+    parse=parse_eslint_output,
+    is_configured=_has_eslint_config,
+)
+MYPY = LinterSpec(
+    name="mypy",
+    extensions=(".py", ".pyi"),
+    config_files=(*MYPY_CONFIGS, "pyproject.toml", "setup.cfg"),
+    build_command=_mypy_command,
+    parse=parse_mypy_output,
+    is_configured=_has_mypy_config,
+    per_file=False,
+)
+
+DEFAULT_LINTERS = (RUFF, ESLINT, MYPY)
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+
+@dataclass
+class LinterStats:
+    """What one linter did during a run."""
+
+    files: int = 0
+    linted: int = 0
+    cached: int = 0
+    issues: int = 0
+    processes: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class LintRun:
+    """Result of a lint engine run."""
+
+    issues: list[LintIssue] = field(default_factory=list)
+    linters: dict[str, LinterStats] = field(default_factory=dict)
+    # Linter name -> why it did not run
+    skipped: dict[str, str] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    @property
+    def files_linted(self) -> int:
+        return sum(s.linted for s in self.linters.values())
+
+    @property
+    def files_cached(self) -> int:
+        return sum(s.cached for s in self.linters.values())
+
+    @property
+    def errors(self) -> list[str]:
+        return [f"{name}: {e}" for name, s in self.linters.items() for e in s.errors]
+
+    def summary(self) -> dict[str, Any]:
+        """JSON-friendly stats (no issues)."""
+        return {
+            "linters": {name: asdict(stats) for name, stats in self.linters.items()},
+            "skipped": self.skipped,
+            "files_linted": self.files_linted,
+            "files_cached": self.files_cached,
+            "issues_found": len(self.issues),
+            "duration_seconds": round(self.duration_seconds, 2),
+        }
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class LintCache:
+    """Per-repository lint results keyed by file content hash.
+
+    Stored as one JSON document per repository::
+
+        {"version": 1, "linters": {"ruff": {"config": "<hash>", "files": {
+            "src/app.py": {"mtime_ns": ..., "size": ..., "hash": "...", "issues": [...]}
+        }}}}
+
+    ``mtime_ns``/``size`` let unchanged files skip re-hashing.
+    """
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self._data: dict[str, Any] = {"version": CACHE_VERSION, "linters": {}}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text())
+                if data.get("version") == CACHE_VERSION:
+                    self._data = data
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"[LINT] Ignoring unreadable cache {path}: {e}")
+
+    def linter(self, name: str, config_hash: str) -> dict[str, Any]:
+        """File entries of a linter (reset when its config changed)."""
+        entry = self._data["linters"].get(name)
+        if entry is None or entry.get("config") != config_hash:
+            entry = {"config": config_hash, "files": {}}
+            self._data["linters"][name] = entry
+        files: dict[str, Any] = entry["files"]
+        return files
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(self._data, fh)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"[LINT] Could not write cache {self.path}: {e}")
+            Path(tmp).unlink(missing_ok=True)
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:32]
+
+
+def _config_hash(repo_path: Path, spec: LinterSpec) -> str:
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{spec.name}".encode())
+    for name in spec.config_files:
+        path = repo_path / name
+        if path.is_file():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:32]
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+
+def list_lint_files(repo_path: Path) -> list[str]:
+    """Tracked and untracked (not ignored) files, relative to the repository."""
+    try:
+        proc = subprocess.run(
+            ["git", "ls-files", "-co", "--exclude-standard"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if proc.returncode == 0:
+            return sorted(line for line in proc.stdout.splitlines() if line)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    return sorted(
+        str(p.relative_to(repo_path))
+        for p in repo_path.rglob("*")
+        if p.is_file() and not should_ignore(p.relative_to(repo_path))
+    )
+
+
+class LintEngine:
+    """Runs linters over a repository with incremental result caching."""
+
+    def __init__(
+        self,
+        repo_path: Path,
+        linters: tuple[LinterSpec, ...] = DEFAULT_LINTERS,
+        cache_dir: Path | None = None,
+        max_parallel: int | None = None,
+        batch_size: int | None = None,
+        timeout_seconds: int | None = None,
+        use_cache: bool = True,
+    ):
+        """Initialize engine.
+
+        Args:
+            repo_path: Repository root (linters run with it as working directory)
+            linters: Linter specs to consider
+            cache_dir: Where result caches live (default from settings)
+            max_parallel: Linter processes at once (default from settings)
+            batch_size: Files per per-file linter process (default from settings)
+            timeout_seconds: Per-process timeout (default from settings)
+            use_cache: False to re-lint everything (the cache is still refreshed)
+        """
+        settings = get_settings().lint
+        self.repo_path = repo_path.resolve()
+        self.linters = linters
+        self.max_parallel = max_parallel or settings.max_parallel
+        self.batch_size = batch_size or settings.batch_size
+        self.timeout_seconds = timeout_seconds or settings.timeout_seconds
+        self.use_cache = use_cache
+        cache_root = cache_dir or settings.cache_dir
+        repo_key = hashlib.sha256(str(self.repo_path).encode()).hexdigest()[:16]
+        self.cache = LintCache(cache_root / f"{repo_key}.json")
+
+    def detect(self, files: list[str]) -> tuple[list[LinterSpec], dict[str, str]]:
+        """Linters that apply to ``files``, and why the others were skipped."""
+        active: list[LinterSpec] = []
+        skipped: dict[str, str] = {}
+        for spec in self.linters:
+            if not any(f.endswith(spec.extensions) for f in files):
+                continue
+            if not spec.is_configured(self.repo_path):
+                skipped[spec.name] = "not configured"
+            elif spec.build_command(self.repo_path, []) is None:
+                skipped[spec.name] = "not installed"
+            else:
+                active.append(spec)
+        return active, skipped
+
+    async def run(self, files: list[str] | None = None) -> LintRun:
+        """Lint the repository (or the given repository-relative files)."""
+        started = time.monotonic()
+        prune = files is None
+        if files is None:
+            files = await asyncio.to_thread(list_lint_files, self.repo_path)
+        specs, skipped = self.detect(files)
+        run = LintRun(skipped=skipped)
+
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        results = await asyncio.gather(
+            *(self._run_linter(spec, files, semaphore, prune) for spec in specs)
+        )
+        for spec, (stats, issues) in zip(specs, results, strict=True):
+            run.linters[spec.name] = stats
+            run.issues.extend(issues)
+
+        await asyncio.to_thread(self.cache.save)
+        run.duration_seconds = time.monotonic() - started
+        logger.info(
+            f"[LINT] {self.repo_path.name}: {len(run.issues)} issues from "
+            f"{', '.join(run.linters) or 'no linters'} "
+            f"({run.files_linted} linted, {run.files_cached} cached) "
+            f"in {run.duration_seconds:.1f}s"
+        )
+        return run
+
+    async def _run_linter(
+        self, spec: LinterSpec, files: list[str], semaphore: asyncio.Semaphore, prune: bool
+    ) -> tuple[LinterStats, list[LintIssue]]:
+        targets = [f for f in files if f.endswith(spec.extensions)]
+        stats = LinterStats(files=len(targets))
+        entries = self.cache.linter(spec.name, _config_hash(self.repo_path, spec))
+        states = await asyncio.to_thread(self._file_states, targets, entries)
+
+        dirty = [f for f in targets if not self.use_cache or states[f] is None]
+        if prune:
+            for stale in set(entries) - set(targets):
+                del entries[stale]
+        if not spec.per_file and dirty:
+            dirty = targets
+
+        issues: list[LintIssue] = []
+        for file_path in targets:
+            if file_path not in dirty:
+                issues.extend(LintIssue(**i) for i in entries[file_path]["issues"])
+        stats.cached = len(targets) - len(dirty)
+
+        batches = (
+            [dirty[i : i + self.batch_size] for i in range(0, len(dirty), self.batch_size)]
+            if spec.per_file
+            else ([dirty] if dirty else [])
+        )
+
+        async def lint_batch(batch: list[str]) -> list[LintIssue] | None:
+            async with semaphore:
+                return await self._exec(spec, batch, stats)
+
+        fresh = await asyncio.gather(*(lint_batch(b) for b in batches))
+        for batch, batch_issues in zip(batches, fresh, strict=True):
+            if batch_issues is None:
+                continue  # Failed: leave the files uncached so they run again
+            by_file: dict[str, list[LintIssue]] = {f: [] for f in batch}
+            for issue in batch_issues:
+                by_file.setdefault(issue.file, []).append(issue)
+            for file_path, file_issues in by_file.items():
+                state = self._stat(file_path)
+                if state is None:
+                    continue
+                state["issues"] = [asdict(i) for i in file_issues]
+                entries[file_path] = state
+            issues.extend(batch_issues)
+            stats.linted += len(batch)
+
+        stats.issues = len(issues)
+        return stats, issues
+
+    async def _exec(
+        self, spec: LinterSpec, batch: list[str], stats: LinterStats
+    ) -> list[LintIssue] | None:
+        """Run one linter process; None on failure."""
+        cmd = spec.build_command(self.repo_path, batch)
+        if cmd is None:
+            stats.errors.append("not installed")
+            return None
+        stats.processes += 1
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=str(self.repo_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=self.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                stats.errors.append(f"timed out after {self.timeout_seconds}s")
+                return None
+        except OSError as e:
+            stats.errors.append(str(e))
+            return None
+
+        if process.returncode not in spec.ok_returncodes:
+            error = (stderr or stdout).decode(errors="replace").strip()[:500]
+            logger.warning(f"[LINT] {spec.name} exited with {process.returncode}: {error}")
+            stats.errors.append(f"exit code {process.returncode}: {error}")
+            return None
+
+        issues = spec.parse(stdout.decode(errors="replace"))
+        for issue in issues:
+            issue.linter = spec.name
+            issue.file = self._relative(issue.file)
+        return issues
+
+    def _relative(self, file_path: str) -> str:
+        path = Path(file_path)
+        if not path.is_absolute():
+            return path.as_posix()
+        try:
+            return path.resolve().relative_to(self.repo_path).as_posix()
+        except ValueError:
+            return file_path
+
+    def _stat(self, file_path: str) -> dict[str, Any] | None:
+        path = self.repo_path / file_path
+        try:
+            stat = path.stat()
+            return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": _file_hash(path)}
+        except OSError:
+            return None
+
+    def _file_states(
+        self, targets: list[str], entries: dict[str, Any]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Cache entry of every target that is still valid (None if it must be linted)."""
+        states: dict[str, dict[str, Any] | None] = {}
+        for file_path in targets:
+            entry = entries.get(file_path)
+            path = self.repo_path / file_path
+            try:
+                stat = path.stat()
+            except OSError:
+                states[file_path] = None
+                continue
+            if entry is None:
+                states[file_path] = None
+            elif entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                states[file_path] = entry
+            elif entry["size"] == stat.st_size and entry["hash"] == _file_hash(path):
+                # Touched but unchanged
+                entry["mtime_ns"] = stat.st_mtime_ns
+                states[file_path] = entry
+            else:
+                states[file_path] = None
+        return states
+
+
+# =============================================================================
+# Issue mapping
+# =============================================================================
+
+# Ruff rules for likely bugs / security problems (pyflakes, syntax, pylint errors, bandit, bugbear)
+RUFF_HIGH_RE = re.compile(r"^(F|E9|PLE|S|B)\d")
+# Ruff rules for pure style (imports, whitespace, quotes, commas, docstrings)
+RUFF_LOW_RE = re.compile(r"^(I|W|Q|COM|D|E[1-5])\d")
+
+
+def lint_severity(issue: LintIssue) -> str:
+    """Map a linter finding to an Issue severity (CRITICAL/HIGH/MEDIUM/LOW)."""
+    if issue.linter == "mypy":
+        return "HIGH" if issue.severity == "error" else "MEDIUM"
+    if issue.linter == "ruff":
+        if RUFF_HIGH_RE.match(issue.code):
+            return "HIGH"
+        if RUFF_LOW_RE.match(issue.code):
+            return "LOW"
+        return "MEDIUM"
+    return "MEDIUM" if issue.severity == "error" else "LOW"
+
+
+def lint_issue_code(issue: LintIssue) -> str:
+    """Stable issue code, e.g. ``RUFF-F401`` or ``ESLINT-no-unused-vars``."""
+    return f"{(issue.linter or 'lint').upper()}-{issue.code or 'ERROR'}"[:50]
@@ -25,6 +25,7 @@ class LintIssue:
     code: str
     message: str
     severity: Literal["error", "warning"] = "error"
+    linter: str = ""
 
 
 @dataclass
@@ -202,6 +203,43 @@ def parse_eslint_output(output: str) -> list[LintIssue]:
         return []
 
 
+def parse_mypy_output(output: str) -> list[LintIssue]:
+    """Parse mypy ``--output json`` (one JSON object per line) into LintIssue objects.
+
+    Notes attached to errors are skipped.
+
+    Args:
+        output: Raw output from mypy.
+
+    Returns:
+        List of LintIssue objects.
+    """
+    issues = []
+    for raw in output.splitlines():
+        if not raw.startswith("{"):
+            continue
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if item.get("severity") == "note":
+            continue
+        message = item.get("message", "")
+        if item.get("hint"):
+            message = f"{message} ({item['hint']})"
+        issues.append(
+            LintIssue(
+                file=item.get("file", ""),
+                line=item.get("line", 0),
+                column=item.get("column", 0),
+                code=item.get("code") or "",
+                message=message,
+                severity="error" if item.get("severity", "error") == "error" else "warning",
+            )
+        )
+    return issues
+
+
 def parse_lint_json_from_llm(output: str) -> list[dict[str, Any]]:
     """Parse JSON issues from LLM lint output.
 
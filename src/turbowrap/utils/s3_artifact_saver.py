@@ -2,6 +2,11 @@
 
 Provides a centralized async S3 saver with lazy client loading,
 eliminating code duplication across ClaudeCLI and GeminiCLI.
+
+Text artifacts (markdown, raw, JSON) are handed to the background
+S3UploadPipeline (compressed, retried, spilled to disk if S3 is down), so
+saving never blocks an LLM call. The pre-signed URL is computed locally
+and returned immediately.
 """
 
 import asyncio
@@ -11,7 +16,9 @@ from typing import Any
 
 from botocore.exceptions import ClientError
 
+from ..config import get_settings
 from .aws_clients import get_s3_client
+from .s3_upload_pipeline import get_upload_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,7 @@ class S3ArtifactSaver:
         region: str,
         prefix: str,
         url_expiration: int | None = None,
+        background: bool | None = None,
     ):
         """Initialize S3 artifact saver.
 
@@ -41,11 +49,16 @@ class S3ArtifactSaver:
             region: AWS region
             prefix: S3 key prefix for artifacts
             url_expiration: Pre-signed URL expiration in seconds (default: 7 days)
+            background: Upload text artifacts via the background pipeline
+                (default: settings.artifact_upload.background)
         """
         self.bucket = bucket
         self.region = region
         self.prefix = prefix
         self.url_expiration = url_expiration or self.DEFAULT_URL_EXPIRATION
+        if background is None:
+            background = get_settings().artifact_upload.background
+        self.background = background
         self._client: Any = None
         self._bucket_region: str | None = None
 
@@ -82,6 +95,30 @@ class S3ArtifactSaver:
             ExpiresIn=self.url_expiration,
         )
 
+    async def _put_text(self, s3_key: str, body: bytes, content_type: str) -> None:
+        """Upload a text artifact, in the background pipeline when enabled.
+
+        Raises:
+            ClientError: Inline upload failed (background uploads retry/spill instead)
+        """
+        if self.background:
+            get_upload_pipeline().submit(
+                bucket=str(self.bucket),
+                key=s3_key,
+                body=body,
+                content_type=content_type,
+                region=self.region,
+            )
+            return
+
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self.bucket,
+            Key=s3_key,
+            Body=body,
+            ContentType=content_type,
+        )
+
     async def save_markdown(
         self,
         content: str,
@@ -126,13 +163,7 @@ class S3ArtifactSaver:
 """
 
         try:
-            await asyncio.to_thread(
-                self.client.put_object,
-                Bucket=self.bucket,
-                Key=s3_key,
-                Body=md_content.encode("utf-8"),
-                ContentType="text/markdown",
-            )
+            await self._put_text(s3_key, md_content.encode("utf-8"), "text/markdown")
             # Generate pre-signed URL for authenticated browser access
             presigned_url = self._generate_presigned_url(s3_key)
             logger.info(f"[S3] Saved {artifact_type} to {s3_key}")
@@ -164,13 +195,7 @@ class S3ArtifactSaver:
         s3_key = f"{self.prefix}/{timestamp}/{context_id}_{artifact_type}.jsonl"
 
         try:
-            await asyncio.to_thread(
-                self.client.put_object,
-                Bucket=self.bucket,
-                Key=s3_key,
-                Body=content.encode("utf-8"),
-                ContentType="application/x-ndjson",
-            )
+            await self._put_text(s3_key, content.encode("utf-8"), "application/x-ndjson")
             # Generate pre-signed URL for authenticated browser access
             presigned_url = self._generate_presigned_url(s3_key)
             logger.info(f"[S3] Saved raw {artifact_type} to {s3_key}")
@@ -205,13 +230,7 @@ class S3ArtifactSaver:
 
         try:
             json_content = json.dumps(content, indent=2, ensure_ascii=False)
-            await asyncio.to_thread(
-                self.client.put_object,
-                Bucket=self.bucket,
-                Key=s3_key,
-                Body=json_content.encode("utf-8"),
-                ContentType="application/json",
-            )
+            await self._put_text(s3_key, json_content.encode("utf-8"), "application/json")
             # Generate pre-signed URL for authenticated browser access
             presigned_url = self._generate_presigned_url(s3_key)
             logger.info(f"[S3] Saved JSON {artifact_type} to {s3_key}")
@@ -0,0 +1,459 @@
+"""Background upload pipeline for S3 artifacts.
+
+Prompt, output and thinking archives used to be uploaded inline (one
+blocking ``put_object`` per artifact, before and after every LLM call).
+This pipeline takes them off the hot path:
+
+- A bounded queue feeds a few worker threads, so it works from any event
+  loop (including ``asyncio.run`` inside worker threads) and from sync code.
+- Text bodies are compressed (gzip, or zstd when ``zstandard`` is installed)
+  and stored with the matching ``Content-Encoding``.
+- Large bodies (e.g. thinking logs) go through multipart upload.
+- Failed uploads are retried with backoff, then spilled to disk and
+  re-queued once S3 is reachable again. Queue overflow spills as well.
+
+Readers that use boto3 directly must decode bodies with ``read_s3_body``;
+browsers and HTTP clients decode ``Content-Encoding`` transparently.
+
+Usage:
+    pipeline = get_upload_pipeline()
+    pipeline.submit("bucket", "prefix/key.md", body, "text/markdown")
+"""
+
+import atexit
+import gzip
+import io
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..config import get_settings
+from .aws_clients import get_s3_client
+
+logger = logging.getLogger(__name__)
+
+# Backoff base delay between retries (doubled on each attempt)
+RETRY_BASE_DELAY_SECONDS = 0.5
+
+# How often idle workers retry spilled uploads
+SPILL_RETRY_INTERVAL_SECONDS = 60.0
+
+_zstd_warning_logged = False
+
+
+# =============================================================================
+# Content encoding
+# =============================================================================
+
+
+def _get_zstd() -> Any:
+    """Get the optional zstandard module (None if not installed)."""
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def encode_body(data: bytes, compression: str, min_bytes: int = 0) -> tuple[bytes, str | None]:
+    """Compress ``data`` for upload.
+
+    Args:
+        data: Raw body
+        compression: "none", "gzip" or "zstd" (falls back to gzip if unavailable)
+        min_bytes: Bodies smaller than this are not compressed
+
+    Returns:
+        Tuple of (body, Content-Encoding or None)
+    """
+    global _zstd_warning_logged
+
+    if compression == "none" or len(data) < min_bytes:
+        return data, None
+
+    if compression == "zstd":
+        zstd = _get_zstd()
+        if zstd is not None:
+            return zstd.ZstdCompressor(level=3).compress(data), "zstd"
+        if not _zstd_warning_logged:
+            logger.warning("[S3 UPLOAD] zstandard not installed, falling back to gzip")
+            _zstd_warning_logged = True
+
+    return gzip.compress(data, compresslevel=6, mtime=0), "gzip"
+
+
+def decode_body(data: bytes, content_encoding: str | None) -> bytes:
+    """Decompress a body according to its ``Content-Encoding``."""
+    if content_encoding == "gzip":
+        return gzip.decompress(data)
+    if content_encoding == "zstd":
+        zstd = _get_zstd()
+        if zstd is None:
+            raise RuntimeError("Artifact is zstd-encoded but zstandard is not installed")
+        return bytes(zstd.ZstdDecompressor().decompress(data))
+    return data
+
+
+def read_s3_body(response: dict[str, Any]) -> bytes:
+    """Read a boto3 ``get_object`` response body, decoding any Content-Encoding."""
+    return decode_body(response["Body"].read(), response.get("ContentEncoding"))
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+
+@dataclass
+class UploadJob:
+    """One pending artifact upload."""
+
+    bucket: str
+    key: str
+    body: bytes
+    content_type: str
+    region: str | None = None
+    metadata: dict[str, str] = field(default_factory=dict)
+    content_encoding: str | None = None
+    encoded: bool = False
+
+
+@dataclass
+class UploadMetrics:
+    """Counters for the upload pipeline."""
+
+    submitted: int = 0
+    uploaded: int = 0
+    multipart: int = 0
+    retries: int = 0
+    spilled: int = 0
+    respooled: int = 0
+    bytes_raw: int = 0
+    bytes_sent: int = 0
+    upload_seconds: float = 0.0
+
+
+class S3UploadPipeline:
+    """Bounded queue + worker threads uploading artifacts to S3."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[str | None], Any] = get_s3_client,
+        workers: int = 2,
+        max_queue: int = 500,
+        compression: str = "gzip",
+        min_compress_bytes: int = 1024,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        max_retries: int = 3,
+        spill_dir: Path | None = None,
+        retry_base_delay: float = RETRY_BASE_DELAY_SECONDS,
+        spill_retry_interval: float = SPILL_RETRY_INTERVAL_SECONDS,
+    ):
+        self._client_factory = client_factory
+        self.workers = workers
+        self.compression = compression
+        self.min_compress_bytes = min_compress_bytes
+        self.multipart_threshold = multipart_threshold
+        self.max_retries = max_retries
+        self.spill_dir = spill_dir
+        self.retry_base_delay = retry_base_delay
+        self.spill_retry_interval = spill_retry_interval
+
+        self._queue: queue.Queue[UploadJob | None] = queue.Queue(maxsize=max_queue)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._metrics = UploadMetrics()
+        self._last_failure = 0.0
+        self._last_spill_drain = 0.0
+        self._started = False
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start worker threads (idempotent)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"s3-upload-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"[S3 UPLOAD] Started {self.workers} upload workers")
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued upload has finished (or spilled).
+
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Flush, spill anything left over and stop the workers."""
+        if not self._started:
+            return
+        if not self.flush(timeout):
+            logger.warning("[S3 UPLOAD] Flush timed out, spilling queued uploads")
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                self._spill(job)
+            self._queue.task_done()
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        self._started = False
+        self._threads.clear()
+        logger.info(f"[S3 UPLOAD] Shutdown: {self.get_metrics()}")
+
+    # -------------------------------------------------------------------------
+    # Submission
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        bucket: str,
+        key: str,
+        body: bytes,
+        content_type: str,
+        region: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        """Queue an upload without blocking. Overflow is spilled to disk."""
+        self.start()
+        job = UploadJob(
+            bucket=bucket,
+            key=key,
+            body=body,
+            content_type=content_type,
+            region=region,
+            metadata=metadata or {},
+        )
+        with self._lock:
+            self._metrics.submitted += 1
+            self._metrics.bytes_raw += len(body)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            logger.warning(f"[S3 UPLOAD] Queue full, spilling {key}")
+            self._spill(job)
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def _worker(self) -> None:
+        while True:
+            try:
+                job = self._queue.get(timeout=self.spill_retry_interval)
+            except queue.Empty:
+                self._maybe_drain_spill()
+                continue
+
+            if job is None:
+                self._queue.task_done()
+                return
+            try:
+                self._upload_with_retry(job)
+            except Exception as e:
+                logger.error(f"[S3 UPLOAD] Unexpected error for {job.key}: {e}")
+            finally:
+                self._queue.task_done()
+            self._maybe_drain_spill()
+
+    def _upload_with_retry(self, job: UploadJob) -> None:
+        if not job.encoded:
+            job.body, job.content_encoding = encode_body(
+                job.body, self.compression, self.min_compress_bytes
+            )
+            job.encoded = True
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                started = time.monotonic()
+                multipart = self._put(job)
+                with self._lock:
+                    self._metrics.uploaded += 1
+                    self._metrics.multipart += int(multipart)
+                    self._metrics.bytes_sent += len(job.body)
+                    self._metrics.upload_seconds += time.monotonic() - started
+                logger.debug(f"[S3 UPLOAD] Uploaded {job.key} ({len(job.body)} bytes)")
+                return
+            except Exception as e:
+                self._last_failure = time.monotonic()
+                if attempt < self.max_retries:
+                    with self._lock:
+                        self._metrics.retries += 1
+                    delay = self.retry_base_delay * (2**attempt)
+                    logger.warning(
+                        f"[S3 UPLOAD] Upload of {job.key} failed ({e}), retrying in {delay:.1f}s"
+                    )
+                    time.sleep(delay)
+                else:
+                    logger.warning(f"[S3 UPLOAD] Upload of {job.key} failed ({e}), spilling")
+
+        self._spill(job)
+
+    def _put(self, job: UploadJob) -> bool:
+        """Upload one job. Returns True if multipart was used."""
+        client = self._client_factory(job.region)
+        extra: dict[str, Any] = {"ContentType": job.content_type}
+        if job.content_encoding:
+            extra["ContentEncoding"] = job.content_encoding
+        if job.metadata:
+            extra["Metadata"] = job.metadata
+
+        if len(job.body) >= self.multipart_threshold:
+            from boto3.s3.transfer import TransferConfig
+
+            client.upload_fileobj(
+                io.BytesIO(job.body),
+                job.bucket,
+                job.key,
+                ExtraArgs=extra,
+                Config=TransferConfig(
+                    multipart_threshold=self.multipart_threshold,
+                    multipart_chunksize=self.multipart_threshold,
+                ),
+            )
+            return True
+
+        client.put_object(Bucket=job.bucket, Key=job.key, Body=job.body, **extra)
+        return False
+
+    # -------------------------------------------------------------------------
+    # Spill to disk
+    # -------------------------------------------------------------------------
+
+    def _spill(self, job: UploadJob) -> None:
+        """Persist a job that couldn't be uploaded; it is retried later."""
+        if self.spill_dir is None:
+            logger.error(f"[S3 UPLOAD] Dropping {job.key}: no spill directory configured")
+            return
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            name = uuid.uuid4().hex
+            (self.spill_dir / f"{name}.body").write_bytes(job.body)
+            header = asdict(job)
+            del header["body"]
+            # Write the header last: it marks the spill entry as complete
+            (self.spill_dir / f"{name}.json").write_text(json.dumps(header))
+            with self._lock:
+                self._metrics.spilled += 1
+        except OSError as e:
+            logger.error(f"[S3 UPLOAD] Failed to spill {job.key}: {e}")
+
+    def _maybe_drain_spill(self) -> None:
+        """Re-queue spilled uploads when S3 has been healthy for a while."""
+        if self.spill_dir is None or not self.spill_dir.exists():
+            return
+        now = time.monotonic()
+        with self._lock:
+            if (
+                now - self._last_failure < self.spill_retry_interval
+                or now - self._last_spill_drain < self.spill_retry_interval
+            ):
+                return
+            self._last_spill_drain = now
+        self.drain_spill()
+
+    def drain_spill(self) -> int:
+        """Move spilled uploads back onto the queue.
+
+        Returns:
+            Number of uploads re-queued
+        """
+        if self.spill_dir is None or not self.spill_dir.exists():
+            return 0
+
+        requeued = 0
+        for header_path in sorted(self.spill_dir.glob("*.json")):
+            body_path = header_path.with_suffix(".body")
+            try:
+                header = json.loads(header_path.read_text())
+                job = UploadJob(body=body_path.read_bytes(), **header)
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"[S3 UPLOAD] Skipping corrupt spill entry {header_path.name}: {e}")
+                continue
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                break
+            header_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            requeued += 1
+
+        if requeued:
+            with self._lock:
+                self._metrics.respooled += requeued
+            logger.info(f"[S3 UPLOAD] Re-queued {requeued} spilled uploads")
+        return requeued
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get throughput and queue metrics."""
+        with self._lock:
+            m = UploadMetrics(**asdict(self._metrics))
+        return {
+            **asdict(m),
+            "queue_depth": self._queue.qsize(),
+            "compression_ratio": round(m.bytes_sent / m.bytes_raw, 3) if m.bytes_raw else None,
+            "throughput_bytes_per_sec": (
+                round(m.bytes_sent / m.upload_seconds) if m.upload_seconds else None
+            ),
+            "avg_upload_ms": (
+                round(m.upload_seconds / m.uploaded * 1000, 1) if m.uploaded else None
+            ),
+        }
+
+
+# Singleton instance
+_pipeline: S3UploadPipeline | None = None
+_pipeline_lock = threading.Lock()
+
+
+def get_upload_pipeline() -> S3UploadPipeline:
+    """Get singleton S3UploadPipeline configured from settings."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                config = get_settings().artifact_upload
+                _pipeline = S3UploadPipeline(
+                    workers=config.workers,
+                    max_queue=config.max_queue,
+                    compression=config.compression,
+                    min_compress_bytes=config.min_compress_bytes,
+                    multipart_threshold=config.multipart_threshold_mb * 1024 * 1024,
+                    max_retries=config.max_retries,
+                    spill_dir=config.spill_dir.expanduser(),
+                )
+                # Don't lose queued artifacts when a CLI process exits
+                atexit.register(_pipeline.shutdown)
+    return _pipeline
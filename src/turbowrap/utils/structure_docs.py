@@ -0,0 +1,288 @@
+"""Process-wide cache of parsed repository structure documents.
+
+Reviews, fixes and chat sessions all embed ``.llms/structure.xml`` (or a
+legacy STRUCTURE.md) in their prompts. Each used to read the file again and
+send it whole. StructureCache reads a document once per content version
+(keyed by path, validated by mtime/size and then by content hash) and
+parses XML documents into modules, files and symbols, so callers can ask
+for the part they need:
+
+    doc = load_structure_document(repo_path, workspace_path)
+    doc.text                                           # Whole document
+    doc.render(paths=changed_files, max_tokens=8000)   # Touched directories only
+    doc.find_symbol("ReviewContext")                   # ["src/review/base.py"]
+
+Both the compact (``<r><m p=..><f n=..><fn n=..>``) and the verbose
+(``<repository><module path=..>``) formats written by
+tools/structure_generator.py are understood.
+"""
+
+import hashlib
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from xml.sax.saxutils import quoteattr
+
+from turbowrap_llm.hooks import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+STRUCTURE_XML_PATH = Path(".llms") / "structure.xml"
+MAX_CACHED_DOCUMENTS = 32
+
+# Compact and verbose tag/attribute names (see StructureGenerator._generate_structure_xml)
+_MODULE_TAGS = {"m", "module"}
+_FILE_TAGS = {"f", "file"}
+_SYMBOL_TAGS = {"fn", "cls", "cmp", "function", "class", "component"}
+_NAME_ATTRS = ("n", "name")
+_PATH_ATTRS = ("p", "path")
+
+
+def _attr(elem: ET.Element, names: tuple[str, ...]) -> str:
+    for name in names:
+        value = elem.get(name)
+        if value is not None:
+            return value
+    return ""
+
+
+def _normalize_dir(path: str) -> str:
+    """Module path as written by the generator ("/" for the root)."""
+    path = path.strip().strip("/")
+    return "/" if path in ("", ".") else path
+
+
+@dataclass
+class StructureModule:
+    """One directory of the structure document."""
+
+    path: str  # "/" for the root, otherwise relative without slashes
+    xml: str
+    files: list[str] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.xml)
+
+
+class StructureDocument:
+    """A structure document, indexed by directory, file and symbol."""
+
+    def __init__(self, path: Path, text: str, digest: str) -> None:
+        """Parse a document.
+
+        Args:
+            path: File the document was read from
+            text: Document content
+            digest: SHA-256 of the content
+        """
+        self.path = path
+        self.text = text
+        self.digest = digest
+        self.is_xml = False
+        self.repo_type: str | None = None
+        self.modules: dict[str, StructureModule] = {}
+        self.symbols: dict[str, list[str]] = {}
+        self._header = ""
+        self._footer = ""
+        if text.lstrip().startswith("<"):
+            self._parse(text)
+
+    def _parse(self, text: str) -> None:
+        try:
+            root = ET.fromstring(text)  # noqa: S314 - written by our own generator
+        except ET.ParseError as e:
+            logger.warning(f"[STRUCTURE] Cannot parse {self.path}: {e}")
+            return
+
+        self.is_xml = True
+        self.repo_type = root.get("type")
+        attrs = "".join(f" {k}={quoteattr(v)}" for k, v in root.attrib.items())
+        header = [f'<?xml version="1.0" encoding="UTF-8"?>\n<{root.tag}{attrs}>']
+        for child in root:
+            if child.tag not in _MODULE_TAGS:
+                header.append(ET.tostring(child, encoding="unicode").strip())
+                continue
+            dir_path = _normalize_dir(_attr(child, _PATH_ATTRS))
+            module = StructureModule(
+                path=dir_path, xml=" " + ET.tostring(child, encoding="unicode").strip()
+            )
+            for file_elem in child:
+                if file_elem.tag not in _FILE_TAGS:
+                    continue
+                name = _attr(file_elem, _NAME_ATTRS)
+                file_path = name if dir_path == "/" else f"{dir_path}/{name}"
+                module.files.append(file_path)
+                for symbol in file_elem:
+                    if symbol.tag in _SYMBOL_TAGS:
+                        self.symbols.setdefault(_attr(symbol, _NAME_ATTRS), []).append(file_path)
+            self.modules[dir_path] = module
+        self._header = "".join(header)
+        self._footer = f"\n</{root.tag}>"
+
+    # -- Queries --------------------------------------------------------------
+
+    @property
+    def tokens(self) -> int:
+        """Estimated token count of the whole document."""
+        return estimate_tokens(self.text)
+
+    def find_symbol(self, name: str) -> list[str]:
+        """Files defining a function, class or component with this name."""
+        return list(self.symbols.get(name, []))
+
+    def modules_for(self, paths: list[str]) -> list[StructureModule]:
+        """Modules of the directories containing ``paths`` and their parents.
+
+        Directories holding the paths come first, then their ancestors
+        (closest first), without duplicates.
+        """
+        touched: list[str] = []
+        ancestors: list[str] = []
+        for path in paths:
+            parent = PurePosixPath(path.strip("/")).parent
+            touched.append(_normalize_dir(str(parent)))
+            ancestors.extend(_normalize_dir(str(p)) for p in parent.parents)
+        ordered = dict.fromkeys([*touched, *ancestors])
+        return [self.modules[p] for p in ordered if p in self.modules]
+
+    def render(self, paths: list[str] | None = None, max_tokens: int | None = None) -> str:
+        """The document, or the part of it that matters for ``paths``.
+
+        Args:
+            paths: Only directories containing these files (and their
+                parents); all directories if None
+            max_tokens: Token budget; directories that don't fit are left
+                out (noted in a comment), most relevant ones kept first
+
+        Returns:
+            XML in the same format as the source file. Markdown documents
+            and unparseable files are returned whole.
+        """
+        if not self.is_xml or (paths is None and (max_tokens is None or self.tokens <= max_tokens)):
+            return self.text
+
+        candidates = list(self.modules.values()) if paths is None else self.modules_for(paths)
+        budget = None if max_tokens is None else max_tokens - estimate_tokens(self._header)
+        chosen: set[str] = set()
+        for module in candidates:
+            if budget is not None:
+                if module.tokens > budget:
+                    continue
+                budget -= module.tokens
+            chosen.add(module.path)
+
+        parts = [self._header]
+        parts.extend("\n" + m.xml for m in self.modules.values() if m.path in chosen)
+        omitted = len(self.modules) - len(chosen)
+        if omitted:
+            parts.append(f"\n <!-- {omitted} of {len(self.modules)} directories omitted -->")
+        parts.append(self._footer)
+        return "".join(parts)
+
+
+@dataclass
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    document: StructureDocument
+
+
+class StructureCache:
+    """Parsed structure documents keyed by path, reloaded when they change."""
+
+    def __init__(self, max_documents: int = MAX_CACHED_DOCUMENTS) -> None:
+        self.max_documents = max_documents
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Path, _CacheEntry] = OrderedDict()
+        self.stats = {"hits": 0, "loads": 0, "parses": 0}
+
+    def get(self, path: Path) -> StructureDocument | None:
+        """Parsed document at ``path``, or None if it can't be read."""
+        path = path.resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            self._drop(path)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(path)
+                self.stats["hits"] += 1
+                return entry.document
+
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            logger.warning(f"[STRUCTURE] Failed to read {path}: {e}")
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            self.stats["loads"] += 1
+            entry = self._entries.get(path)
+            if entry and entry.document.digest == digest:
+                # Touched (e.g. regenerated) but identical: keep the parsed form
+                document = entry.document
+            else:
+                document = StructureDocument(path, data.decode("utf-8", errors="replace"), digest)
+                self.stats["parses"] += 1
+                logger.info(f"[STRUCTURE] Loaded {path} ({len(data):,} bytes)")
+            self._entries[path] = _CacheEntry(stat.st_mtime_ns, stat.st_size, document)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_documents:
+                self._entries.popitem(last=False)
+        return document
+
+    def _drop(self, path: Path) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache: StructureCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_structure_cache() -> StructureCache:
+    """Get the process-wide structure document cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = StructureCache()
+    return _cache
+
+
+def structure_xml_path(repo_path: Path | str, workspace_path: str | None = None) -> Path:
+    """Location of ``.llms/structure.xml`` for a repository or monorepo workspace."""
+    base = Path(repo_path)
+    if workspace_path and (base / workspace_path).exists():
+        base = base / workspace_path
+    return base / STRUCTURE_XML_PATH
+
+
+def load_structure_document(
+    repo_path: Path | str, workspace_path: str | None = None
+) -> StructureDocument | None:
+    """Cached ``.llms/structure.xml`` of a repository, or None if missing."""
+    return get_structure_cache().get(structure_xml_path(repo_path, workspace_path))
+
+
+__all__ = [
+    "STRUCTURE_XML_PATH",
+    "StructureCache",
+    "StructureDocument",
+    "StructureModule",
+    "get_structure_cache",
+    "load_structure_document",
+    "structure_xml_path",
+]
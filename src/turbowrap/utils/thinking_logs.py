@@ -0,0 +1,223 @@
+"""Key index for reviewer thinking logs in S3.
+
+Thinking logs are written to ``thinking/{YYYY}/{MM}/{DD}/{HHMMSS}/
+{review_id}_{component}.md`` (see S3Logger). Finding one reviewer's log
+used to mean listing every object under ``thinking/``, so lookups got
+slower with every review ever run. Now:
+
+- The writer also stores a small pointer at
+  ``thinking/index/{review_id}/{component}.json`` holding the log key, so
+  a lookup is one GET whatever the bucket size.
+- Logs written before the index existed are found by listing only the
+  day prefixes the review can have written to (the task's creation day
+  and the next one, or the retention window when the day is unknown).
+  A log found this way gets its pointer, so the scan happens once.
+
+All methods are blocking (boto3): call them from a thread in async code.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+THINKING_PREFIX = "thinking/"
+INDEX_PREFIX = "thinking/index/"
+# Reviews that started close to midnight finish the next day
+SCAN_DAYS_AFTER_START = 1
+
+
+@dataclass
+class ThinkingLogRef:
+    """Location of one reviewer's thinking log."""
+
+    reviewer_name: str
+    s3_key: str
+    last_modified: datetime | None = None
+    size_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "reviewer_name": self.reviewer_name,
+            "s3_key": self.s3_key,
+            "last_modified": self.last_modified.isoformat() if self.last_modified else None,
+            "size_bytes": self.size_bytes,
+        }
+
+
+def index_key(review_id: str, component: str) -> str:
+    """Pointer key of a review component's thinking log."""
+    return f"{INDEX_PREFIX}{review_id}/{component}.json"
+
+
+def day_prefix(day: date) -> str:
+    """Key prefix of the thinking logs written on ``day`` (UTC)."""
+    return f"{THINKING_PREFIX}{day:%Y/%m/%d}/"
+
+
+def _is_missing(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code", "") in ("NoSuchKey", "404")
+
+
+def _filename(key: str) -> str:
+    return key.rsplit("/", 1)[-1]
+
+
+class ThinkingLogIndex:
+    """Resolve and list thinking logs without scanning the whole bucket."""
+
+    def __init__(self, client: Any, bucket: str, retention_days: int = 10) -> None:
+        """Initialize index.
+
+        Args:
+            client: boto3 S3 client
+            bucket: Thinking logs bucket
+            retention_days: Days of logs the bucket keeps (bounds legacy scans)
+        """
+        self.client = client
+        self.bucket = bucket
+        self.retention_days = retention_days
+
+    # -- Writing --------------------------------------------------------------
+
+    def record(
+        self, review_id: str, component: str, s3_key: str, size_bytes: int | None = None
+    ) -> None:
+        """Point a review component at its (latest) thinking log."""
+        body = json.dumps(
+            {
+                "s3_key": s3_key,
+                "size_bytes": size_bytes,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=index_key(review_id, component),
+            Body=body.encode("utf-8"),
+            ContentType="application/json",
+        )
+
+    # -- Lookup ---------------------------------------------------------------
+
+    def resolve(
+        self,
+        review_id: str,
+        reviewer_name: str,
+        started_at: datetime | None = None,
+    ) -> str | None:
+        """Key of a reviewer's thinking log for a review.
+
+        Args:
+            review_id: Review/task ID
+            reviewer_name: Reviewer component (e.g. reviewer_be)
+            started_at: When the review started; narrows the legacy scan
+
+        Returns:
+            The log key. Without an exact match, the most recent log of the
+            reviewer in the scanned days (reviews whose logs were written
+            under another id). None if nothing was found.
+        """
+        pointer = self._read_pointer(review_id, reviewer_name)
+        if pointer:
+            return str(pointer["s3_key"])
+
+        exact: dict[str, Any] | None = None
+        fallback: dict[str, Any] | None = None
+        for obj in self._scan(self._days(started_at)):
+            if not _filename(obj["Key"]).endswith(f"_{reviewer_name}.md"):
+                continue
+            if review_id in obj["Key"]:
+                if exact is None or obj["LastModified"] > exact["LastModified"]:
+                    exact = obj
+            elif fallback is None or obj["LastModified"] > fallback["LastModified"]:
+                fallback = obj
+
+        if exact:
+            self._backfill(review_id, reviewer_name, exact)
+            return str(exact["Key"])
+        return str(fallback["Key"]) if fallback else None
+
+    def list_logs(self, review_id: str, started_at: datetime | None = None) -> list[ThinkingLogRef]:
+        """Thinking logs of a review, one per reviewer (most recent)."""
+        logs: dict[str, ThinkingLogRef] = {}
+        prefix = f"{INDEX_PREFIX}{review_id}/"
+        for obj in self._paginate(prefix):
+            component = obj["Key"][len(prefix) :].removesuffix(".json")
+            pointer = self._read_pointer(review_id, component)
+            if pointer:
+                logs[component] = ThinkingLogRef(
+                    component, pointer["s3_key"], obj["LastModified"], pointer.get("size_bytes")
+                )
+        if logs:
+            return sorted(logs.values(), key=lambda ref: ref.reviewer_name)
+
+        # Not indexed: logs written before the index existed
+        latest: dict[str, dict[str, Any]] = {}
+        for obj in self._scan(self._days(started_at)):
+            filename = _filename(obj["Key"])
+            if not filename.startswith(f"{review_id}_") or not filename.endswith(".md"):
+                continue
+            component = filename[len(review_id) + 1 : -len(".md")]
+            if component not in latest or obj["LastModified"] > latest[component]["LastModified"]:
+                latest[component] = obj
+        for component, obj in latest.items():
+            self._backfill(review_id, component, obj)
+            logs[component] = ThinkingLogRef(
+                component, obj["Key"], obj["LastModified"], obj.get("Size")
+            )
+        return sorted(logs.values(), key=lambda ref: ref.reviewer_name)
+
+    # -- Internals ------------------------------------------------------------
+
+    def _read_pointer(self, review_id: str, component: str) -> dict[str, Any] | None:
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=index_key(review_id, component)
+            )
+        except ClientError as e:
+            if _is_missing(e):
+                return None
+            raise
+        try:
+            pointer = json.loads(response["Body"].read())
+        except ValueError as e:
+            logger.warning(f"[THINKING] Bad index entry for {review_id}/{component}: {e}")
+            return None
+        return pointer if isinstance(pointer, dict) and pointer.get("s3_key") else None
+
+    def _backfill(self, review_id: str, component: str, obj: dict[str, Any]) -> None:
+        try:
+            self.record(review_id, component, obj["Key"], obj.get("Size"))
+        except ClientError as e:
+            logger.debug(f"[THINKING] Cannot index {obj['Key']}: {e}")
+
+    def _days(self, started_at: datetime | None) -> list[date]:
+        """Days to scan, newest first."""
+        today = datetime.now(timezone.utc).date()
+        if started_at is not None:
+            if started_at.tzinfo is not None:
+                started_at = started_at.astimezone(timezone.utc)
+            first = started_at.date()
+            last = min(today, first + timedelta(days=SCAN_DAYS_AFTER_START))
+        else:
+            last = today
+            first = today - timedelta(days=self.retention_days)
+        return [last - timedelta(days=n) for n in range((last - first).days + 1)]
+
+    def _scan(self, days: list[date]) -> Iterator[dict[str, Any]]:
+        for day in days:
+            yield from self._paginate(day_prefix(day))
+
+    def _paginate(self, prefix: str) -> Iterator[dict[str, Any]]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            yield from page.get("Contents", [])
@@ -0,0 +1,218 @@
+"""
+Tests for the headless browser pool used by ScreenshotService.
+
+Run with: uv run pytest tests/api/test_browser_pool.py -v
+
+Uses fake browser objects, so Playwright/Chromium are not required.
+"""
+
+import asyncio
+
+import pytest
+
+from turbowrap.api.services import browser_pool
+from turbowrap.api.services.browser_pool import BrowserPool, BrowserPoolFullError
+
+# =============================================================================
+# Fake Playwright objects
+# =============================================================================
+
+
+class FakePage:
+    def __init__(self, browser: "FakeBrowser", viewport: dict[str, int]):
+        self.browser = browser
+        self.viewport = viewport
+        self.url = ""
+
+    async def goto(self, url: str, wait_until: str, timeout: int) -> None:
+        self.url = url
+        await asyncio.sleep(self.browser.delay)
+        if self.browser.crash_on_goto:
+            self.browser.connected = False
+            raise RuntimeError("Target closed")
+
+    async def wait_for_timeout(self, ms: int) -> None:
+        return None
+
+    async def screenshot(self, full_page: bool, type: str) -> bytes:
+        return f"{self.url}@{self.viewport['width']}x{self.viewport['height']}".encode()
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser", viewport: dict[str, int]):
+        self.browser = browser
+        self.viewport = viewport
+        self.closed = False
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self.browser, self.viewport)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connected = True
+        self.closed = False
+        self.crash_on_goto = False
+        self.contexts: list[FakeContext] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, viewport: dict[str, int], user_agent: str) -> FakeContext:
+        context = FakeContext(self, viewport)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+        self.connected = False
+
+
+@pytest.fixture
+def launched():
+    """List of browsers launched by the pool."""
+    return []
+
+
+def make_pool(launched, delay: float = 0.0, **kwargs) -> BrowserPool:
+    async def factory() -> FakeBrowser:
+        browser = FakeBrowser(delay=delay)
+        launched.append(browser)
+        return browser
+
+    return BrowserPool(browser_factory=factory, **kwargs)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    async def test_reuses_warm_browser(self, launched):
+        """Sequential captures reuse one browser with a fresh context each."""
+        pool = make_pool(launched, size=2)
+
+        first = await pool.capture("https://a.test", 800, 600)
+        second = await pool.capture("https://b.test", 800, 600)
+
+        assert first == b"https://a.test@800x600"
+        assert second == b"https://b.test@800x600"
+        assert len(launched) == 1
+        assert len(launched[0].contexts) == 2
+        assert all(c.closed for c in launched[0].contexts)
+
+    async def test_dedupes_concurrent_same_capture(self, launched):
+        """Concurrent requests for the same URL and viewport share one capture."""
+        pool = make_pool(launched, delay=0.05)
+
+        results = await asyncio.gather(
+            *(pool.capture("https://a.test", 800, 600) for _ in range(5))
+        )
+
+        assert len(set(results)) == 1
+        assert sum(len(b.contexts) for b in launched) == 1
+        assert pool.get_stats()["deduplicated"] == 4
+
+    async def test_different_viewports_not_deduped(self, launched):
+        """Same URL with a different viewport is a separate capture."""
+        pool = make_pool(launched, delay=0.01)
+
+        a, b = await asyncio.gather(
+            pool.capture("https://a.test", 800, 600),
+            pool.capture("https://a.test", 1920, 1080),
+        )
+
+        assert a != b
+        assert pool.get_stats()["captures"] == 2
+
+    async def test_concurrency_cap_and_pool_size(self, launched):
+        """Parallel captures never exceed the pool size or concurrency cap."""
+        pool = make_pool(launched, delay=0.02, size=2, max_concurrent=3)
+        peak = 0
+
+        async def watch() -> None:
+            nonlocal peak
+            for _ in range(20):
+                peak = max(peak, pool.get_stats()["active_captures"])
+                await asyncio.sleep(0.005)
+
+        await asyncio.gather(
+            watch(), *(pool.capture(f"https://{i}.test", 800, 600) for i in range(8))
+        )
+
+        assert len(launched) == 2
+        assert 0 < peak <= 3
+
+    async def test_queue_full_raises(self, launched):
+        """Captures beyond the queue bound are rejected."""
+        pool = make_pool(launched, delay=0.05, max_concurrent=1, max_queued=1)
+
+        results = await asyncio.gather(
+            *(pool.capture(f"https://{i}.test", 800, 600) for i in range(3)),
+            return_exceptions=True,
+        )
+
+        assert sum(isinstance(r, BrowserPoolFullError) for r in results) == 1
+
+    async def test_recycles_after_max_pages(self, launched):
+        """Browsers are closed and replaced after max_pages_per_browser captures."""
+        pool = make_pool(launched, size=1, max_pages_per_browser=2)
+
+        for i in range(5):
+            await pool.capture(f"https://{i}.test", 800, 600)
+
+        assert len(launched) == 3
+        assert launched[0].closed and launched[1].closed
+        assert not launched[2].closed
+        assert pool.get_stats()["recycled"] == 2
+
+    async def test_recycles_crashed_browser(self, launched):
+        """A browser that disconnects mid-capture is replaced."""
+        pool = make_pool(launched, size=1)
+        await pool.capture("https://warm.test", 800, 600)
+        launched[0].crash_on_goto = True
+
+        with pytest.raises(RuntimeError, match="Target closed"):
+            await pool.capture("https://boom.test", 800, 600)
+
+        assert await pool.capture("https://ok.test", 800, 600) == b"https://ok.test@800x600"
+        assert len(launched) == 2
+        assert pool.get_stats()["crashes"] == 1
+
+    async def test_close_shuts_down_browsers(self, launched):
+        """close() closes warm browsers and rejects new captures."""
+        pool = make_pool(launched, size=2)
+        await pool.warm_up()
+        assert len(launched) == 2
+
+        await pool.close()
+
+        assert all(b.closed for b in launched)
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.capture("https://a.test")
+
+    async def test_startup_warm_up_is_failure_tolerant(self, launched, monkeypatch):
+        """warm_browser_pool() fills the pool, and only logs when launching fails."""
+        pool = make_pool(launched, size=2)
+        monkeypatch.setattr(browser_pool, "get_browser_pool", lambda: pool)
+
+        await browser_pool.warm_browser_pool()
+        await pool.capture("https://a.test")
+
+        assert len(launched) == 2
+
+        async def broken() -> FakeBrowser:
+            raise RuntimeError("Playwright is not installed")
+
+        monkeypatch.setattr(
+            browser_pool, "get_browser_pool", lambda: BrowserPool(browser_factory=broken)
+        )
+        await browser_pool.warm_browser_pool()
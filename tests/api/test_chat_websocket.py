@@ -0,0 +1,238 @@
+"""
+Tests for the token-streaming WebSocket chat.
+
+Run with: uv run pytest tests/api/test_chat_websocket.py -v
+
+These tests verify:
+1. Tokens are forwarded as they arrive, in order, before the final message
+2. Closing the socket or sending "cancel" stops the model stream
+3. A slow client pauses the stream instead of growing an unbounded buffer
+4. The assistant answer is saved once the stream completes
+"""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from fastapi import WebSocketDisconnect
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from turbowrap.api.websocket.chat_handler import ChatWebSocketHandler
+from turbowrap.db.base import Base
+from turbowrap.db.models import ChatMessage, ChatSession
+
+DISCONNECT = object()
+
+
+class FakeWebSocket:
+    """In-memory WebSocket: incoming frames from a queue, outgoing recorded."""
+
+    def __init__(self) -> None:
+        self.incoming: asyncio.Queue[Any] = asyncio.Queue()
+        self.sent: list[dict[str, Any]] = []
+        self.can_send = asyncio.Event()
+        self.can_send.set()
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive_text(self) -> str:
+        item = await self.incoming.get()
+        if item is DISCONNECT:
+            raise WebSocketDisconnect()
+        return json.dumps(item)
+
+    async def send_text(self, text: str) -> None:
+        await self.can_send.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed = True
+
+    def of_type(self, kind: str) -> list[dict[str, Any]]:
+        return [frame for frame in self.sent if frame["type"] == kind]
+
+
+class StubClaude:
+    """Async token stream controlled by the test."""
+
+    def __init__(self, tokens: list[str], gate: asyncio.Event | None = None) -> None:
+        self.tokens = tokens
+        self.gate = gate
+        self.pulled = 0
+        self.finished = False
+        self.cancelled = False
+
+    async def astream(self, prompt: str, system_prompt: str = ""):
+        try:
+            for index, token in enumerate(self.tokens):
+                if self.gate and index:
+                    await self.gate.wait()
+                self.pulled += 1
+                yield token
+            self.finished = True
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(ChatSession(id="chat-1", title="Test"))
+    session.commit()
+    return session
+
+
+def _handler(
+    db, claude: StubClaude, send_buffer: int = 64
+) -> tuple[ChatWebSocketHandler, FakeWebSocket]:
+    websocket = FakeWebSocket()
+    handler = ChatWebSocketHandler(websocket, "chat-1", db, send_buffer=send_buffer)  # type: ignore[arg-type]
+    handler._claude = claude  # type: ignore[assignment]
+    return handler, websocket
+
+
+async def _until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStreaming:
+    """Tokens reach the client as they are produced."""
+
+    async def test_deltas_arrive_in_order_before_final_message(self, db):
+        tokens = [f"tok{i} " for i in range(50)]
+        handler, websocket = _handler(db, StubClaude(tokens))
+        task = asyncio.create_task(handler.handle())
+
+        await websocket.incoming.put({"type": "message", "content": "Hello"})
+        await _until(lambda: websocket.of_type("message"))
+        await websocket.incoming.put(DISCONNECT)
+        await task
+
+        kinds = [frame["type"] for frame in websocket.sent]
+        assert kinds[:2] == ["message_received", "generating"]
+        assert kinds[-1] == "message"
+        assert set(kinds[2:-1]) == {"delta"}
+        assert "".join(f["content"] for f in websocket.of_type("delta")) == "".join(tokens)
+        assert websocket.of_type("message")[0]["content"] == "".join(tokens)
+
+        saved = db.query(ChatMessage).filter_by(role="assistant").one()
+        assert saved.content == "".join(tokens)
+
+    async def test_first_token_is_sent_before_the_answer_completes(self, db):
+        gate = asyncio.Event()
+        handler, websocket = _handler(db, StubClaude(["first", "second"], gate))
+        task = asyncio.create_task(handler.handle())
+
+        await websocket.incoming.put({"type": "message", "content": "Hello"})
+        await _until(lambda: websocket.of_type("delta"))
+        assert websocket.of_type("delta")[0]["content"] == "first"
+        assert not websocket.of_type("message")
+
+        gate.set()
+        await _until(lambda: websocket.of_type("message"))
+        await websocket.incoming.put(DISCONNECT)
+        await task
+
+
+# =============================================================================
+# Cancellation
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestCancellation:
+    """Abandoned answers stop consuming the model."""
+
+    async def test_disconnect_cancels_the_stream(self, db):
+        claude = StubClaude(["a", "b", "c"], asyncio.Event())
+        handler, websocket = _handler(db, claude)
+        task = asyncio.create_task(handler.handle())
+
+        await websocket.incoming.put({"type": "message", "content": "Hello"})
+        await _until(lambda: claude.pulled == 1)
+        await websocket.incoming.put(DISCONNECT)
+        await asyncio.wait_for(task, 1)
+
+        assert claude.cancelled and not claude.finished
+        assert db.query(ChatMessage).filter_by(role="assistant").count() == 0
+
+    async def test_cancel_message_stops_generation_and_keeps_connection(self, db):
+        claude = StubClaude(["a", "b"], asyncio.Event())
+        handler, websocket = _handler(db, claude)
+        task = asyncio.create_task(handler.handle())
+
+        await websocket.incoming.put({"type": "message", "content": "Hello"})
+        await _until(lambda: claude.pulled == 1)
+        await websocket.incoming.put({"type": "cancel"})
+        await websocket.incoming.put({"type": "ping"})
+        await _until(lambda: websocket.of_type("pong"))
+
+        assert claude.cancelled
+        assert websocket.of_type("cancelled")
+        assert not task.done()
+        await websocket.incoming.put(DISCONNECT)
+        await task
+
+    async def test_one_answer_at_a_time(self, db):
+        handler, websocket = _handler(db, StubClaude(["a", "b"], asyncio.Event()))
+        task = asyncio.create_task(handler.handle())
+
+        await websocket.incoming.put({"type": "message", "content": "One"})
+        await websocket.incoming.put({"type": "message", "content": "Two"})
+        await _until(lambda: websocket.of_type("error"))
+
+        assert "already being generated" in websocket.of_type("error")[0]["message"]
+        await websocket.incoming.put(DISCONNECT)
+        await task
+
+
+# =============================================================================
+# Backpressure
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBackpressure:
+    """A slow reader throttles the stream."""
+
+    async def test_bounded_buffer_pauses_the_stream(self, db):
+        tokens = [f"{i}," for i in range(100)]
+        claude = StubClaude(tokens)
+        handler, websocket = _handler(db, claude, send_buffer=4)
+        task = asyncio.create_task(handler.handle())
+
+        websocket.can_send.clear()  # Client stops reading
+        await websocket.incoming.put({"type": "message", "content": "Hello"})
+        await asyncio.sleep(0.05)
+
+        # message_received is in flight, the buffer holds 4 frames
+        assert claude.pulled <= 6
+        assert handler._outbox.qsize() <= 4
+
+        websocket.can_send.set()
+        await _until(lambda: websocket.of_type("message"))
+        await websocket.incoming.put(DISCONNECT)
+        await task
+
+        deltas = websocket.of_type("delta")
+        assert "".join(f["content"] for f in deltas) == "".join(tokens)
+        assert claude.finished
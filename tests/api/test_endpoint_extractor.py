@@ -0,0 +1,332 @@
+"""
+Tests for static endpoint detection.
+
+Run with: uv run pytest tests/api/test_endpoint_extractor.py -v
+
+These tests verify:
+1. Python routes (FastAPI, Flask, Django) are found with their full mount prefix
+2. JavaScript/TypeScript served routes and consumed calls are found
+3. Only changed files are parsed again (content-hash cache)
+4. The LLM only describes new or changed endpoints
+5. Saving diffs against existing rows instead of rewriting every endpoint
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from turbowrap.api.services.endpoint_detector import (
+    DetectionResult,
+    EndpointInfo,
+    adetect_endpoints,
+    save_endpoints_to_db,
+)
+from turbowrap.api.services.endpoint_extractor import EndpointExtractor
+from turbowrap.db.base import Base
+from turbowrap.db.models import Endpoint, Repository
+from turbowrap.utils.endpoint_parsing import (
+    extract_javascript,
+    extract_python,
+    join_paths,
+    normalize_route_path,
+)
+
+USERS_ROUTES = '''
+from fastapi import APIRouter, Depends, Query
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@router.get("/{user_id}", response_model=UserOut)
+async def get_user(user_id: int, verbose: bool = Query(False), user=Depends(get_current_user)):
+    """Get one user.
+
+    Longer explanation.
+    """
+
+
+@router.post("")
+def create_user(payload: UserCreate, db: Session = Depends(get_db)) -> UserOut:
+    pass
+'''
+
+ROUTES_INIT = """
+from .users import router as users_router
+"""
+
+MAIN = """
+from fastapi import FastAPI
+from app.routes import users_router
+
+app = FastAPI()
+app.include_router(users_router, prefix="/api")
+
+
+@app.get("/health")
+def health():
+    return {"ok": True}
+"""
+
+CLIENT_TS = """
+export async function loadUser(id: string) {
+  const res = await fetch(`${API_BASE}/api/users/${id}`);
+  await fetch("/api/users", { method: "POST", body: JSON.stringify({}) });
+  await axios.delete<void>(`/api/users/${user.id}?hard=1`);
+  return fetch(url);
+}
+"""
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / "app" / "routes").mkdir(parents=True)
+    (root / "web").mkdir()
+    (root / "app" / "routes" / "users.py").write_text(USERS_ROUTES)
+    (root / "app" / "routes" / "__init__.py").write_text(ROUTES_INIT)
+    (root / "app" / "main.py").write_text(MAIN)
+    (root / "app" / "helpers.py").write_text("def helper():\n    return 1\n")
+    (root / "web" / "client.ts").write_text(CLIENT_TS)
+    (root / "package.json").write_text('{"dependencies": {"react": "18"}}')
+    return root
+
+
+def _extractor(repo: Path, tmp_path: Path) -> EndpointExtractor:
+    return EndpointExtractor(repo, cache_dir=tmp_path / "cache")
+
+
+def _routes(endpoints: list[dict]) -> set[tuple[str, str, str]]:
+    return {(e["method"], e["path"], e["source"]) for e in endpoints}
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestParsing:
+    """Per-file extraction."""
+
+    def test_path_helpers(self):
+        assert join_paths("/api", "/users/", "{id}") == "/api/users/{id}"
+        assert join_paths("", "/") == "/"
+        assert normalize_route_path("/u/<int:user_id>/:tab/{n:int}") == "/u/{user_id}/{tab}/{n}"
+
+    def test_fastapi_handler_details(self):
+        facts = extract_python("app/routes/users.py", USERS_ROUTES)
+
+        get_user, create_user = facts["endpoints"]
+        assert facts["routers"]["router"]["prefix"] == "/users"
+        assert (get_user["method"], get_user["path"], get_user["router"]) == (
+            "GET",
+            "/{user_id}",
+            "router",
+        )
+        assert get_user["description"] == "Get one user."
+        assert get_user["auth_required"] is True
+        assert get_user["response_type"] == "UserOut"
+        assert [(p["name"], p["param_type"], p["required"]) for p in get_user["parameters"]] == [
+            ("user_id", "path", True),
+            ("verbose", "query", False),
+        ]
+        assert [(p["name"], p["param_type"]) for p in create_user["parameters"]] == [
+            ("payload", "body")
+        ]
+        assert create_user["auth_required"] is False
+        assert create_user["response_type"] == "UserOut"
+
+    def test_flask_blueprint_and_django_urls(self):
+        flask = extract_python(
+            "shop/views.py",
+            "from flask import Blueprint\n"
+            "bp = Blueprint('shop', __name__, url_prefix='/shop')\n"
+            "@bp.route('/items/<int:item_id>', methods=['GET', 'PUT'])\n"
+            "def item(item_id):\n    pass\n",
+        )
+        django = extract_python(
+            "shop/urls.py",
+            "from django.urls import include, path\n"
+            "urlpatterns = [path('orders/<int:pk>/', views.order), path('x/', include('x.urls'))]\n",
+        )
+
+        assert flask["framework"] == "flask"
+        assert _routes(flask["endpoints"]) == {
+            ("GET", "/items/{item_id}", "served"),
+            ("PUT", "/items/{item_id}", "served"),
+        }
+        assert _routes(django["endpoints"]) == {("ANY", "/orders/{pk}/", "served")}
+
+    def test_javascript_served_and_consumed(self):
+        express = extract_javascript(
+            "server/app.js",
+            "const express = require('express');\nrouter.get('/items/:id', handler);\n",
+        )
+        next_route = extract_javascript(
+            "src/app/api/items/[id]/route.ts",
+            "export async function GET(req) {}\nexport const DELETE = handler;\n",
+        )
+        client = extract_javascript("web/client.ts", CLIENT_TS)
+
+        assert _routes(express["endpoints"]) == {("GET", "/items/{id}", "served")}
+        assert _routes(next_route["endpoints"]) == {
+            ("GET", "/api/items/{id}", "served"),
+            ("DELETE", "/api/items/{id}", "served"),
+        }
+        assert [(e["method"], e["path"], e["line"]) for e in client["endpoints"]] == [
+            ("GET", "/api/users/{id}", 3),
+            ("POST", "/api/users", 4),
+            ("DELETE", "/api/users/{id}", 5),
+        ]
+
+
+# =============================================================================
+# Extraction and cache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestExtractor:
+    """Repository extraction, prefix resolution and incremental re-runs."""
+
+    def test_prefixes_resolved_across_modules(self, repo, tmp_path):
+        extraction = _extractor(repo, tmp_path).extract()
+
+        assert _routes(extraction.endpoints) == {
+            ("GET", "/api/users/{user_id}", "served"),
+            ("POST", "/api/users", "served"),
+            ("GET", "/health", "served"),
+            ("GET", "/api/users/{id}", "consumed"),
+            ("POST", "/api/users", "consumed"),
+            ("DELETE", "/api/users/{id}", "consumed"),
+        }
+        assert extraction.framework == "fastapi"
+        assert extraction.frontend_framework == "react"
+        users = next(e for e in extraction.endpoints if e["handler"] == "get_user")
+        assert users["tags"] == ["users"]
+        assert users["file"] == "app/routes/users.py"
+
+    def test_only_changed_files_are_parsed(self, repo, tmp_path):
+        first = _extractor(repo, tmp_path).extract()
+        unchanged = _extractor(repo, tmp_path).extract()
+        main = repo / "app" / "main.py"
+        main.write_text(MAIN.replace('prefix="/api"', 'prefix="/v2"'))
+        changed = _extractor(repo, tmp_path).extract()
+
+        assert first.files_parsed == 5
+        assert (unchanged.files_parsed, unchanged.files_cached) == (0, 5)
+        assert (changed.files_parsed, changed.files_cached) == (1, 4)
+        assert ("GET", "/v2/users/{user_id}", "served") in _routes(changed.endpoints)
+
+    def test_touched_but_identical_file_is_not_parsed(self, repo, tmp_path):
+        _extractor(repo, tmp_path).extract()
+        main = repo / "app" / "main.py"
+        main.write_text(main.read_text())
+
+        assert _extractor(repo, tmp_path).extract().files_parsed == 0
+
+
+# =============================================================================
+# Detection and enrichment
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestDetection:
+    """adetect_endpoints() on top of the extractor."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path):
+        with patch("turbowrap.api.services.endpoint_extractor.get_settings") as settings:
+            settings.return_value.endpoints.cache_dir = tmp_path / "cache"
+            settings.return_value.endpoints.workers = 1
+            settings.return_value.endpoints.pool_min_files = 1000
+            yield
+
+    async def test_static_detection_prefers_served_definitions(self, repo):
+        result = await adetect_endpoints(str(repo), use_ai=False)
+
+        assert result.error is None
+        routes = {(r.method, r.path): r for r in result.routes}
+        assert len(routes) == len(result.routes) == 5
+        assert routes[("POST", "/api/users")].source == "served"
+        assert routes[("GET", "/api/users/{user_id}")].parameters[0].name == "user_id"
+
+    async def test_only_new_endpoints_are_enriched(self, repo):
+        async def describe(_repo_path, endpoints):
+            return {e["fingerprint"]: {"description": f"Does {e['path']}"} for e in endpoints}
+
+        enrich = AsyncMock(side_effect=describe)
+        with patch("turbowrap.api.services.endpoint_detector._enrich_endpoints", enrich):
+            first = await adetect_endpoints(str(repo))
+            again = await adetect_endpoints(str(repo))
+
+        assert enrich.await_count == 1
+        described = {r.path: r.description for r in again.routes if r.method == "GET"}
+        # Docstrings win over generated descriptions
+        assert described["/api/users/{user_id}"] == "Get one user."
+        assert described["/health"] == "Does /health"
+        assert len(enrich.await_args.args[1]) == 4
+        assert [r.description for r in first.routes] == [r.description for r in again.routes]
+
+    async def test_missing_repository(self, tmp_path):
+        result = await adetect_endpoints(str(tmp_path / "nope"))
+
+        assert result.error and not result.routes
+
+
+# =============================================================================
+# Endpoint rows
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestEndpointRows:
+    """Saving diffs against existing rows."""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add(
+            Repository(id="repo-1", name="repo", url="https://github.com/o/r", local_path="/x")
+        )
+        session.commit()
+        return session
+
+    def test_only_changes_are_written(self, db):
+        result = DetectionResult(
+            framework="fastapi",
+            routes=[
+                EndpointInfo(method="GET", path="/a", file="a.py", line=1),
+                EndpointInfo(method="POST", path="/b", file="a.py", line=9),
+            ],
+        )
+
+        assert save_endpoints_to_db(db, "repo-1", result) == 2
+        assert save_endpoints_to_db(db, "repo-1", result) == 0
+
+        result.routes[0].description = "Now documented"
+        result.routes.pop()
+        result.routes.append(EndpointInfo(method="GET", path="/c", file="c.py"))
+        assert save_endpoints_to_db(db, "repo-1", result) == 2
+
+        rows = {(r.method, r.path): r for r in db.query(Endpoint).all()}
+        assert set(rows) == {("GET", "/a"), ("GET", "/c")}
+        assert rows[("GET", "/a")].description == "Now documented"
+        assert rows[("GET", "/c")].framework == "fastapi"
+
+    def test_failed_detection_keeps_rows(self, db):
+        save_endpoints_to_db(
+            db, "repo-1", DetectionResult(routes=[EndpointInfo(method="GET", path="/a", file="")])
+        )
+
+        assert save_endpoints_to_db(db, "repo-1", DetectionResult(error="boom")) == 0
+        assert db.query(Endpoint).count() == 1
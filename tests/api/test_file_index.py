@@ -0,0 +1,213 @@
+"""
+Tests for the in-memory repository file index.
+
+Run with: uv run pytest tests/api/test_file_index.py -v
+
+These tests verify:
+1. Directories are scanned lazily, once, and hidden entries are skipped
+2. Listings support glob patterns, extension filters and depth limits
+3. File watcher changes patch the index without rescanning
+4. The registry keeps indexes current (watcher batches, TTL, invalidation)
+5. Hierarchical trees stop at the requested depth for lazy expansion
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from turbowrap.api.routes.repos import _build_tree
+from turbowrap.api.services.file_index import FileIndexRegistry, RepoFileIndex, split_path
+from turbowrap.api.services.file_watcher import FileChangeBatch, FileWatcherService
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    for rel, content in {
+        "README.md": "# Repo",
+        "src/app.py": "print('hi')",
+        "src/util/helpers.py": "x = 1",
+        "docs/guide.md": "guide",
+        "vendor/lib/big.js": "//" * 100,
+        ".git/config": "[core]",
+        "src/.env": "SECRET=1",
+    }.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content)
+    return root
+
+
+@pytest.fixture
+def hub():
+    service = FileWatcherService()
+    with patch.object(FileWatcherService, "get_instance", return_value=service):
+        yield service
+    service.stop()
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRepoFileIndex:
+    """Lazy scanning and queries."""
+
+    def test_list_dir_scans_only_what_is_asked(self, repo):
+        index = RepoFileIndex(repo)
+
+        top = index.list_dir()
+        assert [(e.name, e.is_dir) for e in top] == [
+            ("README.md", False),
+            ("docs", True),
+            ("src", True),
+            ("vendor", True),
+        ]
+        assert index.stats()["dirs_scanned"] == 1
+
+        src = index.list_dir("src")
+        index.list_dir("src")
+        assert [e.path for e in src] == ["src/app.py", "src/util"]
+        assert src[0].size == len("print('hi')")
+        assert index.stats()["dirs_scanned"] == 2
+
+    def test_pattern_and_missing_paths(self, repo):
+        index = RepoFileIndex(repo)
+
+        assert [e.name for e in index.list_dir("", "*.md")] == ["README.md"]
+        with pytest.raises(KeyError):
+            index.list_dir("nope")
+        with pytest.raises(NotADirectoryError):
+            index.list_dir("README.md")
+        assert index.get("src/util/helpers.py").extension == ".py"
+        assert index.get(".git/config") is None
+
+    @pytest.mark.parametrize("bad", ["../etc", "/etc/passwd", "src/../../x"])
+    def test_paths_cannot_escape_repository(self, repo, bad):
+        with pytest.raises(ValueError):
+            split_path(bad)
+        with pytest.raises(ValueError):
+            RepoFileIndex(repo).list_dir(bad)
+
+    def test_iter_files_and_walk(self, repo):
+        index = RepoFileIndex(repo)
+
+        assert [e.path for e in index.iter_files(extensions=["md", ".PY"])] == [
+            "README.md",
+            "docs/guide.md",
+            "src/app.py",
+            "src/util/helpers.py",
+        ]
+        assert len(list(index.iter_files(extensions=["*"]))) == 5
+        assert [e.path for e in index.walk("src", max_depth=1)] == ["src/app.py", "src/util"]
+
+    def test_changes_patch_the_index(self, repo):
+        index = RepoFileIndex(repo)
+        list(index.walk())
+        scanned = index.stats()["dirs_scanned"]
+
+        (repo / "src" / "new.py").write_text("y = 2")
+        (repo / "docs" / "guide.md").unlink()
+        (repo / "docs").rmdir()
+        (repo / "pkg").mkdir()
+        (repo / "pkg" / "mod.py").write_text("")
+        index.apply_changes(
+            {"src/new.py": "created", "docs/guide.md": "deleted", "pkg/mod.py": "created"}
+        )
+
+        assert index.get("src/new.py").size == 5
+        assert index.get("docs") is None  # Removed with its last file
+        assert [e.path for e in index.iter_files("pkg")] == ["pkg/mod.py"]
+        # Only the new directory was scanned
+        assert index.stats()["dirs_scanned"] == scanned + 1
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRegistry:
+    """Keeping indexes current."""
+
+    def test_watcher_batches_patch_indexes(self, repo, hub):
+        registry = FileIndexRegistry(max_incremental_changes=2)
+        hub.watch("r1", repo)
+        index = registry.get("r1", repo)
+        index.list_dir()
+
+        (repo / "NOTES.md").write_text("notes")
+        hub._record("r1", "created", "NOTES.md")
+        hub._flush(force=True)
+        assert index.get("NOTES.md") is not None
+
+        resets = index.stats()["resets"]
+        registry._on_batch(
+            FileChangeBatch(
+                repo_id="r1",
+                repo_path=repo,
+                changes={"a": "created", "b": "created", "c": "created"},
+            )
+        )
+        assert index.stats()["resets"] == resets + 1  # Too many changes: rescan
+
+    def test_unwatched_indexes_expire(self, repo, hub):
+        registry = FileIndexRegistry(unwatched_ttl_seconds=0)
+        index = registry.get("r1", repo)
+        index.list_dir()
+
+        (repo / "NOTES.md").write_text("notes")
+        assert registry.get("r1", repo) is index
+        assert index.get("NOTES.md") is not None
+
+    def test_invalidate_and_limit(self, repo, tmp_path, hub):
+        registry = FileIndexRegistry(max_repos=1, unwatched_ttl_seconds=3600)
+        hub.watch("r1", repo)
+        index = registry.get("r1", repo)
+        index.list_dir()
+        (repo / "NOTES.md").write_text("notes")
+
+        assert index.get("NOTES.md") is None  # Watched repo, event not flushed yet
+        registry.invalidate("r1")
+        assert index.get("NOTES.md") is not None
+
+        registry.get("r2", tmp_path)
+        assert registry.get("r1", repo) is not index
+
+
+# =============================================================================
+# Tree
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestTree:
+    """Hierarchies built from the index."""
+
+    def test_depth_limited_tree_marks_unloaded_directories(self, repo):
+        index = RepoFileIndex(repo)
+
+        tree = _build_tree(index.walk(max_depth=1), "", 1, {"README.md"}, set())
+
+        assert [(n.name, n.type, n.loaded) for n in tree.children] == [
+            ("docs", "directory", False),
+            ("src", "directory", False),
+            ("vendor", "directory", False),
+            ("README.md", "file", True),
+        ]
+        assert tree.children[-1].is_modified is True
+        assert all(not n.children for n in tree.children)
+
+    def test_filtered_subtree_keeps_only_matching_directories(self, repo):
+        index = RepoFileIndex(repo)
+
+        tree = _build_tree(index.iter_files("src", [".py"]), "src", None, set(), set())
+        shallow = _build_tree(index.iter_files("", [".py"]), "", 1, set(), set())
+
+        assert tree.name == "src"
+        assert [n.path for n in tree.children] == ["src/util", "src/app.py"]
+        assert [n.path for n in tree.children[0].children] == ["src/util/helpers.py"]
+        assert [(n.path, n.loaded) for n in shallow.children] == [("src", False)]
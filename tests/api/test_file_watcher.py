@@ -0,0 +1,195 @@
+"""
+Tests for the repository file watching hub.
+
+Run with: uv run pytest tests/api/test_file_watcher.py -v
+
+These tests verify:
+1. Raw events on the same path coalesce into one net change
+2. Bursts become one batch per repository, published when quiet or too old
+3. Batches reach SSE subscribers (filtered by repository) and listeners
+4. Several repositories are watched at once, up to a limit
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from turbowrap.api.services.file_watcher import (
+    FileChangeBatch,
+    FileChangeHandler,
+    FileWatcherService,
+    _coalesce,
+)
+
+
+@pytest.fixture
+def hub():
+    service = FileWatcherService()
+    yield service
+    service.stop()
+
+
+@pytest.fixture
+def repos(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name in ("one", "two", "three"):
+        (tmp_path / name).mkdir()
+        paths.append(tmp_path / name)
+    return paths
+
+
+# =============================================================================
+# Coalescing
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestCoalescing:
+    """Net effect of several events on one path."""
+
+    @pytest.mark.parametrize(
+        ("previous", "action", "expected"),
+        [
+            (None, "modified", "modified"),
+            ("created", "modified", "created"),
+            ("created", "deleted", None),
+            ("deleted", "created", "modified"),
+            ("modified", "deleted", "deleted"),
+        ],
+    )
+    def test_coalesce(self, previous, action, expected):
+        assert _coalesce(previous, action) == expected
+
+    def test_ignored_paths(self, hub, repos):
+        handler = FileChangeHandler(hub, "r1", repos[0])
+
+        assert handler._relative(str(repos[0] / "src" / "a.py")) == "src/a.py"
+        assert handler._relative(str(repos[0] / ".env")) == ".env"
+        for ignored in (".git/index", "node_modules/x/index.js", "a.py.swp", "b/__pycache__/c"):
+            assert handler._relative(str(repos[0] / ignored)) is None
+        assert handler._relative("/elsewhere/a.py") is None
+
+    def test_burst_becomes_one_batch(self, hub, repos):
+        hub.quiet_seconds = hub.max_batch_seconds = 60
+        hub.watch("r1", repos[0])
+        batches: list[FileChangeBatch] = []
+        hub.add_listener(batches.append)
+
+        for i in range(500):
+            hub._record("r1", "modified", f"src/f{i % 100}.py")
+        hub._record("r1", "created", "tmp.txt")
+        hub._record("r1", "deleted", "tmp.txt")
+        hub._record("unknown", "modified", "x.py")
+
+        assert hub._flush() == 0  # Still collecting
+        assert hub._flush(force=True) == 1
+        assert len(batches) == 1
+        assert batches[0].raw_events == 502
+        assert len(batches[0].paths) == 100
+        assert hub.get_status()["repos"][0]["batches_published"] == 1
+
+    def test_batch_closes_after_quiet_or_max_age(self, hub, repos):
+        hub.watch("r1", repos[0])
+        hub.quiet_seconds, hub.max_batch_seconds = 0.05, 0.3
+        batches: list[FileChangeBatch] = []
+        hub.add_listener(batches.append)
+
+        hub._record("r1", "modified", "a.py")
+        time.sleep(0.2)
+        assert [b.paths for b in batches] == [["a.py"]]
+
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            hub._record("r1", "modified", "b.py")  # Never quiet
+            time.sleep(0.01)
+        hub._flush(force=True)
+        # Closed by age at least once while events kept coming
+        assert len(batches) >= 3
+
+
+# =============================================================================
+# Subscribers
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSubscribers:
+    """Delivery to SSE queues and listeners."""
+
+    async def test_subscribers_receive_filtered_batches(self, hub, repos):
+        hub.watch("r1", repos[0])
+        hub.watch("r2", repos[1])
+        hub.max_event_paths = 2
+        everything = hub.subscribe()
+        only_r2 = hub.subscribe({"r2"})
+
+        for name in ("a.py", "b.py", "c.py"):
+            hub._record("r1", "created", name)
+        hub._record("r2", "modified", "d.py")
+        await asyncio.to_thread(hub._flush, True)
+
+        first = await asyncio.wait_for(everything.get(), 1)
+        second = await asyncio.wait_for(everything.get(), 1)
+        filtered = await asyncio.wait_for(only_r2.get(), 1)
+        assert (first["repo_id"], first["count"], first["truncated"]) == ("r1", 3, True)
+        assert len(first["changes"]) == 2
+        assert second["repo_id"] == filtered["repo_id"] == "r2"
+        assert only_r2.empty()
+
+        hub.unsubscribe(everything)
+        assert hub.subscriber_count == 1
+
+    def test_failing_listener_does_not_block_others(self, hub, repos):
+        hub.watch("r1", repos[0])
+        received = []
+
+        def broken(_batch):
+            raise RuntimeError("boom")
+
+        hub.add_listener(broken)
+        hub.add_listener(received.append)
+        hub._record("r1", "modified", "a.py")
+        hub._flush(force=True)
+
+        assert len(received) == 1
+
+
+# =============================================================================
+# Watching
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestWatching:
+    """Several repositories on one observer."""
+
+    def test_repo_limit_drops_least_recently_requested(self, hub, repos):
+        hub.max_repos = 2
+        hub.watch("r1", repos[0])
+        hub.watch("r2", repos[1])
+        hub.switch_repo("r1", str(repos[0]))
+        hub.watch("r3", repos[2])
+
+        assert hub.watched_repo_ids == ["r1", "r3"]
+        assert hub.current_repo_id == "r1"
+        assert hub.watch("missing", repos[0] / "nope") is False
+
+    async def test_real_changes_arrive_as_one_batch(self, hub, repos):
+        hub.quiet_seconds = 0.2
+        hub.watch("r1", repos[0])
+        hub.watch("r2", repos[1])
+        queue = hub.subscribe()
+
+        for i in range(40):
+            (repos[0] / f"file{i}.py").write_text("x = 1\n")
+
+        events, paths = [], set()
+        while len(paths) < 40:
+            events.append(await asyncio.wait_for(queue.get(), 5))
+            paths |= {c["path"] for c in events[-1]["changes"]}
+        assert paths == {f"file{i}.py" for i in range(40)}
+        assert {e["repo_id"] for e in events} == {"r1"}
+        assert len(events) <= 2  # Not one event per file
+        assert hub.get_status()["observer_running"] is True
@@ -0,0 +1,310 @@
+"""
+Tests for fingerprint-based issue persistence.
+
+Run with: uv run pytest tests/api/test_issue_store_service.py -v
+
+Uses an in-memory SQLite database.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from turbowrap.api.services.issue_store_service import AUTO_RESOLVE_NOTE, IssueStoreService
+from turbowrap.api.services.review_stream_service import ReviewStreamService
+from turbowrap.db.base import Base
+from turbowrap.db.models import Issue, Repository, Task
+from turbowrap.review.models.report import FinalReport, RepositoryInfo, RepoType
+from turbowrap.review.models.review import Issue as ReviewIssue
+from turbowrap.review.models.review import IssueCategory, IssueSeverity
+from turbowrap.review.utils.fingerprint import issue_fingerprint, normalize_issue_path
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(Repository(id="repo-1", name="org/repo", url="https://x/repo", local_path="/tmp/r"))
+    for task_id in ("task-1", "task-2", "task-3"):
+        db.add(Task(id=task_id, repository_id="repo-1", type="review", status="running"))
+    db.commit()
+    db.close()
+    return factory
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+def _issue(
+    file: str = "src/api.py",
+    line: int = 10,
+    title: str = "SQL injection in user query",
+    code: str | None = "cursor.execute(f'SELECT * FROM u WHERE id={uid}')",
+    flagged_by: list[str] | None = None,
+    severity: IssueSeverity = IssueSeverity.HIGH,
+) -> ReviewIssue:
+    return ReviewIssue(
+        id=f"SEC-{line:03d}",
+        severity=severity,
+        category=IssueCategory.SECURITY,
+        file=file,
+        line=line,
+        title=title,
+        description="desc",
+        current_code=code,
+        flagged_by=flagged_by or ["claude"],
+    )
+
+
+def _rows(db) -> list[Issue]:
+    db.expire_all()
+    return db.query(Issue).order_by(Issue.file).all()
+
+
+# =============================================================================
+# Fingerprints
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIssueFingerprint:
+    """Tests for issue_fingerprint."""
+
+    def test_stable_across_rewording_and_line_shift(self):
+        a = issue_fingerprint("./src/api.py", "security", "SQL injection in query", "x  =  1", 10)
+        b = issue_fingerprint(
+            "src/api.py", "security", "Potential query SQL injection", "x = 1", 42
+        )
+
+        assert a == b
+
+    def test_differs_by_code_and_category(self):
+        base = issue_fingerprint("src/api.py", "security", "SQL injection", "x = 1")
+
+        assert issue_fingerprint("src/api.py", "security", "SQL injection", "y = 2") != base
+        assert issue_fingerprint("src/api.py", "logic", "SQL injection", "x = 1") != base
+
+    def test_without_code_uses_line_bucket(self):
+        near = issue_fingerprint("a.py", "logic", "Off by one", None, 41)
+
+        assert issue_fingerprint("a.py", "logic", "Off by one", None, 45) == near
+        assert issue_fingerprint("a.py", "logic", "Off by one", None, 90) != near
+
+    def test_normalize_issue_path(self):
+        assert normalize_issue_path(".\\src\\\\api.py") == "src/api.py"
+        assert normalize_issue_path(None) == ""
+
+
+# =============================================================================
+# Upsert
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIssueStoreService:
+    """Tests for IssueStoreService.upsert_review_issues."""
+
+    def test_rereview_updates_instead_of_duplicating(self, db):
+        store = IssueStoreService(db)
+        first = store.upsert_review_issues("task-1", "repo-1", [_issue()])
+        db.commit()
+
+        second = store.upsert_review_issues(
+            "task-2", "repo-1", [_issue(line=14, flagged_by=["gemini"])]
+        )
+        db.commit()
+
+        (row,) = _rows(db)
+        assert first.inserted == 1 and second.inserted == 0 and second.updated == 1
+        assert second.issue_ids == first.issue_ids
+        assert row.task_id == "task-2"
+        assert row.line == 14
+        assert row.flagged_by == ["claude", "gemini"]
+
+    def test_duplicates_within_report_collapsed(self, db):
+        result = IssueStoreService(db).upsert_review_issues(
+            "task-1",
+            "repo-1",
+            [
+                _issue(flagged_by=["claude"], severity=IssueSeverity.MEDIUM),
+                _issue(flagged_by=["grok"], severity=IssueSeverity.CRITICAL),
+            ],
+        )
+        db.commit()
+
+        (row,) = _rows(db)
+        assert result.inserted == 1
+        assert row.severity == "CRITICAL"
+        assert row.flagged_by == ["claude", "grok"]
+
+    def test_vanished_issues_auto_resolved_and_reopened(self, db):
+        store = IssueStoreService(db)
+        store.upsert_review_issues(
+            "task-1", "repo-1", [_issue(), _issue(file="src/other.py", code="eval(x)")]
+        )
+        db.commit()
+
+        # Re-review of src/api.py only: other.py is out of scope and stays open
+        result = store.upsert_review_issues("task-2", "repo-1", [], reviewed_files=["src/api.py"])
+        db.commit()
+
+        api, other = _rows(db)
+        assert result.resolved == 1
+        assert api.status == "resolved" and api.resolution_note == AUTO_RESOLVE_NOTE
+        assert other.status == "open"
+
+        # Reported again later: the auto-resolved row is reopened, not duplicated
+        again = store.upsert_review_issues("task-3", "repo-1", [_issue()])
+        db.commit()
+        api, _ = _rows(db)
+        assert again.reopened == 1
+        assert api.status == "open" and api.resolved_at is None
+
+    def test_ignored_issues_suppressed(self, db):
+        store = IssueStoreService(db)
+        store.upsert_review_issues("task-1", "repo-1", [_issue()])
+        db.commit()
+        (row,) = _rows(db)
+        row.status = "ignored"
+        db.commit()
+
+        result = store.upsert_review_issues("task-2", "repo-1", [_issue()])
+        db.commit()
+
+        assert result.suppressed == 1
+        assert len(_rows(db)) == 1
+
+    def test_legacy_rows_backfilled(self, db):
+        issue = _issue()
+        db.add(
+            Issue(
+                task_id="task-1",
+                repository_id="repo-1",
+                issue_code=issue.id,
+                severity="HIGH",
+                category="security",
+                file=issue.file,
+                line=issue.line,
+                title=issue.title,
+                description=issue.description,
+                current_code=issue.current_code,
+            )
+        )
+        db.commit()
+
+        result = IssueStoreService(db).upsert_review_issues("task-2", "repo-1", [_issue()])
+        db.commit()
+
+        (row,) = _rows(db)
+        assert result.updated == 1
+        assert row.fingerprint is not None
+
+    def test_bulk_upsert_many_issues(self, db):
+        issues = [_issue(file=f"src/m{i}.py", code=f"x = {i}") for i in range(1500)]
+        store = IssueStoreService(db)
+
+        assert store.upsert_review_issues("task-1", "repo-1", issues).inserted == 1500
+        db.commit()
+        assert store.upsert_review_issues("task-2", "repo-1", issues).updated == 1500
+        db.commit()
+        assert db.query(Issue).count() == 1500
+
+
+# =============================================================================
+# Review results
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSaveReviewResults:
+    """Tests for ReviewStreamService result persistence."""
+
+    async def test_stores_slim_report_and_merges_late_issues(self, db, session_factory):
+        report = FinalReport(
+            id="rev_1",
+            repository=RepositoryInfo(type=RepoType.BACKEND),
+            issues=[_issue()],
+            reviewed_files=["src/api.py"],
+        )
+        service = ReviewStreamService(db, review_manager=None)  # type: ignore[arg-type]
+
+        await service._save_review_results(db, "task-1", "repo-1", report)
+
+        stored = db.query(Task).filter(Task.id == "task-1").one().result
+        assert "issues" not in stored and "reviewed_files" not in stored
+        assert len(stored["issue_ids"]) == 1
+
+        with patch(
+            "turbowrap.api.services.review_stream_service.get_session_local",
+            return_value=session_factory,
+        ):
+            service._merge_late_issues(
+                "task-1",
+                "repo-1",
+                "grok",
+                [_issue(flagged_by=["grok"]), _issue(file="src/new.py", code="eval(x)")],
+            )
+
+        db.expire_all()
+        stored = db.query(Task).filter(Task.id == "task-1").one().result
+        assert stored["summary"]["total_issues"] == 2
+        assert len(stored["issue_ids"]) == 2
+        api = db.query(Issue).filter(Issue.file == "src/api.py").one()
+        assert api.flagged_by == ["claude", "grok"]
+
+    async def test_consecutive_reviews_update_the_same_rows(self, db, session_factory):
+        class InlineReviewManager:
+            def get_active_sessions(self) -> list:
+                return []
+
+            async def start_review(self, task_id, repository_id, review_coro):
+                await review_coro(MagicMock())
+                return MagicMock()
+
+        def report(line: int) -> FinalReport:
+            return FinalReport(
+                id="rev",
+                repository=RepositoryInfo(type=RepoType.BACKEND),
+                issues=[_issue(line=line), _issue(file="src/db.py", code="eval(q)")],
+                reviewed_files=["src/api.py", "src/db.py"],
+            )
+
+        service = ReviewStreamService(db, review_manager=InlineReviewManager())  # type: ignore[arg-type]
+        repo = db.query(Repository).filter(Repository.id == "repo-1").one()
+        orchestrator = MagicMock()
+        with (
+            patch(
+                "turbowrap.api.services.review_stream_service.Orchestrator",
+                return_value=orchestrator,
+            ),
+            patch(
+                "turbowrap.api.services.review_stream_service.get_session_local",
+                return_value=session_factory,
+            ),
+        ):
+            orchestrator.review = AsyncMock(return_value=report(10))
+            first = await service.start_or_reconnect("repo-1", repo, "initial", False)
+            orchestrator.review = AsyncMock(return_value=report(14))
+            second = await service.start_or_reconnect("repo-1", repo, "initial", False)
+
+        rows = _rows(db)
+        assert len(rows) == 2
+        assert all(row.deleted_at is None and row.status == "open" for row in rows)
+        assert {row.task_id for row in rows} == {second.task_id}
+        assert rows[0].file == "src/api.py" and rows[0].line == 14
+        assert first.task_id != second.task_id
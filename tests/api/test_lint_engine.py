@@ -0,0 +1,261 @@
+"""
+Tests for the native lint engine.
+
+Run with: uv run pytest tests/api/test_lint_engine.py -v
+
+These tests verify:
+1. Linters are detected from files, configuration and installed tools
+2. Only files whose content changed are linted again (content-hash cache)
+3. Per-file linters run in parallel batches; project-wide linters re-check everything
+4. Findings map to Issue rows in bulk without duplicating open issues
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from turbowrap.api.routes.analysis import _store_lint_issues
+from turbowrap.db.base import Base
+from turbowrap.db.models import Issue, Repository
+from turbowrap.utils.lint_engine import (
+    RUFF,
+    LintEngine,
+    LinterSpec,
+    lint_issue_code,
+    lint_severity,
+)
+from turbowrap.utils.lint_utils import LintIssue, parse_mypy_output, parse_ruff_output
+
+# Reports every "TODO" line as a ruff-style finding and logs each invocation
+FAKE_LINTER = """
+import json, sys
+from pathlib import Path
+Path("calls.log").open("a").write(" ".join(sys.argv[1:]) + "\\n")
+out = []
+for name in sys.argv[1:]:
+    for n, line in enumerate(Path(name).read_text().splitlines(), 1):
+        if "TODO" in line:
+            out.append({"filename": str(Path(name).resolve()), "code": "FIX001",
+                        "message": "TODO left", "location": {"row": n, "column": 1}})
+print(json.dumps(out))
+"""
+
+
+def _fake_spec(per_file: bool = True, name: str = "fake") -> LinterSpec:
+    return LinterSpec(
+        name=name,
+        extensions=(".py",),
+        config_files=("fake.toml",),
+        build_command=lambda _repo, files: [sys.executable, "-c", FAKE_LINTER, *files],
+        parse=parse_ruff_output,
+        per_file=per_file,
+    )
+
+
+def _calls(repo: Path) -> list[list[str]]:
+    log = repo / "calls.log"
+    return [line.split() for line in log.read_text().splitlines()] if log.exists() else []
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "a.py").write_text("x = 1  # TODO\n")
+    (root / "b.py").write_text("y = 2\n")
+    (root / "c.py").write_text("# TODO\n# TODO\n")
+    (root / "readme.md").write_text("TODO\n")
+    return root
+
+
+def _engine(repo: Path, tmp_path: Path, *specs: LinterSpec, **kwargs) -> LintEngine:
+    return LintEngine(repo, linters=specs, cache_dir=tmp_path / "cache", **kwargs)
+
+
+FILES = ["a.py", "b.py", "c.py", "readme.md"]
+
+
+# =============================================================================
+# Parsing and detection
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestParsing:
+    """Tests for linter output parsing and severity mapping."""
+
+    def test_mypy_json_lines(self):
+        output = "\n".join(
+            [
+                json.dumps(
+                    {
+                        "file": "a.py",
+                        "line": 3,
+                        "column": 4,
+                        "message": "Bad",
+                        "hint": None,
+                        "code": "arg-type",
+                        "severity": "error",
+                    }
+                ),
+                json.dumps({"file": "a.py", "line": 3, "message": "See", "severity": "note"}),
+                "Success: no issues found",
+            ]
+        )
+
+        (issue,) = parse_mypy_output(output)
+
+        assert (issue.file, issue.line, issue.code) == ("a.py", 3, "arg-type")
+
+    def test_severity_and_issue_code(self):
+        def finding(linter: str, code: str, severity: str = "error") -> LintIssue:
+            return LintIssue("a.py", 1, 1, code, "msg", severity, linter=linter)  # type: ignore[arg-type]
+
+        assert lint_severity(finding("ruff", "F401")) == "HIGH"
+        assert lint_severity(finding("ruff", "S608")) == "HIGH"
+        assert lint_severity(finding("ruff", "SIM102")) == "MEDIUM"
+        assert lint_severity(finding("ruff", "I001")) == "LOW"
+        assert lint_severity(finding("mypy", "arg-type")) == "HIGH"
+        assert lint_severity(finding("eslint", "no-unused-vars", "warning")) == "LOW"
+        assert lint_issue_code(finding("eslint", "no-unused-vars")) == "ESLINT-no-unused-vars"
+
+    def test_detects_only_configured_and_installed_linters(self, repo, tmp_path):
+        unconfigured = LinterSpec(
+            name="typed",
+            extensions=(".py",),
+            config_files=(),
+            build_command=lambda _repo, _files: ["true"],
+            parse=parse_ruff_output,
+            is_configured=lambda _repo: False,
+        )
+        missing = LinterSpec(
+            name="missing",
+            extensions=(".py",),
+            config_files=(),
+            build_command=lambda _repo, _files: None,
+            parse=parse_ruff_output,
+        )
+        engine = _engine(repo, tmp_path, _fake_spec(), unconfigured, missing)
+
+        active, skipped = engine.detect(FILES)
+
+        assert [s.name for s in active] == ["fake"]
+        assert skipped == {"typed": "not configured", "missing": "not installed"}
+        assert engine.detect(["readme.md"]) == ([], {})
+
+
+# =============================================================================
+# Incremental runs
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIncrementalRuns:
+    """Tests for the content-hash result cache."""
+
+    async def test_only_changed_files_are_relinted(self, repo, tmp_path):
+        first = await _engine(repo, tmp_path, _fake_spec()).run(FILES)
+        (repo / "b.py").write_text("y = 2  # TODO\n")
+        (repo / "c.py").touch()  # Same content, new mtime
+        second = await _engine(repo, tmp_path, _fake_spec()).run(FILES)
+
+        assert sorted((i.file, i.line) for i in first.issues) == [
+            ("a.py", 1),
+            ("c.py", 1),
+            ("c.py", 2),
+        ]
+        assert _calls(repo)[-1][-1] == "b.py"
+        assert second.linters["fake"].linted == 1
+        assert second.linters["fake"].cached == 2
+        assert len(second.issues) == 4
+        assert {i.linter for i in second.issues} == {"fake"}
+
+    async def test_config_change_and_full_run_relint_everything(self, repo, tmp_path):
+        await _engine(repo, tmp_path, _fake_spec()).run(FILES)
+        (repo / "fake.toml").write_text("strict = true\n")
+        after_config = await _engine(repo, tmp_path, _fake_spec()).run(FILES)
+        full = await _engine(repo, tmp_path, _fake_spec(), use_cache=False).run(FILES)
+
+        assert after_config.files_linted == 3
+        assert full.files_linted == 3 and full.files_cached == 0
+
+    async def test_batches_run_per_file_and_project_wide_linters(self, repo, tmp_path):
+        run = await _engine(
+            repo, tmp_path, _fake_spec(), _fake_spec(per_file=False, name="typed"), batch_size=1
+        ).run(FILES)
+        assert run.linters["fake"].processes == 3
+        assert run.linters["typed"].processes == 1
+
+        (repo / "b.py").write_text("z = 3\n")
+        rerun = await _engine(
+            repo, tmp_path, _fake_spec(), _fake_spec(per_file=False, name="typed"), batch_size=1
+        ).run(FILES)
+        assert rerun.linters["fake"].linted == 1
+        assert rerun.linters["typed"].linted == 3
+
+    async def test_failed_linter_is_reported_and_not_cached(self, repo, tmp_path):
+        broken = LinterSpec(
+            name="broken",
+            extensions=(".py",),
+            config_files=(),
+            build_command=lambda _repo, _files: [sys.executable, "-c", "import sys; sys.exit(2)"],
+            parse=parse_ruff_output,
+        )
+
+        first = await _engine(repo, tmp_path, broken).run(FILES)
+        second = await _engine(repo, tmp_path, broken).run(FILES)
+
+        assert first.errors and first.files_linted == 0
+        assert second.linters["broken"].cached == 0
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+    async def test_real_ruff_paths_are_repository_relative(self, tmp_path):
+        repo = tmp_path / "ruffrepo"
+        (repo / "pkg").mkdir(parents=True)
+        (repo / "pyproject.toml").write_text("[tool.ruff.lint]\nselect = ['F']\n")
+        (repo / "pkg" / "mod.py").write_text("import os\n")
+
+        run = await _engine(repo, tmp_path, RUFF).run(["pyproject.toml", "pkg/mod.py"])
+
+        assert [(i.file, i.code, i.linter) for i in run.issues] == [("pkg/mod.py", "F401", "ruff")]
+
+
+# =============================================================================
+# Issue rows
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestIssueRows:
+    """Findings are stored in bulk and deduplicated against open issues."""
+
+    def test_store_skips_open_duplicates(self):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        db.add(Repository(id="repo-1", name="repo", url="https://github.com/o/r", local_path="/x"))
+        db.commit()
+        findings = [
+            LintIssue("a.py", 1, 1, "F401", "`os` imported but unused", linter="ruff"),
+            LintIssue("a.py", 1, 1, "F401", "`os` imported but unused", linter="ruff"),
+            LintIssue("b.ts", 4, 2, "no-undef", "'x' is not defined", linter="eslint"),
+        ]
+
+        created = _store_lint_issues(db, "repo-1", None, findings)  # type: ignore[arg-type]
+        again = _store_lint_issues(db, "repo-1", None, findings)  # type: ignore[arg-type]
+
+        rows = db.query(Issue).order_by(Issue.file).all()
+        assert len(created) == 2 and again == []
+        assert [(r.issue_code, r.severity, r.rule, r.flagged_by) for r in rows] == [
+            ("RUFF-F401", "HIGH", "F401", ["ruff"]),
+            ("ESLINT-no-undef", "MEDIUM", "no-undef", ["eslint"]),
+        ]
+        assert rows[0].fingerprint and rows[0].category == "linting"
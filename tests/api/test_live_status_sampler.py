@@ -0,0 +1,211 @@
+"""
+Tests for the live status background sampler.
+
+Run with: uv run pytest tests/api/test_live_status_sampler.py -v
+
+Uses a fake psutil module, so results don't depend on the host's processes.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from turbowrap.api.services.live_status_sampler import LiveStatusSampler, format_elapsed
+from turbowrap.api.services.operation_tracker import Operation, OperationType
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProcess:
+    def __init__(self, pid: int, name: str, cmdline: list[str], cwd: str, create_time: float):
+        self.pid = pid
+        self.info = {
+            "name": name,
+            "memory_percent": 1.5,
+            "cpu_percent": 12.34,
+            "create_time": create_time,
+            "status": "running",
+        }
+        self._cmdline = cmdline
+        self._cwd = cwd
+        self.cmdline_calls = 0
+
+    def cmdline(self) -> list[str]:
+        self.cmdline_calls += 1
+        return self._cmdline
+
+    def cwd(self) -> str:
+        return self._cwd
+
+
+class FakePsutil:
+    NoSuchProcess = ProcessLookupError
+    AccessDenied = PermissionError
+
+    def __init__(self, processes: list[FakeProcess]):
+        self.processes = processes
+        self.iter_calls = 0
+
+    def process_iter(self, attrs: list[str]) -> list[FakeProcess]:
+        self.iter_calls += 1
+        return list(self.processes)
+
+    def cpu_percent(self, interval: float | None = None) -> float:
+        assert interval is None, "sampler must not block on cpu_percent"
+        return 42.0
+
+    def cpu_count(self) -> int:
+        return 8
+
+    def virtual_memory(self) -> Any:
+        return SimpleNamespace(total=16 * 1024**3, available=4 * 1024**3, percent=75.0)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_psutil(clock):
+    return FakePsutil(
+        [
+            FakeProcess(101, "claude", ["claude", "--print"], "/repos/chat-repo", clock.now - 30),
+            FakeProcess(102, "node", ["node", "/usr/bin/claude"], "/repos/review-repo", 0.0),
+            FakeProcess(103, "node", ["node", "server.js"], "/srv/web", clock.now),
+            FakeProcess(
+                104, "docker", ["docker", "build", "-t", "app:latest", "."], "/repos/app", 0.0
+            ),
+            FakeProcess(105, "python", ["python", "app.py"], "/srv", clock.now),
+        ]
+    )
+
+
+def make_operation(op_id: str, parent: str | None = None, working_dir: str | None = None):
+    return Operation(
+        operation_id=op_id,
+        operation_type=OperationType.REVIEW if working_dir else OperationType.CLI_TASK,
+        status="in_progress",
+        parent_session_id=parent,
+        details={"working_dir": working_dir} if working_dir else {},
+    )
+
+
+def make_sampler(fake_psutil, clock, **kwargs) -> LiveStatusSampler:
+    defaults: dict[str, Any] = {
+        "interval": 2.0,
+        "history_size": 5,
+        "psutil_module": fake_psutil,
+        "session_source": lambda: [{"pid": 101, "session_id": "chat-1"}],
+        "operation_source": lambda: [
+            make_operation("op-chat", parent="chat-1"),
+            make_operation("op-review", working_dir="/repos/review-repo/"),
+        ],
+        "clock": clock,
+    }
+    defaults.update(kwargs)
+    return LiveStatusSampler(**defaults)
+
+
+@pytest.mark.unit
+class TestLiveStatusSampler:
+    """Tests for LiveStatusSampler."""
+
+    def test_scan_classifies_processes(self, fake_psutil, clock):
+        snapshot = make_sampler(fake_psutil, clock).sample_now()
+
+        assert snapshot.system["cpu_percent"] == 42.0
+        assert snapshot.system["memory_used_gb"] == 12.0
+        assert [p["pid"] for p in snapshot.cli_processes] == [101, 102]
+        assert snapshot.cli_processes[0]["elapsed"] == "30s"
+        assert snapshot.cli_processes[0]["repo_name"] == "chat-repo"
+        (build,) = snapshot.build_processes
+        assert build["operation"] == "build"
+        assert build["image_name"] == "app"
+
+    def test_maps_pids_to_sessions_and_operations(self, fake_psutil, clock):
+        snapshot = make_sampler(fake_psutil, clock).sample_now()
+        chat, review = snapshot.cli_processes
+
+        assert chat["session_id"] == "chat-1"
+        assert chat["operation_id"] == "op-chat"
+        assert review["session_id"] is None
+        assert review["operation_id"] == "op-review"
+        assert review["operation_type"] == "review"
+
+    def test_reads_served_from_snapshot(self, fake_psutil, clock):
+        """Polls within the freshness window don't trigger new scans."""
+        sampler = make_sampler(fake_psutil, clock)
+
+        for _ in range(20):
+            sampler.get_latest()
+            clock.now += 0.1
+
+        assert fake_psutil.iter_calls == 1
+
+    def test_stale_snapshot_resampled(self, fake_psutil, clock):
+        sampler = make_sampler(fake_psutil, clock)
+        sampler.get_latest()
+
+        clock.now += 5
+        sampler.get_latest()
+
+        assert fake_psutil.iter_calls == 2
+
+    def test_cmdline_cached_per_process(self, fake_psutil, clock):
+        sampler = make_sampler(fake_psutil, clock)
+        sampler.sample_now()
+        clock.now += 1
+        sampler.sample_now()
+
+        assert fake_psutil.processes[0].cmdline_calls == 1
+
+    def test_history_ring_buffer(self, fake_psutil, clock):
+        sampler = make_sampler(fake_psutil, clock)
+        for _ in range(8):
+            sampler.sample_now()
+            clock.now += 1
+
+        history = sampler.get_history(10)
+        assert len(history["timestamps"]) == 5
+        assert history["cpu_percent"] == [42.0] * 5
+        assert history["cli_processes"] == [2] * 5
+        assert sampler.get_history(2)["timestamps"] == history["timestamps"][-2:]
+
+    def test_without_psutil(self, clock):
+        sampler = make_sampler(None, clock)
+        sampler._get_psutil = lambda: None  # type: ignore[method-assign]
+
+        snapshot = sampler.sample_now()
+        assert snapshot.system == {"error": "psutil not installed"}
+        assert snapshot.cli_processes == []
+
+    async def test_background_loop_pauses_when_idle(self, fake_psutil, clock):
+        sampler = make_sampler(fake_psutil, clock, interval=0.01, idle_after=60)
+        sampler.start()
+        await asyncio.sleep(0.05)
+        assert fake_psutil.iter_calls > 0
+
+        clock.now += 120
+        await asyncio.sleep(0.02)
+        calls = fake_psutil.iter_calls
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+
+        assert fake_psutil.iter_calls == calls
+        assert not sampler.running
+
+
+@pytest.mark.unit
+def test_format_elapsed():
+    assert format_elapsed(5) == "5s"
+    assert format_elapsed(185) == "3m 5s"
+    assert format_elapsed(7800) == "2h 10m"
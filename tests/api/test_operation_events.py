@@ -0,0 +1,149 @@
+"""
+Tests for replayable operation event streams.
+
+Run with: uv run pytest tests/api/test_operation_events.py -v
+
+These tests verify:
+1. Stream events get increasing ids and are recorded per operation
+2. Subscribing after Last-Event-ID replays exactly the missed events, once
+3. Events dropped from the bounded log are reported as "truncated"
+4. The SSE endpoint resumes from the header or ?last_event_id= and finishes
+   completed operations after replaying them
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from turbowrap.api.routes.operations import stream_operation_output
+from turbowrap.api.services.operation_tracker import OperationTracker, OperationType
+
+
+@pytest.fixture
+def tracker():
+    instance = object.__new__(OperationTracker)
+    instance._init_store()
+    with (
+        patch.object(OperationTracker, "_instance", instance),
+        patch.object(instance, "_persist_register"),
+        patch.object(instance, "_persist_complete"),
+        patch.object(instance, "_persist_fail"),
+        patch.object(instance, "_persist_update"),
+    ):
+        yield instance
+
+
+def _drain(queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+async def _publish(tracker: OperationTracker, op_id: str, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        await tracker.publish_event(op_id, "chunk", {"content": f"line {i}"})
+
+
+async def _stream(op_id: str, **params) -> list[dict[str, str]]:
+    params.setdefault("last_event_id", None)
+    params.setdefault("last_event_id_header", None)
+    response = await stream_operation_output(op_id, **params)
+    return [message async for message in response.body_iterator]
+
+
+# =============================================================================
+# Event log
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestEventLog:
+    """Recording and replaying events."""
+
+    async def test_resume_replays_only_missed_events(self, tracker):
+        await _publish(tracker, "op-1", 10)
+
+        queue = tracker.subscribe("op-1", last_event_id=7)
+
+        assert [e["id"] for e in _drain(queue)] == [8, 9, 10]
+        assert [e["id"] for e in tracker.events_since("op-1", 8)] == [9, 10]
+
+    async def test_late_subscriber_gets_everything_then_live_events(self, tracker):
+        await _publish(tracker, "op-1", 3)
+        queue = tracker.subscribe("op-1")
+        await _publish(tracker, "op-1", 2, start=3)
+        await tracker.signal_completion("op-1")
+
+        events = _drain(queue)
+
+        assert [e["id"] for e in events[:-1]] == [1, 2, 3, 4, 5]
+        assert events[-1] is None
+        assert events[3]["data"] == {"content": "line 3"}
+
+    async def test_completed_operation_replays_and_ends(self, tracker):
+        await _publish(tracker, "op-1", 2)
+        await tracker.signal_completion("op-1")
+
+        events = _drain(tracker.subscribe("op-1", last_event_id=1))
+
+        assert [e["id"] if e else None for e in events] == [2, None]
+
+    async def test_overflow_reports_truncation(self, tracker):
+        tracker.EVENT_LOG_SIZE = 5
+        await _publish(tracker, "op-1", 12)
+
+        events = _drain(tracker.subscribe("op-1", last_event_id=2))
+
+        assert events[0] == {"id": None, "type": "truncated", "data": {"missed_events": 5}}
+        assert [e["id"] for e in events[1:]] == [8, 9, 10, 11, 12]
+        assert _drain(tracker.subscribe("op-1", last_event_id=12)) == []
+
+    async def test_logs_expire_with_their_operation(self, tracker):
+        tracker.register(OperationType.FIX, operation_id="op-1")
+        await _publish(tracker, "op-1", 1)
+        await _publish(tracker, "orphan", 1)
+        tracker.complete("op-1")
+
+        with (
+            patch.object(OperationTracker, "TTL_SECONDS", -1),
+            patch("turbowrap.api.services.operation_tracker.time.monotonic", return_value=1e12),
+        ):
+            tracker._cleanup_expired()
+
+        assert tracker.events_since("op-1") == []
+        assert tracker.events_since("orphan") == []
+
+
+# =============================================================================
+# SSE endpoint
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestStreamEndpoint:
+    """Resuming the SSE stream."""
+
+    async def test_header_resume_of_completed_operation(self, tracker):
+        tracker.register(OperationType.FIX, operation_id="op-1")
+        await _publish(tracker, "op-1", 4)
+        tracker.complete("op-1", result={"ok": True})
+        await tracker.signal_completion("op-1")
+
+        messages = await _stream("op-1", last_event_id_header="2")
+
+        assert [m["event"] for m in messages] == ["connected", "chunk", "chunk", "complete"]
+        assert [m.get("id") for m in messages[1:3]] == ["3", "4"]
+        assert json.loads(messages[-1]["data"])["status"] == "completed"
+
+    async def test_query_parameter_wins_and_completion_without_signal(self, tracker):
+        tracker.register(OperationType.FIX, operation_id="op-1")
+        await _publish(tracker, "op-1", 3)
+        tracker.complete("op-1")
+
+        messages = await _stream("op-1", last_event_id=1, last_event_id_header="0")
+
+        assert [m.get("id") for m in messages] == [None, "2", "3", None]
+        assert messages[-1]["event"] == "complete"
+        assert not tracker.has_subscribers("op-1")
@@ -0,0 +1,141 @@
+"""
+Tests for the authenticated principal cache.
+
+Run with: uv run pytest tests/api/test_principal_cache.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from turbowrap.api.principal_cache import PrincipalCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return PrincipalCache(ttl_seconds=300, max_entries=10, clock=clock)
+
+
+@pytest.mark.unit
+class TestPrincipalCache:
+    """Tests for PrincipalCache."""
+
+    def test_claims_round_trip(self, cache, clock):
+        cache.put_claims("tok", {"sub": "abc", "exp": clock.now + 3600})
+
+        assert cache.get_claims("tok")["sub"] == "abc"
+        assert cache.get_claims("other") is None
+
+    def test_bounded_by_token_expiry(self, cache, clock):
+        """Claims are never served after the token's exp."""
+        cache.put_claims("tok", {"sub": "abc", "exp": clock.now + 60})
+
+        clock.now += 59
+        assert cache.get_claims("tok") is not None
+        clock.now += 2
+        assert cache.get_claims("tok") is None
+
+    def test_bounded_by_ttl(self, cache, clock):
+        cache.put_claims("tok", {"sub": "abc", "exp": clock.now + 3600})
+
+        clock.now += 301
+        assert cache.get_claims("tok") is None
+
+    def test_expired_token_not_cached(self, cache, clock):
+        cache.put_claims("tok", {"sub": "abc", "exp": clock.now - 1})
+
+        assert cache.get_claims("tok") is None
+
+    def test_user_attached_to_principal(self, cache, clock):
+        cache.set_user("tok", "user-1", "coder")  # no principal yet: ignored
+        assert cache.get_user("tok") is None
+
+        cache.put_claims("tok", {"sub": "abc", "exp": clock.now + 3600})
+        cache.set_user("tok", "user-1", "coder")
+
+        assert cache.get_user("tok") == ("user-1", "coder")
+
+    def test_invalidate_user(self, cache, clock):
+        """Role/assignment changes drop principals and repo IDs for that user only."""
+        for token, user_id in (("tok-a", "user-1"), ("tok-b", "user-1"), ("tok-c", "user-2")):
+            cache.put_claims(token, {"sub": token, "exp": clock.now + 3600})
+            cache.set_user(token, user_id, "coder")
+        cache.set_repo_ids("user-1", frozenset({"repo-1"}))
+        cache.set_repo_ids("user-2", frozenset({"repo-2"}))
+
+        cache.invalidate_user("user-1")
+
+        assert cache.get_claims("tok-a") is None
+        assert cache.get_claims("tok-b") is None
+        assert cache.get_user("tok-c") == ("user-2", "coder")
+        assert cache.get_repo_ids("user-1") is None
+        assert cache.get_repo_ids("user-2") == frozenset({"repo-2"})
+
+    def test_lru_bound(self, cache, clock):
+        for i in range(15):
+            cache.put_claims(f"tok-{i}", {"sub": str(i), "exp": clock.now + 3600})
+
+        assert cache.get_stats()["principals"] == 10
+        assert cache.get_claims("tok-0") is None
+        assert cache.get_claims("tok-14") is not None
+
+    def test_disabled_with_zero_ttl(self, clock):
+        cache = PrincipalCache(ttl_seconds=0, clock=clock)
+        cache.put_claims("tok", {"sub": "abc", "exp": clock.now + 3600})
+
+        assert cache.get_claims("tok") is None
+
+
+@pytest.mark.unit
+class TestVerifyTokenCaching:
+    """verify_token skips JWKS/RSA verification for cached tokens."""
+
+    def test_second_verify_uses_cache(self, cache, clock):
+        from turbowrap.api import auth
+
+        claims = {"sub": "abc", "exp": clock.now + 3600}
+        with (
+            patch.object(auth, "get_principal_cache", return_value=cache),
+            patch.object(auth, "get_jwks", return_value={"keys": [{"kid": "k1"}]}) as jwks,
+            patch.object(auth.jwt, "get_unverified_header", return_value={"kid": "k1"}),
+            patch.object(auth.jwt, "decode", return_value=claims) as decode,
+        ):
+            assert auth.verify_token("tok") == claims
+            assert auth.verify_token("tok") == claims
+
+        assert jwks.call_count == 1
+        assert decode.call_count == 1
+
+
+@pytest.mark.unit
+class TestRepoAccessCaching:
+    """Repo ACL checks query UserRepository once per user."""
+
+    def test_check_repo_access_cached(self, cache):
+        from turbowrap.api import deps
+
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [
+            MagicMock(repository_id="repo-1")
+        ]
+        user = {"user_id": "user-1", "role": "coder"}
+
+        with patch.object(deps, "get_principal_cache", return_value=cache):
+            assert deps.check_repo_access("repo-1", user, db) is True
+            assert deps.check_repo_access("repo-2", user, db) is False
+            assert deps.get_accessible_repo_ids(user, db) == ["repo-1"]
+
+        assert db.query.call_count == 1
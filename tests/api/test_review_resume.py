@@ -0,0 +1,228 @@
+"""
+Tests for resuming a failed review from its reviewer checkpoints.
+
+Run with: uv run pytest tests/api/test_review_resume.py -v
+
+These tests verify:
+1. Specialist results streamed before a failure are kept as "partial" checkpoints
+2. A resumed review restores checkpointed specialists and only runs the others
+3. CheckpointService returns completed and partial checkpoints for resume
+
+Uses an in-memory SQLite database and a mocked ParallelTripleLLMRunner.
+"""
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from turbowrap.api.services.checkpoint_service import CheckpointService
+from turbowrap.db.base import Base
+from turbowrap.db.models import Repository, Task
+from turbowrap.review.models.review import (
+    Issue,
+    IssueCategory,
+    IssueSeverity,
+    ReviewMode,
+    ReviewOptions,
+    ReviewOutput,
+    ReviewRequest,
+    ReviewRequestSource,
+)
+from turbowrap.review.orchestrator import Orchestrator
+from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMResult
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def checkpoints():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Repository(id="repo-1", name="org/repo", url="https://x/repo", local_path="/tmp/r"))
+    db.add(Task(id="task-1", repository_id="repo-1", type="review", status="running"))
+    db.commit()
+    yield CheckpointService(db)
+    db.close()
+
+
+@pytest.fixture
+def backend_repo(tmp_path):
+    repo = tmp_path / "backend_repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "main.py").write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
+    (repo / "requirements.txt").write_text("fastapi\n")
+    (repo / ".llms").mkdir()
+    (repo / ".llms" / "structure.xml").write_text(
+        '<?xml version="1.0"?>\n<repository type="BACKEND" name="backend_repo"/>\n'
+    )
+    return repo
+
+
+def _issue(issue_id: str, title: str, line: int = 3) -> Issue:
+    return Issue(
+        id=issue_id,
+        severity=IssueSeverity.HIGH,
+        category=IssueCategory.SECURITY,
+        file="src/main.py",
+        line=line,
+        title=title,
+        description=f"{title} in the request handler",
+    )
+
+
+def _request(repo) -> ReviewRequest:
+    return ReviewRequest(
+        type="directory",
+        source=ReviewRequestSource(directory=str(repo)),
+        options=ReviewOptions(mode=ReviewMode.INITIAL, include_functional=False),
+    )
+
+
+def _checkpoint_callback(service: CheckpointService):
+    async def callback(
+        reviewer_name: str,
+        status: str,
+        issues: list[Issue],
+        satisfaction: float,
+        iterations: int,
+        model_usage: list[dict[str, Any]],
+        started_at: datetime,
+    ) -> None:
+        service.save_checkpoint(
+            task_id="task-1",
+            reviewer_name=reviewer_name,
+            issues=issues,
+            final_satisfaction=satisfaction,
+            iterations=iterations,
+            model_usage=model_usage,
+            started_at=started_at,
+            status=status,
+        )
+
+    return callback
+
+
+# =============================================================================
+# Resume
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestReviewResume:
+    """Crash after one specialist streamed, then resume."""
+
+    async def test_resume_skips_partially_checkpointed_specialists(self, checkpoints, backend_repo):
+        orchestrator = Orchestrator()
+        streamed = _issue("BE-QUAL-001", "SQL injection")
+
+        async def crash_after_one_specialist(**kwargs: Any) -> ParallelTripleLLMResult:
+            review = ReviewOutput(reviewer="reviewer_be_quality", issues=[streamed])
+            await kwargs["on_specialist_result"]("claude", review)
+            raise RuntimeError("CLI crashed")
+
+        crashing = MagicMock()
+        crashing.run = AsyncMock(side_effect=crash_after_one_specialist)
+        with (
+            patch("turbowrap.review.orchestrator.ParallelTripleLLMRunner", return_value=crashing),
+            patch.object(orchestrator, "_run_evaluator", return_value=(None, None)),
+        ):
+            await orchestrator.review(
+                _request(backend_repo), checkpoint_callback=_checkpoint_callback(checkpoints)
+            )
+
+        saved = {cp.reviewer_name: cp.status for cp in checkpoints.get_all_checkpoints("task-1")}
+        assert saved == {"reviewer_be_quality": "partial", "reviewer_be_architecture": "failed"}
+
+        # Resume as ReviewStreamService does
+        resumable = checkpoints.get_resumable_reviewers("task-1")
+        completed_checkpoints = {
+            name: {
+                "issues_data": cp.issues_data,
+                "final_satisfaction": cp.final_satisfaction,
+                "iterations": cp.iterations,
+            }
+            for name, cp in resumable.items()
+        }
+        found = _issue("BE-ARCH-001", "Business logic in route", line=40)
+        rerun = MagicMock()
+        rerun.run = AsyncMock(
+            return_value=ParallelTripleLLMResult(
+                final_review=ReviewOutput(reviewer="parallel_triple_llm", issues=[found]),
+                claude_reviews={
+                    "reviewer_be_architecture": ReviewOutput(
+                        reviewer="reviewer_be_architecture", issues=[found]
+                    )
+                },
+            )
+        )
+        with (
+            patch(
+                "turbowrap.review.orchestrator.ParallelTripleLLMRunner", return_value=rerun
+            ) as runner_cls,
+            patch.object(orchestrator, "_run_evaluator", return_value=(None, None)),
+        ):
+            report = await orchestrator.review(
+                _request(backend_repo), completed_checkpoints=completed_checkpoints
+            )
+
+        assert runner_cls.call_args.kwargs["specialists"] == ["reviewer_be_architecture"]
+        assert {issue.title for issue in report.issues} == {
+            "SQL injection",
+            "Business logic in route",
+        }
+        statuses = {r.name: r.status for r in report.reviewers}
+        assert statuses == {
+            "reviewer_be_quality": "completed",
+            "reviewer_be_architecture": "completed",
+        }
+
+    async def test_fully_checkpointed_review_runs_no_llm(self, backend_repo):
+        orchestrator = Orchestrator()
+        saved = _issue("BE-QUAL-001", "SQL injection").model_dump(mode="json")
+        completed_checkpoints = {
+            "reviewer_be_architecture": {"issues_data": [], "iterations": 1},
+            "reviewer_be_quality": {"issues_data": [saved, {"id": "broken"}], "iterations": 1},
+        }
+        runner = MagicMock()
+        runner.run = AsyncMock()
+        with (
+            patch("turbowrap.review.orchestrator.ParallelTripleLLMRunner", return_value=runner),
+            patch.object(orchestrator, "_run_evaluator", return_value=(None, None)),
+        ):
+            report = await orchestrator.review(
+                _request(backend_repo), completed_checkpoints=completed_checkpoints
+            )
+
+        runner.run.assert_not_called()
+        assert [issue.title for issue in report.issues] == ["SQL injection"]
+
+
+@pytest.mark.unit
+class TestResumableCheckpoints:
+    """Checkpoint selection for resume."""
+
+    def test_completed_and_partial_are_resumable(self, checkpoints):
+        for name, status in (("a", "completed"), ("b", "partial"), ("c", "failed")):
+            checkpoints.save_checkpoint(
+                task_id="task-1",
+                reviewer_name=name,
+                issues=[],
+                final_satisfaction=0.0,
+                iterations=1,
+                model_usage=[],
+                started_at=datetime.utcnow(),
+                status=status,
+            )
+
+        assert sorted(checkpoints.get_resumable_reviewers("task-1")) == ["a", "b"]
+        assert list(checkpoints.get_completed_reviewers("task-1")) == ["a"]
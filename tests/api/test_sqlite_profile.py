@@ -0,0 +1,129 @@
+"""
+Tests for the SQLite concurrency profile of the shared session factory.
+
+Run with: uv run pytest tests/api/test_sqlite_profile.py -v
+
+These tests verify:
+1. Every pooled SQLite connection gets journal mode, synchronous level and busy timeout
+2. write_session commits on success, rolls back on error
+3. Writers of this process are serialized on SQLite (and not on other databases)
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from turbowrap.config import DatabaseSettings
+from turbowrap.db import session as db_session
+from turbowrap.db.base import Base
+from turbowrap.db.models import Operation
+from turbowrap.db.session import configure_sqlite_engine, serialized_write, write_session
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False}
+    )
+    configure_sqlite_engine(
+        engine,
+        DatabaseSettings(
+            sqlite_journal_mode="WAL", sqlite_synchronous="NORMAL", sqlite_busy_timeout_ms=2500
+        ),
+    )
+    Base.metadata.create_all(engine, tables=[Operation.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    factory = sessionmaker(bind=engine)
+    with patch.object(db_session, "get_session_local", return_value=factory):
+        yield factory
+
+
+# =============================================================================
+# Pragmas
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPragmas:
+    """Connection profile."""
+
+    def test_every_pooled_connection_is_configured(self, engine):
+        connections = [engine.connect() for _ in range(3)]
+        try:
+            for conn in connections:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 2500
+        finally:
+            for conn in connections:
+                conn.close()
+
+    def test_invalid_modes_are_rejected(self):
+        with pytest.raises(ValueError):
+            DatabaseSettings(sqlite_journal_mode="WAL; DROP TABLE x")
+
+
+# =============================================================================
+# Write path
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestWriteSession:
+    """Single-writer transactions."""
+
+    def test_commits_and_rolls_back(self, session_factory):
+        with write_session() as db:
+            db.add(Operation(id="op-1", operation_type="review"))
+
+        with pytest.raises(RuntimeError), write_session() as db:
+            db.add(Operation(id="op-2", operation_type="review"))
+            raise RuntimeError("boom")
+
+        ids = [op.id for op in session_factory().query(Operation).all()]
+        assert ids == ["op-1"]
+
+    def test_writers_are_serialized(self, session_factory):
+        inside = 0
+        overlap = 0
+        lock = threading.Lock()
+
+        def writer(n: int) -> None:
+            nonlocal inside, overlap
+            for i in range(5):
+                with write_session() as db:
+                    with lock:
+                        inside += 1
+                        overlap = max(overlap, inside)
+                    db.add(Operation(id=f"op-{n}-{i}", operation_type="review"))
+                    time.sleep(0.001)
+                    with lock:
+                        inside -= 1
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlap == 1
+        assert session_factory().query(Operation).count() == 20
+
+    def test_lock_is_reentrant_and_skipped_when_not_sqlite(self, session_factory):
+        db = session_factory()
+        with serialized_write(db), serialized_write(db):
+            assert db_session._write_lock._is_owned()  # type: ignore[attr-defined]
+
+        postgres = MagicMock()
+        postgres.get_bind.return_value.dialect.name = "postgresql"
+        with serialized_write(postgres):
+            assert not db_session._write_lock._is_owned()  # type: ignore[attr-defined]
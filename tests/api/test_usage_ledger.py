@@ -0,0 +1,324 @@
+"""
+Tests for the LLM usage ledger and its hourly rollups.
+
+Run with: uv run pytest tests/api/test_usage_ledger.py -v
+
+Uses an in-memory SQLite database.
+
+These tests verify:
+1. Provider-specific results are normalised into per-model records
+2. Records are buffered and written in batches with their rollups
+3. Rollup queries group by repository/provider/day and match the raw rows
+4. The operation tracker feeds completed and failed LLM operations
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from turbowrap.api.services.operation_tracker import OperationTracker, OperationType
+from turbowrap.api.services.usage_ledger import (
+    UsageLedger,
+    UsageRecord,
+    extract_usage,
+    hour_bucket,
+    infer_provider,
+)
+from turbowrap.db.base import Base
+from turbowrap.db.models import LLMUsage, LLMUsageHourly
+
+NOW = datetime(2026, 10, 18, 10, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def ledger(session_factory):
+    return UsageLedger(batch_size=100, session_factory=session_factory)
+
+
+def _record(
+    repo: str | None = "repo-1",
+    provider: str = "claude",
+    model: str = "claude-opus-4-5",
+    cost: float = 0.5,
+    created_at: datetime = NOW,
+    success: bool = True,
+) -> UsageRecord:
+    return UsageRecord(
+        provider=provider,
+        model=model,
+        operation_type="review",
+        repository_id=repo,
+        input_tokens=1000,
+        output_tokens=200,
+        cache_read_tokens=50,
+        cost_usd=cost,
+        success=success,
+        created_at=created_at,
+    )
+
+
+def _operation(**details) -> SimpleNamespace:
+    return SimpleNamespace(
+        operation_id="op-1",
+        operation_type=OperationType.REVIEW,
+        repository_id="repo-1",
+        parent_session_id="session-1",
+        completed_at=NOW,
+        details=details,
+    )
+
+
+# =============================================================================
+# Normalisation
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestNormalisation:
+    """Tests for extracting usage from provider results."""
+
+    def test_per_model_usage_preferred(self):
+        entries = extract_usage(
+            {
+                "model": "opus",
+                "total_input_tokens": 999,
+                "model_usage": [
+                    {"model": "claude-opus-4-5", "input_tokens": 100, "cost_usd": 0.2},
+                    {"model": "claude-haiku-4-5", "output_tokens": 10, "cost_usd": 0.01},
+                ],
+            }
+        )
+
+        assert [e["model"] for e in entries] == ["claude-opus-4-5", "claude-haiku-4-5"]
+        assert entries[0]["input_tokens"] == 100
+
+    def test_gemini_cache_reads_and_totals_fallback(self):
+        gemini = extract_usage({"model_usage": [{"model": "gemini-3-pro", "cache_reads": 7}]})
+        grok = extract_usage(
+            {"model": "grok-4", "total_input_tokens": 10, "total_output_tokens": 5}
+        )
+
+        assert gemini[0]["cache_read_tokens"] == 7
+        assert grok == [
+            {
+                "model": "grok-4",
+                "input_tokens": 10,
+                "output_tokens": 5,
+                "cache_read_tokens": 0,
+                "cache_creation_tokens": 0,
+                "cost_usd": 0.0,
+            }
+        ]
+
+    def test_results_without_usage_are_skipped(self, ledger):
+        assert extract_usage({"model": "opus", "duration_ms": 100}) == []
+        assert ledger.record_operation(_operation(), {"s3_output_url": "s3://x"}) == 0
+        assert ledger.stats()["buffered"] == 0
+
+    def test_provider_from_cli_or_model(self, ledger):
+        assert infer_provider("gemini-3-flash-preview") == "gemini"
+        assert infer_provider("claude-sonnet-4-5") == "claude"
+        assert infer_provider(None) == "unknown"
+
+        ledger.record_operation(
+            _operation(cli="grok"), {"model": "custom", "total_input_tokens": 1}
+        )
+        ledger.flush()
+
+        with ledger._session_factory() as db:
+            row = db.query(LLMUsage).one()
+        assert row.provider == "grok"
+        assert row.operation_type == "review"
+        assert row.parent_session_id == "session-1"
+
+
+# =============================================================================
+# Batching and rollups
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBatching:
+    """Tests for batched writes and rollup maintenance."""
+
+    def test_flushes_when_batch_is_full(self, session_factory):
+        ledger = UsageLedger(batch_size=3, session_factory=session_factory)
+
+        ledger.record([_record(), _record()])
+        assert ledger.stats()["buffered"] == 2
+        ledger.record([_record()])
+
+        assert ledger.stats() == {"enabled": True, "buffered": 0, "written": 3, "dropped": 0}
+        with session_factory() as db:
+            assert db.query(func.count(LLMUsage.id)).scalar() == 3
+
+    def test_rollups_merge_across_flushes(self, ledger, session_factory):
+        ledger.record([_record(cost=0.5), _record(cost=0.25, success=False)])
+        ledger.flush()
+        ledger.record([_record(cost=1.0), _record(created_at=NOW + timedelta(hours=1))])
+        ledger.flush()
+
+        with session_factory() as db:
+            buckets = db.query(LLMUsageHourly).order_by(LLMUsageHourly.bucket_start).all()
+            first = buckets[0].to_dict()
+
+        assert len(buckets) == 2
+        assert first["calls"] == 3
+        assert first["failed_calls"] == 1
+        assert first["input_tokens"] == 3000
+        assert first["cost_usd"] == pytest.approx(1.75)
+
+    def test_failed_flush_requeues_records(self, session_factory):
+        def broken_session():
+            raise RuntimeError("database is locked")
+
+        ledger = UsageLedger(batch_size=100, max_buffered=2, session_factory=broken_session)
+        ledger.record([_record(), _record(), _record()])
+
+        assert ledger.flush() == 0
+        assert ledger.stats()["buffered"] == 2
+        assert ledger.stats()["dropped"] == 1
+
+        ledger._session_factory = session_factory
+        assert ledger.flush() == 2
+
+    def test_disabled_ledger_records_nothing(self, session_factory):
+        ledger = UsageLedger(enabled=False, session_factory=session_factory)
+
+        ledger.record([_record()])
+
+        assert ledger.stats()["buffered"] == 0
+
+    async def test_stop_flushes_remaining_records(self, ledger, session_factory):
+        ledger.start()
+        ledger.record([_record()])
+        await ledger.stop()
+
+        with session_factory() as db:
+            assert db.query(func.count(LLMUsage.id)).scalar() == 1
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestQueries:
+    """Tests for rollup aggregation."""
+
+    def test_weekly_spend_per_repository(self, ledger, session_factory):
+        ledger.record(
+            [
+                _record(repo="repo-1", cost=1.0),
+                _record(repo="repo-1", cost=2.0, created_at=NOW - timedelta(days=2)),
+                _record(repo="repo-2", cost=0.5, provider="gemini", model="gemini-3-pro"),
+                _record(repo=None, cost=0.1),
+                _record(repo="repo-1", cost=9.0, created_at=NOW - timedelta(days=30)),
+            ]
+        )
+        ledger.flush()
+
+        with session_factory() as db:
+            rows = ledger.query(db, NOW - timedelta(days=7))
+            by_day = ledger.query(
+                db, NOW - timedelta(days=7), group_by=["day"], repository_id="repo-1"
+            )
+            by_provider = ledger.query(db, NOW - timedelta(days=7), group_by=["provider"])
+
+        assert [(r["repository_id"], r["cost_usd"], r["calls"]) for r in rows] == [
+            ("repo-1", 3.0, 2),
+            ("repo-2", 0.5, 1),
+            (None, 0.1, 1),
+        ]
+        assert [(d["day"], d["cost_usd"]) for d in by_day] == [
+            ("2026-10-16", 2.0),
+            ("2026-10-18", 1.0),
+        ]
+        assert {p["provider"]: p["calls"] for p in by_provider} == {"claude": 3, "gemini": 1}
+
+    def test_rollups_match_raw_rows(self, ledger, session_factory):
+        ledger.record(
+            [_record(cost=0.1 * i, created_at=NOW + timedelta(minutes=7 * i)) for i in range(20)]
+        )
+        ledger.flush()
+
+        with session_factory() as db:
+            raw = db.query(func.sum(LLMUsage.cost_usd), func.count(LLMUsage.id)).one()
+            (total,) = ledger.query(db, NOW - timedelta(days=1), group_by=[])
+
+        assert total["cost_usd"] == pytest.approx(raw[0])
+        assert total["calls"] == raw[1]
+
+    def test_spend_includes_buffered_records(self, ledger, session_factory):
+        ledger.record([_record(cost=1.0)])
+        ledger.flush()
+        ledger.record([_record(cost=0.5), _record(repo="repo-2", cost=4.0)])
+
+        with session_factory() as db:
+            assert ledger.spend(db, NOW - timedelta(hours=1), "repo-1") == pytest.approx(1.5)
+
+    def test_unknown_group_by_rejected(self, ledger, session_factory):
+        with session_factory() as db, pytest.raises(ValueError):
+            ledger.query(db, NOW, group_by=["user"])
+
+    def test_hour_bucket_is_utc(self):
+        local = datetime(2026, 10, 18, 12, 45, tzinfo=timezone(timedelta(hours=2)))
+
+        assert hour_bucket(local) == datetime(2026, 10, 18, 10, tzinfo=timezone.utc)
+        assert hour_bucket(datetime(2026, 10, 18, 10, 59)) == hour_bucket(NOW)
+
+
+# =============================================================================
+# Tracker integration
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestTrackerIntegration:
+    """OperationTracker hands finished LLM operations to the ledger."""
+
+    def test_complete_and_fail_are_recorded(self, ledger):
+        tracker = OperationTracker()
+        with (
+            patch("turbowrap.api.services.usage_ledger.get_usage_ledger", return_value=ledger),
+            patch.object(tracker, "_persist_register"),
+            patch.object(tracker, "_persist_complete"),
+            patch.object(tracker, "_persist_fail"),
+            patch.object(tracker, "_persist_update"),
+        ):
+            for op_id in ("ledger-ok", "ledger-ko"):
+                tracker.register(
+                    op_type=OperationType.REVIEW,
+                    operation_id=op_id,
+                    repo_id="repo-1",
+                    details={"cli": "claude"},
+                )
+            tracker.update("ledger-ko", details={"total_input_tokens": 40})
+            tracker.complete(
+                "ledger-ok",
+                result={"model": "opus", "total_input_tokens": 100, "cost_usd": 0.3},
+            )
+            tracker.fail("ledger-ko", error="Error: 429 Too Many Requests")
+            ledger.flush()
+            for op_id in ("ledger-ok", "ledger-ko"):
+                tracker.remove(op_id)
+
+        with ledger._session_factory() as db:
+            rows = {r.operation_id: r for r in db.query(LLMUsage).all()}
+        assert rows["ledger-ok"].success and rows["ledger-ok"].cost_usd == 0.3
+        assert not rows["ledger-ko"].success and rows["ledger-ko"].input_tokens == 40
@@ -0,0 +1,155 @@
+"""
+Tests for the offline benchmark harness.
+
+Run with: uv run pytest tests/benchmarks/test_fake_llm_harness.py -v
+
+These tests verify:
+1. The fake CLI emits stream-json the real wrappers parse
+2. Failure modes surface as CLI failures
+3. Benchmark results are machine-readable and comparable
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from turbowrap_llm import ClaudeCLI, GeminiCLI, GrokCLI
+
+from turbowrap.benchmarks import (
+    BenchmarkConfig,
+    FakeLLMScenario,
+    compare_results,
+    fake_llm_environment,
+    results_document,
+    run_benchmarks,
+)
+from turbowrap.benchmarks.fake_llm import SCENARIO_ENV, build_review_text, load_scenario
+from turbowrap.review.reviewers.utils import IncrementalJSONExtractor
+
+PROMPT = "Review as reviewer_be_quality and reviewer_be_architecture"
+
+# =============================================================================
+# Scenario
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestScenario:
+    """Tests for scenario loading and synthetic output."""
+
+    def test_dialect_overrides_default(self):
+        raw = json.dumps({"default": {"issues_per_specialist": 3}, "grok": {"failure": "stall"}})
+
+        grok = load_scenario("grok", raw)
+        claude = load_scenario("claude", raw)
+
+        assert grok.issues_per_specialist == 3 and grok.failure == "stall"
+        assert claude.failure == "none"
+
+    def test_review_blocks_use_prompt_specialists(self):
+        blocks = build_review_text(FakeLLMScenario(issues_per_specialist=4), PROMPT, "claude")
+
+        found = IncrementalJSONExtractor(required_keys=("specialist", "review")).feed(
+            "".join(blocks)
+        )
+        assert sorted(d["specialist"] for d in found) == [
+            "reviewer_be_architecture",
+            "reviewer_be_quality",
+        ]
+        assert all(len(d["review"]["issues"]) == 4 for d in found)
+
+
+# =============================================================================
+# Fake CLI
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestFakeCLI:
+    """The real CLI wrappers against the fake binary."""
+
+    @pytest.mark.parametrize("cli_cls", [ClaudeCLI, GeminiCLI, GrokCLI])
+    async def test_wrappers_parse_fake_stream(self, tmp_path, cli_cls):
+        chunks: list[str] = []
+
+        async def on_chunk(chunk: str) -> None:
+            chunks.append(chunk)
+
+        with fake_llm_environment({"default": FakeLLMScenario(issues_per_specialist=2)}):
+            result = await cli_cls(working_dir=tmp_path).run(
+                PROMPT, on_chunk=on_chunk, save_artifacts=False
+            )
+
+        assert result.success, result.error
+        assert '"specialist": "reviewer_be_quality"' in result.output
+        assert chunks and "reviewer_be_architecture" in "".join(chunks)
+
+    async def test_exit_error_fails_cli(self, tmp_path):
+        scenario = FakeLLMScenario(failure="exit_error", fail_after_fraction=0.3)
+
+        with fake_llm_environment({"claude": scenario}):
+            result = await ClaudeCLI(working_dir=tmp_path).run(PROMPT, save_artifacts=False)
+
+        assert not result.success
+        assert "simulated API error" in (result.error or "")
+
+    def test_environment_restored(self):
+        path = os.environ.get("PATH")
+
+        with fake_llm_environment() as bin_dir:
+            assert os.environ["PATH"].startswith(str(bin_dir))
+            assert Path(os.environ[SCENARIO_ENV]).exists()
+
+        assert os.environ.get("PATH") == path
+        assert SCENARIO_ENV not in os.environ
+
+
+# =============================================================================
+# Suites and results
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestSuites:
+    """Tests for the benchmark suites and result comparison."""
+
+    async def test_review_e2e_results_document(self):
+        config = BenchmarkConfig(
+            scenario=FakeLLMScenario(issues_per_specialist=3), repeat=1, files_count=4
+        )
+
+        results = await run_benchmarks(config, ["review_e2e"])
+        document = json.loads(json.dumps(results_document(results)))
+
+        (bench,) = document["benchmarks"]
+        assert bench["name"] == "review_e2e"
+        assert bench["metrics"]["failed_providers"] == 0
+        assert bench["metrics"]["merged_issues"] > 0
+        assert {"wall_s", "cpu_s", "loop_lag_max_ms", "peak_mem_mb"} <= set(bench["metrics"])
+
+    def test_compare_results_flags_regressions_above_noise(self):
+        def doc(wall: float, lag: float) -> dict:
+            metrics = {"wall_s": wall, "loop_lag_max_ms": lag}
+            return {"benchmarks": [{"name": "review_e2e", "metrics": metrics}]}
+
+        baseline = doc(wall=1.0, lag=1.0)
+
+        assert compare_results(doc(wall=1.1, lag=3.0), baseline) == []
+        (regression,) = compare_results(doc(wall=2.0, lag=1.0), baseline)
+        assert regression.startswith("review_e2e.wall_s")
+
+    async def test_sqlite_writes_reports_commit_latency_per_profile(self):
+        config = BenchmarkConfig(repeat=1, db_writers=3, db_readers=1, db_commits=5)
+
+        results = await run_benchmarks(config, ["sqlite_writes"])
+
+        assert [r.name for r in results] == [
+            "sqlite_writes[default]",
+            "sqlite_writes[tuned]",
+            "sqlite_writes[serialized]",
+        ]
+        for result in results:
+            assert result.metrics["commits"] + result.metrics["lock_errors"] == 30
+            assert result.metrics["commit_p99_ms"] >= result.metrics["commit_p50_ms"]
+        assert results[1].params["journal_mode"] == "WAL"
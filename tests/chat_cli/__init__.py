@@ -0,0 +1 @@
+"""Chat CLI process manager tests."""
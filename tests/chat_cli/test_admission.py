@@ -0,0 +1,221 @@
+"""
+Tests for CLI process admission and idle eviction.
+
+Run with: uv run pytest tests/chat_cli/test_admission.py -v
+
+These tests verify (with a fake `claude` binary on PATH and a stubbed clock):
+1. Spawns beyond max_processes wait in a FIFO queue instead of failing
+2. The queue is bounded and waiting times out
+3. Idle processes are evicted least recently used first, and revived on
+   their next message (same session, --resume once a message was sent)
+4. evict_idle_processes stops processes idle longer than the limit, never busy ones
+"""
+
+import asyncio
+import json
+import os
+import stat
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from turbowrap.chat_cli import process_manager as pm
+from turbowrap.chat_cli.process_manager import CLIProcessManager
+
+FAKE_CLAUDE = f"""#!{sys.executable}
+import json, os, sys, time
+
+args = sys.argv[1:]
+message = sys.stdin.read()
+with open(os.environ["FAKE_CLI_LOG"], "a") as log:
+    log.write(json.dumps({{"args": args, "message": message}}) + "\\n")
+if message.startswith("sleep:"):
+    time.sleep(float(message.split(":", 1)[1]))
+print(json.dumps({{"type": "result", "result": "echo " + message}}), flush=True)
+"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _NoGovernor:
+    @asynccontextmanager
+    async def slot(self, *args, **kwargs):
+        yield
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch) -> Path:
+    """Put a fake `claude` on PATH; returns the invocation log."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "claude"
+    script.write_text(FAKE_CLAUDE)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.jsonl"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_CLI_LOG", str(log))
+    monkeypatch.setattr(pm, "validate_working_dir", lambda path: path.resolve())
+    monkeypatch.setattr(pm, "get_llm_governor", _NoGovernor)
+    return log
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+async def make_manager(clock, fake_cli):
+    managers: list[CLIProcessManager] = []
+
+    def factory(**kwargs) -> CLIProcessManager:
+        manager = CLIProcessManager(clock=clock, **kwargs)
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        await manager.terminate_all()
+
+
+def _calls(log: Path) -> list[dict]:
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+async def _send(manager: CLIProcessManager, session_id: str, message: str) -> str:
+    return "".join([chunk async for chunk in manager.send_message(session_id, message)])
+
+
+# =============================================================================
+# Admission queue
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestAdmissionQueue:
+    """Waiting for a process slot."""
+
+    async def test_burst_queues_instead_of_failing(self, make_manager, tmp_path):
+        manager = make_manager(max_processes=2)
+        await manager.spawn_claude("a", tmp_path)
+        await manager.spawn_claude("b", tmp_path)
+        sends = [asyncio.create_task(_send(manager, sid, "sleep:0.4")) for sid in ("a", "b")]
+        await asyncio.sleep(0.1)
+
+        spawn_c = asyncio.create_task(manager.spawn_claude("c", tmp_path))
+        await asyncio.sleep(0.05)
+        assert not spawn_c.done()
+        assert manager.get_process_stats()["queued"] == 1
+
+        await asyncio.gather(*sends)
+        proc_c = await asyncio.wait_for(spawn_c, 5)
+
+        assert proc_c.is_running
+        assert "echo hi" in await _send(manager, "c", "hi")
+        assert manager.get_process_stats()["live_processes"] <= 2
+
+    async def test_waiters_are_admitted_in_order(self, make_manager, tmp_path):
+        manager = make_manager(max_processes=1)
+        await manager.spawn_claude("a", tmp_path)
+        send = asyncio.create_task(_send(manager, "a", "sleep:0.3"))
+        await asyncio.sleep(0.1)
+
+        admitted: list[str] = []
+        spawns = []
+        for sid in ("b", "c", "d"):
+            task = asyncio.create_task(manager.spawn_claude(sid, tmp_path))
+            task.add_done_callback(lambda t, sid=sid: admitted.append(sid))
+            spawns.append(task)
+            await asyncio.sleep(0.01)
+
+        await send
+        await asyncio.gather(*spawns)
+
+        assert admitted == ["b", "c", "d"]
+        assert manager.get_process_stats()["live_processes"] == 1
+
+    async def test_bounded_queue_and_timeout(self, make_manager, tmp_path):
+        manager = make_manager(max_processes=1, max_queue=1, admission_timeout=0.2)
+        await manager.spawn_claude("a", tmp_path)
+        send = asyncio.create_task(_send(manager, "a", "sleep:0.6"))
+        await asyncio.sleep(0.1)
+
+        waiting = asyncio.create_task(manager.spawn_claude("b", tmp_path))
+        await asyncio.sleep(0.01)
+        with pytest.raises(RuntimeError, match="already waiting"):
+            await manager.spawn_claude("c", tmp_path)
+        with pytest.raises(RuntimeError, match="No CLI process slot"):
+            await waiting
+
+        assert manager.get_process("b") is None
+        assert manager.get_process_stats()["queued"] == 0
+        await send
+
+
+# =============================================================================
+# Idle eviction
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestIdleEviction:
+    """Evicting idle processes and reviving them."""
+
+    async def test_lru_eviction_and_transparent_revival(
+        self, make_manager, tmp_path, clock, fake_cli
+    ):
+        manager = make_manager(max_processes=2)
+        proc_a = await manager.spawn_claude("a", tmp_path, context="You are A")
+        clock.now = 10
+        proc_b = await manager.spawn_claude("b", tmp_path)
+        clock.now = 20
+        await manager.spawn_claude("c", tmp_path)  # Evicts a, the least recently used
+
+        assert proc_a.process is None and proc_b.is_running
+
+        clock.now = 30
+        assert "echo first" in await _send(manager, "a", "first")  # Evicts b
+        assert proc_b.process is None
+        assert "echo second" in await _send(manager, "a", "second")
+
+        first, second = _calls(fake_cli)
+        session_id = proc_a.claude_session_id
+        assert first["args"][first["args"].index("--session-id") + 1] == session_id
+        assert "--system-prompt-file" in first["args"]
+        assert second["args"][second["args"].index("--resume") + 1] == session_id
+
+    async def test_evict_idle_processes(self, make_manager, tmp_path, clock):
+        manager = make_manager(max_processes=4)
+        proc_a = await manager.spawn_claude("a", tmp_path)
+        clock.now = 100
+        proc_b = await manager.spawn_claude("b", tmp_path)
+        clock.now = 650
+
+        assert manager.evict_idle_processes(max_idle_seconds=600) == 1
+
+        assert proc_a.process is None and proc_b.is_running
+        stats = manager.get_process_stats()
+        assert stats["total_processes"] == 2 and stats["live_processes"] == 1
+
+    async def test_session_busy_until_last_message_finishes(self, make_manager, tmp_path, clock):
+        manager = make_manager(max_processes=4)
+        proc_a = await manager.spawn_claude("a", tmp_path)
+        # Two messages in flight on the same session; the first one finishes
+        manager._mark_busy("a")
+        manager._mark_busy("a")
+        manager._mark_done("a")
+        clock.now = 1000
+
+        assert manager.evict_idle_processes(max_idle_seconds=600) == 0
+        assert proc_a.is_running
+
+        manager._mark_done("a")
+        assert manager.evict_idle_processes(max_idle_seconds=600) == 1
@@ -3,10 +3,14 @@ Pytest configuration and shared fixtures for TurboWrap tests.
 """
 
 import asyncio
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+# Upload S3 artifacts inline so tests never start background upload workers
+os.environ.setdefault("TURBOWRAP_ARTIFACT_UPLOAD_BACKGROUND", "false")
+
 
 @pytest.fixture
 def mock_settings():
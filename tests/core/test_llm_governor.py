@@ -0,0 +1,240 @@
+"""
+Tests for the global LLM rate limiter and concurrency governor.
+
+Run with: uv run pytest tests/core/test_llm_governor.py -v
+
+These tests verify:
+1. Priority classes (interactive before batch) and the interactive reserve
+2. Round-robin fairness across repositories
+3. Request/token buckets, rate-limit backoff and queue timeouts
+4. The turbowrap_llm CLIs go through the installed governor
+"""
+
+import asyncio
+import time
+
+import pytest
+from turbowrap_llm import ClaudeCLI
+from turbowrap_llm.hooks import get_default_limiter, set_default_limiter
+
+from turbowrap.benchmarks import FakeLLMScenario, fake_llm_environment
+from turbowrap.exceptions import LLMQueueTimeoutError
+from turbowrap.llm.governor import (
+    LLMGovernor,
+    Priority,
+    RateLimit,
+    current_call_context,
+    is_rate_limit_error,
+    llm_call_context,
+)
+
+
+def make_governor(reserve: int = 0, **limit: float) -> LLMGovernor:
+    return LLMGovernor({"claude": RateLimit(**limit)}, interactive_reserve=reserve)
+
+
+async def run_queued(
+    governor: LLMGovernor, calls: list[tuple[str, Priority, str | None]]
+) -> list[str]:
+    """Queue calls behind a held slot, then release it and record the grant order."""
+    order: list[str] = []
+    holder = await governor.acquire("claude")
+
+    async def call(name: str, priority: Priority, repository: str | None) -> None:
+        async with governor.slot("claude", priority=priority, repository=repository):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    tasks = []
+    for name, priority, repository in calls:
+        tasks.append(asyncio.create_task(call(name, priority, repository)))
+        await asyncio.sleep(0.01)  # Deterministic enqueue order
+
+    holder.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+# =============================================================================
+# Scheduling
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestScheduling:
+    """Tests for priority classes and per-repository fairness."""
+
+    async def test_interactive_overtakes_queued_batch(self):
+        governor = make_governor(max_concurrent=1)
+
+        order = await run_queued(
+            governor,
+            [
+                ("batch-1", Priority.BATCH, "repo-a"),
+                ("batch-2", Priority.BATCH, "repo-a"),
+                ("chat", Priority.INTERACTIVE, "repo-b"),
+            ],
+        )
+
+        assert order == ["chat", "batch-1", "batch-2"]
+
+    async def test_round_robin_across_repositories(self):
+        governor = make_governor(max_concurrent=1)
+
+        order = await run_queued(
+            governor,
+            [
+                ("a1", Priority.BATCH, "repo-a"),
+                ("a2", Priority.BATCH, "repo-a"),
+                ("a3", Priority.BATCH, "repo-a"),
+                ("b1", Priority.BATCH, "repo-b"),
+            ],
+        )
+
+        assert order == ["a1", "b1", "a2", "a3"]
+
+    async def test_priority_from_call_context(self):
+        governor = make_governor(max_concurrent=1)
+        holder = await governor.acquire("claude")
+
+        with llm_call_context(priority=Priority.BATCH, repository="repo-a"):
+            with llm_call_context(priority=Priority.INTERACTIVE):
+                assert current_call_context().repository == "repo-a"
+                waiter = asyncio.create_task(governor.acquire("claude"))
+                await asyncio.sleep(0.01)
+
+        waiting = governor.snapshot()["limits"]["claude"]["waiting"]
+        assert waiting["interactive"] == 1
+        holder.release()
+        (await waiter).release()
+
+    async def test_interactive_reserve(self):
+        governor = make_governor(reserve=1, max_concurrent=2)
+        batch = await governor.acquire("claude", priority=Priority.BATCH)
+
+        with pytest.raises(LLMQueueTimeoutError):
+            await governor.acquire("claude", priority=Priority.BATCH, timeout=0.05)
+        chat = await governor.acquire("claude", priority=Priority.INTERACTIVE, timeout=0.05)
+
+        assert governor.snapshot()["limits"]["claude"]["in_flight"] == 2
+        batch.release()
+        chat.release()
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        governor = make_governor(max_concurrent=1)
+        holder = await governor.acquire("claude")
+
+        waiter = asyncio.create_task(governor.acquire("claude"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert governor.snapshot()["waiting"] == 0
+        holder.release()
+        assert governor.snapshot()["limits"]["claude"]["in_flight"] == 0
+
+
+# =============================================================================
+# Budgets
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBudgets:
+    """Tests for token buckets, backoff and timeouts."""
+
+    async def test_request_bucket_times_out_when_empty(self):
+        governor = make_governor(requests_per_minute=1)
+
+        async with governor.slot("claude"):
+            pass
+        with pytest.raises(LLMQueueTimeoutError):
+            await governor.acquire("claude", timeout=0.05)
+
+    async def test_token_bucket_delays_until_refilled(self):
+        # 6000 tokens/min = 100 tokens/s
+        governor = make_governor(input_tokens_per_minute=6000)
+
+        async with governor.slot("claude", input_tokens=6000):
+            pass
+        start = time.monotonic()
+        async with governor.slot("claude", input_tokens=30) as lease:
+            pass
+
+        assert time.monotonic() - start >= 0.2
+        assert lease.waited_seconds >= 0.2
+
+    async def test_rate_limited_provider_is_paused(self):
+        governor = make_governor()
+
+        async with governor.slot("claude") as lease:
+            lease.observe("Error: 429 Too Many Requests")
+
+        assert governor.snapshot()["limits"]["claude"]["rate_limited"] == 1
+        with pytest.raises(LLMQueueTimeoutError):
+            await governor.acquire("claude", timeout=0.05)
+
+    async def test_model_limits_apply_with_provider_limits(self):
+        governor = LLMGovernor(
+            {"claude": RateLimit(max_concurrent=5), "claude:opus": RateLimit(max_concurrent=1)},
+            interactive_reserve=0,
+        )
+        opus = await governor.acquire("claude", "opus")
+
+        sonnet = await governor.acquire("claude", "sonnet", timeout=0.05)
+        with pytest.raises(LLMQueueTimeoutError):
+            await governor.acquire("claude", "opus", timeout=0.05)
+
+        assert governor.snapshot()["limits"]["claude"]["in_flight"] == 2
+        opus.release()
+        sonnet.release()
+
+    async def test_sync_acquire_on_event_loop_is_admitted_and_counted(self):
+        governor = make_governor(max_concurrent=1)
+        holder = await governor.acquire("claude")
+
+        with governor.slot_sync("claude"):
+            assert governor.snapshot()["limits"]["claude"]["in_flight"] == 2
+
+        holder.release()
+
+    def test_rate_limit_errors_detected(self):
+        assert is_rate_limit_error("anthropic.RateLimitError: rate_limit_error")
+        assert is_rate_limit_error(RuntimeError("RESOURCE_EXHAUSTED: quota"))
+        assert not is_rate_limit_error("Timeout after 300s")
+        assert not is_rate_limit_error(None)
+
+    async def test_disabled_governor_never_waits(self):
+        governor = LLMGovernor({"claude": RateLimit(max_concurrent=1)}, enabled=False)
+
+        async with governor.slot("claude"), governor.slot("claude", timeout=0.01):
+            pass
+
+
+# =============================================================================
+# CLI integration
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestCLIIntegration:
+    """The turbowrap_llm CLI wrappers use the installed governor."""
+
+    async def test_cli_run_goes_through_default_limiter(self, tmp_path):
+        governor = make_governor(max_concurrent=2)
+        previous = get_default_limiter()
+        set_default_limiter(governor)
+        try:
+            with fake_llm_environment({"default": FakeLLMScenario(issues_per_specialist=1)}):
+                with llm_call_context(priority=Priority.BATCH, repository="repo-a"):
+                    result = await ClaudeCLI(working_dir=tmp_path).run(
+                        "Review as reviewer_be_quality", save_artifacts=False
+                    )
+        finally:
+            set_default_limiter(previous)
+
+        assert result.success, result.error
+        stats = governor.snapshot()["limits"]["claude"]
+        assert stats["granted"] == 1
+        assert stats["in_flight"] == 0
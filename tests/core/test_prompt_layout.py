@@ -0,0 +1,215 @@
+"""
+Tests for cache-friendly prompt assembly and prompt-cache tracking.
+
+Run with: uv run pytest tests/core/test_prompt_layout.py -v
+
+These tests verify:
+1. Segments render from most to least stable, with stable fingerprints
+2. The monitor predicts cache reads from recently sent prefixes (TTL, minimum size)
+3. Expected vs actual cache reads are aggregated per provider
+4. Review and fix prompts keep volatile values (file lists, paths) at the end
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from turbowrap.fix.orchestrator import FixOrchestrator
+from turbowrap.llm.prompt_layout import (
+    PromptCacheMonitor,
+    PromptLayout,
+    RenderedPrompt,
+    Stability,
+)
+from turbowrap.review.models.review import ReviewRequest, ReviewRequestSource
+from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMRunner
+from turbowrap.review.reviewers.base import ReviewContext
+
+INSTRUCTIONS = "Review instructions. " * 400  # ~2000 tokens
+
+
+def _prompt(files: str, output: str = "out.json") -> RenderedPrompt:
+    return (
+        PromptLayout()
+        .add("output", f"Save to {output}", Stability.VOLATILE)
+        .add("files", files, Stability.SHARD)
+        .add("instructions", INSTRUCTIONS)
+        .render()
+    )
+
+
+def _usage(input_tokens: int, cache_read: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        model_usage=[
+            SimpleNamespace(
+                input_tokens=input_tokens, cache_read_tokens=cache_read, cache_creation_tokens=0
+            )
+        ]
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# =============================================================================
+# Layout
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPromptLayout:
+    """Tests for segment ordering and fingerprints."""
+
+    def test_segments_render_most_stable_first(self):
+        prompt = _prompt("a.py")
+
+        assert [s["name"] for s in prompt.describe()] == ["instructions", "files", "output"]
+        assert prompt.startswith(INSTRUCTIONS)
+        assert prompt.endswith("Save to out.json")
+
+    def test_empty_segments_skipped_and_str_compatible(self):
+        prompt = PromptLayout().add("empty", "").add("text", "hello {llm}").render()
+
+        assert [s.name for s in prompt.segments] == ["text"]
+        assert prompt.replace("{llm}", "claude") == "hello claude"
+        assert isinstance(prompt, str)
+
+    def test_prefix_fingerprints_shared_until_first_difference(self):
+        a = _prompt("a.py").prefix_fingerprints()
+        b = _prompt("b.py").prefix_fingerprints()
+
+        assert a[0] == b[0]
+        assert a[1][0] != b[1][0]
+        assert a[0][1] == len(INSTRUCTIONS) // 4
+
+
+# =============================================================================
+# Monitor
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPromptCacheMonitor:
+    """Tests for expected vs actual cache-read tracking."""
+
+    def test_expects_shared_prefix_of_previous_call(self):
+        monitor = PromptCacheMonitor(clock=FakeClock())
+
+        first = monitor.observe("claude", _prompt("a.py"), _usage(2100, 0))
+        second = monitor.observe("claude", _prompt("b.py"), _usage(100, 2000))
+
+        assert first is not None and second is not None
+        assert first.expected_cache_read_tokens == 0
+        assert second.expected_cache_read_tokens == len(INSTRUCTIONS) // 4
+        assert second.matched_segments == ["instructions"]
+        assert second.actual_cache_read_tokens == 2000
+
+    def test_identical_prompt_expects_full_prefix(self):
+        monitor = PromptCacheMonitor(clock=FakeClock())
+        prompt = _prompt("a.py")
+
+        monitor.observe("claude", prompt)
+        observation = monitor.observe("claude", prompt)
+
+        assert observation is not None
+        assert observation.matched_segments == ["instructions", "files", "output"]
+
+    def test_expired_and_small_prefixes_not_expected(self):
+        clock = FakeClock()
+        monitor = PromptCacheMonitor(ttl_seconds=300, clock=clock)
+        small = PromptLayout().add("instructions", "short").render()
+
+        monitor.observe("claude", _prompt("a.py"))
+        monitor.observe("claude", small)
+        clock.now = 301
+
+        assert monitor.expected_cache_read("claude", _prompt("a.py")) == (0, [])
+        assert monitor.expected_cache_read("claude", small) == (0, [])
+
+    def test_providers_and_models_tracked_separately(self):
+        monitor = PromptCacheMonitor(clock=FakeClock())
+
+        monitor.observe("claude", _prompt("a.py"), model="opus")
+
+        assert monitor.expected_cache_read("gemini", _prompt("a.py"))[0] == 0
+        assert monitor.expected_cache_read("claude", _prompt("a.py"), model="haiku")[0] == 0
+        assert monitor.expected_cache_read("claude", _prompt("a.py"), model="opus")[0] > 0
+
+    def test_snapshot_hit_rate(self):
+        monitor = PromptCacheMonitor(clock=FakeClock())
+
+        monitor.observe("claude", _prompt("a.py"), _usage(2000, 0))
+        monitor.observe("claude", _prompt("b.py"), _usage(500, 1500))
+        gemini_result = SimpleNamespace(
+            model_usage=None,
+            session_stats=SimpleNamespace(
+                model_usage=[SimpleNamespace(input_tokens=10, cache_reads=30)]
+            ),
+        )
+        monitor.observe("gemini", _prompt("a.py"), gemini_result)
+        monitor.observe("grok", "plain prompt", SimpleNamespace())
+
+        providers = monitor.snapshot()["providers"]
+        assert providers["claude"]["calls"] == 2
+        assert providers["claude"]["cache_hit_rate"] == 0.375
+        assert providers["gemini"]["actual_cache_read_tokens"] == 30
+        assert "grok" not in providers
+
+
+# =============================================================================
+# Review and fix prompts
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPromptOrdering:
+    """Review/fix prompts put volatile values after the cacheable prefix."""
+
+    def _context(self, repo_path: Path) -> ReviewContext:
+        return ReviewContext(
+            request=ReviewRequest(type="directory", source=ReviewRequestSource()),
+            repo_path=repo_path,
+            files=["a.py", "b.py"],
+            structure_docs={".llms/structure.xml": "<structure/>"},
+        )
+
+    def test_parallel_prompt_shards_share_prefix(self, tmp_path):
+        runner = ParallelTripleLLMRunner(specialists=["reviewer_be_quality"])
+        context = self._context(tmp_path)
+
+        first = runner._build_parallel_prompt(context, ["a.py"], output_suffix="_s1")
+        second = runner._build_parallel_prompt(context, ["b.py"], output_suffix="_s2")
+
+        names = [s.name for s in first.segments]
+        assert names == [
+            "header",
+            "specialists",
+            "output_format",
+            "structure",
+            "files",
+            "instructions",
+        ]
+        assert first.prefix_fingerprints()[3] == second.prefix_fingerprints()[3]
+        assert '{"specialist": "<specialist_name>", "review": {' in first
+        assert first.index("a.py") > first.index("<structure/>")
+        assert first.rstrip().endswith("one per specialist.")
+        assert ".turbowrap_review_parallel_{llm}_s1.json" in first
+
+    def test_fix_prompt_puts_session_values_last(self, tmp_path):
+        orchestrator = FixOrchestrator(tmp_path)
+
+        prompt = orchestrator._build_fix_prompt(
+            master_todo_path=Path("/tmp/fix_session_1/master_todo.json"),
+            branch_name="fix/issue-1",
+            workspace_path="packages/api",
+        )
+
+        assert [s.name for s in prompt.segments] == ["header", "monorepo_scope", "session"]
+        assert prompt.index("packages/api") < prompt.index("master_todo.json")
+        assert prompt.rstrip().endswith("fix/issue-1")
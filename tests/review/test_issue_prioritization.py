@@ -12,6 +12,8 @@ These tests verify:
 6. Full processing pipeline
 """
 
+import time
+
 import pytest
 
 from turbowrap.orchestration.report_utils import (
@@ -230,6 +232,132 @@ class TestIssueDuplication:
         assert len(result) == 2
 
 
+@pytest.mark.functional
+class TestNearDuplicateDeduplication:
+    """Tests for similarity-based deduplication."""
+
+    def _sql_issue(self, line: int, title: str, category: IssueCategory, reviewer: str) -> Issue:
+        issue = _make_issue(
+            file="src/db.py",
+            line=line,
+            severity=IssueSeverity.HIGH,
+            category=category,
+            title=title,
+            description="User input is interpolated into the SQL query string",
+            flagged_by=[reviewer],
+        )
+        issue.current_code = "cursor.execute(f'SELECT * FROM users WHERE id={user_id}')"
+        return issue
+
+    def test_nearby_similar_issues_merged(self):
+        """The same problem reported a few lines apart is merged."""
+        issues = [
+            self._sql_issue(42, "SQL injection in user lookup", IssueCategory.SECURITY, "claude"),
+            self._sql_issue(44, "User lookup SQL injection", IssueCategory.SECURITY, "gemini"),
+            self._sql_issue(41, "SQL injection via f-string", IssueCategory.LOGIC, "grok"),
+        ]
+
+        result = deduplicate_issues(issues)
+
+        assert len(result) == 1
+        assert result[0] is issues[0]
+        assert result[0].flagged_by == ["claude", "gemini", "grok"]
+
+    def test_far_apart_issues_kept(self):
+        """Similar issues outside the line window stay separate."""
+        issues = [
+            self._sql_issue(10, "SQL injection in user lookup", IssueCategory.SECURITY, "claude"),
+            self._sql_issue(90, "SQL injection in user lookup", IssueCategory.SECURITY, "gemini"),
+        ]
+
+        assert len(deduplicate_issues(issues)) == 2
+
+    def test_unrelated_nearby_issues_kept(self):
+        """Different problems on close lines stay separate."""
+        issues = [
+            _make_issue(
+                file="src/main.py",
+                line=10,
+                severity=IssueSeverity.HIGH,
+                category=IssueCategory.SECURITY,
+                title="SQL injection vulnerability",
+            ),
+            _make_issue(
+                file="src/main.py",
+                line=12,
+                severity=IssueSeverity.LOW,
+                category=IssueCategory.SECURITY,
+                title="Hardcoded secret key",
+            ),
+        ]
+
+        assert len(deduplicate_issues(issues)) == 2
+
+    def test_same_reviewer_nearby_issues_kept(self):
+        """Two findings of one reviewer a few lines apart are separate problems."""
+        issues = [
+            self._sql_issue(10, "SQL injection in user query", IssueCategory.SECURITY, "claude"),
+            self._sql_issue(16, "SQL injection in order query", IssueCategory.SECURITY, "claude"),
+        ]
+        issues[1].current_code = "cursor.execute(f'SELECT * FROM orders WHERE id={order_id}')"
+
+        result = deduplicate_issues(issues)
+
+        assert [issue.line for issue in result] == [10, 16]
+
+    def test_same_specialist_from_other_llm_merged(self):
+        """The LLM, not the specialist name, identifies the reviewer."""
+        issues = [
+            self._sql_issue(42, "SQL injection in user lookup", IssueCategory.SECURITY, "claude"),
+            self._sql_issue(44, "User lookup SQL injection", IssueCategory.SECURITY, "gemini"),
+        ]
+        for issue in issues:
+            issue.flagged_by.append("reviewer_be_quality")
+
+        assert len(deduplicate_issues(issues)) == 1
+
+    def test_different_code_kept(self):
+        """Similar wording about different code is not merged."""
+        issues = [
+            self._sql_issue(42, "SQL injection in user lookup", IssueCategory.SECURITY, "claude"),
+            self._sql_issue(44, "SQL injection in user lookup", IssueCategory.SECURITY, "gemini"),
+        ]
+        issues[1].current_code = "db.raw(request.args['filter'])"
+
+        assert len(deduplicate_issues(issues)) == 2
+
+    def test_similarity_can_be_disabled(self):
+        """similarity_threshold=None only merges exact duplicates."""
+        issues = [
+            self._sql_issue(42, "SQL injection in user lookup", IssueCategory.SECURITY, "claude"),
+            self._sql_issue(44, "SQL injection in user lookup", IssueCategory.SECURITY, "gemini"),
+        ]
+
+        assert len(deduplicate_issues(issues, similarity_threshold=None)) == 2
+
+    def test_large_input_stays_fast(self):
+        """Thousands of raw issues from sharded runs are deduplicated quickly."""
+        # 2000 problems, each reported by three LLMs on adjacent lines
+        issues = [
+            _make_issue(
+                file=f"src/module_{(i // 3) % 500}.py",
+                line=(i // 1500) * 40 + (i % 3),
+                severity=IssueSeverity.MEDIUM,
+                category=IssueCategory.LOGIC,
+                title=f"Unchecked return value of helper_{i // 3}",
+                flagged_by=[["claude", "gemini", "grok"][i % 3]],
+            )
+            for i in range(6000)
+        ]
+
+        start = time.perf_counter()
+        result = deduplicate_issues(issues)
+        elapsed = time.perf_counter() - start
+
+        assert len(result) == 2000
+        assert elapsed < 5.0
+
+
 # =============================================================================
 # Severity Ordering Tests
 # =============================================================================
@@ -0,0 +1,172 @@
+"""
+Tests for lazy, memory-capped review file contents.
+
+Run with: uv run pytest tests/review/test_review_file_view.py -v
+
+These tests verify:
+1. Files are registered without being read and read on first access
+2. Cached contents stay under the per-review byte ceiling (LRU eviction)
+3. Files are grouped by token budget and code context reads only what fits
+4. ReviewContext stays compatible with plain dict file contents
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from turbowrap.review.models.review import ReviewRequest, ReviewRequestSource
+from turbowrap.review.reviewers.base import ReviewContext
+from turbowrap.review.utils.file_view import ReviewFileView, read_text_mapped
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    for name in ("a", "b", "c"):
+        (tmp_path / "src" / f"{name}.py").write_text(f"# {name}\n" + "x = 1\n" * 200)
+    (tmp_path / "big.py").write_text("y = 2\n" * 20000)
+    (tmp_path / "image.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+FILES = ["src/a.py", "src/b.py", "src/c.py", "big.py", "image.png", "missing.py"]
+
+
+# =============================================================================
+# Lazy loading
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLazyLoading:
+    """Tests for on-demand reads."""
+
+    def test_registers_text_files_within_size_limit(self, repo):
+        with patch("turbowrap.review.utils.file_view.read_text_mapped") as read:
+            view = ReviewFileView(repo, FILES, max_file_bytes=50000)
+
+        read.assert_not_called()
+        assert list(view) == ["src/a.py", "src/b.py", "src/c.py"]
+        assert "big.py" not in view
+
+    def test_reads_once_then_serves_from_cache(self, repo):
+        view = ReviewFileView(repo, FILES)
+
+        assert view["src/a.py"].startswith("# a\n")
+        assert view["src/a.py"] == view.get("src/a.py")
+        assert view.stats()["reads"] == 1
+        assert view.stats()["hits"] == 2
+
+    def test_assigned_content_is_kept(self, repo):
+        view = ReviewFileView(repo, FILES)
+        view["generated.py"] = "z = 3"
+
+        view.release()
+        view["other.py"] = "w = 4"
+
+        assert "generated.py" not in view
+        assert dict(view.items())["other.py"] == "w = 4"
+        assert len(view) == 4
+
+    def test_prefix_read_from_mmap(self, repo):
+        assert read_text_mapped(repo / "src" / "a.py", max_bytes=4) == "# a\n"
+        (repo / "utf8.py").write_text("é" * 10, encoding="utf-8")
+        assert read_text_mapped(repo / "utf8.py", max_bytes=3) == "é"
+
+
+# =============================================================================
+# Memory ceiling
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestMemoryCeiling:
+    """Tests for the per-review byte ceiling."""
+
+    def test_least_recently_used_files_are_evicted(self, repo):
+        one_file = sys.getsizeof((repo / "src" / "a.py").read_text())
+        view = ReviewFileView(repo, FILES, max_cached_bytes=2 * one_file)
+
+        for path in ("src/a.py", "src/b.py", "src/a.py", "src/c.py"):
+            view[path]
+        stats = view.stats()
+
+        assert stats["cached_files"] == 2
+        assert stats["evictions"] == 1
+        assert stats["cached_bytes"] <= 2 * one_file
+        assert view["src/b.py"].startswith("# b")
+        assert view.stats()["reads"] == 4
+
+    def test_files_over_the_ceiling_are_not_cached(self, repo):
+        view = ReviewFileView(repo, FILES, max_cached_bytes=100)
+
+        assert view["src/a.py"].startswith("# a")
+        assert view.stats()["cached_bytes"] == 0
+        assert view.stats()["uncached"] == 1
+
+    def test_release_drops_contents_but_keeps_paths(self, repo):
+        view = ReviewFileView(repo, FILES)
+        list(view.values())
+
+        view.release()
+
+        assert view.stats()["cached_bytes"] == 0
+        assert len(view) == 3
+
+
+# =============================================================================
+# Chunks and code context
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestChunking:
+    """Tests for token-budgeted access."""
+
+    def test_chunks_respect_token_budget(self, repo):
+        view = ReviewFileView(repo, FILES)
+
+        chunks = list(view.iter_chunks(max_tokens=400))
+
+        assert [[path for path, _ in chunk] for chunk in chunks] == [
+            ["src/a.py"],
+            ["src/b.py"],
+            ["src/c.py"],
+        ]
+        assert len(list(view.iter_chunks(max_tokens=10000))) == 1
+
+    def test_code_context_truncates_and_counts_remaining_files(self, repo):
+        context = ReviewContext(
+            request=ReviewRequest(type="directory", source=ReviewRequestSource()),
+            file_contents=ReviewFileView(repo, FILES),
+        )
+
+        code = context.get_code_context(max_chars=2300)
+
+        assert "### src/a.py" in code
+        assert "### src/b.py" in code and "... (truncated)" in code
+        assert code.endswith("... (1 more files)")
+        assert context.file_contents.stats()["cached_files"] == 1
+
+    def test_small_files_fill_the_last_of_the_budget(self):
+        context = ReviewContext(
+            request=ReviewRequest(type="directory", source=ReviewRequestSource()),
+            file_contents={"big.py": "x" * 1500, "small.py": "y = 1", "large.py": "z" * 500},
+        )
+
+        code = context.get_code_context(max_chars=1600)
+
+        assert "y = 1" in code
+        assert "### large.py" not in code
+        assert code.endswith("... (1 more files)")
+
+    def test_plain_dict_is_wrapped(self):
+        context = ReviewContext(
+            request=ReviewRequest(type="directory", source=ReviewRequestSource()),
+            file_contents={"a.py": "print('a')"},
+        )
+
+        assert isinstance(context.file_contents, ReviewFileView)
+        assert "print('a')" in context.get_code_context()
@@ -0,0 +1,264 @@
+"""
+Tests for the hedged three-LLM review fan-out.
+
+Run with: uv run pytest tests/review/test_review_hedging.py -v
+
+These tests verify:
+1. Quorum + straggler grace cutoff
+2. Hedged restarts of providers whose stream stalls
+3. Late results delivered after the cutoff
+"""
+
+import asyncio
+
+import pytest
+
+from turbowrap.config import get_settings
+from turbowrap.review.models.review import (
+    Issue,
+    IssueCategory,
+    IssueSeverity,
+    ReviewOutput,
+    ReviewRequest,
+    ReviewRequestSource,
+    ReviewSummary,
+)
+from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMRunner
+from turbowrap.review.reviewers.base import ReviewContext
+from turbowrap.review.utils.hedging import CompletionPolicy, HedgedFanOut
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+def _issue(file: str, line: int, flagged_by: list[str]) -> Issue:
+    return Issue(
+        id=f"ISSUE-{file}-{line}",
+        severity=IssueSeverity.HIGH,
+        category=IssueCategory.LOGIC,
+        file=file,
+        line=line,
+        title="Bug",
+        description="desc",
+        flagged_by=flagged_by,
+    )
+
+
+def _reviews(llm: str, *files: str) -> dict[str, ReviewOutput]:
+    return {
+        "reviewer_be_quality": ReviewOutput(
+            reviewer="reviewer_be_quality",
+            summary=ReviewSummary(files_reviewed=1, score=8.0),
+            issues=[_issue(f, 1, []) for f in files],
+        )
+    }
+
+
+def _runner(**hedging: object) -> ParallelTripleLLMRunner:
+    runner = ParallelTripleLLMRunner(specialists=["reviewer_be_quality"])
+    settings = get_settings()
+    runner.settings = settings.model_copy(
+        update={"review_hedging": settings.review_hedging.model_copy(update=hedging)}
+    )
+    return runner
+
+
+def _context(tmp_path) -> ReviewContext:
+    request = ReviewRequest(type="directory", source=ReviewRequestSource())
+    return ReviewContext(request=request, repo_path=tmp_path, files=["a.py"])
+
+
+def _policy(**kwargs: object) -> CompletionPolicy:
+    defaults: dict = {"quorum": 2, "min_grace_seconds": 0.05, "poll_interval": 0.01}
+    defaults.update(kwargs)
+    return CompletionPolicy(**defaults)
+
+
+async def _after(delay: float, value: object) -> object:
+    await asyncio.sleep(delay)
+    return value
+
+
+# =============================================================================
+# HedgedFanOut
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestHedgedFanOut:
+    """Tests for HedgedFanOut."""
+
+    async def test_cutoff_after_quorum_and_grace(self):
+        fan_out = HedgedFanOut(_policy())
+
+        result = await fan_out.run(
+            {
+                "claude": lambda: _after(0.01, "c"),
+                "gemini": lambda: _after(0.02, "g"),
+                "grok": lambda: _after(5, "x"),
+            }
+        )
+
+        assert result.results == {"claude": "c", "gemini": "g"}
+        assert list(result.stragglers) == ["grok"]
+        # Stragglers keep running and can still be awaited
+        result.stragglers["grok"].cancel()
+
+    async def test_straggler_within_grace_is_kept(self):
+        fan_out = HedgedFanOut(_policy(min_grace_seconds=1.0))
+
+        result = await fan_out.run(
+            {
+                "claude": lambda: _after(0.01, "c"),
+                "gemini": lambda: _after(0.01, "g"),
+                "grok": lambda: _after(0.05, "x"),
+            }
+        )
+
+        assert result.results["grok"] == "x"
+        assert result.stragglers == {}
+
+    async def test_failures_do_not_count_towards_quorum(self):
+        async def crash() -> str:
+            raise RuntimeError("CLI crashed")
+
+        fan_out = HedgedFanOut(_policy())
+        result = await fan_out.run(
+            {
+                "claude": crash,
+                "gemini": lambda: _after(0.01, "g"),
+                "grok": lambda: _after(0.1, "x"),
+            }
+        )
+
+        assert isinstance(result.results["claude"], RuntimeError)
+        assert result.results["grok"] == "x"
+
+    async def test_stalled_provider_gets_hedged_restart(self):
+        attempts: list[int] = []
+
+        async def flaky_stream() -> str:
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                await asyncio.sleep(10)  # first attempt hangs without output
+            return f"attempt{len(attempts)}"
+
+        fan_out = HedgedFanOut(_policy(quorum=1, stall_seconds=0.03))
+        result = await fan_out.run({"gemini": flaky_stream})
+
+        assert result.results["gemini"] == "attempt2"
+        assert result.hedges == {"gemini": 1}
+
+    async def test_stream_activity_prevents_hedge(self):
+        fan_out = HedgedFanOut(_policy(quorum=1, stall_seconds=0.05))
+
+        async def chatty() -> str:
+            for _ in range(10):
+                fan_out.touch("claude")
+                await asyncio.sleep(0.02)
+            return "done"
+
+        result = await fan_out.run({"claude": chatty})
+
+        assert result.results["claude"] == "done"
+        assert result.hedges == {}
+
+
+# =============================================================================
+# Runner integration
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRunnerLateResults:
+    """Tests for straggler handling in ParallelTripleLLMRunner."""
+
+    def _install(self, runner: ParallelTripleLLMRunner, grok_gate: asyncio.Event) -> None:
+        async def fast(llm: str):
+            return _reviews(llm, f"{llm}.py", "shared.py"), 0.01
+
+        async def run_claude(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            return await fast("claude")
+
+        async def run_gemini(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            return await fast("gemini")
+
+        async def run_grok(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            await grok_gate.wait()
+            return _reviews("grok", "grok.py"), 1.0
+
+        runner._run_claude = run_claude  # type: ignore[method-assign]
+        runner._run_gemini = run_gemini  # type: ignore[method-assign]
+        runner._run_grok = run_grok  # type: ignore[method-assign]
+
+    async def test_late_provider_merged_in_background(self, tmp_path):
+        runner = _runner(quorum=2, min_grace_seconds=0.05, grace_factor=0.0)
+        grok_gate = asyncio.Event()
+        self._install(runner, grok_gate)
+        late: list[tuple[str, list[str]]] = []
+
+        async def on_late_result(llm, reviews):
+            issues = reviews["reviewer_be_quality"].issues
+            late.append((llm, [i.file for i in issues]))
+            assert issues[0].flagged_by == ["grok", "reviewer_be_quality"]
+
+        result = await runner.run(_context(tmp_path), on_late_result=on_late_result)
+
+        assert result.late_providers == ["grok"]
+        assert result.grok_status == "late"
+        assert result.claude_status == "ok"
+        assert result.overlap_count == 1  # shared.py from claude + gemini
+
+        grok_gate.set()
+        for _ in range(50):
+            if late:
+                break
+            await asyncio.sleep(0.01)
+        assert late == [("grok", ["grok.py"])]
+
+    async def test_disabled_waits_for_all(self, tmp_path):
+        runner = _runner(enabled=False, min_grace_seconds=0.0)
+        grok_gate = asyncio.Event()
+        self._install(runner, grok_gate)
+        asyncio.get_running_loop().call_later(0.1, grok_gate.set)
+
+        result = await runner.run(_context(tmp_path))
+
+        assert result.late_providers == []
+        assert result.grok_issues_count == 1
+
+    async def test_hedged_restart_gets_own_output_and_publishes_once(self, tmp_path):
+        runner = _runner(quorum=3, stall_seconds=0.05)
+        runner._completion_policy = lambda: _policy(quorum=3, stall_seconds=0.05)  # type: ignore[method-assign]
+        block = (
+            '{"specialist": "reviewer_be_quality", "review": {"issues": '
+            '[{"id": "X", "severity": "high", "category": "logic", "file": "a.py", '
+            '"line": 1, "title": "Bug", "description": "desc"}]}}'
+        )
+        suffixes: list[str] = []
+
+        async def run_claude(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            suffixes.append(output_suffix)
+            assert f".turbowrap_review_parallel_{{llm}}{output_suffix}.json" in prompt
+            await on_chunk(block)
+            if len(suffixes) == 1:
+                await asyncio.sleep(10)  # first attempt stalls after one specialist
+            return _reviews("claude", "a.py"), 0.1
+
+        async def run_other(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            return _reviews("gemini", "b.py"), 0.01
+
+        runner._run_claude = run_claude  # type: ignore[method-assign]
+        runner._run_gemini = run_other  # type: ignore[method-assign]
+        runner._run_grok = run_other  # type: ignore[method-assign]
+        published: list[str] = []
+
+        async def on_result(llm: str, review: ReviewOutput) -> None:
+            published.append(llm)
+
+        result = await runner.run(_context(tmp_path), on_specialist_result=on_result)
+
+        assert suffixes == ["", "_hedge1"]
+        assert published == ["claude"]
+        assert result.claude_status == "ok"
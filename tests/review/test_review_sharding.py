@@ -0,0 +1,252 @@
+"""
+Tests for token-budgeted sharded reviews.
+
+Run with: uv run pytest tests/review/test_review_sharding.py -v
+
+These tests verify:
+1. Shard planning (token balance, directory locality, caps)
+2. Per-provider and global CLI concurrency limits
+3. Merging shard results into one review per specialist
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from turbowrap.config import get_settings
+from turbowrap.review.models.review import (
+    Issue,
+    IssueCategory,
+    IssueSeverity,
+    ReviewOutput,
+    ReviewRequest,
+    ReviewRequestSource,
+    ReviewSummary,
+)
+from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMRunner
+from turbowrap.review.reviewers.base import ReviewContext
+from turbowrap.review.utils.sharding import ReviewShard, plan_review_shards
+from turbowrap.utils.file_utils import count_file_tokens
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+def _counter(tokens: dict[str, int]):
+    return lambda path: tokens[Path(path).as_posix().split("repo/", 1)[1]]
+
+
+def _review(spec: str, file: str, score: float, files_reviewed: int) -> ReviewOutput:
+    return ReviewOutput(
+        reviewer=spec,
+        summary=ReviewSummary(files_reviewed=files_reviewed, high_issues=1, score=score),
+        issues=[
+            Issue(
+                id=f"{spec}-{file}",
+                file=file,
+                line=1,
+                severity=IssueSeverity.HIGH,
+                category=IssueCategory.LOGIC,
+                title=f"Bug in {file}",
+                description="desc",
+            )
+        ],
+    )
+
+
+def _context(repo_path: Path, files: list[str] | None = None) -> ReviewContext:
+    request = ReviewRequest(type="directory", source=ReviewRequestSource())
+    return ReviewContext(request=request, repo_path=repo_path, files=files or [])
+
+
+def _fake_file_tokens(path: Path) -> dict[str, int]:
+    """Stand-in for tiktoken: ~4 chars per token."""
+    return {"tokens": path.stat().st_size // 4}
+
+
+def _runner(**sharding: object) -> ParallelTripleLLMRunner:
+    runner = ParallelTripleLLMRunner(specialists=["reviewer_be_quality"])
+    settings = get_settings()
+    runner.settings = settings.model_copy(
+        update={"review_sharding": settings.review_sharding.model_copy(update=sharding)}
+    )
+    return runner
+
+
+# =============================================================================
+# Shard planning
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPlanReviewShards:
+    """Tests for plan_review_shards."""
+
+    def test_small_review_is_one_shard(self):
+        files = ["b.py", "a.py"]
+        shards = plan_review_shards(
+            files, Path("/repo"), 1000, 8, token_counter=_counter({"a.py": 10, "b.py": 10})
+        )
+
+        assert len(shards) == 1
+        assert shards[0].files == files  # original order preserved when unsharded
+
+    def test_balanced_by_tokens(self):
+        tokens = {f"pkg{i}/mod.py": 100 for i in range(8)}
+        shards = plan_review_shards(
+            list(tokens), Path("/repo"), 250, 8, token_counter=_counter(tokens)
+        )
+
+        assert len(shards) == 4
+        assert [s.tokens for s in shards] == [200, 200, 200, 200]
+        assert sorted(f for s in shards for f in s.files) == sorted(tokens)
+
+    def test_keeps_directories_together(self):
+        tokens = {
+            "api/a.py": 100,
+            "api/b.py": 100,
+            "api/c.py": 100,
+            "core/a.py": 100,
+            "core/b.py": 100,
+            "core/c.py": 100,
+        }
+        shards = plan_review_shards(
+            list(reversed(tokens)), Path("/repo"), 300, 8, token_counter=_counter(tokens)
+        )
+
+        assert [s.files for s in shards] == [
+            ["api/a.py", "api/b.py", "api/c.py"],
+            ["core/a.py", "core/b.py", "core/c.py"],
+        ]
+
+    def test_respects_max_shards(self):
+        tokens = {f"f{i}.py": 1000 for i in range(20)}
+        shards = plan_review_shards(list(tokens), Path("/repo"), 100, 3, _counter(tokens))
+
+        assert len(shards) == 3
+        assert sum(len(s.files) for s in shards) == 20
+
+    def test_count_file_tokens_cached_until_change(self, tmp_path):
+        path = tmp_path / "mod.py"
+        path.write_text("x = 1\n" * 10)
+
+        with patch(
+            "turbowrap.utils.file_utils.calculate_tokens_for_file", side_effect=_fake_file_tokens
+        ) as tokenize:
+            first = count_file_tokens(path)
+            assert count_file_tokens(path) == first
+            assert tokenize.call_count == 1
+
+            path.write_text("x = 1\n" * 20)
+            assert count_file_tokens(path) > first
+            assert tokenize.call_count == 2
+
+        assert count_file_tokens(tmp_path / "missing.py") == 0
+
+
+# =============================================================================
+# Sharded execution
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestShardedRunner:
+    """Tests for ParallelTripleLLMRunner sharded execution."""
+
+    async def test_concurrency_caps(self, tmp_path):
+        runner = _runner(workers_per_provider=2, max_concurrent_clis=3)
+        context = _context(tmp_path)
+        shards = [ReviewShard(index=i, files=[f"d{i}/f.py"]) for i in range(6)]
+
+        running = {"claude": 0, "gemini": 0}
+        peaks = {"claude": 0, "gemini": 0, "total": 0}
+
+        def fake_run(llm: str):
+            async def run(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+                running[llm] += 1
+                peaks[llm] = max(peaks[llm], running[llm])
+                peaks["total"] = max(peaks["total"], sum(running.values()))
+                assert f"_{shard.label}.json" in prompt
+                await asyncio.sleep(0.01)
+                running[llm] -= 1
+                return {"reviewer_be_quality": _review("q", shard.files[0], 8.0, 1)}, 0.01
+
+            return run
+
+        slots = asyncio.Semaphore(3)
+        results = await asyncio.gather(
+            runner._run_sharded(fake_run("claude"), context, shards, None, slots, "claude"),
+            runner._run_sharded(fake_run("gemini"), context, shards, None, slots, "gemini"),
+        )
+
+        assert peaks["claude"] <= 2 and peaks["gemini"] <= 2
+        assert peaks["total"] <= 3
+        for reviews, _ in results:
+            assert len(reviews["reviewer_be_quality"].issues) == 6
+
+    async def test_failed_shards_skipped(self, tmp_path):
+        runner = _runner()
+        shards = [ReviewShard(index=i, files=[f"f{i}.py"]) for i in range(3)]
+
+        async def flaky(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            if shard.index == 1:
+                raise RuntimeError("CLI crashed")
+            return {"reviewer_be_quality": _review("q", shard.files[0], 8.0, 1)}, 0.0
+
+        reviews, _ = await runner._run_sharded(
+            flaky, _context(tmp_path), shards, None, asyncio.Semaphore(6), "grok"
+        )
+        assert [i.file for i in reviews["reviewer_be_quality"].issues] == ["f0.py", "f2.py"]
+
+        async def broken(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+            raise RuntimeError("CLI missing")
+
+        with pytest.raises(RuntimeError, match="CLI missing"):
+            await runner._run_sharded(
+                broken, _context(tmp_path), shards, None, asyncio.Semaphore(6), "x"
+            )
+
+    def test_merge_shard_reviews(self):
+        merged = ParallelTripleLLMRunner._merge_shard_reviews(
+            [
+                {"spec": _review("spec", "a.py", 9.0, 3)},
+                {"spec": _review("spec", "b.py", 5.0, 1)},
+            ]
+        )["spec"]
+
+        assert merged.summary.files_reviewed == 4
+        assert merged.summary.high_issues == 2
+        assert merged.summary.score == pytest.approx(8.0)
+        assert [i.file for i in merged.issues] == ["a.py", "b.py"]
+
+    async def test_run_dispatches_shards(self, tmp_path):
+        for i in range(4):
+            (tmp_path / f"m{i}").mkdir()
+            (tmp_path / f"m{i}" / "mod.py").write_text("value = 1\n" * 400)
+        files = [f"m{i}/mod.py" for i in range(4)]
+        runner = _runner(max_shard_tokens=1000, workers_per_provider=2)
+        calls: list[tuple[str, list[str]]] = []
+
+        def fake_run(llm: str):
+            async def run(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+                calls.append((llm, shard.files))
+                return {"reviewer_be_quality": _review(llm, shard.files[0], 7.0, 1)}, 0.0
+
+            return run
+
+        runner._run_claude = fake_run("claude")  # type: ignore[method-assign]
+        runner._run_gemini = fake_run("gemini")  # type: ignore[method-assign]
+        runner._run_grok = fake_run("grok")  # type: ignore[method-assign]
+
+        with patch(
+            "turbowrap.utils.file_utils.calculate_tokens_for_file", side_effect=_fake_file_tokens
+        ):
+            result = await runner.run(_context(tmp_path, files))
+
+        assert result.shards_count == 4
+        assert len(calls) == 12
+        assert result.claude_issues_count == 4
+        assert result.final_review.summary.files_reviewed == 4
@@ -0,0 +1,174 @@
+"""
+Tests for streaming specialist result extraction.
+
+Run with: uv run pytest tests/review/test_specialist_streaming.py -v
+
+These tests verify:
+1. IncrementalJSONExtractor handles objects split across chunks
+2. Specialist reviews are published while the CLI is still streaming
+3. _parse_output extracts fenced and bare objects in a single linear pass
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from turbowrap.review.models.review import ReviewOutput, ReviewRequest, ReviewRequestSource
+from turbowrap.review.parallel_triple_llm_runner import ParallelTripleLLMRunner
+from turbowrap.review.reviewers.base import ReviewContext
+from turbowrap.review.reviewers.utils import IncrementalJSONExtractor
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+def _block(spec: str, n_issues: int = 1) -> str:
+    issues = [
+        {
+            "id": f"{spec}-{i}",
+            "severity": "high",
+            "category": "logic",
+            "file": f"src/{spec}.py",
+            "line": i + 1,
+            "title": 'Unbalanced {brace} in "quoted" title',
+            "description": "Uses `dict[str, {}]`",
+        }
+        for i in range(n_issues)
+    ]
+    review = {"summary": {"score": 7.5}, "issues": issues}
+    return json.dumps({"specialist": spec, "review": review}, indent=2)
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+# =============================================================================
+# Incremental extraction
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIncrementalJSONExtractor:
+    """Tests for IncrementalJSONExtractor."""
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 100_000])
+    def test_objects_split_across_chunks(self, size):
+        output = (
+            "Reading agents/*.md {llm} files...\n```json\n"
+            + _block("reviewer_be_quality")
+            + "\n```\nNext specialist: {not json}\n"
+            + _block("analyst_func", 2)
+        )
+        extractor = IncrementalJSONExtractor(required_keys=("specialist", "review"))
+
+        found = [obj for chunk in _chunks(output, size) for obj in extractor.feed(chunk)]
+
+        assert [o["specialist"] for o in found] == ["reviewer_be_quality", "analyst_func"]
+        assert found[0]["review"]["issues"][0]["title"] == 'Unbalanced {brace} in "quoted" title'
+
+    def test_emits_when_object_closes(self):
+        extractor = IncrementalJSONExtractor()
+        text = _block("reviewer_be_quality")
+
+        assert extractor.feed(text[:-1]) == []
+        assert len(extractor.feed(text[-1] + " trailing prose")) == 1
+
+    def test_skips_invalid_and_filtered_objects(self):
+        extractor = IncrementalJSONExtractor(required_keys=("specialist", "review"))
+
+        found = extractor.feed('{"a": 1} {"specialist": "x", "oops"} {"specialist": "y"}')
+
+        assert found == []
+
+    def test_buffer_trimmed_between_objects(self):
+        extractor = IncrementalJSONExtractor()
+        for _ in range(100):
+            extractor.feed("prose " * 100 + '{"k": 1}')
+
+        assert len(extractor._buffer) == 0
+
+    def test_linear_on_large_output(self):
+        """Many specialist markers must not trigger a rescan per marker."""
+        output = "\n".join(_block(f"spec{i}", 20) for i in range(300))
+        extractor = IncrementalJSONExtractor(required_keys=("specialist", "review"))
+
+        start = time.perf_counter()
+        found = [obj for chunk in _chunks(output, 512) for obj in extractor.feed(chunk)]
+        elapsed = time.perf_counter() - start
+
+        assert len(found) == 300
+        assert elapsed < 5
+
+
+# =============================================================================
+# Runner integration
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSpecialistStreaming:
+    """Tests for on_specialist_result in ParallelTripleLLMRunner."""
+
+    async def test_results_published_before_cli_exits(self, tmp_path):
+        runner = ParallelTripleLLMRunner(specialists=["reviewer_be_quality", "analyst_func"])
+        request = ReviewRequest(type="directory", source=ReviewRequestSource())
+        context = ReviewContext(request=request, repo_path=tmp_path, files=["a.py"])
+        cli_finished = asyncio.Event()
+        published: list[tuple[str, str, bool]] = []
+
+        def fake_run(llm: str):
+            async def run(ctx, prompt, on_chunk, shard=None, output_suffix=""):
+                output = _block("reviewer_be_quality") + "\n" + _block("analyst_func", 3)
+                for chunk in _chunks(output, 50):
+                    await on_chunk(chunk)
+                await asyncio.sleep(0)
+                cli_finished.set()
+                return runner._parse_output(output, llm, 1), 0.0
+
+            return run
+
+        runner._run_claude = fake_run("claude")  # type: ignore[method-assign]
+        runner._run_gemini = fake_run("gemini")  # type: ignore[method-assign]
+        runner._run_grok = fake_run("grok")  # type: ignore[method-assign]
+
+        async def on_result(llm: str, review: ReviewOutput) -> None:
+            published.append((llm, review.reviewer, cli_finished.is_set()))
+            assert review.issues[0].flagged_by == [llm, review.reviewer]
+
+        result = await runner.run(context, on_specialist_result=on_result)
+
+        assert len(published) == 6
+        assert not any(finished for _, _, finished in published)
+        assert result.claude_issues_count == 4
+
+    async def test_failing_callback_does_not_abort_stream(self, tmp_path):
+        runner = ParallelTripleLLMRunner(specialists=["reviewer_be_quality"])
+        received: list[str] = []
+
+        async def on_chunk(chunk: str) -> None:
+            received.append(chunk)
+
+        async def broken(llm: str, review: ReviewOutput) -> None:
+            raise RuntimeError("checkpoint DB locked")
+
+        wrapped = runner._stream_specialists("claude", 1, on_chunk, broken)
+        assert wrapped is not None
+        for chunk in _chunks(_block("reviewer_be_quality") + "done", 10):
+            await wrapped(chunk)
+
+        assert "".join(received).endswith("done")
+        assert runner._stream_specialists("claude", 1, on_chunk, None) is on_chunk
+
+    def test_parse_output_fenced_and_bare(self):
+        runner = ParallelTripleLLMRunner(specialists=["reviewer_be_quality", "analyst_func"])
+        output = "```json\n" + _block("reviewer_be_quality", 2) + "\n```\n" + _block("analyst_func")
+
+        reviews = runner._parse_output(output, "gemini", 3)
+
+        assert set(reviews) == {"reviewer_be_quality", "analyst_func"}
+        assert len(reviews["reviewer_be_quality"].issues) == 2
+        assert reviews["analyst_func"].issues[0].flagged_by == ["gemini", "analyst_func"]
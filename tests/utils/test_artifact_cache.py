@@ -0,0 +1,185 @@
+"""
+Tests for the S3 artifact read-through cache.
+
+Run with: uv run pytest tests/utils/test_artifact_cache.py -v
+
+Uses LocalObjectStore, so no AWS access is needed.
+"""
+
+import threading
+import time
+
+import pytest
+
+from turbowrap.utils.artifact_cache import (
+    ArtifactCache,
+    LocalObjectStore,
+    StoredObject,
+    parse_s3_url,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalObjectStore(tmp_path / "s3")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, store, clock):
+    return ArtifactCache(
+        store=store,
+        cache_dir=tmp_path / "cache",
+        max_bytes=1000,
+        revalidate_seconds=60,
+        clock=clock,
+    )
+
+
+@pytest.mark.unit
+class TestArtifactCache:
+    """Tests for ArtifactCache."""
+
+    def test_repeat_reads_hit_cache(self, cache, store):
+        store.put("bucket", "mockups/a.html", b"<html>a</html>")
+
+        assert cache.get("bucket", "mockups/a.html") == b"<html>a</html>"
+        assert cache.get_text("bucket", "mockups/a.html") == "<html>a</html>"
+
+        assert store.get_calls == 1
+        assert store.head_calls == 1
+
+    def test_revalidates_by_etag_after_window(self, cache, store, clock):
+        """After the freshness window a HEAD is issued; unchanged objects aren't re-downloaded."""
+        store.put("bucket", "k", b"v1")
+        cache.get("bucket", "k")
+
+        clock.now += 61
+        assert cache.get("bucket", "k") == b"v1"
+        assert store.head_calls == 2
+        assert store.get_calls == 1
+
+    def test_changed_object_is_refetched(self, cache, store, clock):
+        store.put("bucket", "k", b"v1")
+        cache.get("bucket", "k")
+        store.put("bucket", "k", b"v2")
+
+        clock.now += 61
+        assert cache.get("bucket", "k") == b"v2"
+        assert store.get_calls == 2
+
+    def test_invalidate_forces_revalidation(self, cache, store):
+        store.put("bucket", "k", b"v1")
+        cache.get("bucket", "k")
+        store.put("bucket", "k", b"v2")
+
+        cache.invalidate("bucket", "k")
+        assert cache.get("bucket", "k") == b"v2"
+
+    def test_lru_eviction_respects_size_bound(self, cache, store):
+        for name in ("a", "b", "c"):
+            store.put("bucket", name, name.encode() * 400)
+            cache.get("bucket", name)
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 1000
+        assert stats["entries"] == 2
+
+    def test_oversized_object_not_cached(self, cache, store):
+        store.put("bucket", "big", b"x" * 2000)
+
+        assert cache.get("bucket", "big") == b"x" * 2000
+        assert cache.get_stats()["entries"] == 0
+
+    def test_range_read_from_cached_body(self, cache, store):
+        store.put("bucket", "log", b"0123456789")
+        cache.get("bucket", "log")
+
+        assert cache.get_range("bucket", "log", 2, 5) == b"2345"
+        assert cache.get_range("bucket", "log", 7) == b"789"
+        assert store.get_calls == 1
+
+    def test_range_read_uncached_goes_to_store(self, cache, store):
+        store.put("bucket", "log", b"0123456789")
+
+        assert cache.get_range("bucket", "log", 0, 3) == b"0123"
+        assert cache.get_stats()["entries"] == 0
+
+    def test_survives_restart(self, tmp_path, store, clock):
+        store.put("bucket", "k", b"persisted")
+        first = ArtifactCache(store, tmp_path / "cache", clock=clock)
+        first.get("bucket", "k")
+
+        second = ArtifactCache(store, tmp_path / "cache", clock=clock)
+        assert second.get("bucket", "k") == b"persisted"
+        assert store.get_calls == 1
+
+    def test_concurrent_reads_share_one_download(self, tmp_path):
+        """Concurrent misses for the same key trigger a single GET."""
+
+        class SlowStore(LocalObjectStore):
+            def get(self, bucket, key, byte_range=None) -> StoredObject:
+                time.sleep(0.1)
+                return super().get(bucket, key, byte_range)
+
+        store = SlowStore(tmp_path / "s3")
+        store.put("bucket", "k", b"shared")
+        cache = ArtifactCache(store, tmp_path / "cache")
+
+        results: list[bytes] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("bucket", "k")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == [b"shared"] * 5
+        assert store.get_calls == 1
+
+    def test_missing_object_raises(self, cache):
+        with pytest.raises(FileNotFoundError):
+            cache.get("bucket", "missing")
+
+    async def test_async_get(self, cache, store):
+        store.put("bucket", "k", b"async")
+
+        assert await cache.aget_text("bucket", "k") == "async"
+
+
+@pytest.mark.unit
+class TestParseS3Url:
+    """Tests for parse_s3_url."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("s3://bucket/path/to/file.md", ("bucket", "path/to/file.md")),
+            (
+                "https://turbowrap-thinking.s3.eu-west-3.amazonaws.com/mockups/x/mockup.html",
+                ("turbowrap-thinking", "mockups/x/mockup.html"),
+            ),
+            (
+                "https://bucket.s3.amazonaws.com/a/b%20c.md?X-Amz-Signature=abc&X-Amz-Expires=60",
+                ("bucket", "a/b c.md"),
+            ),
+            ("https://example.com/file.md", None),
+            ("s3://bucket-only", None),
+        ],
+    )
+    def test_parse(self, url, expected):
+        assert parse_s3_url(url) == expected
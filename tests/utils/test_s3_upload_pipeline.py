@@ -0,0 +1,196 @@
+"""
+Tests for the background S3 artifact upload pipeline.
+
+Run with: uv run pytest tests/utils/test_s3_upload_pipeline.py -v
+
+Uses a fake S3 client, so no AWS access is needed.
+"""
+
+import gzip
+import io
+import threading
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from turbowrap.utils.s3_artifact_saver import S3ArtifactSaver
+from turbowrap.utils.s3_upload_pipeline import (
+    S3UploadPipeline,
+    decode_body,
+    encode_body,
+    read_s3_body,
+)
+
+
+class FakeS3Client:
+    """Records uploads; fails the first ``fail_times`` calls."""
+
+    def __init__(self, fail_times: int = 0):
+        self.fail_times = fail_times
+        self.objects: dict[str, dict[str, Any]] = {}
+        self.multipart_keys: list[str] = []
+        self._lock = threading.Lock()
+
+    def _maybe_fail(self) -> None:
+        with self._lock:
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise ConnectionError("S3 unavailable")
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **extra: Any) -> None:
+        self._maybe_fail()
+        self.objects[Key] = {"Body": Body, **extra}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None) -> None:
+        self._maybe_fail()
+        self.multipart_keys.append(key)
+        self.objects[key] = {"Body": fileobj.read(), **(ExtraArgs or {})}
+
+
+def make_pipeline(client: FakeS3Client, tmp_path, **kwargs) -> S3UploadPipeline:
+    defaults: dict[str, Any] = {
+        "client_factory": lambda region: client,
+        "workers": 2,
+        "min_compress_bytes": 10,
+        "retry_base_delay": 0,
+        "spill_dir": tmp_path / "spill",
+        "spill_retry_interval": 0.05,
+    }
+    defaults.update(kwargs)
+    return S3UploadPipeline(**defaults)
+
+
+@pytest.mark.unit
+class TestContentEncoding:
+    """Tests for encode_body/decode_body."""
+
+    def test_gzip_round_trip(self):
+        data = b"prompt " * 500
+        body, encoding = encode_body(data, "gzip")
+
+        assert encoding == "gzip"
+        assert len(body) < len(data)
+        assert decode_body(body, encoding) == data
+
+    def test_small_bodies_not_compressed(self):
+        assert encode_body(b"tiny", "gzip", min_bytes=1024) == (b"tiny", None)
+
+    def test_none_disables_compression(self):
+        assert encode_body(b"x" * 5000, "none") == (b"x" * 5000, None)
+
+    def test_zstd_falls_back_to_gzip_without_package(self):
+        with patch("turbowrap.utils.s3_upload_pipeline._get_zstd", return_value=None):
+            _, encoding = encode_body(b"x" * 5000, "zstd")
+
+        assert encoding == "gzip"
+
+    def test_read_s3_body_decodes(self):
+        response = {"Body": io.BytesIO(gzip.compress(b"hello")), "ContentEncoding": "gzip"}
+
+        assert read_s3_body(response) == b"hello"
+
+
+@pytest.mark.unit
+class TestS3UploadPipeline:
+    """Tests for S3UploadPipeline."""
+
+    def test_uploads_compressed_in_background(self, tmp_path):
+        client = FakeS3Client()
+        pipeline = make_pipeline(client, tmp_path)
+
+        for i in range(10):
+            pipeline.submit("bucket", f"k{i}.md", b"content " * 100, "text/markdown")
+        assert pipeline.flush(timeout=5)
+
+        assert len(client.objects) == 10
+        stored = client.objects["k0.md"]
+        assert stored["ContentEncoding"] == "gzip"
+        assert stored["ContentType"] == "text/markdown"
+        assert gzip.decompress(stored["Body"]) == b"content " * 100
+
+        metrics = pipeline.get_metrics()
+        assert metrics["uploaded"] == 10
+        assert metrics["compression_ratio"] < 1
+        pipeline.shutdown()
+
+    def test_large_bodies_use_multipart(self, tmp_path):
+        client = FakeS3Client()
+        pipeline = make_pipeline(client, tmp_path, compression="none", multipart_threshold=1000)
+
+        pipeline.submit("bucket", "thinking.md", b"t" * 5000, "text/markdown")
+        pipeline.submit("bucket", "small.md", b"s" * 10, "text/markdown")
+        assert pipeline.flush(timeout=5)
+
+        assert client.multipart_keys == ["thinking.md"]
+        assert pipeline.get_metrics()["multipart"] == 1
+        pipeline.shutdown()
+
+    def test_retries_transient_failures(self, tmp_path):
+        client = FakeS3Client(fail_times=2)
+        pipeline = make_pipeline(client, tmp_path, workers=1, max_retries=3)
+
+        pipeline.submit("bucket", "k.md", b"data", "text/markdown")
+        assert pipeline.flush(timeout=5)
+
+        assert "k.md" in client.objects
+        assert pipeline.get_metrics()["retries"] == 2
+        pipeline.shutdown()
+
+    def test_spills_and_recovers_when_s3_down(self, tmp_path):
+        client = FakeS3Client(fail_times=100)
+        pipeline = make_pipeline(client, tmp_path, workers=1, max_retries=1)
+
+        pipeline.submit("bucket", "k.md", b"payload " * 50, "text/markdown")
+        assert pipeline.flush(timeout=5)
+        assert client.objects == {}
+        assert len(list((tmp_path / "spill").glob("*.json"))) == 1
+
+        # S3 comes back: spilled upload is re-queued and stored as originally encoded
+        client.fail_times = 0
+        assert pipeline.drain_spill() == 1
+        assert pipeline.flush(timeout=5)
+
+        assert gzip.decompress(client.objects["k.md"]["Body"]) == b"payload " * 50
+        assert list((tmp_path / "spill").iterdir()) == []
+        pipeline.shutdown()
+
+    def test_queue_overflow_spills(self, tmp_path):
+        gate = threading.Event()
+
+        class BlockingClient(FakeS3Client):
+            def put_object(self, **kwargs: Any) -> None:
+                gate.wait(5)
+                super().put_object(**kwargs)
+
+        client = BlockingClient()
+        pipeline = make_pipeline(client, tmp_path, workers=1, max_queue=1)
+
+        for i in range(5):
+            pipeline.submit("bucket", f"k{i}.md", b"x", "text/markdown")
+
+        assert pipeline.get_metrics()["spilled"] >= 3
+        gate.set()
+        pipeline.shutdown()
+
+
+@pytest.mark.unit
+class TestS3ArtifactSaverBackground:
+    """S3ArtifactSaver hands text artifacts to the pipeline."""
+
+    async def test_save_returns_url_without_blocking(self, tmp_path):
+        client = FakeS3Client()
+        pipeline = make_pipeline(client, tmp_path)
+        saver = S3ArtifactSaver(bucket="bucket", region="eu-west-3", prefix="cli", background=True)
+        saver._client = MagicMock()
+        saver._client.generate_presigned_url.return_value = "https://signed"
+
+        with patch("turbowrap.utils.s3_artifact_saver.get_upload_pipeline", return_value=pipeline):
+            url = await saver.save_raw("hello " * 500, "output", "ctx-1")
+
+        assert url == "https://signed"
+        saver._client.put_object.assert_not_called()
+        assert pipeline.flush(timeout=5)
+        (key,) = client.objects
+        assert key.startswith("cli/") and key.endswith("ctx-1_output.jsonl")
+        pipeline.shutdown()
@@ -0,0 +1,171 @@
+"""
+Tests for the shared structure document cache.
+
+Run with: uv run pytest tests/utils/test_structure_docs.py -v
+
+These tests verify:
+1. Compact and verbose structure.xml are indexed by directory, file and symbol
+2. Subsets keep the directories of the given paths and fit a token budget
+3. Documents are read once per content version
+4. Review contexts keep only the structure of the directories a diff touches
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from turbowrap_llm.hooks import estimate_tokens
+
+from turbowrap.utils.context_utils import load_structure_documentation
+from turbowrap.utils.structure_docs import (
+    StructureCache,
+    StructureDocument,
+    load_structure_document,
+)
+
+COMPACT = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- TurboWrap ts:1767131197 -->
+<r n="demo" type="backend" lang="Python"><meta fw="FastAPI" files="5" lines="300" />
+ <m p="/"><f n="main.py" l="10" /></m>
+ <m p="src"><f n="app.py" l="50"><fn n="create_app" d="Build app" /></f></m>
+ <m p="src/api" purpose="HTTP routes"><f n="users.py" l="80"><cls n="UserRouter" /></f></m>
+ <m p="src/db"><f n="models.py" l="90"><cls n="User" /><cls n="Base" /></f></m>
+ <m p="docs"><f n="build.py" l="70"><fn n="create_app" /></f></m>
+</r>"""
+
+VERBOSE = """<?xml version="1.0" encoding="UTF-8"?>
+<repository name="demo" type="frontend">
+  <metadata files="1" />
+  <module path="web"><file name="App.tsx" lines="20"><component name="App" /></file></module>
+</repository>"""
+
+
+def _document(text: str, name: str = "structure.xml") -> StructureDocument:
+    return StructureDocument(Path(name), text, "digest")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / ".llms").mkdir()
+    (tmp_path / ".llms" / "structure.xml").write_text(COMPACT)
+    return tmp_path
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStructureDocument:
+    """Indexing and subsets."""
+
+    def test_compact_format_is_indexed(self):
+        doc = _document(COMPACT)
+
+        assert doc.is_xml and doc.repo_type == "backend"
+        assert list(doc.modules) == ["/", "src", "src/api", "src/db", "docs"]
+        assert doc.modules["src/db"].files == ["src/db/models.py"]
+        assert doc.find_symbol("create_app") == ["src/app.py", "docs/build.py"]
+        assert doc.find_symbol("missing") == []
+
+    def test_verbose_format_and_markdown(self):
+        verbose = _document(VERBOSE)
+        markdown = _document("# Structure\n\n- src/", "STRUCTURE.md")
+
+        assert verbose.repo_type == "frontend"
+        assert verbose.find_symbol("App") == ["web/App.tsx"]
+        assert not markdown.is_xml
+        assert markdown.render(paths=["src/a.py"], max_tokens=1) == markdown.text
+
+    def test_subset_keeps_touched_directories_and_parents(self):
+        doc = _document(COMPACT)
+
+        subset = doc.render(paths=["src/api/users.py"])
+
+        assert 'p="src/api"' in subset and 'p="src"' in subset and 'p="/"' in subset
+        assert 'p="src/db"' not in subset and 'p="docs"' not in subset
+        assert "<!-- 2 of 5 directories omitted -->" in subset
+        assert subset.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<r n="demo"')
+        assert '<meta fw="FastAPI"' in subset and subset.endswith("</r>")
+
+    def test_budget_prefers_the_closest_directories(self):
+        doc = _document(COMPACT)
+        header = estimate_tokens(doc.render(paths=[]))
+        api = doc.modules["src/api"].tokens
+
+        subset = doc.render(paths=["src/api/users.py"], max_tokens=header + api)
+
+        assert 'p="src/api"' in subset and 'p="src"' not in subset
+        assert doc.render(max_tokens=doc.tokens) == doc.text
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStructureCache:
+    """Reading once per content version."""
+
+    def test_unchanged_file_is_not_read_again(self, repo):
+        cache = StructureCache()
+        path = repo / ".llms" / "structure.xml"
+
+        first = cache.get(path)
+        assert cache.get(path) is first
+        assert cache.stats == {"hits": 1, "loads": 1, "parses": 1}
+
+        # Rewritten with the same content: read again but not re-parsed
+        path.write_text(COMPACT)
+        os.utime(path, ns=(1, 1))
+        assert cache.get(path) is first
+        assert cache.stats["parses"] == 1
+
+        path.write_text(COMPACT.replace("backend", "fullstack"))
+        assert cache.get(path).repo_type == "fullstack"
+        assert cache.stats["parses"] == 2
+
+        path.unlink()
+        assert cache.get(path) is None
+
+    def test_loaders_share_the_cache(self, repo, tmp_path):
+        assert load_structure_document(repo) is load_structure_document(repo)
+        assert "src/db" not in load_structure_documentation(repo, paths=["src/api/users.py"])
+        assert load_structure_documentation(tmp_path / "missing") is None
+
+
+# =============================================================================
+# Review context
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReviewFocus:
+    """Diff reviews embed the touched part of the structure."""
+
+    def test_diff_context_keeps_touched_directories(self, repo):
+        from turbowrap.review.models.review import ReviewRequest, ReviewRequestSource
+        from turbowrap.review.orchestrator import Orchestrator
+        from turbowrap.review.reviewers.base import ReviewContext
+
+        orchestrator = Orchestrator.__new__(Orchestrator)
+        context = ReviewContext(
+            request=ReviewRequest(
+                type="directory", source=ReviewRequestSource(directory=str(repo))
+            ),
+            repo_path=repo,
+            files=["src/db/models.py"],
+        )
+        orchestrator._load_structure_docs(context)
+        assert context.structure_docs["structure.xml"] == COMPACT
+
+        with patch("turbowrap.review.orchestrator.get_settings") as settings:
+            settings.return_value.review_context.structure_max_tokens = 8000
+            orchestrator._focus_structure_docs(context)
+
+        focused = context.structure_docs["structure.xml"]
+        assert 'p="src/db"' in focused and 'p="src/api"' not in focused
+        assert orchestrator._detect_repo_type([], context.structure_docs).name == "BACKEND"
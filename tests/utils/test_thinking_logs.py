@@ -0,0 +1,203 @@
+"""
+Tests for the thinking log key index.
+
+Run with: uv run pytest tests/utils/test_thinking_logs.py -v
+
+These tests verify:
+1. Indexed logs are resolved with one GET, however many keys the bucket holds
+2. Logs written before the index are found in the task's day prefixes only,
+   and indexed on the way
+3. Listing a review's logs uses the index, then date-bounded prefixes
+4. S3Logger records the index entry when it saves thinking
+"""
+
+import bisect
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from botocore.exceptions import ClientError
+
+from turbowrap.review.reviewers.utils.s3_logger import S3ArtifactMetadata, S3Logger
+from turbowrap.utils.thinking_logs import ThinkingLogIndex, day_prefix, index_key
+
+BUCKET = "thinking-test"
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+class FakeS3:
+    """In-memory S3 with sorted keys, 1000-key pages and call counters."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, datetime]] = {}
+        self._keys: list[str] = []
+        self.list_pages = 0
+        self.keys_listed = 0
+        self.gets = 0
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **_: object) -> dict:
+        if Key not in self.objects:
+            bisect.insort(self._keys, Key)
+        self.objects[Key] = (Body, datetime.now(timezone.utc))
+        return {}
+
+    def add(self, key: str, modified: datetime, body: bytes = b"# log") -> None:
+        if key not in self.objects:
+            self._keys.append(key)
+        self.objects[key] = (body, modified)
+
+    def sort(self) -> None:
+        self._keys.sort()
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        self.gets += 1
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body, modified = self.objects[Key]
+        return {"Body": io.BytesIO(body), "LastModified": modified}
+
+    def get_paginator(self, name: str) -> "FakeS3":
+        assert name == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket: str, Prefix: str):
+        start = bisect.bisect_left(self._keys, Prefix)
+        page: list[dict] = []
+        for key in self._keys[start:]:
+            if not key.startswith(Prefix):
+                break
+            body, modified = self.objects[key]
+            page.append({"Key": key, "LastModified": modified, "Size": len(body)})
+            if len(page) == 1000:
+                self.list_pages += 1
+                self.keys_listed += len(page)
+                yield {"Contents": page}
+                page = []
+        self.list_pages += 1
+        self.keys_listed += len(page)
+        yield {"Contents": page} if page else {}
+
+
+def _log_key(when: datetime, review_id: str, reviewer: str) -> str:
+    return f"thinking/{when:%Y/%m/%d/%H%M%S}/{review_id}_{reviewer}.md"
+
+
+@pytest.fixture(scope="module")
+def big_bucket() -> FakeS3:
+    """100k legacy logs spread over the last 10 days."""
+    s3 = FakeS3()
+    for n in range(100_000):
+        when = NOW - timedelta(minutes=n * 0.144)  # 10,000 per day
+        s3.add(_log_key(when, f"task-{n:06d}", "reviewer_be"), when)
+    s3.sort()
+    return s3
+
+
+def _reset(s3: FakeS3) -> None:
+    s3.list_pages = s3.keys_listed = s3.gets = 0
+
+
+# =============================================================================
+# Lookup
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestResolve:
+    """Finding one reviewer's log."""
+
+    def test_indexed_lookup_does_not_list(self, big_bucket):
+        index = ThinkingLogIndex(big_bucket, BUCKET)
+        key = _log_key(NOW, "task-new", "reviewer_fe")
+        big_bucket.put_object(Bucket=BUCKET, Key=key, Body=b"# thinking")
+        index.record("task-new", "reviewer_fe", key, 10)
+        _reset(big_bucket)
+
+        assert index.resolve("task-new", "reviewer_fe") == key
+        assert big_bucket.list_pages == 0 and big_bucket.gets == 1
+
+    def test_legacy_lookup_scans_only_the_task_days(self, big_bucket):
+        index = ThinkingLogIndex(big_bucket, BUCKET)
+        when = NOW - timedelta(minutes=50_000 * 0.144)
+        _reset(big_bucket)
+
+        key = index.resolve("task-050000", "reviewer_be", started_at=when)
+
+        assert key == _log_key(when, "task-050000", "reviewer_be")
+        # The task's day and the next one, not the 100k keys of the bucket
+        assert big_bucket.keys_listed <= 20_000 + 1
+        assert big_bucket.objects[index_key("task-050000", "reviewer_be")]
+
+        _reset(big_bucket)
+        assert index.resolve("task-050000", "reviewer_be", started_at=when) == key
+        assert big_bucket.list_pages == 0
+
+    def test_unknown_task_falls_back_to_latest_reviewer_log(self):
+        s3 = FakeS3()
+        older, newer = NOW - timedelta(days=2), NOW - timedelta(hours=1)
+        s3.add(_log_key(older, "reviewer_be_1700000000", "reviewer_be"), older)
+        s3.add(_log_key(newer, "reviewer_be_1700009999", "reviewer_be"), newer)
+        s3.add(_log_key(NOW - timedelta(days=30), "task-x", "reviewer_be"), NOW)  # Expired day
+        s3.sort()
+
+        key = ThinkingLogIndex(s3, BUCKET, retention_days=10).resolve("task-x", "reviewer_be")
+
+        assert key == _log_key(newer, "reviewer_be_1700009999", "reviewer_be")
+        assert ThinkingLogIndex(s3, BUCKET).resolve("task-x", "reviewer_fe") is None
+
+
+# =============================================================================
+# Listing
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestListLogs:
+    """Listing a review's logs."""
+
+    def test_indexed_and_legacy_listing(self):
+        s3 = FakeS3()
+        index = ThinkingLogIndex(s3, BUCKET)
+        s3.add(_log_key(NOW, "task-1", "reviewer_be"), NOW, b"x" * 42)
+        s3.add(_log_key(NOW, "task-1", "reviewer_fe_quality"), NOW)
+        s3.add(_log_key(NOW, "task-2", "reviewer_be"), NOW)
+        s3.sort()
+
+        legacy = index.list_logs("task-1", started_at=NOW)
+        assert [(r.reviewer_name, r.size_bytes) for r in legacy] == [
+            ("reviewer_be", 42),
+            ("reviewer_fe_quality", 5),
+        ]
+
+        _reset(s3)
+        indexed = index.list_logs("task-1", started_at=NOW)
+        assert [r.to_dict()["s3_key"] for r in indexed] == [r.s3_key for r in legacy]
+        assert indexed[0].size_bytes == 42
+        assert s3.keys_listed == 2  # Only the review's index entries
+
+    def test_day_prefix(self):
+        assert day_prefix(datetime(2026, 1, 2).date()) == "thinking/2026/01/02/"
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestS3Logger:
+    """Saving thinking records the index entry."""
+
+    async def test_save_thinking_indexes_the_log(self):
+        s3 = FakeS3()
+        logger = S3Logger()
+        logger.bucket = BUCKET
+        logger._client = s3  # type: ignore[assignment]
+        metadata = S3ArtifactMetadata(review_id="task-9", component="reviewer_be", model="opus")
+
+        url = await logger.save_thinking("deep thoughts", metadata)
+
+        key = url.removeprefix(f"s3://{BUCKET}/")
+        _reset(s3)
+        assert ThinkingLogIndex(s3, BUCKET).resolve("task-9", "reviewer_be") == key
+        assert s3.list_pages == 0